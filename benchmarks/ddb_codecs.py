@@ -0,0 +1,278 @@
+"""
+DDB Codecs Benchmark
+
+Compares the compiled model codecs to the hand-written `to_ddb_item` and
+`from_ddb_item` implementations they replaced, encoding and decoding the
+same items of each model.
+
+Usage:
+    python -m benchmarks.ddb_codecs [NUM_ROWS]
+"""
+
+import datetime as dt
+import gc
+import sys
+import time
+from typing import Callable, Dict, List, Tuple
+
+from benchmarks.spending_analytics import create_transactions
+from src.database.accounts.models import Account, AccountType, DepositoryAccount
+from src.database.holdings.models import Holding
+from src.database.models import get_slots
+from src.database.transactions.models import (
+    BankingTransactionSubType,
+    BankTransaction,
+    InvestmentTransaction,
+    InvestmentTransactionSubType,
+    Transaction,
+    TransactionCategory,
+    TransactionType,
+)
+
+DEFAULT_NUM_ROWS = 100_000
+
+
+def legacy_decode_bank_transaction(ddb_item: dict) -> BankTransaction:
+    return BankTransaction(
+        transaction_id=ddb_item["transaction_id"]["S"],
+        account_id=ddb_item["account_id"]["S"],
+        user_id=ddb_item["user_id"]["S"],
+        transaction_type=TransactionType.from_string(ddb_item["transaction_type"]["S"]),
+        transaction_subtype=BankingTransactionSubType.from_string(
+            ddb_item["transaction_subtype"]["S"]
+        ),
+        transaction_category=TransactionCategory.from_string(
+            ddb_item["transaction_category"]["S"]
+        ),
+        transaction_date=dt.datetime.fromisoformat(
+            ddb_item["transaction_date"]["S"].split("#")[0]
+        ).date(),
+        transaction_amount=float(ddb_item["transaction_amount"]["N"]),
+        merchant_name=ddb_item["merchant_name"]["S"],
+        merchant_logo_s3_uri=ddb_item["merchant_logo_s3_uri"]["S"],
+        plaid_transaction_id=ddb_item.get("plaid_transaction_id", {}).get("S"),
+        plaid_account_id=ddb_item.get("plaid_account_id", {}).get("S"),
+    )
+
+
+def legacy_encode_common_attributes(transaction: Transaction) -> dict:
+    ddb_item = {
+        "transaction_id": {"S": transaction.transaction_id},
+        "account_id": {"S": transaction.account_id},
+        "user_id": {"S": transaction.user_id},
+        "transaction_type": {"S": transaction.transaction_type.value},
+        "transaction_subtype": {"S": transaction.transaction_subtype.value},
+        "transaction_category": {"S": transaction.transaction_category.value},
+        "transaction_date": {"S": transaction._get_transaction_date_uuid()},
+        "transaction_amount": {"N": str(transaction.transaction_amount)},
+        "merchant_logo_s3_uri": {"S": transaction.merchant_logo_s3_uri},
+    }
+    if transaction.plaid_transaction_id:
+        ddb_item["plaid_transaction_id"] = {"S": transaction.plaid_transaction_id}
+    if transaction.plaid_account_id:
+        ddb_item["plaid_account_id"] = {"S": transaction.plaid_account_id}
+    return ddb_item
+
+
+def legacy_encode_transaction(transaction: Transaction) -> dict:
+    if isinstance(transaction, InvestmentTransaction):
+        return {
+            **legacy_encode_common_attributes(transaction),
+            "security_id": {"S": transaction.security_id},
+            "account_security_id": {
+                "S": InvestmentTransaction.get_account_security_id(
+                    transaction.account_id, transaction.security_id
+                )
+            },
+            "quantity": {"N": str(transaction.quantity)},
+            "price_per_share": {"N": str(transaction.price_per_share)},
+        }
+    return {
+        **legacy_encode_common_attributes(transaction),
+        "merchant_name": {"S": transaction.merchant_name},
+    }
+
+
+def legacy_decode_investment_transaction(ddb_item: dict) -> InvestmentTransaction:
+    return InvestmentTransaction(
+        transaction_id=ddb_item["transaction_id"]["S"],
+        account_id=ddb_item["account_id"]["S"],
+        user_id=ddb_item["user_id"]["S"],
+        transaction_type=TransactionType.from_string(ddb_item["transaction_type"]["S"]),
+        transaction_category=TransactionCategory.from_string(
+            ddb_item["transaction_category"]["S"]
+        ),
+        transaction_subtype=InvestmentTransactionSubType.from_string(
+            ddb_item["transaction_subtype"]["S"]
+        ),
+        transaction_date=dt.datetime.fromisoformat(
+            ddb_item["transaction_date"]["S"].split("#")[0]
+        ).date(),
+        transaction_amount=float(ddb_item["transaction_amount"]["N"]),
+        security_id=ddb_item["security_id"]["S"],
+        quantity=float(ddb_item["quantity"]["N"]),
+        merchant_logo_s3_uri=ddb_item["merchant_logo_s3_uri"]["S"],
+        price_per_share=float(ddb_item["price_per_share"]["N"]),
+        plaid_transaction_id=ddb_item.get("plaid_transaction_id", {}).get("S"),
+        plaid_account_id=ddb_item.get("plaid_account_id", {}).get("S"),
+    )
+
+
+def legacy_decode_account(ddb_item: dict) -> DepositoryAccount:
+    plaid_last_sync_at = None
+    if ddb_item.get("plaid_last_sync_at", {}).get("S"):
+        plaid_last_sync_at = dt.datetime.fromisoformat(
+            ddb_item["plaid_last_sync_at"]["S"]
+        )
+    return DepositoryAccount(
+        user_id=ddb_item["user_id"]["S"],
+        account_id=ddb_item["account_id"]["S"],
+        account_type=AccountType.from_string(ddb_item["account_type"]["S"]),
+        account_subtype=ddb_item["account_subtype"]["S"],
+        institution_name=ddb_item["institution_name"]["S"],
+        account_name=ddb_item["account_name"]["S"],
+        account_mask=ddb_item["account_mask"]["S"],
+        balance=float(ddb_item["balance"]["N"]),
+        balance_last_updated_at=dt.datetime.fromisoformat(
+            ddb_item["balance_last_updated_at"]["S"]
+        ),
+        created_at=dt.datetime.fromisoformat(ddb_item["created_at"]["S"]),
+        updated_at=dt.datetime.fromisoformat(ddb_item["updated_at"]["S"]),
+        plaid_institution_id=ddb_item.get("plaid_institution_id", {}).get("S"),
+        plaid_account_id=ddb_item.get("plaid_account_id", {}).get("S"),
+        logo_s3_uri=ddb_item["logo_s3_uri"]["S"],
+        plaid_access_token=ddb_item.get("plaid_access_token", {}).get("S"),
+        plaid_cursor=ddb_item.get("plaid_cursor", {}).get("S"),
+        plaid_item_id=ddb_item.get("plaid_item_id", {}).get("S"),
+        plaid_last_sync_at=plaid_last_sync_at,
+    )
+
+
+def legacy_decode_holding(ddb_item: dict) -> Holding:
+    return Holding(
+        account_id=ddb_item["account_id"]["S"],
+        security_id=ddb_item["security_id"]["S"],
+        quantity=float(ddb_item["quantity"]["N"]),
+        total_cost_basis=float(ddb_item["total_cost_basis"]["N"]),
+        average_cost_basis=float(ddb_item["average_cost_basis"]["N"]),
+        created_at=dt.datetime.fromisoformat(ddb_item["created_at"]["S"]),
+        updated_at=dt.datetime.fromisoformat(ddb_item["updated_at"]["S"]),
+        last_transaction_key=ddb_item.get("last_transaction_key", {}).get("S"),
+        updates_since_reconciliation=int(
+            ddb_item.get("updates_since_reconciliation", {"N": "0"})["N"]
+        ),
+    )
+
+
+def create_models(num_rows: int) -> Dict[str, list]:
+    now = dt.datetime.now(dt.timezone.utc)
+    return {
+        "bank transaction": create_transactions(num_rows),
+        "investment transaction": [
+            InvestmentTransaction(
+                transaction_id=f"investment-{i}",
+                account_id="acct-001",
+                user_id="user-benchmark",
+                transaction_type=TransactionType.INVESTMENT,
+                transaction_subtype=InvestmentTransactionSubType.BUY,
+                transaction_category=TransactionCategory.INVESTMENT,
+                transaction_date=now.date(),
+                transaction_amount=1000.0 + i,
+                security_id="sec-nasdaq-aapl",
+                quantity=10.0,
+                price_per_share=100.0 + i / 10,
+            )
+            for i in range(num_rows)
+        ],
+        "account": [
+            Account.create(
+                user_id="user-benchmark",
+                account_type="depository",
+                account_subtype="checking",
+                institution_name="Walrus Bank",
+                account_name=f"Account {i}",
+                account_mask=f"{i % 10000:04}",
+                balance=float(i),
+                plaid_account_id=f"plaid-{i}" if i % 2 else None,
+            )
+            for i in range(num_rows)
+        ],
+        "holding": [
+            Holding.create_new_holding("acct-001", f"sec-{i}", 10.0, 100.0)
+            for i in range(num_rows)
+        ],
+    }
+
+
+LEGACY_DECODERS: Dict[str, Callable[[dict], object]] = {
+    "bank transaction": legacy_decode_bank_transaction,
+    "investment transaction": legacy_decode_investment_transaction,
+    "account": legacy_decode_account,
+    "holding": legacy_decode_holding,
+}
+
+DECODERS: Dict[str, Callable[[dict], object]] = {
+    "bank transaction": Transaction.from_ddb_item,
+    "investment transaction": Transaction.from_ddb_item,
+    "account": Account.from_ddb_item,
+    "holding": Holding.from_ddb_item,
+}
+
+
+def get_attributes(model) -> tuple:
+    return tuple(getattr(model, name) for name in get_slots(type(model)))
+
+
+def timed(function: Callable, values: List, repeat: int = 3) -> Tuple[float, list]:
+    """Get the best time of the repeats, garbage collection is disabled as in timeit."""
+    best = float("inf")
+    for _ in range(repeat):
+        result = None
+        gc.collect()
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            result = [function(value) for value in values]
+            best = min(best, time.perf_counter() - start)
+        finally:
+            gc.enable()
+    return best, result
+
+
+def main(num_rows: int) -> None:
+    print(
+        f"{'model':>24} {'legacy decode (s)':>18} {'codec decode (s)':>17} "
+        f"{'speedup':>8} {'legacy encode (s)':>18} {'codec encode (s)':>17} "
+        f"{'speedup':>8}"
+    )
+    for name, models in create_models(num_rows).items():
+        items = [model.to_ddb_item() for model in models]
+        legacy_decode_seconds, legacy_models = timed(LEGACY_DECODERS[name], items)
+        decode_seconds, decoded_models = timed(DECODERS[name], items)
+
+        # sanity check the codecs against the legacy implementations
+        assert [get_attributes(model) for model in decoded_models] == [
+            get_attributes(model) for model in legacy_models
+        ]
+
+        if name.endswith("transaction"):
+            legacy_encode_seconds, legacy_items = timed(
+                legacy_encode_transaction, models
+            )
+            encode_seconds, _ = timed(lambda model: model.to_ddb_item(), models)
+            assert legacy_items == items
+            encode = (
+                f"{legacy_encode_seconds:>18.4f} {encode_seconds:>17.4f} "
+                f"{legacy_encode_seconds / encode_seconds:>7.1f}x"
+            )
+        else:
+            encode = f"{'-':>18} {'-':>17} {'-':>8}"
+
+        print(
+            f"{name:>24} {legacy_decode_seconds:>18.4f} {decode_seconds:>17.4f} "
+            f"{legacy_decode_seconds / decode_seconds:>7.1f}x {encode}"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_NUM_ROWS)
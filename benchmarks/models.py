@@ -0,0 +1,359 @@
+"""
+Models Benchmark
+
+Compares the slotted domain models to dict-based equivalents, i.e. the same
+constructors without `__slots__` as the models were before, measuring the
+construction time, the memory retained per model, and the time to copy a
+model, for the volumes of models created by large syncs.
+
+Usage:
+    python -m benchmarks.models [NUM_ROWS]
+"""
+
+import copy
+import datetime as dt
+import sys
+import tracemalloc
+from abc import ABC
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Optional, Tuple
+
+from benchmarks.ddb_codecs import timed
+from src.database.accounts.models import AccountType, DepositoryAccount
+from src.database.securities.models import SecurityType, Stock
+from src.database.sessions.models import Session
+from src.database.transactions.models import (
+    BankingTransactionSubType,
+    BankTransaction,
+    TransactionCategory,
+    TransactionType,
+)
+
+DEFAULT_NUM_ROWS = 100_000
+
+
+class LegacyTransaction(ABC):
+    DEFAULT_MERCHANT_LOGO_S3_URI = BankTransaction.DEFAULT_MERCHANT_LOGO_S3_URI
+
+    def __init__(
+        self,
+        transaction_id,
+        account_id,
+        user_id,
+        transaction_type,
+        transaction_subtype,
+        transaction_category,
+        transaction_date,
+        transaction_amount,
+        merchant_logo_s3_uri=None,
+        plaid_transaction_id=None,
+        plaid_account_id=None,
+    ) -> None:
+        self.transaction_id = transaction_id
+        self.account_id = account_id
+        self.user_id = user_id
+        self.transaction_type = transaction_type
+        self.transaction_subtype = transaction_subtype
+        self.transaction_category = transaction_category
+        self.transaction_date = transaction_date
+        self.transaction_amount = transaction_amount
+        if merchant_logo_s3_uri is None:
+            merchant_logo_s3_uri = self.DEFAULT_MERCHANT_LOGO_S3_URI
+        self.merchant_logo_s3_uri = merchant_logo_s3_uri
+        self.plaid_transaction_id = plaid_transaction_id
+        self.plaid_account_id = plaid_account_id
+
+
+class LegacyBankTransaction(LegacyTransaction):
+    def __init__(
+        self,
+        transaction_id,
+        account_id,
+        user_id,
+        transaction_type,
+        transaction_subtype,
+        transaction_category,
+        transaction_date,
+        transaction_amount,
+        merchant_name,
+        merchant_logo_s3_uri=None,
+        plaid_transaction_id=None,
+        plaid_account_id=None,
+    ) -> None:
+        super().__init__(
+            transaction_id,
+            account_id,
+            user_id,
+            transaction_type,
+            transaction_subtype,
+            transaction_category,
+            transaction_date,
+            transaction_amount,
+            merchant_logo_s3_uri,
+            plaid_transaction_id,
+            plaid_account_id,
+        )
+        self.merchant_name = merchant_name
+
+
+class LegacyAccount(ABC):
+    def __init__(
+        self,
+        account_id,
+        user_id,
+        account_type,
+        account_subtype,
+        institution_name,
+        account_name,
+        account_mask,
+        balance,
+        balance_last_updated_at,
+        created_at,
+        updated_at,
+        plaid_institution_id=None,
+        plaid_account_id=None,
+        plaid_access_token=None,
+        plaid_item_id=None,
+        plaid_cursor=None,
+        plaid_last_sync_at=None,
+        logo_s3_uri=None,
+    ) -> None:
+        self.account_id = account_id
+        self.user_id = user_id
+        self.account_type = account_type
+        self.account_subtype = account_subtype
+        self.institution_name = institution_name
+        self.account_name = account_name
+        self.account_mask = account_mask
+        self.balance = balance
+        self.balance_last_updated_at = balance_last_updated_at
+        self.created_at = created_at
+        self.updated_at = updated_at
+        self.plaid_institution_id = plaid_institution_id
+        self.plaid_account_id = plaid_account_id
+        self.plaid_access_token = plaid_access_token
+        self.plaid_item_id = plaid_item_id
+        self.plaid_cursor = plaid_cursor
+        self.plaid_last_sync_at = plaid_last_sync_at
+        self.logo_s3_uri = logo_s3_uri
+
+
+class LegacyDepositoryAccount(LegacyAccount):
+    def __init__(
+        self,
+        account_id,
+        user_id,
+        account_type,
+        account_subtype,
+        institution_name,
+        account_name,
+        account_mask,
+        balance,
+        balance_last_updated_at,
+        created_at,
+        updated_at,
+        plaid_institution_id=None,
+        plaid_account_id=None,
+        plaid_access_token=None,
+        plaid_item_id=None,
+        plaid_cursor=None,
+        plaid_last_sync_at=None,
+        logo_s3_uri=None,
+    ) -> None:
+        super().__init__(
+            account_id=account_id,
+            user_id=user_id,
+            account_type=account_type,
+            account_subtype=account_subtype,
+            institution_name=institution_name,
+            account_name=account_name,
+            account_mask=account_mask,
+            balance=balance,
+            balance_last_updated_at=balance_last_updated_at,
+            created_at=created_at,
+            updated_at=updated_at,
+            plaid_institution_id=plaid_institution_id,
+            plaid_account_id=plaid_account_id,
+            plaid_access_token=plaid_access_token,
+            plaid_item_id=plaid_item_id,
+            plaid_cursor=plaid_cursor,
+            plaid_last_sync_at=plaid_last_sync_at,
+            logo_s3_uri=logo_s3_uri,
+        )
+
+
+class LegacySecurity(ABC):
+    def __init__(
+        self,
+        security_id,
+        security_name,
+        security_type,
+        current_price,
+        price_updated_at,
+        price_expires_at,
+    ):
+        self.security_id = security_id
+        self.security_name = security_name
+        self.security_type = security_type
+        self.current_price = current_price
+        self.price_updated_at = price_updated_at
+        self.price_expires_at = price_expires_at
+
+
+class LegacyStock(LegacySecurity):
+    def __init__(
+        self,
+        name,
+        ticker,
+        exchange,
+        price,
+        price_updated_at,
+        price_expires_at,
+        security_id=None,
+    ) -> None:
+        if not security_id:
+            security_id = self._generate_security_id(exchange=exchange, ticker=ticker)
+        super().__init__(
+            security_id,
+            name,
+            SecurityType.STOCK,
+            price,
+            price_updated_at,
+            price_expires_at,
+        )
+        self.ticker = ticker
+        self.exchange = exchange
+
+    def _generate_security_id(self, **kwargs) -> str:
+        exchange = kwargs.get("exchange")
+        ticker = kwargs.get("ticker")
+        return f"sec-{exchange.lower()}-{ticker.lower()}"
+
+
+@dataclass
+class LegacySession:
+    user_id: str
+    token_id: str
+    ip_address: str
+    device: str
+    session_start: dt.datetime
+    session_expiration: dt.datetime
+    revoked: bool
+    session_end: Optional[dt.datetime] = None
+    ttl: Optional[int] = None
+
+
+def create_arguments(num_rows: int) -> Dict[str, List[dict]]:
+    now = dt.datetime.now(dt.timezone.utc)
+    return {
+        "bank transaction": [
+            {
+                "transaction_id": f"bank-{i}",
+                "account_id": f"acct-{i % 10}",
+                "user_id": "user-benchmark",
+                "transaction_type": TransactionType.BANKING,
+                "transaction_subtype": BankingTransactionSubType.DEBIT,
+                "transaction_category": TransactionCategory.RESTAURANTS,
+                "transaction_date": now.date(),
+                "transaction_amount": float(i),
+                "merchant_name": f"Merchant {i % 100}",
+            }
+            for i in range(num_rows)
+        ],
+        "account": [
+            {
+                "account_id": f"acct-{i}",
+                "user_id": "user-benchmark",
+                "account_type": AccountType.DEPOSITORY,
+                "account_subtype": "checking",
+                "institution_name": "Walrus Bank",
+                "account_name": f"Account {i}",
+                "account_mask": f"{i % 10000:04}",
+                "balance": float(i),
+                "balance_last_updated_at": now,
+                "created_at": now,
+                "updated_at": now,
+            }
+            for i in range(num_rows)
+        ],
+        "stock": [
+            {
+                "name": f"Stock {i}",
+                "ticker": f"T{i}",
+                "exchange": "NASDAQ",
+                "price": float(i),
+                "price_updated_at": now,
+                "price_expires_at": now,
+                "security_id": f"sec-nasdaq-t{i}",
+            }
+            for i in range(num_rows)
+        ],
+        "session": [
+            {
+                "user_id": "user-benchmark",
+                "token_id": f"token-{i}",
+                "ip_address": "127.0.0.1",
+                "device": "benchmark",
+                "session_start": now,
+                "session_expiration": now,
+                "revoked": False,
+            }
+            for i in range(num_rows)
+        ],
+    }
+
+
+MODELS: Dict[str, Tuple[type, type]] = {
+    "bank transaction": (LegacyBankTransaction, BankTransaction),
+    "account": (LegacyDepositoryAccount, DepositoryAccount),
+    "stock": (LegacyStock, Stock),
+    "session": (LegacySession, Session),
+}
+
+
+def get_retained_bytes(
+    create: Callable[[dict], object], arguments: List[dict]
+) -> float:
+    """Get the memory retained per model, the attribute values are shared by both models."""
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        models = [create(kwargs) for kwargs in arguments]
+        retained = tracemalloc.get_traced_memory()[0] - before - sys.getsizeof(models)
+    finally:
+        tracemalloc.stop()
+    return retained / len(models)
+
+
+def main(num_rows: int) -> None:
+    print(
+        f"{'model':>16} {'dict (s)':>9} {'slots (s)':>10} {'speedup':>8} "
+        f"{'dict (B)':>9} {'slots (B)':>10} {'saved':>6} "
+        f"{'dict copy (s)':>14} {'slots copy (s)':>15} {'speedup':>8}"
+    )
+    for name, arguments in create_arguments(num_rows).items():
+        legacy_model, model = MODELS[name]
+
+        # construction is short, take the best of more repeats
+        legacy_seconds, legacy_models = timed(
+            lambda kwargs: legacy_model(**kwargs), arguments, repeat=7
+        )
+        seconds, models = timed(lambda kwargs: model(**kwargs), arguments, repeat=7)
+        legacy_bytes = get_retained_bytes(
+            lambda kwargs: legacy_model(**kwargs), arguments
+        )
+        slotted_bytes = get_retained_bytes(lambda kwargs: model(**kwargs), arguments)
+        legacy_copy_seconds, _ = timed(copy.copy, legacy_models)
+        copy_seconds, _ = timed(lambda model: model.replace(), models)
+
+        print(
+            f"{name:>16} {legacy_seconds:>9.4f} {seconds:>10.4f} "
+            f"{legacy_seconds / seconds:>7.1f}x {legacy_bytes:>9.0f} "
+            f"{slotted_bytes:>10.0f} {1 - slotted_bytes / legacy_bytes:>6.0%} "
+            f"{legacy_copy_seconds:>14.4f} {copy_seconds:>15.4f} "
+            f"{legacy_copy_seconds / copy_seconds:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_NUM_ROWS)
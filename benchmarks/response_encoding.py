@@ -0,0 +1,103 @@
+"""
+Response Encoding Benchmark
+
+Compares the encodings of API responses, in the time to serialize and
+compress the GetTransactions response of a batch and in the bytes sent to
+the client, against the uncompressed standard library JSON of the legacy
+responses. The orjson encoder is included if orjson is installed.
+
+Usage:
+    python -m benchmarks.response_encoding [NUM_ROWS ...]
+"""
+
+import base64
+import json
+import sys
+from typing import List
+
+import src.api.common.response as response_module
+from benchmarks.ddb_codecs import timed
+from benchmarks.transactions_payload import create_accounts, create_batch
+from src.api.common.models import HTTPStatus, Status
+from src.api.common.response import (
+    OrjsonJSONEncoder,
+    Response,
+    StdlibJSONEncoder,
+    orjson,
+)
+from src.api.transactions.get_transactions.models import (
+    GetTransactionsResponseTransactions,
+    TransactionsLayout,
+)
+from src.environment import Domain
+
+DEFAULT_NUM_ROWS = [100, 1_000, 10_000]
+
+ACCEPT_ENCODINGS = {"identity": None, "gzip": "gzip", "deflate": "deflate"}
+"""(Dict[str, Optional[str]]): The Accept-Encoding header of each benchmarked encoding."""
+
+
+def create_response(num_rows: int, accept_encoding: str) -> Response:
+    transactions = GetTransactionsResponseTransactions(
+        create_accounts(), create_batch(num_rows)
+    )
+    return Response(
+        domain=Domain.DEVELOPMENT,
+        api_name="GetTransactions",
+        request_id="request-benchmark",
+        http_status=HTTPStatus.OK,
+        status=Status.SUCCESS,
+        message="Retrieved transactions!",
+        data={
+            "num_transactions": num_rows,
+            **transactions.to_dict(TransactionsLayout.ROWS),
+        },
+        accept_encoding=accept_encoding,
+    )
+
+
+def get_wire_bytes(response_json: dict) -> int:
+    """Get the size of the body sent to the client, API Gateway decodes base64 bodies."""
+    if response_json.get("isBase64Encoded"):
+        return len(base64.b64decode(response_json["body"]))
+    return len(response_json["body"].encode("utf-8"))
+
+
+def main(num_rows: List[int]) -> None:
+    encoders = [StdlibJSONEncoder()]
+    if orjson is not None:
+        encoders.append(OrjsonJSONEncoder())
+
+    print(
+        f"{'rows':>8} {'encoder':>8} {'encoding':>9} {'time (s)':>9} "
+        f"{'speedup':>8} {'bytes':>12} {'saved':>6}"
+    )
+    for n in num_rows:
+        response = create_response(n, None)
+
+        # the legacy responses are uncompressed stdlib JSON
+        legacy_seconds, bodies = timed(
+            lambda response: json.dumps(response._get_body()), [response], repeat=5
+        )
+        legacy_bytes = len(bodies[0].encode("utf-8"))
+        print(
+            f"{n:>8} {'legacy':>8} {'identity':>9} {legacy_seconds:>9.4f} "
+            f"{1:>7.1f}x {legacy_bytes:>12,} {0:>6.0%}"
+        )
+
+        for encoder in encoders:
+            response_module.JSON_ENCODER = encoder
+            for name, accept_encoding in ACCEPT_ENCODINGS.items():
+                response.accept_encoding = accept_encoding
+                seconds, responses = timed(Response.to_json, [response], repeat=5)
+                wire_bytes = get_wire_bytes(responses[0])
+                print(
+                    f"{n:>8} {encoder.name:>8} {name:>9} {seconds:>9.4f} "
+                    f"{legacy_seconds / seconds:>7.1f}x {wire_bytes:>12,} "
+                    f"{1 - wire_bytes / legacy_bytes:>6.0%}"
+                )
+    response_module.JSON_ENCODER = response_module.get_json_encoder()
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or DEFAULT_NUM_ROWS)
@@ -0,0 +1,124 @@
+"""
+Spending Analytics Benchmark
+
+Compares the vectorized spending analytics engine to a per-transaction
+Python loop computing the same category, merchant, account, and weekday
+breakdowns of the current and previous periods.
+
+Usage:
+    python -m benchmarks.spending_analytics [NUM_ROWS ...]
+"""
+
+import datetime as dt
+import random
+import sys
+import time
+from collections import defaultdict
+from typing import Callable, List, Tuple
+
+from src.database.transactions.models import (
+    BankingTransactionSubType,
+    BankTransaction,
+    Transaction,
+    TransactionCategory,
+    TransactionType,
+)
+from src.transactions.analytics import SpendingAnalyticsEngine, TransactionColumns
+
+DEFAULT_NUM_ROWS = [10_000, 100_000, 1_000_000]
+NUM_MERCHANTS = 2_000
+NUM_ACCOUNTS = 8
+START_DATE = dt.date(2025, 1, 1)
+END_DATE = dt.date(2025, 6, 30)
+
+
+def create_transactions(num_rows: int, seed: int = 0) -> List[Transaction]:
+    rng = random.Random(seed)
+    categories = [
+        category
+        for category in TransactionCategory
+        if category != TransactionCategory.INVESTMENT
+    ]
+    subtypes = [BankingTransactionSubType.DEBIT] * 9 + [
+        BankingTransactionSubType.CREDIT
+    ]
+    first_day = START_DATE - (END_DATE - START_DATE) - dt.timedelta(days=1)
+    num_days = (END_DATE - first_day).days + 1
+    return [
+        BankTransaction(
+            transaction_id=f"bank-{i}",
+            account_id=f"acct-{rng.randrange(NUM_ACCOUNTS)}",
+            user_id="user-benchmark",
+            transaction_type=TransactionType.BANKING,
+            transaction_subtype=rng.choice(subtypes),
+            transaction_category=rng.choice(categories),
+            transaction_date=first_day + dt.timedelta(days=rng.randrange(num_days)),
+            transaction_amount=round(rng.uniform(1, 500), 2),
+            merchant_name=f"Merchant {rng.randrange(NUM_MERCHANTS)}",
+        )
+        for i in range(num_rows)
+    ]
+
+
+def loop_analytics(transactions: List[Transaction]) -> dict:
+    """The per-transaction baseline."""
+    previous_start_date, previous_end_date = (
+        SpendingAnalyticsEngine.get_previous_period(START_DATE, END_DATE)
+    )
+    breakdowns = {
+        name: [defaultdict(float), defaultdict(float)]
+        for name in ["categories", "merchants", "accounts", "weekdays"]
+    }
+    for transaction in transactions:
+        if not transaction.is_expense():
+            continue
+        day = transaction.transaction_date
+        if START_DATE <= day <= END_DATE:
+            period = 0
+        elif previous_start_date <= day <= previous_end_date:
+            period = 1
+        else:
+            continue
+        amount = transaction.transaction_amount
+        breakdowns["categories"][period][transaction.transaction_category] += amount
+        breakdowns["merchants"][period][transaction.merchant_name] += amount
+        breakdowns["accounts"][period][transaction.account_id] += amount
+        breakdowns["weekdays"][period][day.weekday()] += amount
+    return breakdowns
+
+
+def timed(function: Callable, *args) -> Tuple[float, object]:
+    start = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - start, result
+
+
+def main(num_rows_list: List[int]) -> None:
+    engine = SpendingAnalyticsEngine()
+    print(
+        f"{'rows':>10} {'loop (s)':>10} {'load (s)':>10} {'engine (s)':>11} "
+        f"{'speedup':>8} {'speedup w/ load':>16}"
+    )
+    for num_rows in num_rows_list:
+        transactions = create_transactions(num_rows)
+        loop_seconds, expected = timed(loop_analytics, transactions)
+        load_seconds, columns = timed(
+            TransactionColumns.from_transactions, transactions
+        )
+        engine_seconds, analytics = timed(
+            engine.get_analytics, columns, START_DATE, END_DATE, 10
+        )
+
+        # sanity check the engine against the baseline
+        expected_total = sum(expected["categories"][0].values())
+        assert abs(analytics.total_spend - expected_total) < 1e-6 * num_rows
+
+        print(
+            f"{num_rows:>10,} {loop_seconds:>10.4f} {load_seconds:>10.4f} "
+            f"{engine_seconds:>11.4f} {loop_seconds / engine_seconds:>7.1f}x "
+            f"{loop_seconds / (load_seconds + engine_seconds):>15.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or DEFAULT_NUM_ROWS)
@@ -0,0 +1,86 @@
+"""
+Transaction Batch Benchmark
+
+Compares decoding DDB transaction items into Transaction objects to decoding
+them into a columnar TransactionBatch, in time and in the memory retained
+by the decoded transactions, and the
+time to serialize each into dicts.
+
+Usage:
+    python -m benchmarks.transaction_batch [NUM_ROWS ...]
+"""
+
+import random
+import sys
+import time
+import tracemalloc
+from typing import Callable, List, Tuple
+
+from benchmarks.spending_analytics import create_transactions
+from src.database.transactions.batch import TransactionBatch
+from src.database.transactions.table import TransactionsTable
+
+DEFAULT_NUM_ROWS = [10_000, 100_000, 1_000_000]
+
+
+def create_ddb_items(num_rows: int, seed: int = 0) -> List[dict]:
+    items = [transaction.to_ddb_item() for transaction in create_transactions(num_rows)]
+    random.Random(seed).shuffle(items)
+    return items
+
+
+def decode_transactions(items: List[dict]) -> list:
+    """The per-item baseline of the transactions table."""
+    return [TransactionsTable._from_ddb_item(item) for item in items]
+
+
+def to_dicts(transactions: list) -> List[dict]:
+    return [transaction.to_dict() for transaction in transactions]
+
+
+def timed(function: Callable, *args) -> Tuple[float, object]:
+    start = time.perf_counter()
+    result = function(*args)
+    return time.perf_counter() - start, result
+
+
+def retained_memory(function: Callable, *args) -> int:
+    """Get the memory retained by the result of the function, in bytes."""
+    tracemalloc.start()
+    try:
+        result = function(*args)  # noqa: F841
+        return tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+
+
+def main(num_rows_list: List[int]) -> None:
+    print(
+        f"{'rows':>10} {'objects (s)':>12} {'batch (s)':>10} {'speedup':>8} "
+        f"{'objects (MB)':>13} {'batch (MB)':>11} {'to_dict (s)':>12} "
+        f"{'to_dicts (s)':>13}"
+    )
+    for num_rows in num_rows_list:
+        items = create_ddb_items(num_rows)
+        objects_seconds, transactions = timed(decode_transactions, items)
+        batch_seconds, batch = timed(TransactionBatch.from_ddb_items, items)
+        to_dict_seconds, expected = timed(to_dicts, transactions)
+        to_dicts_seconds, dicts = timed(batch.to_dicts)
+
+        # sanity check the batch against the baseline
+        assert dicts == expected
+
+        del transactions, batch, expected, dicts
+        objects_bytes = retained_memory(decode_transactions, items)
+        batch_bytes = retained_memory(TransactionBatch.from_ddb_items, items)
+
+        print(
+            f"{num_rows:>10,} {objects_seconds:>12.4f} {batch_seconds:>10.4f} "
+            f"{objects_seconds / batch_seconds:>7.1f}x "
+            f"{objects_bytes / 2**20:>13.1f} {batch_bytes / 2**20:>11.1f} "
+            f"{to_dict_seconds:>12.4f} {to_dicts_seconds:>13.4f}"
+        )
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or DEFAULT_NUM_ROWS)
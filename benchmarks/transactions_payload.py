@@ -0,0 +1,92 @@
+"""
+Transactions Payload Benchmark
+
+Compares the layouts of the transactions of GetTransactions responses, in
+the time to build and JSON serialize the transactions of a batch and in
+the size of the serialized payload.
+
+Usage:
+    python -m benchmarks.transactions_payload [NUM_ROWS ...]
+"""
+
+import json
+import sys
+import time
+from typing import Dict, List
+
+from benchmarks.spending_analytics import NUM_ACCOUNTS, create_transactions
+from src.api.transactions.get_transactions.models import (
+    GetTransactionsResponseTransactions,
+    TransactionsLayout,
+)
+from src.database.accounts.models import Account
+from src.database.transactions.batch import TransactionBatch
+
+DEFAULT_NUM_ROWS = [1_000, 10_000, 100_000]
+
+
+def create_accounts() -> Dict[str, Account]:
+    accounts = {}
+    for i in range(NUM_ACCOUNTS):
+        account = Account.create(
+            user_id="user-benchmark",
+            account_type="depository",
+            account_subtype="checking",
+            institution_name="Walrus Bank",
+            account_name=f"Account {i}",
+            account_mask=f"{i:04}",
+            balance=0.0,
+        )
+        account.account_id = f"acct-{i}"
+        accounts[account.account_id] = account
+    return accounts
+
+
+def create_batch(num_rows: int) -> TransactionBatch:
+    transactions = create_transactions(num_rows)
+    for transaction in transactions:
+        # merchants have their own logos
+        merchant = transaction.merchant_name.lower().replace(" ", "-")
+        transaction.merchant_logo_s3_uri = (
+            f"s3://walter-backend-media-dev/public/logos/merchants/{merchant}.png"
+        )
+    return TransactionBatch.from_ddb_items(
+        transaction.to_ddb_item() for transaction in transactions
+    )
+
+
+def main(num_rows: List[int]) -> None:
+    accounts = create_accounts()
+    # warm up the imports and caches of each layout
+    warm_up = GetTransactionsResponseTransactions(accounts, create_batch(100))
+    for layout in TransactionsLayout:
+        json.dumps(warm_up.to_dict(layout))
+
+    print(
+        f"{'rows':>8} {'layout':>11} {'build (s)':>10} {'dumps (s)':>10} "
+        f"{'total (s)':>10} {'speedup':>8} {'bytes':>12} {'saved':>6}"
+    )
+    for n in num_rows:
+        transactions = GetTransactionsResponseTransactions(accounts, create_batch(n))
+        baseline = None
+        for layout in TransactionsLayout:
+            start = time.perf_counter()
+            payload = transactions.to_dict(layout)
+            build_seconds = time.perf_counter() - start
+            start = time.perf_counter()
+            body = json.dumps(payload)
+            dumps_seconds = time.perf_counter() - start
+
+            total_seconds = build_seconds + dumps_seconds
+            if baseline is None:
+                baseline = (total_seconds, len(body))
+            print(
+                f"{n:>8} {layout.value:>11} {build_seconds:>10.4f} "
+                f"{dumps_seconds:>10.4f} {total_seconds:>10.4f} "
+                f"{baseline[0] / total_seconds:>7.1f}x {len(body):>12,} "
+                f"{1 - len(body) / baseline[1]:>6.0%}"
+            )
+
+
+if __name__ == "__main__":
+    main([int(arg) for arg in sys.argv[1:]] or DEFAULT_NUM_ROWS)
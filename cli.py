@@ -3,9 +3,16 @@ from typing import Optional
 
 import typer
 
+from src.ai.mlp.training import (
+    StreamingExpenseCategorizerTrainer,
+    get_export_source,
+    get_transactions_table_source,
+)
 from src.api.routing.router import APIRouter
 from src.canaries.routing.router import CanaryRouter, CanaryType
 from src.database.transactions.models import TransactionType
+from src.environment import AWS_REGION, DOMAIN
+from src.factory import ClientFactory
 from src.utils.log import Logger
 from src.workflows.common.router import WorkflowRouter
 
@@ -491,5 +498,95 @@ def update_prices() -> None:
     log.info(f"WalterCLI: {workflow_name}:\n{json.dumps(response, indent=4)}")
 
 
+@app.command()
+def backfill_transactions_index(
+    max_pages: int = typer.Option(
+        50, help="The number of table pages backfilled per workflow invocation"
+    )
+) -> None:
+    """
+    This CLI command backfills the account security index of the Transactions table.
+
+    The workflow is invoked until the backfill completes, after which holding transaction
+    history can be read from the index by enabling `migrations.holding_transactions_index_enabled`.
+    """
+    workflow_name = "BackfillTransactionsIndex"
+    log.info(f"WalterCLI: {workflow_name}")
+    event: dict = get_workflow_event(workflow_name)
+    event["max_pages"] = max_pages
+    while True:
+        response: dict = (
+            WorkflowRouter()
+            .get_workflow(event)
+            .invoke(event, emit_metrics=False)
+            .to_json()
+        )
+        log.info(f"WalterCLI: {workflow_name}:\n{json.dumps(response, indent=4)}")
+        data = response.get("Data")
+        if data is None or data["complete"]:
+            break
+        event["exclusive_start_key"] = data["last_evaluated_key"]
+
+
+@app.command()
+def reconcile_cash_flow_rollups(
+    user_id: str = typer.Option(
+        None,
+        help="The user to reconcile. Defaults to None which reconciles every user.",
+    ),
+    dry_run: bool = typer.Option(
+        False, help="Report the drifted and stale rollups without writing them"
+    ),
+) -> None:
+    """
+    This CLI command rebuilds the cash flow rollups from the transactions and repairs any drift.
+
+    Run it once to backfill the rollups of existing transactions, after which transaction totals
+    can be read from the rollups by enabling `migrations.cash_flow_rollups_enabled`.
+    """
+    workflow_name = "ReconcileCashFlowRollups"
+    log.info(f"WalterCLI: {workflow_name}")
+    event: dict = get_workflow_event(workflow_name)
+    event["dry_run"] = dry_run
+    if user_id:
+        event["user_id"] = user_id
+    response: dict = (
+        WorkflowRouter().get_workflow(event).invoke(event, emit_metrics=False).to_json()
+    )
+    log.info(f"WalterCLI: {workflow_name}:\n{json.dumps(response, indent=4)}")
+
+
+######
+# AI #
+######
+
+
+@app.command()
+def train_expense_categorizer(
+    export: str = typer.Option(
+        None,
+        help="CSV export with vendor,amount,category columns. Defaults to None which streams the Transactions table.",
+    ),
+    version: str = typer.Option(
+        None, help="The model version, defaults to the current UTC timestamp"
+    ),
+) -> None:
+    """
+    This CLI command retrains the expense categorizer.
+
+    The versioned model artifacts and training report are written to the working directory.
+    """
+    log.info("WalterCLI: TrainExpenseCategorizer")
+    if export:
+        source = get_export_source(export)
+    else:
+        walter_db = ClientFactory(region=AWS_REGION, domain=DOMAIN).get_db_client()
+        source = get_transactions_table_source(walter_db)
+    report = StreamingExpenseCategorizerTrainer().train(source, version)
+    log.info(
+        f"WalterCLI: TrainExpenseCategorizer:\n{json.dumps(report.to_dict(), indent=4)}"
+    )
+
+
 if __name__ == "__main__":
     app()
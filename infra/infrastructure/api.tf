@@ -13,6 +13,8 @@ locals {
     users                 = { parent = "root", path = "users", cors = true },
     accounts              = { parent = "root", path = "accounts", cors = true },
     transactions          = { parent = "root", path = "transactions", cors = true },
+    spending              = { parent = "analytics", path = "spending", cors = true },
+    history               = { parent = "portfolio", path = "history", cors = true },
     create-link-token     = { parent = "plaid", path = "create-link-token", cors = true }
     exchange-public-token = { parent = "plaid", path = "exchange-public-token", cors = true }
     sync-transactions     = { parent = "plaid", path = "sync-transactions", cors = true }
@@ -43,6 +45,12 @@ locals {
     edit_transaction   = { parent = "root", path = "transactions", method = "PUT" },
     delete_transaction = { parent = "root", path = "transactions", method = "DELETE" },
 
+    # analytics endpoints
+    get_spending_analytics = { parent = "analytics", path = "spending", method = "GET" },
+
+    # portfolio endpoints
+    get_portfolio_history = { parent = "portfolio", path = "history", method = "GET" },
+
     # plaid endpoints
     create_link_token     = { parent = "plaid", path = "create-link-token", method = "POST" },
     exchange_public_token = { parent = "plaid", path = "exchange-public-token", method = "POST" },
@@ -51,9 +59,11 @@ locals {
 
   # used as a helper to get api gateway resource id from parent name
   PARENT_TO_RESOURCE_ID = {
-    auth  = aws_api_gateway_resource.auth.id,
-    plaid = aws_api_gateway_resource.plaid.id,
-    root  = module.api.root_resource_id,
+    analytics = aws_api_gateway_resource.analytics.id,
+    auth      = aws_api_gateway_resource.auth.id,
+    plaid     = aws_api_gateway_resource.plaid.id,
+    portfolio = aws_api_gateway_resource.portfolio.id,
+    root      = module.api.root_resource_id,
   }
 
   API_ROLES = {
@@ -73,6 +83,7 @@ locals {
       ]
       delete_access_table_arns       = []
       send_message_access_queue_arns = []
+      s3_access                      = []
     }
 
     logout = {
@@ -91,6 +102,7 @@ locals {
       ]
       delete_access_table_arns       = []
       send_message_access_queue_arns = []
+      s3_access                      = []
     }
 
     refresh = {
@@ -109,6 +121,7 @@ locals {
       ]
       delete_access_table_arns       = []
       send_message_access_queue_arns = []
+      s3_access                      = []
     }
 
     get_user = {
@@ -127,6 +140,7 @@ locals {
       ]
       delete_access_table_arns       = []
       send_message_access_queue_arns = []
+      s3_access                      = []
     }
 
     create_user = {
@@ -141,6 +155,7 @@ locals {
       ]
       delete_access_table_arns       = []
       send_message_access_queue_arns = []
+      s3_access                      = []
     }
 
     update_user = {
@@ -151,10 +166,12 @@ locals {
         module.users_table.table_arn
       ]
       write_access_table_arns = [
-        module.users_table.table_arn
+        module.users_table.table_arn,
+        module.cache_table.table_arn
       ]
       delete_access_table_arns       = []
       send_message_access_queue_arns = []
+      s3_access                      = []
     }
 
     get_accounts = {
@@ -168,13 +185,17 @@ locals {
         module.sessions_table.table_arn,
         module.users_table.table_arn,
         module.holdings_table.table_arn,
-        module.securities_table.table_arn
+        module.securities_table.table_arn,
+        module.cache_table.table_arn
       ]
       write_access_table_arns = [
-        module.accounts_table.table_arn
+        module.accounts_table.table_arn,
+        module.users_table.table_arn,
+        module.cache_table.table_arn
       ]
       delete_access_table_arns       = []
       send_message_access_queue_arns = []
+      s3_access                      = []
     }
 
     create_account = {
@@ -191,10 +212,12 @@ locals {
       write_access_table_arns = [
         module.accounts_table.table_arn,
         module.sessions_table.table_arn,
-        module.users_table.table_arn
+        module.users_table.table_arn,
+        module.cache_table.table_arn
       ]
       delete_access_table_arns       = []
       send_message_access_queue_arns = []
+      s3_access                      = []
     }
 
     update_account = {
@@ -211,10 +234,12 @@ locals {
       write_access_table_arns = [
         module.accounts_table.table_arn,
         module.sessions_table.table_arn,
-        module.users_table.table_arn
+        module.users_table.table_arn,
+        module.cache_table.table_arn
       ]
       delete_access_table_arns       = []
       send_message_access_queue_arns = []
+      s3_access                      = []
     }
 
     delete_account = {
@@ -228,11 +253,16 @@ locals {
         module.sessions_table.table_arn,
         module.users_table.table_arn
       ]
-      write_access_table_arns = []
-      delete_access_table_arns = [
+      write_access_table_arns = [
         module.accounts_table.table_arn,
+        module.users_table.table_arn,
+        module.cache_table.table_arn
       ]
-      send_message_access_queue_arns = []
+      delete_access_table_arns = []
+      send_message_access_queue_arns = [
+        module.queues["purge_account"].queue_arn
+      ]
+      s3_access = []
     }
 
     get_transactions = {
@@ -248,10 +278,16 @@ locals {
         module.holdings_table.table_arn,
         module.securities_table.table_arn,
         module.transactions_table.table_arn,
+        module.cash_flow_rollups_table.table_arn,
+        module.cache_table.table_arn
+      ]
+      write_access_table_arns = [
+        module.users_table.table_arn,
+        module.cache_table.table_arn
       ]
-      write_access_table_arns        = []
       delete_access_table_arns       = []
       send_message_access_queue_arns = []
+      s3_access                      = []
     }
 
     add_transaction = {
@@ -263,13 +299,18 @@ locals {
       read_access_table_arns = [
         module.transactions_table.table_arn,
         module.sessions_table.table_arn,
-        module.users_table.table_arn
+        module.users_table.table_arn,
+        module.cache_table.table_arn
       ]
       write_access_table_arns = [
-        module.transactions_table.table_arn
+        module.transactions_table.table_arn,
+        module.cache_table.table_arn,
+        module.users_table.table_arn,
+        module.cash_flow_rollups_table.table_arn
       ]
       delete_access_table_arns       = []
       send_message_access_queue_arns = []
+      s3_access                      = []
     }
 
     edit_transaction = {
@@ -281,13 +322,18 @@ locals {
       read_access_table_arns = [
         module.transactions_table.table_arn,
         module.sessions_table.table_arn,
-        module.users_table.table_arn
+        module.users_table.table_arn,
+        module.cache_table.table_arn
       ]
       write_access_table_arns = [
         module.transactions_table.table_arn,
+        module.cache_table.table_arn,
+        module.users_table.table_arn,
+        module.cash_flow_rollups_table.table_arn
       ]
       delete_access_table_arns       = []
       send_message_access_queue_arns = []
+      s3_access                      = []
     }
 
     delete_transaction = {
@@ -301,11 +347,63 @@ locals {
         module.sessions_table.table_arn,
         module.users_table.table_arn
       ]
-      write_access_table_arns = []
+      write_access_table_arns = [
+        module.users_table.table_arn,
+        module.cash_flow_rollups_table.table_arn,
+        module.cache_table.table_arn
+      ]
       delete_access_table_arns = [
         module.transactions_table.table_arn
       ]
       send_message_access_queue_arns = []
+      s3_access                      = []
+    }
+
+    get_spending_analytics = {
+      name        = "GetSpendingAnalytics"
+      description = "The role used by the WalterBackend API function to execute the GetSpendingAnalytics API. (${var.domain})"
+      secrets = [
+        module.secrets["Auth"].secret_name
+      ]
+      read_access_table_arns = [
+        module.accounts_table.table_arn,
+        module.sessions_table.table_arn,
+        module.users_table.table_arn,
+        module.transactions_table.table_arn
+      ]
+      write_access_table_arns = [
+        module.users_table.table_arn
+      ]
+      delete_access_table_arns       = []
+      send_message_access_queue_arns = []
+      s3_access                      = []
+    }
+
+    get_portfolio_history = {
+      name        = "GetPortfolioHistory"
+      description = "The role used by the WalterBackend API function to execute the GetPortfolioHistory API. (${var.domain})"
+      secrets = [
+        module.secrets["Auth"].secret_name
+      ]
+      read_access_table_arns = [
+        module.accounts_table.table_arn,
+        module.sessions_table.table_arn,
+        module.users_table.table_arn,
+        module.transactions_table.table_arn,
+        module.securities_table.table_arn
+      ]
+      write_access_table_arns = [
+        module.users_table.table_arn
+      ]
+      delete_access_table_arns       = []
+      send_message_access_queue_arns = []
+      s3_access = [
+        {
+          access_type = "read"
+          bucket_arn  = module.cdn_bucket.bucket_arn
+          prefixes    = ["private/prices/*"]
+        }
+      ]
     }
 
     create_link_token = {
@@ -325,6 +423,7 @@ locals {
       ]
       delete_access_table_arns       = []
       send_message_access_queue_arns = []
+      s3_access                      = []
     }
 
     exchange_public_token = {
@@ -341,12 +440,14 @@ locals {
       write_access_table_arns = [
         module.sessions_table.table_arn,
         module.users_table.table_arn,
-        module.accounts_table.table_arn
+        module.accounts_table.table_arn,
+        module.cache_table.table_arn
       ]
       delete_access_table_arns = []
       send_message_access_queue_arns = [
         module.queues["sync_transactions"].queue_arn
       ]
+      s3_access = []
     }
 
     sync_transactions = {
@@ -370,6 +471,7 @@ locals {
       send_message_access_queue_arns = [
         module.queues["sync_transactions"].queue_arn
       ]
+      s3_access = []
     }
   }
 }
@@ -414,6 +516,18 @@ resource "aws_api_gateway_resource" "plaid" {
   path_part   = "plaid"
 }
 
+resource "aws_api_gateway_resource" "analytics" {
+  rest_api_id = module.api.api_id
+  parent_id   = module.api.root_resource_id
+  path_part   = "analytics"
+}
+
+resource "aws_api_gateway_resource" "portfolio" {
+  rest_api_id = module.api.api_id
+  parent_id   = module.api.root_resource_id
+  path_part   = "portfolio"
+}
+
 module "resources" {
   for_each           = local.RESOURCES
   source             = "./modules/api_gateway_resource"
@@ -424,8 +538,10 @@ module "resources" {
 
   # add explicit dependencies to the required prerequisite resources
   depends_on = [
+    aws_api_gateway_resource.analytics,
     aws_api_gateway_resource.auth,
-    aws_api_gateway_resource.plaid
+    aws_api_gateway_resource.plaid,
+    aws_api_gateway_resource.portfolio
   ]
 }
 
@@ -466,6 +582,7 @@ module "api_roles" {
   write_table_access_arns        = each.value.write_access_table_arns
   delete_table_access_arns       = each.value.delete_access_table_arns
   send_message_access_queue_arns = each.value.send_message_access_queue_arns
+  s3_access                      = each.value.s3_access
   api_base_role                  = module.api_base_role.arn
   assume_api_role_principals     = var.api_assume_role_additional_principals
 }
@@ -135,7 +135,8 @@ locals {
       write_table_access_arns = [
         module.users_table.table_arn,
         module.sessions_table.table_arn,
-        module.transactions_table.table_arn
+        module.transactions_table.table_arn,
+        module.cash_flow_rollups_table.table_arn
       ]
       delete_table_access_arns = []
     }
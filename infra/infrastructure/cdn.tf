@@ -28,6 +28,13 @@ module "cdn_bucket" {
       principals = [
         module.workflow_roles["sync_transactions"].role_arn
       ]
+    },
+    {
+      prefix = "private/prices/*"
+      principals = [
+        module.workflow_roles["update_security_prices"].role_arn,
+        module.api_roles["get_portfolio_history"].role_arn
+      ]
     }
   ]
   write_access_principals = [
@@ -42,6 +49,12 @@ module "cdn_bucket" {
       principals = [
         module.workflow_roles["sync_transactions"].role_arn
       ]
+    },
+    {
+      prefix = "private/prices/*"
+      principals = [
+        module.workflow_roles["update_security_prices"].role_arn
+      ]
     }
   ]
   delete_access_principals = [
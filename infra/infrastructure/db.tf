@@ -1,17 +1,21 @@
 locals {
-  USERS_TABLE        = "Users-${var.domain}"
-  SESSIONS_TABLE     = "Sessions-${var.domain}"
-  ACCOUNTS_TABLE     = "Accounts-${var.domain}"
-  TRANSACTIONS_TABLE = "Transactions-${var.domain}"
-  SECURITIES_TABLE   = "Securities-${var.domain}"
-  HOLDINGS_TABLE     = "Holdings-${var.domain}"
-
-  USERS_EMAIL_INDEX                     = "Users-EmailIndex-${var.domain}"
-  ACCOUNTS_PLAID_ACCOUNT_ID_INDEX       = "Accounts-PlaidAccountIdIndex-${var.domain}"
-  ACCOUNTS_PLAID_ITEM_ID_INDEX          = "Accounts-PlaidItemIdIndex-${var.domain}"
-  TRANSACTIONS_USER_DATE_RANGE_INDEX    = "Transactions-UserDateRangeIndex-${var.domain}"
-  TRANSACTIONS_ACCOUNT_DATE_RANGE_INDEX = "Transactions-AccountDateRangeIndex-${var.domain}"
-  SECURITIES_TICKER_INDEX               = "Securities-TickerIndex-${var.domain}"
+  USERS_TABLE             = "Users-${var.domain}"
+  SESSIONS_TABLE          = "Sessions-${var.domain}"
+  ACCOUNTS_TABLE          = "Accounts-${var.domain}"
+  TRANSACTIONS_TABLE      = "Transactions-${var.domain}"
+  SECURITIES_TABLE        = "Securities-${var.domain}"
+  HOLDINGS_TABLE          = "Holdings-${var.domain}"
+  CACHE_TABLE             = "Cache-${var.domain}"
+  CASH_FLOW_ROLLUPS_TABLE = "CashFlowRollups-${var.domain}"
+
+  USERS_EMAIL_INDEX                       = "Users-EmailIndex-${var.domain}"
+  ACCOUNTS_PLAID_ACCOUNT_ID_INDEX         = "Accounts-PlaidAccountIdIndex-${var.domain}"
+  ACCOUNTS_PLAID_ITEM_ID_INDEX            = "Accounts-PlaidItemIdIndex-${var.domain}"
+  TRANSACTIONS_USER_DATE_RANGE_INDEX      = "Transactions-UserDateRangeIndex-${var.domain}"
+  TRANSACTIONS_ACCOUNT_DATE_RANGE_INDEX   = "Transactions-AccountDateRangeIndex-${var.domain}"
+  TRANSACTIONS_PLAID_TRANSACTION_ID_INDEX = "Transactions-PlaidTransactionIdIndex-${var.domain}"
+  TRANSACTIONS_ACCOUNT_SECURITY_INDEX     = "Transactions-AccountSecurityDateRangeIndex-${var.domain}"
+  SECURITIES_TICKER_INDEX                 = "Securities-TickerIndex-${var.domain}"
 }
 
 /*******************
@@ -102,6 +106,15 @@ module "accounts_table" {
 #        - Keys: account_id + transaction_date
 #        - Enables fast queries for all account transactions over a date range
 #
+#   3. TRANSACTIONS_ACCOUNT_SECURITY_INDEX
+#        - Keys: account_security_id (account_id#security_id, sparse) + transaction_date
+#        - Reads the transaction history of a single holding; existing rows are
+#          backfilled by the BackfillTransactionsIndex workflow
+#
+#   4. TRANSACTIONS_PLAID_TRANSACTION_ID_INDEX
+#        - Keys: plaid_transaction_id (sparse, keys only)
+#        - Resolves modified and removed Plaid transactions to their primary keys
+#
 # Design Rationale:
 #   - Primary key (user_id + transaction_id) provides strong entity linkage.
 #   - GSIs support the main access patterns:
@@ -118,10 +131,12 @@ module "transactions_table" {
   range_key = "transaction_id"
 
   attributes = {
-    user_id          = "S"
-    account_id       = "S"
-    transaction_id   = "S"
-    transaction_date = "S"
+    user_id              = "S"
+    account_id           = "S"
+    transaction_id       = "S"
+    transaction_date     = "S"
+    account_security_id  = "S"
+    plaid_transaction_id = "S"
   }
 
   global_secondary_indexes = [
@@ -134,6 +149,16 @@ module "transactions_table" {
       name      = local.TRANSACTIONS_ACCOUNT_DATE_RANGE_INDEX
       hash_key  = "account_id"
       range_key = "transaction_date"
+    },
+    {
+      name      = local.TRANSACTIONS_ACCOUNT_SECURITY_INDEX
+      hash_key  = "account_security_id"
+      range_key = "transaction_date"
+    },
+    {
+      name            = local.TRANSACTIONS_PLAID_TRANSACTION_ID_INDEX
+      hash_key        = "plaid_transaction_id"
+      projection_type = "KEYS_ONLY"
     }
   ]
 }
@@ -168,4 +193,47 @@ module "holdings_table" {
     account_id  = "S"
     security_id = "S"
   }
-}
\ No newline at end of file
+}
+
+module "cache_table" {
+  source = "./modules/dynamodb_table"
+
+  name     = local.CACHE_TABLE
+  hash_key = "cache_key"
+
+  attributes = {
+    cache_key = "S"
+  }
+
+  ttl = {
+    attribute_name = "ttl"
+    enabled        = true
+  }
+}
+
+# ------------------------------------------------------------------------------
+# DynamoDB: CashFlowRollups Table
+# ------------------------------------------------------------------------------
+# Primary Key:
+#   - Partition key: owner_id (user#<user_id> or account#<account_id>)
+#   - Sort key:      bucket (M#YYYY-MM or D#YYYY-MM-DD)
+#
+# Purpose:
+#   Stores the monthly and daily income, expense, transaction count, and
+#   per-category totals of each user and account. Rollups are updated
+#   incrementally by transaction writes and rebuilt from the raw transactions
+#   by the ReconcileCashFlowRollups workflow.
+# ------------------------------------------------------------------------------
+
+module "cash_flow_rollups_table" {
+  source = "./modules/dynamodb_table"
+
+  name      = local.CASH_FLOW_ROLLUPS_TABLE
+  hash_key  = "owner_id"
+  range_key = "bucket"
+
+  attributes = {
+    owner_id = "S"
+    bucket   = "S"
+  }
+}
@@ -56,6 +56,15 @@ locals {
       input = jsonencode({
         workflow_name = "UpdateSecurityPrices"
       })
+    },
+    reconcile_cash_flow_rollups = {
+      name                = "WalterBackend-ReconcileCashFlowRollups-Schedule-${var.domain}"
+      description         = "The schedule to invoke the ReconcileCashFlowRollups workflow (${var.domain})."
+      function_arn        = module.functions["workflow"].function_arn
+      schedule_expression = "cron(0 8 * * ? *)"
+      input = jsonencode({
+        workflow_name = "ReconcileCashFlowRollups"
+      })
     }
   }
 
@@ -66,6 +75,12 @@ locals {
       maximum_concurrency = var.sync_transactions_max_concurrency
       max_retry_attempts  = var.sync_transactions_max_retry_attempts
     }
+    purge_account = {
+      function_name       = local.FUNCTIONS.workflow.name,
+      queue_arn           = module.queues["purge_account"].queue_arn,
+      maximum_concurrency = var.purge_account_max_concurrency
+      max_retry_attempts  = var.purge_account_max_retry_attempts
+    }
   }
 }
 
@@ -2,6 +2,10 @@ resource "aws_api_gateway_rest_api" "api" {
   name        = var.name
   description = var.description
 
+  # decode base64 encoded Lambda responses, i.e. compressed bodies, into
+  # binary and base64 encode request bodies before invoking the Lambda
+  binary_media_types = ["*/*"]
+
   endpoint_configuration {
     types = ["EDGE"]
   }
@@ -3,6 +3,7 @@ locals {
   API_ROLE_SECRETS_ACCESS_POLICY_NAME = "WalterBackend-API-${var.name}-Secrets-Policy-${var.domain}"
   API_ROLE_DB_ACCESS_POLICY_NAME      = "WalterBackend-API-${var.name}-DB-Policy-${var.domain}"
   API_ROLE_SQS_ACCESS_POLICY_NAME     = "WalterBackend-API-${var.name}-SQS-Policy-${var.domain}"
+  API_ROLE_S3_ACCESS_POLICY_NAME      = "WalterBackend-API-${var.name}-S3-Policy-${var.domain}"
 }
 
 resource "aws_iam_role" "api_iam_role" {
@@ -70,4 +71,23 @@ module "api_iam_role_sqs_access" {
   access_type = "producer"
 }
 
+resource "aws_iam_role_policy_attachment" "s3_access_attachment" {
+  count      = length(var.s3_access) > 0 ? 1 : 0
+  role       = aws_iam_role.api_iam_role.name
+  policy_arn = module.api_iam_role_s3_access[0].policy_arn
+}
 
+module "api_iam_role_s3_access" {
+  count       = length(var.s3_access) > 0 ? 1 : 0
+  source      = "../iam_s3_access_policy"
+  policy_name = local.API_ROLE_S3_ACCESS_POLICY_NAME
+  read_access_bucket_prefixes = flatten([
+    for s in var.s3_access : (s.access_type == "read" ? [for p in s.prefixes : "${s.bucket_arn}/${p}"] : [])
+  ])
+  write_access_bucket_prefixes = flatten([
+    for s in var.s3_access : (s.access_type == "write" ? [for p in s.prefixes : "${s.bucket_arn}/${p}"] : [])
+  ])
+  delete_access_bucket_prefixes = flatten([
+    for s in var.s3_access : (s.access_type == "delete" ? [for p in s.prefixes : "${s.bucket_arn}/${p}"] : [])
+  ])
+}
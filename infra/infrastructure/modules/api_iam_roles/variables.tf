@@ -43,6 +43,20 @@ variable "send_message_access_queue_arns" {
   type        = list(string)
 }
 
+variable "s3_access" {
+  description = "The S3 bucket prefixes that the API requires read, write, or delete access to."
+  type = list(object({
+    access_type = string
+    bucket_arn  = string
+    prefixes    = list(string)
+  }))
+
+  validation {
+    condition     = alltrue([for s in var.s3_access : contains(["read", "write", "delete"], s.access_type)])
+    error_message = "access_type must be one of: read, write, delete"
+  }
+}
+
 variable "api_base_role" {
   description = "The IAM role used by the WalterBackend API function to assume the more specific API roles after routing."
   type        = string
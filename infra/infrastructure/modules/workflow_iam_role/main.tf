@@ -3,6 +3,7 @@ locals {
   WORKFLOW_SECRETS_ACCESS_POLICY_NAME = "WalterBackend-Workflow-${var.name}-Secrets-Policy-${var.domain}"
   WORKFLOW_DB_ACCESS_POLICY_NAME      = "WalterBackend-Workflow-${var.name}-DB-Policy-${var.domain}"
   WORKFLOW_SQS_ACCESS_POLICY_NAME     = "WalterBackend-Workflow-${var.name}-SQS-Policy-${var.domain}"
+  WORKFLOW_SQS_SEND_POLICY_NAME       = "WalterBackend-Workflow-${var.name}-SQS-Send-Policy-${var.domain}"
   WORKFLOW_S3_ACCESS_POLICY_NAME      = "WalterBackend-Workflow-${var.name}-S3-Policy-${var.domain}"
 }
 
@@ -71,6 +72,20 @@ module "workflow_role_sqs_access" {
   access_type = "consumer"
 }
 
+resource "aws_iam_role_policy_attachment" "sqs_send_access_attachment" {
+  count      = length(var.send_message_access_queue_arns) > 0 ? 1 : 0
+  role       = aws_iam_role.workflow_role.name
+  policy_arn = module.workflow_role_sqs_send_access[0].policy_arn
+}
+
+module "workflow_role_sqs_send_access" {
+  count       = length(var.send_message_access_queue_arns) > 0 ? 1 : 0
+  source      = "../iam_sqs_queue_access_policy"
+  name        = local.WORKFLOW_SQS_SEND_POLICY_NAME
+  queue_arns  = var.send_message_access_queue_arns
+  access_type = "producer"
+}
+
 resource "aws_iam_role_policy_attachment" "s3_access_attachment" {
   count      = length(var.s3_access) > 0 ? 1 : 0
   role       = aws_iam_role.workflow_role.name
@@ -43,6 +43,12 @@ variable "receive_message_access_queue_arns" {
   type        = list(string)
 }
 
+variable "send_message_access_queue_arns" {
+  description = "The ARN(s) of the SQS queues that the workflow can send messages to, e.g. to resume unfinished tasks."
+  type        = list(string)
+  default     = []
+}
+
 variable "workflow_base_role" {
   description = "The IAM role used by the WalterBackend workflow function to assume the more specific workflow roles after routing."
   type        = string
@@ -1,6 +1,7 @@
 locals {
   QUEUES = {
     sync_transactions = { name = "SyncTransactions", max_retries = var.sync_transactions_max_retry_attempts }
+    purge_account     = { name = "PurgeAccount", max_retries = var.purge_account_max_retry_attempts }
   }
 }
 
@@ -239,6 +239,28 @@ variable "sync_transactions_max_retry_attempts" {
   }
 }
 
+variable "purge_account_max_concurrency" {
+  description = "The maximum number of concurrent Lambdas allowed to process purge account events."
+  type        = number
+  default     = 2
+
+  validation {
+    condition     = var.purge_account_max_concurrency >= 2 && var.purge_account_max_concurrency <= 1000
+    error_message = "The purge_account_max_concurrency must be between 2 and 1000."
+  }
+}
+
+variable "purge_account_max_retry_attempts" {
+  description = "The maximum number of times to retry purge account tasks before delivering them to the dead-letter queue."
+  type        = number
+  default     = 3
+
+  validation {
+    condition     = var.purge_account_max_retry_attempts >= 1 && var.purge_account_max_retry_attempts <= 10
+    error_message = "The purge_account_max_retry_attempts must be between 1 and 10."
+  }
+}
+
 variable "cdn_bucket_access_additional_principals" {
   description = "The list of additional AWS principal(s) allowed to access the CDN S3 bucket."
   type        = list(string)
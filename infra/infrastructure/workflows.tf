@@ -7,14 +7,29 @@ locals {
         module.secrets["Polygon"].secret_name
       ]
       read_access_table_arns = [
-        module.securities_table.table_arn
+        module.securities_table.table_arn,
+        module.holdings_table.table_arn,
+        module.cache_table.table_arn
       ]
       write_access_table_arns = [
-        module.securities_table.table_arn
+        module.securities_table.table_arn,
+        module.cache_table.table_arn
       ]
       delete_access_table_arns   = []
       receive_message_queue_arns = []
-      s3_access                  = []
+      send_message_queue_arns    = []
+      s3_access = [
+        {
+          access_type = "read"
+          bucket_arn  = module.cdn_bucket.bucket_arn
+          prefixes    = ["private/prices/*"]
+        },
+        {
+          access_type = "write"
+          bucket_arn  = module.cdn_bucket.bucket_arn
+          prefixes    = ["private/prices/*"]
+        }
+      ]
       principals = [
         var.workflow_assume_role_additional_principals
       ]
@@ -34,23 +49,133 @@ locals {
       write_access_table_arns = [
         module.users_table.table_arn,
         module.accounts_table.table_arn,
+        module.transactions_table.table_arn,
+        module.cash_flow_rollups_table.table_arn,
+        module.cache_table.table_arn
+      ]
+      delete_access_table_arns = [
         module.transactions_table.table_arn
       ]
-      delete_access_table_arns = []
       receive_message_queue_arns = [
         module.queues["sync_transactions"].queue_arn
       ]
+      send_message_queue_arns = []
       s3_access = [
+        {
+          access_type = "read"
+          bucket_arn  = module.cdn_bucket.bucket_arn
+          prefixes    = ["public/logos/*", "private/manifests/*"]
+        },
         {
           access_type = "write"
           bucket_arn  = module.cdn_bucket.bucket_arn
-          prefixes    = ["public/logos/*"]
+          prefixes    = ["public/logos/*", "private/manifests/*"]
         }
       ]
       principals = [
         var.workflow_assume_role_additional_principals
       ]
     }
+
+    backfill_transactions_index = {
+      name        = "BackfillTransactionsIndex"
+      description = "The role that is assumed by the WalterBackend Workflow function to execute the BackfillTransactionsIndex workflow. (${var.domain})"
+      secrets     = []
+      read_access_table_arns = [
+        module.transactions_table.table_arn
+      ]
+      write_access_table_arns = [
+        module.transactions_table.table_arn
+      ]
+      delete_access_table_arns   = []
+      receive_message_queue_arns = []
+      send_message_queue_arns    = []
+      s3_access                  = []
+      principals = [
+        var.workflow_assume_role_additional_principals
+      ]
+    }
+
+    rebuild_holdings = {
+      name        = "RebuildHoldings"
+      description = "The role that is assumed by the WalterBackend Workflow function to execute the RebuildHoldings workflow. (${var.domain})"
+      secrets     = []
+      read_access_table_arns = [
+        module.accounts_table.table_arn,
+        module.transactions_table.table_arn,
+        module.holdings_table.table_arn
+      ]
+      write_access_table_arns = [
+        module.holdings_table.table_arn,
+        module.cache_table.table_arn
+      ]
+      delete_access_table_arns = [
+        module.holdings_table.table_arn
+      ]
+      receive_message_queue_arns = []
+      send_message_queue_arns    = []
+      s3_access                  = []
+      principals = [
+        var.workflow_assume_role_additional_principals
+      ]
+    }
+
+    purge_account = {
+      name        = "PurgeAccount"
+      description = "The role that is assumed by the WalterBackend Workflow function to execute the PurgeAccount workflow. (${var.domain})"
+      secrets     = []
+      read_access_table_arns = [
+        module.accounts_table.table_arn,
+        module.transactions_table.table_arn,
+        module.holdings_table.table_arn,
+        module.cash_flow_rollups_table.table_arn
+      ]
+      write_access_table_arns = [
+        module.accounts_table.table_arn,
+        module.cash_flow_rollups_table.table_arn,
+        module.cache_table.table_arn
+      ]
+      delete_access_table_arns = [
+        module.accounts_table.table_arn,
+        module.transactions_table.table_arn,
+        module.holdings_table.table_arn,
+        module.cash_flow_rollups_table.table_arn
+      ]
+      receive_message_queue_arns = [
+        module.queues["purge_account"].queue_arn
+      ]
+      send_message_queue_arns = [
+        module.queues["purge_account"].queue_arn
+      ]
+      s3_access = []
+      principals = [
+        var.workflow_assume_role_additional_principals
+      ]
+    }
+
+    reconcile_cash_flow_rollups = {
+      name        = "ReconcileCashFlowRollups"
+      description = "The role that is assumed by the WalterBackend Workflow function to execute the ReconcileCashFlowRollups workflow. (${var.domain})"
+      secrets     = []
+      read_access_table_arns = [
+        module.users_table.table_arn,
+        module.accounts_table.table_arn,
+        module.transactions_table.table_arn,
+        module.cash_flow_rollups_table.table_arn
+      ]
+      write_access_table_arns = [
+        module.cash_flow_rollups_table.table_arn
+      ]
+      delete_access_table_arns = [
+        module.cash_flow_rollups_table.table_arn
+      ]
+      receive_message_queue_arns = []
+      send_message_queue_arns    = []
+      s3_access                  = []
+      principals = [
+        var.workflow_assume_role_additional_principals
+      ]
+    }
   }
 }
 
@@ -66,7 +191,7 @@ module "workflow_base_role" {
   description                       = "The IAM role used by the WalterBackend Workflow function to assume execution roles. (${var.domain})"
   assumable_entities                = [for role in local.WORKFLOW_ROLES : role.name]
   kms_key_arns                      = [module.env_vars_key.arn]
-  receive_message_queue_access_arns = [module.queues["sync_transactions"].queue_arn]
+  receive_message_queue_access_arns = [module.queues["sync_transactions"].queue_arn, module.queues["purge_account"].queue_arn]
 }
 
 module "workflow_roles" {
@@ -81,6 +206,7 @@ module "workflow_roles" {
   write_table_access_arns           = each.value.write_access_table_arns
   delete_table_access_arns          = each.value.delete_access_table_arns
   receive_message_access_queue_arns = each.value.receive_message_queue_arns
+  send_message_access_queue_arns    = each.value.send_message_queue_arns
   workflow_base_role                = module.workflow_base_role.arn
   additional_principals             = var.workflow_assume_role_additional_principals
 }
@@ -0,0 +1,92 @@
+import os
+from dataclasses import dataclass
+from typing import Optional
+
+from src.aws.sqs.client import WalterSQSClient
+from src.utils.log import Logger
+
+LOG = Logger(__name__).get_logger()
+
+
+@dataclass
+class PurgeAccountTask:
+    """
+    PurgeAccount Task
+
+    A task to purge the transactions and holdings of an account being deleted.
+    Tasks carry the purge progress so an unfinished purge can be resumed by
+    a follow-up task from where the previous one left off.
+    """
+
+    # PurgeAccount tasks are processed by the PurgeAccount workflow
+    WORKFLOW_NAME = "PurgeAccount"
+
+    user_id: str
+    account_id: str
+    exclusive_start_key: Optional[dict] = None
+    num_deleted_transactions: int = 0
+    num_runs: int = 0
+
+    def to_dict(self) -> dict:
+        return {
+            "workflow_name": self.WORKFLOW_NAME,
+            "user_id": self.user_id,
+            "account_id": self.account_id,
+            "exclusive_start_key": self.exclusive_start_key,
+            "num_deleted_transactions": self.num_deleted_transactions,
+            "num_runs": self.num_runs,
+        }
+
+    @classmethod
+    def from_dict(cls, task: dict) -> "PurgeAccountTask":
+        return PurgeAccountTask(
+            user_id=task["user_id"],
+            account_id=task["account_id"],
+            exclusive_start_key=task.get("exclusive_start_key"),
+            num_deleted_transactions=task.get("num_deleted_transactions", 0),
+            num_runs=task.get("num_runs", 0),
+        )
+
+
+@dataclass
+class PurgeAccountTaskQueue:
+    """
+    PurgeAccount Task Queue
+    """
+
+    # the queue name format must stay in sync with terraform to ensure proper queue url
+    QUEUE_NAME_FORMAT = "WalterBackend-PurgeAccount-Queue-{domain}"
+    QUEUE_URL_FORMAT = "https://sqs.{region}.amazonaws.com/{account_id}/{queue_name}"
+
+    client: WalterSQSClient
+
+    # the queue url is set during post-init
+    queue_url: str = None
+
+    def __post_init__(self) -> None:
+        self.queue_url = PurgeAccountTaskQueue.QUEUE_URL_FORMAT.format(
+            region=self.client.client.meta.region_name,
+            account_id=os.getenv("AWS_ACCOUNT_ID", "010526272437"),
+            queue_name=PurgeAccountTaskQueue.QUEUE_NAME_FORMAT.format(
+                domain=self.client.domain.value
+            ),
+        )
+        LOG.debug(f"Initializing PurgeAccountQueue with queue URL: '{self.queue_url}'")
+
+    def add_task(self, task: PurgeAccountTask) -> str:
+        """
+        Adds a PurgeAccount task to the queue.
+
+        Args:
+            task (PurgeAccountTask): The task to be added to the queue.
+
+        Returns:
+            str: The ID of the added task message in the queue.
+        """
+        LOG.info(f"Adding PurgeAccount task for account '{task.account_id}' to queue")
+        LOG.debug(f"PurgeAccountTask:\n{task}")
+        message_id = self.client.send_message(
+            queue_url=self.queue_url, message=task.to_dict()
+        )
+        LOG.info(f"Added PurgeAccount task to queue with ID: '{message_id}'")
+        return message_id
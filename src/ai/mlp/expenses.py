@@ -1,15 +1,12 @@
+import os
 from dataclasses import dataclass
-from typing import List
+from typing import Optional
 
 import joblib
 import numpy as np
-from sklearn.compose import ColumnTransformer
-from sklearn.model_selection import train_test_split
-from sklearn.neural_network import MLPClassifier
 from sklearn.pipeline import Pipeline
-from sklearn.preprocessing import LabelEncoder, OneHotEncoder, StandardScaler
+from sklearn.preprocessing import LabelEncoder
 
-from src.config import CONFIG
 from src.database.transactions.models import TransactionCategory
 from src.utils.log import Logger
 
@@ -27,13 +24,17 @@ class ExpenseCategorizerMLP:
     as they are added to WalterDB. The expense categorization
     logic is powered by a multilayer perceptron model trained
     on user expense data. The model is trained ahead of time
-    and lazily loaded during categorization.
+    by the `StreamingExpenseCategorizerTrainer` and lazily
+    loaded during categorization. If a model version is
+    given, the artifacts for that version are loaded.
+    The pickled pipeline only references the featurizer
+    module, so loading it does not import the trainer.
     """
 
-    HIDDEN_LAYER_SIZES = CONFIG.expense_categorization.num_hidden_layers
     LABEL_ENCODER_FILE_NAME = "expense_category_encoder.pkl"
     PIPELINE_FILE_NAME = "expense_categorization_pipeline.pkl"
 
+    model_version: Optional[str] = None
     expense_category_encoder: LabelEncoder = None  # lazy init
     expense_categorization_pipeline: Pipeline = None  # lazy init
 
@@ -76,47 +77,22 @@ class ExpenseCategorizerMLP:
 
         return expense_category
 
-    def train(
-        self, vendors: List[str], amounts: List[float], categories: List[str]
-    ) -> None:
-        log.info("Training expense categorizer...")
-        features = np.array(list(zip(amounts, vendors)), dtype=object)
-        targets = np.array(categories)
-        label_encoder = LabelEncoder()
-        targets_encoded = label_encoder.fit_transform(targets)
-        preprocessor = ColumnTransformer(
-            transformers=[
-                ("num", StandardScaler(), [0]),  # 'amount'
-                ("cat", OneHotEncoder(handle_unknown="ignore"), [1]),  # 'vendor'
-            ]
-        )
-        pipeline = Pipeline(
-            [
-                ("preprocessor", preprocessor),
-                (
-                    "mlp",
-                    MLPClassifier(
-                        hidden_layer_sizes=(ExpenseCategorizerMLP.HIDDEN_LAYER_SIZES,),
-                        max_iter=300,
-                        solver="adam",
-                        random_state=1,
-                    ),
-                ),
-            ]
-        )
-        features_train, features_test, targets_train, targets_test = train_test_split(
-            features, targets_encoded, test_size=0.2, random_state=42
-        )
-        pipeline.fit(features_train, targets_train)
-        joblib.dump(label_encoder, ExpenseCategorizerMLP.LABEL_ENCODER_FILE_NAME)
-        joblib.dump(pipeline, ExpenseCategorizerMLP.PIPELINE_FILE_NAME)
+    @staticmethod
+    def get_versioned_file_name(file_name: str, version: Optional[str]) -> str:
+        """Get the artifact file name for the given model version, if any."""
+        if version is None:
+            return file_name
+        stem, extension = os.path.splitext(file_name)
+        return f"{stem}-{version}{extension}"
 
     def _init_label_encoder(self) -> None:
         """Lazily initialize the expense category encoder."""
         if self.expense_category_encoder is None:
             log.debug("Loading expense category encoder...")
             self.expense_category_encoder = joblib.load(
-                ExpenseCategorizerMLP.LABEL_ENCODER_FILE_NAME
+                ExpenseCategorizerMLP.get_versioned_file_name(
+                    ExpenseCategorizerMLP.LABEL_ENCODER_FILE_NAME, self.model_version
+                )
             )
 
     def _init_pipeline(self) -> None:
@@ -124,5 +100,7 @@ class ExpenseCategorizerMLP:
         if self.expense_categorization_pipeline is None:
             log.debug("Loading expense categorization pipeline...")
             self.expense_categorization_pipeline = joblib.load(
-                ExpenseCategorizerMLP.PIPELINE_FILE_NAME
+                ExpenseCategorizerMLP.get_versioned_file_name(
+                    ExpenseCategorizerMLP.PIPELINE_FILE_NAME, self.model_version
+                )
             )
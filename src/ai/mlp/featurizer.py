@@ -0,0 +1,50 @@
+import re
+from typing import List
+
+import numpy as np
+from scipy import sparse
+from sklearn.base import BaseEstimator, TransformerMixin
+from sklearn.feature_extraction import FeatureHasher
+
+
+class HashedExpenseFeaturizer(BaseEstimator, TransformerMixin):
+    """
+    Hashed Expense Featurizer
+
+    Stateless featurizer mapping `[amount, vendor]` rows to a fixed-width
+    sparse matrix. Vendor names are hashed into `n_features` buckets so the
+    feature space (and model size) does not grow with every new merchant,
+    and the amount is represented by its signed log magnitude so no fitted
+    scaling statistics are required. Being stateless, the featurizer can be
+    applied to each minibatch independently during streaming training.
+    """
+
+    VENDOR_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+    def __init__(self, n_features: int = 4096) -> None:
+        self.n_features = n_features
+
+    def fit(self, features, targets=None) -> "HashedExpenseFeaturizer":
+        return self
+
+    def transform(self, features) -> sparse.csr_matrix:
+        features = np.asarray(features, dtype=object)
+        amounts = features[:, 0].astype(float)
+        vendor_tokens = [
+            HashedExpenseFeaturizer._tokenize(vendor) for vendor in features[:, 1]
+        ]
+        hasher = FeatureHasher(
+            n_features=self.n_features, input_type="string", alternate_sign=False
+        )
+        vendor_features = hasher.transform(vendor_tokens)
+        amount_features = sparse.csr_matrix(
+            np.column_stack([np.log1p(np.abs(amounts)), np.sign(amounts)])
+        )
+        return sparse.hstack([vendor_features, amount_features], format="csr")
+
+    @staticmethod
+    def _tokenize(vendor: str) -> List[str]:
+        vendor = str(vendor).lower().strip()
+        tokens = HashedExpenseFeaturizer.VENDOR_TOKEN_PATTERN.findall(vendor)
+        # include the full vendor name so exact merchant matches stay distinct
+        return [f"vendor={vendor}"] + [f"token={token}" for token in tokens]
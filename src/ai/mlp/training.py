@@ -0,0 +1,252 @@
+import csv
+import datetime as dt
+import json
+import time
+from dataclasses import dataclass
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
+
+import joblib
+import numpy as np
+from sklearn.neural_network import MLPClassifier
+from sklearn.pipeline import Pipeline
+from sklearn.preprocessing import LabelEncoder
+
+from src.ai.mlp.expenses import ExpenseCategorizerMLP
+from src.ai.mlp.featurizer import HashedExpenseFeaturizer
+from src.config import CONFIG
+from src.database.client import WalterDB
+from src.database.transactions.models import BankTransaction, TransactionCategory
+from src.utils.log import Logger
+
+log = Logger(__name__).get_logger()
+
+LabeledExpense = Tuple[str, float, str]
+"""(LabeledExpense): A labeled training example of (vendor, amount, category)."""
+
+LabeledExpenseSource = Callable[[], Iterable[LabeledExpense]]
+"""(LabeledExpenseSource): Callable returning a fresh stream of labeled expenses per pass."""
+
+
+@dataclass
+class TrainingReport:
+    """
+    Training Report
+
+    Accuracy and throughput summary of a streaming training run.
+    """
+
+    version: str
+    num_epochs: int
+    num_batches: int
+    num_training_samples: int
+    num_holdout_samples: int
+    num_skipped_samples: int
+    holdout_accuracy: Optional[float]
+    training_seconds: float
+    samples_per_second: float
+
+    def to_dict(self) -> dict:
+        return {
+            "version": self.version,
+            "num_epochs": self.num_epochs,
+            "num_batches": self.num_batches,
+            "num_training_samples": self.num_training_samples,
+            "num_holdout_samples": self.num_holdout_samples,
+            "num_skipped_samples": self.num_skipped_samples,
+            "holdout_accuracy": self.holdout_accuracy,
+            "training_seconds": self.training_seconds,
+            "samples_per_second": self.samples_per_second,
+        }
+
+
+@dataclass
+class StreamingExpenseCategorizerTrainer:
+    """
+    WalterAI: Streaming Expense Categorizer Trainer
+
+    This class trains the expense categorizer MLP from a stream of labeled
+    expenses in fixed-size minibatches via `MLPClassifier.partial_fit`. Only
+    a single minibatch is held in memory at a time and vendors are hashed
+    into a fixed-width feature space, so retraining on the full transaction
+    history fits in Lambda-sized memory. Every `holdout_every`-th labeled
+    expense is held out of training and used to report accuracy.
+
+    The trained artifacts are compatible with `ExpenseCategorizerMLP` and
+    are written with a version suffix alongside a JSON training report.
+    """
+
+    REPORT_FILE_NAME = "expense_categorization_report.json"
+
+    num_hidden_layers: int = CONFIG.expense_categorization.num_hidden_layers
+    num_hashed_features: int = CONFIG.expense_categorization.num_hashed_features
+    batch_size: int = CONFIG.expense_categorization.training_batch_size
+    num_epochs: int = CONFIG.expense_categorization.training_epochs
+    holdout_every: int = CONFIG.expense_categorization.holdout_every
+
+    def __post_init__(self) -> None:
+        log.debug("Creating StreamingExpenseCategorizerTrainer...")
+
+    def train(
+        self, source: LabeledExpenseSource, version: Optional[str] = None
+    ) -> TrainingReport:
+        """
+        Train the expense categorizer from the given labeled expense stream.
+
+        Args:
+            source: Callable returning a fresh iterable of labeled expenses,
+                invoked once per epoch and once more for evaluation.
+            version: The artifact version, defaults to the current UTC timestamp.
+
+        Returns:
+            The training report for the run.
+        """
+        if version is None:
+            version = dt.datetime.now(dt.UTC).strftime("%Y%m%d%H%M%S")
+        log.info(f"Training expense categorizer version '{version}'...")
+
+        label_encoder = LabelEncoder().fit(
+            [category.value for category in TransactionCategory]
+        )
+        classes = np.arange(len(label_encoder.classes_))
+        featurizer = HashedExpenseFeaturizer(n_features=self.num_hashed_features)
+        mlp = MLPClassifier(
+            hidden_layer_sizes=(self.num_hidden_layers,),
+            solver="adam",
+            random_state=1,
+        )
+
+        num_batches = 0
+        num_samples_processed = 0
+        num_skipped_samples = 0
+        start = time.perf_counter()
+        for epoch in range(self.num_epochs):
+            for features, targets, skipped in self._stream_batches(
+                source, label_encoder, holdout=False
+            ):
+                num_skipped_samples += skipped
+                if len(targets) == 0:
+                    continue
+                mlp.partial_fit(
+                    featurizer.transform(features), targets, classes=classes
+                )
+                num_batches += 1
+                num_samples_processed += len(targets)
+            log.info(f"Completed training epoch {epoch + 1} of {self.num_epochs}")
+        training_seconds = time.perf_counter() - start
+
+        if num_samples_processed == 0:
+            raise ValueError("No labeled expenses available to train categorizer!")
+
+        num_correct = 0
+        num_holdout_samples = 0
+        for features, targets, _ in self._stream_batches(
+            source, label_encoder, holdout=True
+        ):
+            if len(targets) == 0:
+                continue
+            predictions = mlp.predict(featurizer.transform(features))
+            num_correct += int(np.sum(predictions == targets))
+            num_holdout_samples += len(targets)
+
+        report = TrainingReport(
+            version=version,
+            num_epochs=self.num_epochs,
+            num_batches=num_batches,
+            num_training_samples=num_samples_processed // self.num_epochs,
+            num_holdout_samples=num_holdout_samples,
+            num_skipped_samples=num_skipped_samples // self.num_epochs,
+            holdout_accuracy=(
+                num_correct / num_holdout_samples if num_holdout_samples else None
+            ),
+            training_seconds=training_seconds,
+            samples_per_second=(
+                num_samples_processed / training_seconds if training_seconds else 0.0
+            ),
+        )
+
+        pipeline = Pipeline([("featurizer", featurizer), ("mlp", mlp)])
+        self._dump(label_encoder, pipeline, report)
+
+        log.info(f"Trained expense categorizer:\n{json.dumps(report.to_dict())}")
+
+        return report
+
+    def _stream_batches(
+        self, source: LabeledExpenseSource, label_encoder: LabelEncoder, holdout: bool
+    ) -> Iterator[Tuple[np.ndarray, np.ndarray, int]]:
+        """Yield `(features, encoded targets, num skipped)` minibatches from the source."""
+        rows, labels, skipped = [], [], 0
+        for index, (vendor, amount, category) in enumerate(source()):
+            if (index % self.holdout_every == 0) != holdout:
+                continue
+            try:
+                label = TransactionCategory.from_string(category).value
+            except ValueError:
+                skipped += 1
+                continue
+            rows.append((amount, vendor))
+            labels.append(label)
+            if len(rows) == self.batch_size:
+                yield *self._to_batch(rows, labels, label_encoder), skipped
+                rows, labels, skipped = [], [], 0
+        if rows or skipped:
+            yield *self._to_batch(rows, labels, label_encoder), skipped
+
+    @staticmethod
+    def _to_batch(
+        rows: List[Tuple[float, str]], labels: List[str], label_encoder: LabelEncoder
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        features = np.array(rows, dtype=object).reshape(-1, 2)
+        targets = label_encoder.transform(labels) if labels else np.array([])
+        return features, targets
+
+    @staticmethod
+    def _dump(
+        label_encoder: LabelEncoder, pipeline: Pipeline, report: TrainingReport
+    ) -> None:
+        version = report.version
+        encoder_file = ExpenseCategorizerMLP.get_versioned_file_name(
+            ExpenseCategorizerMLP.LABEL_ENCODER_FILE_NAME, version
+        )
+        pipeline_file = ExpenseCategorizerMLP.get_versioned_file_name(
+            ExpenseCategorizerMLP.PIPELINE_FILE_NAME, version
+        )
+        report_file = ExpenseCategorizerMLP.get_versioned_file_name(
+            StreamingExpenseCategorizerTrainer.REPORT_FILE_NAME, version
+        )
+        log.info(f"Writing expense categorizer artifacts for version '{version}'")
+        joblib.dump(label_encoder, encoder_file)
+        joblib.dump(pipeline, pipeline_file)
+        with open(report_file, "w") as report_json:
+            json.dump(report.to_dict(), report_json, indent=4)
+
+
+###########
+# SOURCES #
+###########
+
+
+def get_transactions_table_source(walter_db: WalterDB) -> LabeledExpenseSource:
+    """Stream labeled bank transactions page by page from the Transactions table."""
+
+    def source() -> Iterator[LabeledExpense]:
+        for transaction in walter_db.stream_transactions():
+            if isinstance(transaction, BankTransaction) and transaction.merchant_name:
+                yield (
+                    transaction.merchant_name,
+                    transaction.transaction_amount,
+                    transaction.transaction_category.value,
+                )
+
+    return source
+
+
+def get_export_source(file_path: str) -> LabeledExpenseSource:
+    """Stream labeled expenses from a CSV export with `vendor,amount,category` columns."""
+
+    def source() -> Iterator[LabeledExpense]:
+        with open(file_path, newline="") as export:
+            for row in csv.DictReader(export):
+                yield row["vendor"], float(row["amount"]), row["category"]
+
+    return source
@@ -73,6 +73,9 @@ class CreateAccount(WalterAPIMethod):
     def is_authenticated_api(self) -> bool:
         return True
 
+    def is_user_data_write_api(self) -> bool:
+        return True
+
     def _create_new_account(self, user: User, event: dict):
         log.info("Creating new account for user")
 
@@ -1,7 +1,9 @@
 import json
 from dataclasses import dataclass
+from datetime import datetime, timezone
 from typing import Optional
 
+from src.accounts.queue import PurgeAccountTask, PurgeAccountTaskQueue
 from src.api.common.exceptions import (
     AccountDoesNotExist,
     BadRequest,
@@ -24,7 +26,14 @@ log = Logger(__name__).get_logger()
 
 @dataclass
 class DeleteAccount(WalterAPIMethod):
-    """WalterAPI: DeleteAccount"""
+    """
+    WalterAPI: DeleteAccount
+
+    This API marks an account as deleting, which hides it from all reads, and
+    adds a PurgeAccount task to the queue to purge its transactions and
+    holdings and delete the account asynchronously. The API returns
+    immediately regardless of the size of the account history.
+    """
 
     API_NAME = "DeleteAccount"
     REQUIRED_QUERY_FIELDS = []
@@ -43,6 +52,7 @@ class DeleteAccount(WalterAPIMethod):
         walter_authenticator: WalterAuthenticator,
         metrics: DatadogMetricsClient,
         walter_db: WalterDB,
+        queue: PurgeAccountTaskQueue,
     ) -> None:
         super().__init__(
             domain,
@@ -55,6 +65,7 @@ class DeleteAccount(WalterAPIMethod):
             metrics,
             walter_db,
         )
+        self.queue = queue
 
     def execute(self, event: dict, session: Optional[Session]) -> Response:
         user = self._verify_user_exists(session.user_id)
@@ -63,7 +74,7 @@ class DeleteAccount(WalterAPIMethod):
         return self._create_response(
             http_status=HTTPStatus.OK,
             status=Status.SUCCESS,
-            message="Successfully deleted account!",
+            message="Successfully started account deletion!",
         )
 
     def validate_fields(self, event: dict) -> None:
@@ -73,6 +84,9 @@ class DeleteAccount(WalterAPIMethod):
     def is_authenticated_api(self) -> bool:
         return True
 
+    def is_user_data_write_api(self) -> bool:
+        return True
+
     def _verify_account_exists(self, user: User, event: dict) -> None:
         """
         Verifies whether an account exists for the user.
@@ -101,14 +115,14 @@ class DeleteAccount(WalterAPIMethod):
 
     def _delete_account(self, user: User, event: dict) -> None:
         """
-        Deletes an account for the user, including its transactions.
+        Marks an account as deleting and queues the purge of its data.
 
         Args:
             user: The authenticated `User` object.
             event: The request event containing account data.
 
-        Returns:
-            None
+        Raises:
+            AccountDoesNotExist: If the account was deleted concurrently.
         """
         log.info("Deleting account for user")
 
@@ -116,13 +130,18 @@ class DeleteAccount(WalterAPIMethod):
         body = json.loads(event["body"])
         account_id = body["account_id"]
 
-        log.info(f"Deleting transactions for account '{account_id}'")
-        self.db.delete_account_transactions(account_id)
-
-        log.info(f"Deleting holdings for account '{account_id}'")
-        self.db.delete_account_holdings(account_id)
+        if not self.db.mark_account_deleting(
+            user.user_id, account_id, datetime.now(timezone.utc)
+        ):
+            raise AccountDoesNotExist("Account does not exist!")
 
-        log.info(f"Deleting account '{account_id}'")
-        self.db.delete_account(user.user_id, account_id)
+        try:
+            self.queue.add_task(
+                PurgeAccountTask(user_id=user.user_id, account_id=account_id)
+            )
+        except Exception:
+            log.error(f"Unable to queue purge of account '{account_id}'!")
+            self.db.unmark_account_deleting(user.user_id, account_id)
+            raise
 
-        log.info("Account deleted successfully!")
+        log.info("Account deletion started successfully!")
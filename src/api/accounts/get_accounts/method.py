@@ -1,18 +1,24 @@
 from dataclasses import dataclass
-from datetime import datetime, timezone
-from typing import List, Optional
+from datetime import datetime, timedelta, timezone
+from typing import Dict, FrozenSet, List, Optional
 
-from src.api.accounts.get_accounts.models import GetAccountsResponseData
+from src.api.accounts.get_accounts.models import (
+    GET_ACCOUNTS_FIELDS,
+    GetAccountsResponseData,
+)
+from src.api.common.etags import ValidatorType
 from src.api.common.exceptions import (
     BadRequest,
     NotAuthenticated,
     SessionDoesNotExist,
     UserDoesNotExist,
 )
+from src.api.common.fields import parse_fields
 from src.api.common.methods import WalterAPIMethod
 from src.api.common.models import HTTPStatus, Status
 from src.api.common.response import Response
 from src.auth.authenticator import WalterAuthenticator
+from src.config import CONFIG
 from src.database.accounts.models import Account, AccountType, InvestmentAccount
 from src.database.client import WalterDB
 from src.database.holdings.models import Holding
@@ -28,7 +34,17 @@ log = Logger(__name__).get_logger()
 
 @dataclass
 class GetAccounts(WalterAPIMethod):
-    """WalterAPI: GetAccounts"""
+    """
+    WalterAPI: GetAccounts
+
+    Requests with `fields`, e.g. `fields=account_id,account_name`, only
+    compute and return the given account fields, see `GET_ACCOUNTS_FIELDS`.
+    Holdings and their securities are only read if balances or holdings
+    are requested.
+
+    Responses are cached by user, request, and data version for a short
+    TTL, as security prices change without bumping the data version.
+    """
 
     API_NAME = "GetAccounts"
     REQUIRED_QUERY_FIELDS = []
@@ -62,14 +78,23 @@ class GetAccounts(WalterAPIMethod):
 
     def execute(self, event: dict, session: Optional[Session]) -> Response:
         user: User = self._verify_user_exists(session.user_id)
+        fields: Optional[FrozenSet[str]] = parse_fields(
+            WalterAPIMethod.get_query_field(event, "fields"), GET_ACCOUNTS_FIELDS
+        )
         accounts: List[Account] = self._get_user_accounts(user)
-        holdings: List[Holding] = self._get_user_holdings(user, accounts)
-        securities: List[Security] = self._get_user_securities(user, holdings)
+        holdings: List[Holding] = []
+        securities: List[Security] = []
+        is_holdings_required = GetAccountsResponseData.is_holdings_required(fields)
+        if is_holdings_required:
+            holdings = self._get_user_holdings(user, accounts)
+            securities = self._get_user_securities(user, holdings)
         # TODO: Move logic from model class to this class so model class is not as complex
         data: GetAccountsResponseData = GetAccountsResponseData.create(
-            user, accounts, holdings, securities
+            user, accounts, holdings, securities, fields
         )
-        self._update_investment_account_balances(user, data, accounts)
+        # balances can only be updated if the holdings were read
+        if is_holdings_required:
+            self._update_investment_account_balances(user, data, accounts)
         return self._create_response(
             http_status=HTTPStatus.OK,
             status=Status.SUCCESS,
@@ -83,6 +108,13 @@ class GetAccounts(WalterAPIMethod):
     def is_authenticated_api(self) -> bool:
         return True
 
+    def get_validator_type(self) -> Optional[ValidatorType]:
+        return ValidatorType.DATA_VERSION
+
+    def get_response_cache_ttl_seconds(self) -> Optional[int]:
+        # prices are not versioned, so the TTL bounds their staleness
+        return CONFIG.response_cache.accounts_ttl_seconds
+
     def _get_user_accounts(self, user: User) -> List[Account]:
         log.info(f"Getting all accounts for user: {user.user_id}")
         accounts: List[Account] = self.db.get_accounts(user.user_id)
@@ -120,19 +152,35 @@ class GetAccounts(WalterAPIMethod):
         data: GetAccountsResponseData,
         accounts: List[Account],
     ) -> None:
-        # create account ids to account balance map
-        account_id_to_balance: dict[str, float] = {}
-        for account in data.to_dict()["accounts"]:
-            account_id_to_balance[account["account_id"]] = account["balance"]
+        """
+        Update the balances of investment accounts to the value of their holdings.
 
-        # update investment account balances
+        Balances are always updated in the response but only persisted if
+        they changed by more than the balance tolerance or were last
+        persisted longer than the max balance age ago, so polling this API
+        does not write to the Accounts table on every request.
+        """
         log.info(f"Updating investment account balances for user: {user.user_id}")
+        now = datetime.now(timezone.utc)
+        max_balance_age = timedelta(
+            minutes=CONFIG.account_balances.max_balance_age_minutes
+        )
+        balances: Dict[str, float] = data.get_investment_account_balances()
         for account in accounts:
-            if account.account_type == AccountType.INVESTMENT and isinstance(
-                account, InvestmentAccount
+            if account.account_id not in balances:
+                continue
+            balance = balances[account.account_id]
+            is_changed = (
+                abs(balance - account.balance)
+                > CONFIG.account_balances.balance_tolerance
+            )
+            is_expired = now - account.balance_last_updated_at >= max_balance_age
+            account.balance = balance
+            if not is_changed and not is_expired:
+                log.debug(f"Balance of account '{account.account_id}' is up to date")
+                continue
+            if self.db.update_account_balance(
+                user.user_id, account.account_id, balance, now
             ):
-                now = datetime.now(timezone.utc)
-                account.balance = account_id_to_balance[account.account_id]
                 account.balance_last_updated_at = now
                 account.updated_at = now
-                self.db.update_account(account)
@@ -1,12 +1,56 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Dict, List
+from enum import Enum
+from typing import Any, Dict, FrozenSet, List, Optional
 
 from src.database.accounts.models import Account, AccountType, InvestmentAccount
 from src.database.holdings.models import Holding
 from src.database.securities.models import Security
 from src.database.users.models import User
 
+ACCOUNT_FIELDS = [
+    "linked_with_plaid",
+    "account_id",
+    "institution_name",
+    "account_name",
+    "account_type",
+    "account_subtype",
+    "balance",
+    "updated_at",
+    "holdings",
+]
+"""(List[str]): The fields of GetAccounts accounts."""
+
+HOLDING_FIELDS = [
+    "security_id",
+    "security_ticker",
+    "security_name",
+    "quantity",
+    "current_price",
+    "total_value",
+    "total_cost_basis",
+    "average_cost_basis",
+    "gain_loss",
+    "updated_at",
+]
+"""(List[str]): The fields of the holdings of GetAccounts investment accounts."""
+
+GET_ACCOUNTS_FIELDS = ACCOUNT_FIELDS + [f"holdings.{field}" for field in HOLDING_FIELDS]
+"""(List[str]): The fields GetAccounts responses can be narrowed to, `holdings` selects every holding field."""
+
+
+def _serialize(value: Any) -> Any:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, Enum):
+        return value.value
+    return value
+
+
+def _select(model: Any, names: List[str], fields: FrozenSet[str]) -> dict:
+    """Serialize the selected fields of a response dict, each field is only computed if selected."""
+    return {name: _serialize(getattr(model, name)) for name in names if name in fields}
+
 
 @dataclass
 class GetAccountsResponseAccountDict:
@@ -19,7 +63,10 @@ class GetAccountsResponseAccountDict:
     balance: float
     updated_at: datetime
 
-    def to_dict(self) -> dict:
+    def to_dict(self, fields: Optional[FrozenSet[str]] = None) -> dict:
+        if fields is not None:
+            # only investment accounts have holdings
+            return _select(self, ACCOUNT_FIELDS[:-1], fields)
         return {
             "linked_with_plaid": self.linked_with_plaid,
             "account_id": self.account_id,
@@ -39,13 +86,21 @@ class GetAccountsResponseHoldingDict:
     security_name: str
     quantity: float
     current_price: float
-    total_value: float
     total_cost_basis: float
     average_cost_basis: float
-    gain_loss: float
     updated_at: datetime
 
-    def to_dict(self) -> dict:
+    @property
+    def total_value(self) -> float:
+        return self.quantity * self.current_price
+
+    @property
+    def gain_loss(self) -> float:
+        return self.quantity * self.current_price - self.total_cost_basis
+
+    def to_dict(self, fields: Optional[FrozenSet[str]] = None) -> dict:
+        if fields is not None:
+            return _select(self, HOLDING_FIELDS, fields)
         return {
             "security_id": self.security_id,
             "security_ticker": self.security_ticker,
@@ -72,7 +127,18 @@ class GetAccountsResponseInvestmentAccountDict:
     updated_at: datetime
     holdings: List[GetAccountsResponseHoldingDict]
 
-    def to_dict(self) -> dict:
+    def to_dict(
+        self,
+        fields: Optional[FrozenSet[str]] = None,
+        holding_fields: Optional[FrozenSet[str]] = None,
+    ) -> dict:
+        if fields is not None:
+            account = _select(self, ACCOUNT_FIELDS[:-1], fields)
+            if "holdings" in fields:
+                account["holdings"] = [
+                    holding.to_dict(holding_fields) for holding in self.holdings
+                ]
+            return account
         return {
             "linked_with_plaid": self.linked_with_plaid,
             "account_id": self.account_id,
@@ -88,13 +154,40 @@ class GetAccountsResponseInvestmentAccountDict:
 
 @dataclass
 class GetAccountsResponseData:
+    """
+    GetAccounts Response Data
+
+    Only the given fields of each account are computed and serialized, if
+    any, e.g. `holdings.quantity` selects the quantity of each holding and
+    `holdings` selects every holding field. The total balance is returned
+    with the `balance` field.
+    """
 
     user: User
     accounts: List[Account]
     holdings: List[Holding]
     securities: List[Security]
+    fields: Optional[FrozenSet[str]] = None
 
     def __post_init__(self) -> None:
+        # split the fieldset into the account and holding fields, None
+        # selects every field
+        self.account_fields: Optional[FrozenSet[str]] = None
+        self.holding_fields: Optional[FrozenSet[str]] = None
+        if self.fields is not None:
+            self.account_fields = frozenset(
+                field for field in self.fields if "." not in field
+            )
+            self.holding_fields = frozenset(
+                field.partition(".")[2]
+                for field in self.fields
+                if field.startswith("holdings.")
+            )
+            if self.holding_fields:
+                self.account_fields |= {"holdings"}
+            if "holdings" in self.fields:
+                self.holding_fields = None
+
         # create a map from account_id to holdings
         self.account_to_holdings: Dict[str, List[Holding]] = {}
         for holding in self.holdings:
@@ -107,22 +200,64 @@ class GetAccountsResponseData:
         for security in self.securities:
             self.security_id_to_security[security.security_id] = security
 
+    def get_investment_account_balances(self) -> Dict[str, float]:
+        """Get the current balance of each investment account from its holdings."""
+        balances: Dict[str, float] = {}
+        for account in self.accounts:
+            if account.account_type == AccountType.INVESTMENT and isinstance(
+                account, InvestmentAccount
+            ):
+                balances[account.account_id] = sum(
+                    [
+                        holding.quantity
+                        * self.security_id_to_security[
+                            holding.security_id
+                        ].current_price
+                        for holding in self.account_to_holdings.get(
+                            account.account_id, []
+                        )
+                    ]
+                )
+        return balances
+
+    @staticmethod
+    def is_holdings_required(fields: Optional[FrozenSet[str]]) -> bool:
+        """Whether the holdings and their securities are read for the given fields, i.e. for balances and holdings."""
+        if fields is None:
+            return True
+        return any(
+            field == "balance" or field.startswith("holdings") for field in fields
+        )
+
     def to_dict(self):
-        return {
+        data = {
             "user_id": self.user.user_id,
             "total_num_accounts": len(self.accounts),
-            "total_balance": sum([account.balance for account in self.accounts]),
-            "accounts": [account.to_dict() for account in self._get_accounts()],
         }
+        if self.account_fields is None or "balance" in self.account_fields:
+            data["total_balance"] = sum([account.balance for account in self.accounts])
+        data["accounts"] = [
+            (
+                account.to_dict(self.account_fields, self.holding_fields)
+                if isinstance(account, GetAccountsResponseInvestmentAccountDict)
+                else account.to_dict(self.account_fields)
+            )
+            for account in self._get_accounts()
+        ]
+        return data
 
     def _get_accounts(self) -> List[GetAccountsResponseAccountDict]:
         accounts = []
+        balances = self.get_investment_account_balances()
+        include_holdings = (
+            self.account_fields is None or "holdings" in self.account_fields
+        )
         for account in self.accounts:
             account_type = account.account_type
             if account_type == AccountType.INVESTMENT and isinstance(
                 account, InvestmentAccount
             ):
-                holdings = self._get_holdings(account)
+                holdings = self._get_holdings(account) if include_holdings else []
                 accounts.append(
                     GetAccountsResponseInvestmentAccountDict(
                         linked_with_plaid=account.is_linked_with_plaid(),
@@ -131,7 +266,7 @@ class GetAccountsResponseData:
                         account_name=account.account_name,
                         account_type=account.account_type,
                         account_subtype=account.account_subtype,
-                        balance=sum([holding.total_value for holding in holdings]),
+                        balance=balances[account.account_id],
                         updated_at=account.updated_at,
                         holdings=holdings,
                     )
@@ -172,11 +307,8 @@ class GetAccountsResponseData:
                     security_name=security.security_name,
                     quantity=holding.quantity,
                     current_price=security.current_price,
-                    total_value=holding.quantity * security.current_price,
                     total_cost_basis=holding.total_cost_basis,
                     average_cost_basis=holding.average_cost_basis,
-                    gain_loss=holding.quantity * security.current_price
-                    - holding.total_cost_basis,
                     updated_at=holding.updated_at,
                 )
             )
@@ -190,10 +322,12 @@ class GetAccountsResponseData:
         accounts: List[Account],
         holdings: List[Holding],
         securities: List[Security],
+        fields: Optional[FrozenSet[str]] = None,
     ):
         return GetAccountsResponseData(
             user,
             accounts,
             holdings,
             securities,
+            fields,
         )
@@ -96,6 +96,9 @@ class UpdateAccount(WalterAPIMethod):
     def is_authenticated_api(self) -> bool:
         return True
 
+    def is_user_data_write_api(self) -> bool:
+        return True
+
     def _verify_account_exists(self, user: User, event: dict) -> Account:
         """
         Verifies whether an account exists for the user.
@@ -139,8 +142,10 @@ class UpdateAccount(WalterAPIMethod):
         account.logo_s3_uri = body["logo_url"]
         account.updated_at = datetime.now(timezone.utc)
 
-        # Persist changes
+        # Persist changes, accounts deleted since they were read are not updated
         updated = self.db.update_account(account)
+        if updated is None:
+            raise AccountDoesNotExist("Account does not exist!")
 
         log.info("Account updated successfully!")
         return updated
@@ -0,0 +1,178 @@
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import List, Optional, Tuple
+
+from src.api.common.exceptions import (
+    AccountDoesNotExist,
+    BadRequest,
+    NotAuthenticated,
+    UserDoesNotExist,
+)
+from src.api.common.methods import WalterAPIMethod
+from src.api.common.models import HTTPStatus, Status
+from src.api.common.response import Response
+from src.auth.authenticator import WalterAuthenticator
+from src.config import CONFIG
+from src.database.accounts.models import Account
+from src.database.client import WalterDB
+from src.database.sessions.models import Session
+from src.database.users.models import User
+from src.environment import Domain
+from src.metrics.client import DatadogMetricsClient
+from src.transactions.analytics import SpendingAnalyticsEngine, TransactionColumns
+from src.utils.log import Logger
+
+log = Logger(__name__).get_logger()
+
+
+@dataclass
+class GetSpendingAnalytics(WalterAPIMethod):
+    """
+    WalterAPI: GetSpendingAnalytics
+
+    This API gets the spend of the user, or of a single account, over a date
+    range broken down by category, merchant, account, weekday, and month,
+    with the top merchants and the change from the previous period of the
+    same length.
+
+    The transactions of both periods are read with a single query and
+    decoded straight into columns, and every breakdown is computed by the
+    vectorized spending analytics engine.
+    """
+
+    API_NAME = "GetSpendingAnalytics"
+    REQUIRED_QUERY_FIELDS = []
+    REQUIRED_HEADERS = {"Authorization": "Bearer"}
+    REQUIRED_FIELDS = []
+    EXCEPTIONS = [
+        (BadRequest, HTTPStatus.BAD_REQUEST),
+        (NotAuthenticated, HTTPStatus.UNAUTHORIZED),
+        (AccountDoesNotExist, HTTPStatus.NOT_FOUND),
+        (UserDoesNotExist, HTTPStatus.NOT_FOUND),
+    ]
+
+    engine: SpendingAnalyticsEngine
+
+    def __init__(
+        self,
+        domain: Domain,
+        walter_authenticator: WalterAuthenticator,
+        metrics: DatadogMetricsClient,
+        walter_db: WalterDB,
+    ) -> None:
+        super().__init__(
+            domain,
+            GetSpendingAnalytics.API_NAME,
+            GetSpendingAnalytics.REQUIRED_QUERY_FIELDS,
+            GetSpendingAnalytics.REQUIRED_HEADERS,
+            GetSpendingAnalytics.REQUIRED_FIELDS,
+            GetSpendingAnalytics.EXCEPTIONS,
+            walter_authenticator,
+            metrics,
+            walter_db,
+        )
+        self.engine = SpendingAnalyticsEngine()
+
+    def execute(self, event: dict, session: Optional[Session]) -> Response:
+        user: User = self._verify_user_exists(session.user_id)
+        start_date, end_date = self._get_date_range(event)
+        num_merchants = self._get_num_merchants(event)
+        accounts: List[Account] = self._get_accounts(user, event)
+
+        # the previous period is loaded with the current period so both are
+        # read with a single query and compared in a single pass
+        previous_start_date, _ = SpendingAnalyticsEngine.get_previous_period(
+            start_date, end_date
+        )
+        batch = self.db.get_user_transaction_batch(
+            user.user_id,
+            datetime.combine(previous_start_date, datetime.min.time()),
+            datetime.combine(end_date, datetime.min.time()),
+        )
+        columns = TransactionColumns.from_batch(batch)
+
+        # transactions of accounts that are being deleted are not included
+        analytics = self.engine.get_analytics(
+            columns,
+            start_date,
+            end_date,
+            num_merchants,
+            [account.account_id for account in accounts],
+        )
+
+        data = {"user_id": user.user_id, **analytics.to_dict()}
+        account_names = {
+            account.account_id: account.account_name for account in accounts
+        }
+        for account in data["accounts"]:
+            account["account_name"] = account_names[account["account_id"]]
+
+        return self._create_response(
+            http_status=HTTPStatus.OK,
+            status=Status.SUCCESS,
+            message="Retrieved spending analytics!",
+            data=data,
+        )
+
+    def validate_fields(self, event: dict) -> None:
+        pass
+
+    def is_authenticated_api(self) -> bool:
+        return True
+
+    def _get_date_range(self, event: dict) -> Tuple[date, date]:
+        log.info("Getting optional date range from event...")
+        config = CONFIG.spending_analytics
+        try:
+            end_date_str = WalterAPIMethod.get_query_field(event, "end_date")
+            end_date = (
+                datetime.strptime(end_date_str, "%Y-%m-%d").date()
+                if end_date_str
+                else datetime.now(timezone.utc).date()
+            )
+            start_date_str = WalterAPIMethod.get_query_field(event, "start_date")
+            start_date = (
+                datetime.strptime(start_date_str, "%Y-%m-%d").date()
+                if start_date_str
+                else end_date - timedelta(days=config.default_range_days - 1)
+            )
+        except ValueError:
+            raise BadRequest("Invalid date range! Dates must be formatted YYYY-MM-DD.")
+
+        if start_date > end_date:
+            raise BadRequest("Start date must not be after end date!")
+        if (end_date - start_date).days >= config.max_range_days:
+            raise BadRequest(
+                f"Date range must not exceed {config.max_range_days} days!"
+            )
+
+        return start_date, end_date
+
+    def _get_num_merchants(self, event: dict) -> int:
+        config = CONFIG.spending_analytics
+        num_merchants_str = WalterAPIMethod.get_query_field(event, "num_merchants")
+        if not num_merchants_str:
+            return config.default_num_merchants
+        try:
+            num_merchants = int(num_merchants_str)
+        except ValueError:
+            raise BadRequest(f"Invalid number of merchants '{num_merchants_str}'!")
+        if num_merchants < 1 or num_merchants > config.max_num_merchants:
+            raise BadRequest(
+                f"Number of merchants must be between 1 and {config.max_num_merchants}!"
+            )
+        return num_merchants
+
+    def _get_accounts(self, user: User, event: dict) -> List[Account]:
+        account_id = WalterAPIMethod.get_query_field(event, "account_id")
+        if account_id:
+            log.info(f"Getting spending analytics for account '{account_id}'")
+            account = self.db.get_account(user.user_id, account_id)
+            if account is None:
+                raise AccountDoesNotExist("Account does not exist for user!")
+            return [account]
+
+        log.info(
+            f"Getting spending analytics for all accounts of user '{user.user_id}'"
+        )
+        return self.db.get_accounts(user.user_id)
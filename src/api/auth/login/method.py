@@ -1,4 +1,3 @@
-import datetime as dt
 import json
 from dataclasses import dataclass
 from typing import Optional
@@ -74,7 +73,7 @@ class Login(WalterAPIMethod):
         self._verify_password(event, user)
         tokens = self._create_tokens(user)
         self._create_session(user, tokens, event)
-        self._update_last_active_date(user)
+        self.activity_tracker.record_activity(user.user_id)
         return self._create_response(
             http_status=HTTPStatus.OK,
             status=Status.SUCCESS,
@@ -119,12 +118,6 @@ class Login(WalterAPIMethod):
         log.info(f"Created tokens with ID '{tokens.jti}'")
         return tokens
 
-    def _update_last_active_date(self, user: User) -> None:
-        log.info("Updating user last active time")
-        user.last_active_date = dt.datetime.now(dt.UTC)
-        self.db.update_user(user)
-        log.info("Updated user last active time")
-
     def _create_session(self, user: User, tokens: Tokens, event: dict) -> None:
         log.info(
             f"Creating new session for user '{user.user_id}' with session ID '{tokens.jti}'"
@@ -0,0 +1,53 @@
+import datetime as dt
+from dataclasses import dataclass, field
+
+from src.config import CONFIG
+from src.database.client import WalterDB
+from src.utils.log import Logger
+from src.utils.ttl_cache import TTLCache
+
+log = Logger(__name__).get_logger()
+
+LAST_ACTIVE_WRITES: TTLCache[dt.datetime] = TTLCache()
+"""(TTLCache[datetime]): Time of the last active date write of each user by this process, kept for the write interval."""
+
+
+@dataclass
+class LastActiveTracker:
+    """
+    Last Active Tracker
+
+    Tracks the last active date of users with at most one write per user per
+    `write_interval`. Writes are throttled in-process first, so warm
+    invocations skip the Users table entirely, and then with a conditional
+    update of only the last active date so concurrent processes do not
+    write the attribute more than once per interval either.
+
+    Tracking is best effort: failures are logged and never fail the request.
+    """
+
+    walter_db: WalterDB
+    write_interval: dt.timedelta = field(
+        default_factory=lambda: dt.timedelta(
+            minutes=CONFIG.auth.last_active_write_interval_minutes
+        )
+    )
+    last_writes: TTLCache[dt.datetime] = field(
+        default_factory=lambda: LAST_ACTIVE_WRITES
+    )
+
+    def record_activity(self, user_id: str) -> None:
+        now = dt.datetime.now(dt.UTC)
+        with self.last_writes.lock:
+            if self.last_writes.get(user_id, now) is not None:
+                log.debug(f"Last active date of user '{user_id}' is up to date")
+                return
+            self.last_writes.put(user_id, now, now + self.write_interval)
+        try:
+            self.walter_db.update_user_last_active_date(
+                user_id, now, self.write_interval
+            )
+        except Exception as exception:
+            log.warning(
+                f"Unable to update last active date of user '{user_id}': {exception}"
+            )
@@ -0,0 +1,110 @@
+import base64
+import json
+import zlib
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Optional, Tuple
+
+from src.api.common.response import JSON_ENCODER
+from src.config import CONFIG
+from src.database.client import WalterDB
+from src.utils.log import Logger
+from src.utils.ttl_cache import TTLCache
+
+log = Logger(__name__).get_logger()
+
+MAX_DDB_VALUE_BYTES = 350_000
+"""(int): The largest encoded response stored in the DDB Cache table, items are limited to 400 KB."""
+
+
+@dataclass(frozen=True)
+class CachedResponse:
+    """
+    Cached Response
+
+    The message and data of a successful API response.
+    """
+
+    message: str
+    data: dict
+
+    def encode(self) -> str:
+        contents = JSON_ENCODER.dumps({"message": self.message, "data": self.data})
+        return base64.b64encode(zlib.compress(contents)).decode("ascii")
+
+    @classmethod
+    def decode(cls, value: str) -> "CachedResponse":
+        contents = json.loads(zlib.decompress(base64.b64decode(value)))
+        return cls(contents["message"], contents["data"])
+
+
+RESPONSE_CACHE_ENTRIES: TTLCache[CachedResponse] = TTLCache(
+    max_entries=CONFIG.response_cache.max_entries
+)
+"""(TTLCache[CachedResponse]): Responses cached in memory for all APIs of the process, at most `max_entries` of them."""
+
+
+@dataclass
+class ResponseCache:
+    """
+    Response Cache
+
+    TTL cache of API responses keyed by their data version ETags, i.e. by
+    user, API, request parameters, and data version. Writes bump the data
+    version of the user, so cached responses are never served after the
+    data of the user changes. The TTL bounds the staleness of data without
+    version stamps, e.g. security prices.
+
+    Responses are kept in an in-memory cache shared by all APIs of the
+    process, evicting the least recently used responses beyond
+    `max_entries`. If a WalterDB is given, responses are also written to
+    the DDB Cache table so they are shared across processes, and in-memory
+    misses fall back to the table.
+
+    Cache failures are logged and treated as misses so the cache can never
+    fail a request.
+    """
+
+    walter_db: Optional[WalterDB] = None
+    entries: TTLCache[CachedResponse] = field(
+        default_factory=lambda: RESPONSE_CACHE_ENTRIES
+    )
+
+    def get(self, cache_key: str) -> Optional[CachedResponse]:
+        response = self.entries.get(cache_key)
+        if response is not None:
+            return response
+
+        entry = self._get_ddb_entry(cache_key)
+        if entry is None:
+            return None
+        self.entries.put(cache_key, *entry)
+        return entry[0]
+
+    def put(self, cache_key: str, response: CachedResponse, ttl_seconds: int) -> None:
+        expires_at = datetime.now(timezone.utc) + timedelta(seconds=ttl_seconds)
+        self.entries.put(cache_key, response, expires_at)
+        if self.walter_db is not None:
+            try:
+                value = response.encode()
+                if len(value) > MAX_DDB_VALUE_BYTES:
+                    log.debug(f"Response '{cache_key}' is too large for the DDB cache")
+                    return
+                self.walter_db.put_cache_entry(cache_key, value, expires_at)
+            except Exception as exception:
+                log.warning(f"Unable to put cached response '{cache_key}': {exception}")
+
+    def _get_ddb_entry(
+        self, cache_key: str
+    ) -> Optional[Tuple[CachedResponse, datetime]]:
+        if self.walter_db is None:
+            return None
+        try:
+            entry = self.walter_db.get_cache_entry(cache_key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            return CachedResponse.decode(value), expires_at
+        except Exception as exception:
+            log.warning(f"Unable to get cached response '{cache_key}': {exception}")
+            return None
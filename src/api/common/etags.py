@@ -0,0 +1,95 @@
+import datetime as dt
+import hashlib
+import json
+import os
+from enum import Enum
+from typing import Optional
+
+DEPLOYMENT_VERSION = os.environ.get("AWS_LAMBDA_FUNCTION_VERSION", "")
+"""(str): The version of the deployed function, responses can change between deployments so ETags do too."""
+
+
+class ValidatorType(Enum):
+    """
+    The validators of the ETags of read APIs.
+
+    Data version ETags are computed before the API is executed from the
+    data version of the user, so unchanged responses are not recomputed.
+    Body hash ETags are computed from the response data of APIs whose
+    responses do not only change with the data of the user.
+    """
+
+    DATA_VERSION = "data_version"
+    BODY_HASH = "body_hash"
+
+
+def _get_etag(contents: bytes) -> str:
+    # weak as the same ETag is sent with every content coding of a response,
+    # per RFC 9110 strong ETags must differ between content codings
+    return f'W/"{hashlib.sha256(contents).hexdigest()[:32]}"'
+
+
+def get_opaque_tag(etag: str) -> str:
+    """Get the opaque tag of an ETag, i.e. its value without the weak prefix and quotes."""
+    return etag.strip().removeprefix("W/").strip('"')
+
+
+def get_data_version_etag(
+    api_name: str,
+    user_id: str,
+    version: str,
+    query: Optional[dict],
+    now: dt.datetime,
+    max_age_seconds: int,
+) -> str:
+    """
+    Get the weak ETag of a response from the data version of its user.
+
+    The ETag also changes every `max_age_seconds`, which bounds the
+    staleness of response data without version stamps, e.g. prices.
+
+    Args:
+        api_name: The name of the API.
+        user_id: The user of the request.
+        version: The data version of the user.
+        query: The query string parameters of the request, if any.
+        now: The time of the request.
+        max_age_seconds: The longest time the ETag stays valid.
+
+    Returns:
+        The quoted ETag.
+    """
+    contents = json.dumps(
+        [
+            DEPLOYMENT_VERSION,
+            api_name,
+            user_id,
+            version,
+            query or {},
+            int(now.timestamp()) // max_age_seconds,
+        ],
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return _get_etag(contents.encode("utf-8"))
+
+
+def get_body_etag(body: bytes) -> str:
+    """Get the weak ETag of a response from its serialized data."""
+    return _get_etag(body)
+
+
+def matches_etag(if_none_match: Optional[str], etag: str) -> bool:
+    """
+    Check if the `If-None-Match` header of a request matches the ETag.
+
+    Per RFC 9110, `If-None-Match` uses the weak comparison, i.e. ETags
+    match if their opaque tags match, whether or not either is weak.
+    """
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == etag.removeprefix("W/"):
+            return True
+    return False
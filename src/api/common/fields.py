@@ -0,0 +1,32 @@
+from typing import Collection, FrozenSet, Optional
+
+from src.api.common.exceptions import BadRequest
+
+
+def parse_fields(
+    fields: Optional[str], allowed: Collection[str]
+) -> Optional[FrozenSet[str]]:
+    """
+    Parse the sparse fieldset of a request, i.e. its comma-separated `fields`.
+
+    The fieldset is validated once per request so the response can be built
+    from the selected fields only, e.g. `fields=account_id,balance`.
+
+    Args:
+        fields: The comma-separated fields of the request, if any.
+        allowed: The fields the response can be narrowed to.
+
+    Returns:
+        The selected fields, or None if the request selects all fields.
+    """
+    if not fields:
+        return None
+    selected = frozenset(field.strip() for field in fields.split(",") if field.strip())
+    if not selected:
+        return None
+    unknown = selected - set(allowed)
+    if unknown:
+        raise BadRequest(
+            f"Invalid fields {sorted(unknown)}! Fields must be in {sorted(allowed)}."
+        )
+    return selected
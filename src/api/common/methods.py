@@ -1,8 +1,18 @@
+import base64
 import datetime as dt
 import json
 from abc import ABC, abstractmethod
 from typing import Dict, List, Optional, Tuple
 
+from src.api.common.activity import LastActiveTracker
+from src.api.common.cache import CachedResponse, ResponseCache
+from src.api.common.etags import (
+    ValidatorType,
+    get_body_etag,
+    get_data_version_etag,
+    get_opaque_tag,
+    matches_etag,
+)
 from src.api.common.exceptions import BadRequest, NotAuthenticated, UserDoesNotExist
 from src.api.common.metrics import (
     METRICS_FAILURE,
@@ -10,8 +20,9 @@ from src.api.common.metrics import (
     METRICS_SUCCESS,
 )
 from src.api.common.models import HTTPStatus, Status
-from src.api.common.response import Response
+from src.api.common.response import JSON_ENCODER, Response
 from src.auth.authenticator import WalterAuthenticator
+from src.config import CONFIG
 from src.database.client import WalterDB
 from src.database.sessions.models import Session
 from src.database.users.models import User
@@ -52,6 +63,10 @@ class WalterAPIMethod(ABC):
         self.authenticator = authenticator
         self.metrics = metrics
         self.db = db
+        self.activity_tracker = LastActiveTracker(db)
+        self.response_cache = ResponseCache(
+            db if CONFIG.response_cache.ddb_cache_enabled else None
+        )
 
     def invoke(self, event: dict, emit_metrics: bool = True) -> Response:
         """
@@ -71,6 +86,7 @@ class WalterAPIMethod(ABC):
         )
         log.info(f"Invoking '{self.api_name}' API with request ID: '{self.request_id}'")
         log.debug(f"Event:\n{json.dumps(event, indent=4)}")
+        event = self._decode_body(event)
 
         # start timing the invocation for response time metrics
         start = dt.datetime.now(dt.UTC)
@@ -83,8 +99,17 @@ class WalterAPIMethod(ABC):
             session = None
             if self.is_authenticated_api():
                 session = self._authenticate_request(event)
+                self.activity_tracker.record_activity(session.user_id)
 
-            response = self.execute(event, session)
+            response = self._execute_conditionally(event, session)
+
+            # invalidate the responses of the user after writing their data
+            if (
+                session is not None
+                and self.is_user_data_write_api()
+                and response.http_status.is_success()
+            ):
+                self._bump_user_data_version(session.user_id)
         except Exception as exception:
             log.error("Error occurred during API invocation!", exc_info=True)
             response = self._handle_exception(exception)
@@ -93,6 +118,11 @@ class WalterAPIMethod(ABC):
             end = dt.datetime.now(dt.UTC)
             response.response_time_millis = (end - start).total_seconds() * 1000
 
+            # encode the response body with the accepted encodings of the request
+            response.accept_encoding = WalterAPIMethod.get_header(
+                event, "Accept-Encoding"
+            )
+
             # emit api metrics after adding elapsed time to response obj
             if emit_metrics:
                 self._emit_metrics(response)
@@ -101,6 +131,129 @@ class WalterAPIMethod(ABC):
 
         return response
 
+    def _execute_conditionally(
+        self, event: dict, session: Optional[Session]
+    ) -> Response:
+        """
+        Execute the API unless the response is not modified since the client
+        last received it, i.e. its `If-None-Match` matches the current ETag.
+
+        Data version ETags are checked before executing the API, so unchanged
+        responses cost a single version lookup, and responses of APIs with a
+        response cache TTL are cached by their ETag, so repeated requests of
+        other clients are not recomputed either. Otherwise, including users
+        without a data version yet, the ETag is the hash of the response data
+        and only the transfer of unchanged responses is saved.
+
+        Args:
+            event: The request event of the API invocation.
+            session: The authenticated session, if any.
+
+        Returns:
+            The API response, or a not modified response with its ETag.
+        """
+        validator = self.get_validator_type()
+        # ETags are only supported for the data of authenticated users
+        if validator is None or session is None:
+            return self.execute(event, session)
+
+        if_none_match = WalterAPIMethod.get_header(event, "If-None-Match")
+        etag = None
+        if validator == ValidatorType.DATA_VERSION:
+            # the version is read before the data, so writes during execution
+            # can only make the ETag older than the response and never newer
+            etag = self._get_data_version_etag(event, session)
+            if etag is not None and matches_etag(if_none_match, etag):
+                log.info("Response not modified since the data version of the ETag!")
+                return self._create_not_modified_response(etag)
+
+        cache_ttl_seconds = self.get_response_cache_ttl_seconds()
+        cache_key = None
+        if etag is not None and cache_ttl_seconds:
+            cache_key = "response#" + get_opaque_tag(etag)
+            cached = self.response_cache.get(cache_key)
+            if cached is not None:
+                log.info("Serving response from the response cache!")
+                response = self._create_response(
+                    HTTPStatus.OK, Status.SUCCESS, cached.message, data=cached.data
+                )
+                response.etag = etag
+                return response
+
+        response = self.execute(event, session)
+        if response.http_status != HTTPStatus.OK:
+            return response
+
+        if cache_key is not None:
+            self.response_cache.put(
+                cache_key,
+                CachedResponse(response.message, response.data),
+                cache_ttl_seconds,
+            )
+        if etag is None:
+            etag = get_body_etag(JSON_ENCODER.dumps(response.data))
+            if matches_etag(if_none_match, etag):
+                log.info("Response not modified since the body hash of the ETag!")
+                return self._create_not_modified_response(etag)
+
+        response.etag = etag
+        return response
+
+    def _get_data_version_etag(self, event: dict, session: Session) -> Optional[str]:
+        try:
+            version = self.db.get_user_data_version(session.user_id)
+        except Exception as exception:
+            log.warning(f"Unable to get data version of user: {exception}")
+            return None
+        if version is None:
+            return None
+        return get_data_version_etag(
+            self.api_name,
+            session.user_id,
+            version,
+            event.get("queryStringParameters"),
+            dt.datetime.now(dt.UTC),
+            CONFIG.conditional_requests.validator_max_age_seconds,
+        )
+
+    def _bump_user_data_version(self, user_id: str) -> None:
+        # best effort as the data is already written, the staleness of data
+        # version ETags is bounded by their max age
+        try:
+            self.db.bump_user_data_version(user_id)
+        except Exception as exception:
+            log.error(f"Unable to bump data version of user '{user_id}': {exception}")
+
+    def _create_not_modified_response(self, etag: str) -> Response:
+        response = self._create_response(
+            HTTPStatus.NOT_MODIFIED, Status.SUCCESS, "Not modified!"
+        )
+        response.etag = etag
+        return response
+
+    @staticmethod
+    def _decode_body(event: dict) -> dict:
+        """
+        Decode the base64 encoded body of a request, if any.
+
+        API Gateway base64 encodes request bodies of its binary media types,
+        which include JSON so that compressed responses can be returned.
+        Multipart bodies are left encoded for the APIs that decode them.
+
+        Args:
+            event: The request event of the API invocation.
+
+        Returns:
+            The request event with its body decoded.
+        """
+        if not event.get("isBase64Encoded") or event.get("body") is None:
+            return event
+        content_type = WalterAPIMethod.get_header(event, "Content-Type") or ""
+        if content_type.startswith("multipart/"):
+            return event
+        body = base64.b64decode(event["body"]).decode("utf-8")
+        return {**event, "body": body, "isBase64Encoded": False}
+
     def _validate_request(self, event: dict) -> None:
         log.info("Validating request...")
         self._validate_required_query_fields(event)
@@ -273,7 +426,11 @@ class WalterAPIMethod(ABC):
             response: The API response object.
         """
         log.info(f"Emitting metrics for '{self.api_name}' API")
-        success = response.http_status.is_success()
+        # not modified responses are successful conditional requests
+        success = (
+            response.http_status.is_success()
+            or response.http_status == HTTPStatus.NOT_MODIFIED
+        )
         self.metrics.emit_metric(
             f"api.{METRICS_SUCCESS}", success, tags={"api": self.api_name}
         )
@@ -363,6 +520,27 @@ class WalterAPIMethod(ABC):
         """
         pass
 
+    def get_validator_type(self) -> Optional[ValidatorType]:
+        """
+        Read APIs that support conditional requests should return the
+        validator of their ETags.
+        """
+        return None
+
+    def get_response_cache_ttl_seconds(self) -> Optional[int]:
+        """
+        Read APIs with data version ETags should return the time to live of
+        their cached responses to cache them, or None to not cache them.
+        """
+        return None
+
+    def is_user_data_write_api(self) -> bool:
+        """
+        APIs that write the data of the authenticated user should return True,
+        successful requests bump the data version of the user.
+        """
+        return False
+
     @staticmethod
     def get_query_field(event: dict, field: str) -> Optional[str]:
         if (
@@ -372,3 +550,12 @@ class WalterAPIMethod(ABC):
         ):
             return None
         return event["queryStringParameters"][field]
+
+    @staticmethod
+    def get_header(event: dict, header: str) -> Optional[str]:
+        # headers are case-insensitive
+        header = header.lower()
+        for key, value in (event.get("headers") or {}).items():
+            if key.lower() == header:
+                return value
+        return None
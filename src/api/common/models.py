@@ -26,6 +26,7 @@ class HTTPStatus(Enum):
 
     OK = 200
     CREATED = 201
+    NOT_MODIFIED = 304
     BAD_REQUEST = 400
     UNAUTHORIZED = 401
     NOT_FOUND = 404
@@ -0,0 +1,45 @@
+import base64
+import json
+from typing import Optional
+
+from src.api.common.exceptions import BadRequest
+
+
+def encode_next_token(last_evaluated_key: Optional[dict]) -> Optional[str]:
+    """
+    Encode the last evaluated key of a query page as an opaque next token.
+
+    Args:
+        last_evaluated_key: The DDB key to resume the query from, if any.
+
+    Returns:
+        The URL-safe next token, or None if there are no more pages.
+    """
+    if not last_evaluated_key:
+        return None
+    contents = json.dumps(last_evaluated_key, separators=(",", ":"), sort_keys=True)
+    return base64.urlsafe_b64encode(contents.encode("utf-8")).decode("utf-8")
+
+
+def decode_next_token(next_token: str, key_name: str, key_value: str) -> dict:
+    """
+    Decode an opaque next token into the DDB key to resume a query from.
+
+    Tokens are only valid for the partition they were issued for, so a token
+    issued for one user or account can never resume a query of another.
+
+    Args:
+        next_token: The next token of the previous page.
+        key_name: The partition key name of the queried index.
+        key_value: The partition key value of the query.
+
+    Returns:
+        The DDB key to resume the query from.
+    """
+    try:
+        key = json.loads(base64.urlsafe_b64decode(next_token.encode("utf-8")))
+    except Exception:
+        raise BadRequest("Invalid next token!")
+    if not isinstance(key, dict) or key.get(key_name) != {"S": key_value}:
+        raise BadRequest("Invalid next token!")
+    return key
@@ -1,9 +1,179 @@
+import base64
+import datetime as dt
+import gzip
 import json
+import math
+import uuid
+import zlib
+from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import Optional
+from enum import Enum
+from typing import Any, Optional
+
+import numpy as np
 
 from src.api.common.models import HTTPStatus, Status
+from src.config import CONFIG
 from src.environment import Domain
+from src.utils.log import Logger
+
+try:
+    import orjson
+except ImportError:  # fall back to the standard library without orjson wheels
+    orjson = None
+
+log = Logger(__name__).get_logger()
+
+
+class JSONEncoder(ABC):
+    """
+    WalterAPI - JSON Encoder
+
+    Serializes response bodies into compact UTF-8 JSON.
+    """
+
+    name: str
+
+    @abstractmethod
+    def dumps(self, obj: Any) -> bytes:
+        pass
+
+
+class StdlibJSONEncoder(JSONEncoder):
+    """
+    JSON encoder of the standard library, always available.
+
+    Encodes bodies like the orjson encoder so responses do not depend on
+    which encoder is installed: NaN and infinite floats are encoded as
+    null, and datetimes, enums, UUIDs and NumPy values are serialized
+    instead of raising.
+    """
+
+    name = "json"
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(
+            StdlibJSONEncoder._replace_non_finite(obj),
+            separators=(",", ":"),
+            ensure_ascii=False,
+            allow_nan=False,
+            default=StdlibJSONEncoder._default,
+        ).encode("utf-8")
+
+    @staticmethod
+    def _default(obj: Any) -> Any:
+        if isinstance(obj, (dt.datetime, dt.date, dt.time)):
+            return obj.isoformat()
+        if isinstance(obj, Enum):
+            return StdlibJSONEncoder._replace_non_finite(obj.value)
+        if isinstance(obj, uuid.UUID):
+            return str(obj)
+        if isinstance(obj, (np.ndarray, np.generic)):
+            return StdlibJSONEncoder._replace_non_finite(obj.tolist())
+        raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+    @staticmethod
+    def _replace_non_finite(obj: Any) -> Any:
+        if isinstance(obj, float):
+            return obj if math.isfinite(obj) else None
+        if isinstance(obj, dict):
+            return {
+                key: StdlibJSONEncoder._replace_non_finite(value)
+                for key, value in obj.items()
+            }
+        if isinstance(obj, (list, tuple)):
+            return [StdlibJSONEncoder._replace_non_finite(value) for value in obj]
+        return obj
+
+
+class OrjsonJSONEncoder(JSONEncoder):
+    """
+    JSON encoder of orjson, several times faster than the standard library
+    for large bodies and serializes NumPy scalars and arrays natively.
+    """
+
+    name = "orjson"
+
+    def dumps(self, obj: Any) -> bytes:
+        return orjson.dumps(
+            obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+        )
+
+
+def get_json_encoder() -> JSONEncoder:
+    """
+    Get the fastest available JSON encoder.
+
+    Returns:
+        (JSONEncoder): The orjson encoder if orjson is installed, else the
+            standard library encoder.
+    """
+    if orjson is not None:
+        return OrjsonJSONEncoder()
+    return StdlibJSONEncoder()
+
+
+JSON_ENCODER = get_json_encoder()
+"""(JSONEncoder): The JSON encoder of API responses, chosen once per process."""
+
+
+class ContentEncoding(Enum):
+    """
+    The content encodings of API responses.
+
+    Deflate is the zlib format per RFC 9110, not raw deflate.
+    """
+
+    IDENTITY = "identity"
+    GZIP = "gzip"
+    DEFLATE = "deflate"
+
+    def compress(self, body: bytes, level: int) -> bytes:
+        match self:
+            case ContentEncoding.GZIP:
+                # zero the timestamp so equal bodies compress to equal bytes
+                return gzip.compress(body, compresslevel=level, mtime=0)
+            case ContentEncoding.DEFLATE:
+                return zlib.compress(body, level)
+        return body
+
+
+def get_content_encoding(accept_encoding: Optional[str]) -> ContentEncoding:
+    """
+    Negotiate the content encoding of a response from the `Accept-Encoding`
+    header of its request.
+
+    Gzip is preferred over deflate at equal quality, encodings with a
+    quality of zero are refused, and `*` accepts either.
+
+    Args:
+        accept_encoding: The `Accept-Encoding` header of the request, if any.
+
+    Returns:
+        (ContentEncoding): The accepted content encoding, identity if the
+            client does not accept a supported compression.
+    """
+    if not accept_encoding:
+        return ContentEncoding.IDENTITY
+
+    qualities = {}
+    for coding in accept_encoding.lower().split(","):
+        name, _, params = coding.partition(";")
+        quality = 1.0
+        param, _, value = params.strip().partition("=")
+        if param.strip() == "q":
+            try:
+                quality = float(value)
+            except ValueError:
+                quality = 0.0
+        qualities[name.strip()] = quality
+
+    best, best_quality = ContentEncoding.IDENTITY, 0.0
+    for encoding in [ContentEncoding.GZIP, ContentEncoding.DEFLATE]:
+        quality = qualities.get(encoding.value, qualities.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = encoding, quality
+    return best
 
 
 @dataclass(kw_only=True)
@@ -26,20 +196,63 @@ class Response:
     cookies: Optional[dict] = None  # optional cookies can be included in response
     data: Optional[dict] = None  # optional data can be included in response
     expire_cookies: Optional[bool] = False
+    accept_encoding: Optional[str] = None  # the accepted encodings of the request
+    etag: Optional[str] = None  # optional validator of the response data
+
+    ENCODING_CONFIG = CONFIG.response_encoding
 
     def to_json(self) -> dict:
         headers = self._get_headers()
         multivalue_headers = self._get_multivalue_headers()
-        body = self._get_body()
+        body = None
+        # not modified responses must not include a body
+        if self.http_status != HTTPStatus.NOT_MODIFIED:
+            body = self._get_body()
         return self._get_response(headers, multivalue_headers, body)
 
+    def _encode_body(self, body: dict, headers: dict) -> dict:
+        """
+        Serialize the response body, compressed if the client accepts a
+        supported compression and the body is large enough to benefit.
+
+        Compressed bodies are base64 encoded for API Gateway, which decodes
+        them back into binary before responding to the client.
+        """
+        encoded = JSON_ENCODER.dumps(body)
+        if len(encoded) < self.ENCODING_CONFIG.compression_min_bytes:
+            return {"body": encoded.decode("utf-8")}
+
+        # bodies of this size vary by the accepted encodings of the request
+        headers["Vary"] = "Accept-Encoding"
+        encoding = get_content_encoding(self.accept_encoding)
+        if encoding == ContentEncoding.IDENTITY:
+            return {"body": encoded.decode("utf-8")}
+
+        compressed = encoding.compress(encoded, self.ENCODING_CONFIG.compression_level)
+        log.debug(
+            f"Compressed response body with {encoding.value} from {len(encoded)} to {len(compressed)} bytes"
+        )
+        headers["Content-Encoding"] = encoding.value
+        return {
+            "body": base64.b64encode(compressed).decode("ascii"),
+            "isBase64Encoded": True,
+        }
+
     def _get_headers(self) -> dict:
         headers = {
             "Content-Type": "application/json",
-            "Access-Control-Allow-Headers": "Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token",
+            "Access-Control-Allow-Headers": "Content-Type,X-Amz-Date,Authorization,X-Api-Key,X-Amz-Security-Token,If-None-Match",
             "Access-Control-Allow-Origin": "*",  # TODO: This should be updated for production
             "Access-Control-Allow-Methods": "GET,OPTIONS,POST,PUT,DELETE",
         }
+        if self.etag is not None:
+            # clients may store the response but must revalidate it before reuse
+            headers["ETag"] = self.etag
+            headers["Cache-Control"] = "private, no-cache"
+            headers["Access-Control-Expose-Headers"] = "ETag"
+            # the ETag is shared by every content coding of the response, so
+            # caches must key stored responses, including 304s, by the coding
+            headers["Vary"] = "Accept-Encoding"
         return headers
 
     def _get_multivalue_headers(self) -> dict:
@@ -94,13 +307,17 @@ class Response:
             "statusCode": self.http_status.value,
         }
 
+        # encode body first as encoding can add headers
+        encoded_body = {}
+        if body is not None and len(body) > 0:
+            encoded_body = self._encode_body(body, headers)
+
         # conditionally add headers and body to response
         if headers is not None and len(headers) > 0:
             response["headers"] = headers
         if multivalue_headers is not None and len(multivalue_headers) > 0:
             response["multiValueHeaders"] = multivalue_headers
-        if body is not None and len(body) > 0:
-            response["body"] = json.dumps(body)
+        response.update(encoded_body)
 
         return response
 
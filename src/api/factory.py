@@ -6,6 +6,7 @@ from src.api.accounts.create_account import CreateAccount
 from src.api.accounts.delete_account import DeleteAccount
 from src.api.accounts.get_accounts.method import GetAccounts
 from src.api.accounts.update_account import UpdateAccount
+from src.api.analytics.get_spending_analytics import GetSpendingAnalytics
 from src.api.auth.login.method import Login
 from src.api.auth.logout.method import Logout
 from src.api.auth.refresh.method import Refresh
@@ -13,6 +14,7 @@ from src.api.common.methods import WalterAPIMethod
 from src.api.plaid.create_link_token import CreateLinkToken
 from src.api.plaid.exchange_public_token.method import ExchangePublicToken
 from src.api.plaid.sync_transactions import SyncTransactions
+from src.api.portfolio.get_portfolio_history import GetPortfolioHistory
 from src.api.transactions.add_transaction import AddTransaction
 from src.api.transactions.delete_transaction import DeleteTransaction
 from src.api.transactions.edit_transaction import EditTransaction
@@ -46,6 +48,12 @@ class APIMethod(Enum):
     EDIT_TRANSACTION = EditTransaction.API_NAME
     DELETE_TRANSACTION = DeleteTransaction.API_NAME
 
+    # ANALYTICS
+    GET_SPENDING_ANALYTICS = GetSpendingAnalytics.API_NAME
+
+    # PORTFOLIO
+    GET_PORTFOLIO_HISTORY = GetPortfolioHistory.API_NAME
+
     # USERS
     GET_USER = GetUser.API_NAME
     CREATE_USER = CreateUser.API_NAME
@@ -137,6 +145,7 @@ class APIMethodFactory:
                     walter_authenticator=self.client_factory.get_authenticator(),
                     metrics=self.client_factory.get_metrics_client(),
                     walter_db=self.client_factory.get_db_client(),
+                    queue=self.client_factory.get_purge_account_task_queue(),
                 )
 
             # TRANSACTIONS
@@ -177,6 +186,25 @@ class APIMethodFactory:
                     holding_updater=self.client_factory.get_holding_updater(),
                 )
 
+            # ANALYTICS
+            case APIMethod.GET_SPENDING_ANALYTICS:
+                return GetSpendingAnalytics(
+                    domain=self.client_factory.get_domain(),
+                    walter_authenticator=self.client_factory.get_authenticator(),
+                    metrics=self.client_factory.get_metrics_client(),
+                    walter_db=self.client_factory.get_db_client(),
+                )
+
+            # PORTFOLIO
+            case APIMethod.GET_PORTFOLIO_HISTORY:
+                return GetPortfolioHistory(
+                    domain=self.client_factory.get_domain(),
+                    walter_authenticator=self.client_factory.get_authenticator(),
+                    metrics=self.client_factory.get_metrics_client(),
+                    walter_db=self.client_factory.get_db_client(),
+                    price_history=self.client_factory.get_price_history_store(),
+                )
+
             # USERS
             case APIMethod.GET_USER:
                 return GetUser(
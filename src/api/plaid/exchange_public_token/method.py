@@ -154,6 +154,9 @@ class ExchangePublicToken(WalterAPIMethod):
     def is_authenticated_api(self) -> bool:
         return True
 
+    def is_user_data_write_api(self) -> bool:
+        return True
+
     def _get_details_from_event(self, event: dict) -> Tuple[str, List[AccountDetails]]:
         """
         Extracts and marshals details from an event, including public token, institution
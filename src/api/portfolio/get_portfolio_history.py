@@ -0,0 +1,187 @@
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+from src.api.common.exceptions import (
+    AccountDoesNotExist,
+    BadRequest,
+    NotAuthenticated,
+    UserDoesNotExist,
+)
+from src.api.common.methods import WalterAPIMethod
+from src.api.common.models import HTTPStatus, Status
+from src.api.common.response import Response
+from src.auth.authenticator import WalterAuthenticator
+from src.config import CONFIG
+from src.database.accounts.models import Account, AccountType
+from src.database.client import WalterDB
+from src.database.sessions.models import Session
+from src.database.transactions.models import InvestmentTransaction
+from src.database.users.models import User
+from src.environment import Domain
+from src.investments.portfolio.history import PortfolioHistoryEngine
+from src.investments.securities.history import PriceHistoryStore
+from src.metrics.client import DatadogMetricsClient
+from src.utils.log import Logger
+
+log = Logger(__name__).get_logger()
+
+
+@dataclass
+class GetPortfolioHistory(WalterAPIMethod):
+    """
+    WalterAPI: GetPortfolioHistory
+
+    This API gets the daily value, net contributions, and time-weighted
+    return of the investment accounts of the user, or of a single account,
+    over a date range. Holdings are rebuilt on every day of the range from
+    the investment transactions of the accounts and valued with the daily
+    closes of the price history store, so no Polygon requests are made.
+
+    Date ranges are capped at `max_range_days` and the returned series are
+    downsampled to at most `max_points` days to bound the response time
+    and size of multi-year requests.
+    """
+
+    API_NAME = "GetPortfolioHistory"
+    REQUIRED_QUERY_FIELDS = []
+    REQUIRED_HEADERS = {"Authorization": "Bearer"}
+    REQUIRED_FIELDS = []
+    EXCEPTIONS = [
+        (BadRequest, HTTPStatus.BAD_REQUEST),
+        (NotAuthenticated, HTTPStatus.UNAUTHORIZED),
+        (AccountDoesNotExist, HTTPStatus.NOT_FOUND),
+        (UserDoesNotExist, HTTPStatus.NOT_FOUND),
+    ]
+
+    DEFAULT_RANGE_DAYS = 365
+
+    price_history: PriceHistoryStore
+    engine: PortfolioHistoryEngine
+
+    def __init__(
+        self,
+        domain: Domain,
+        walter_authenticator: WalterAuthenticator,
+        metrics: DatadogMetricsClient,
+        walter_db: WalterDB,
+        price_history: PriceHistoryStore,
+    ) -> None:
+        super().__init__(
+            domain,
+            GetPortfolioHistory.API_NAME,
+            GetPortfolioHistory.REQUIRED_QUERY_FIELDS,
+            GetPortfolioHistory.REQUIRED_HEADERS,
+            GetPortfolioHistory.REQUIRED_FIELDS,
+            GetPortfolioHistory.EXCEPTIONS,
+            walter_authenticator,
+            metrics,
+            walter_db,
+        )
+        self.price_history = price_history
+        self.engine = PortfolioHistoryEngine()
+
+    def execute(self, event: dict, session: Optional[Session]) -> Response:
+        user: User = self._verify_user_exists(session.user_id)
+        start_date, end_date = self._get_date_range(event)
+        accounts: List[Account] = self._get_investment_accounts(user, event)
+
+        transactions: List[InvestmentTransaction] = []
+        for account in accounts:
+            transactions.extend(
+                transaction
+                for transaction in self.db.get_account_transactions(
+                    account.account_id,
+                    datetime.min,
+                    datetime.combine(end_date, datetime.min.time()),
+                )
+                if isinstance(transaction, InvestmentTransaction)
+            )
+
+        security_ids = sorted({transaction.security_id for transaction in transactions})
+        price_history = self.price_history.get_bars_for_securities(security_ids)
+        latest_prices = self._get_latest_prices(security_ids)
+
+        history = self.engine.get_history(
+            transactions, price_history, start_date, end_date, latest_prices
+        ).resample(CONFIG.portfolio_history.max_points)
+
+        return self._create_response(
+            http_status=HTTPStatus.OK,
+            status=Status.SUCCESS,
+            message="Retrieved portfolio history!",
+            data={
+                "user_id": user.user_id,
+                "account_ids": [account.account_id for account in accounts],
+                "start_date": start_date.isoformat(),
+                "end_date": end_date.isoformat(),
+                "start_value": float(history.values[0]),
+                "end_value": float(history.values[-1]),
+                "time_weighted_return": float(history.time_weighted_returns[-1]),
+                "history": history.to_dict(),
+            },
+        )
+
+    def validate_fields(self, event: dict) -> None:
+        pass
+
+    def is_authenticated_api(self) -> bool:
+        return True
+
+    def _get_date_range(self, event: dict) -> Tuple[date, date]:
+        log.info("Getting optional date range from event...")
+        try:
+            end_date_str = WalterAPIMethod.get_query_field(event, "end_date")
+            end_date = (
+                datetime.strptime(end_date_str, "%Y-%m-%d").date()
+                if end_date_str
+                else datetime.now(timezone.utc).date()
+            )
+            start_date_str = WalterAPIMethod.get_query_field(event, "start_date")
+            start_date = (
+                datetime.strptime(start_date_str, "%Y-%m-%d").date()
+                if start_date_str
+                else end_date - timedelta(days=GetPortfolioHistory.DEFAULT_RANGE_DAYS)
+            )
+        except ValueError:
+            raise BadRequest("Invalid date range! Dates must be formatted YYYY-MM-DD.")
+
+        if start_date > end_date:
+            raise BadRequest("Start date must not be after end date!")
+        max_range_days = CONFIG.portfolio_history.max_range_days
+        if (end_date - start_date).days > max_range_days:
+            raise BadRequest(f"Date range must not exceed {max_range_days} days!")
+
+        return start_date, end_date
+
+    def _get_investment_accounts(self, user: User, event: dict) -> List[Account]:
+        account_id = WalterAPIMethod.get_query_field(event, "account_id")
+        if account_id:
+            log.info(f"Getting portfolio history for account '{account_id}'")
+            account = self.db.get_account(user.user_id, account_id)
+            if account is None:
+                raise AccountDoesNotExist("Account does not exist for user!")
+            if account.account_type != AccountType.INVESTMENT:
+                raise BadRequest("Account is not an investment account!")
+            return [account]
+
+        log.info(f"Getting portfolio history for all accounts of user '{user.user_id}'")
+        return [
+            account
+            for account in self.db.get_accounts(user.user_id)
+            if account.account_type == AccountType.INVESTMENT
+        ]
+
+    def _get_latest_prices(
+        self, security_ids: List[str]
+    ) -> Dict[str, Tuple[date, float]]:
+        latest_prices = {}
+        for security_id in security_ids:
+            security = self.db.get_security(security_id)
+            if security is None:
+                continue
+            latest_prices[security_id] = (
+                security.price_updated_at.date(),
+                security.current_price,
+            )
+        return latest_prices
@@ -21,6 +21,8 @@ class APIRouter:
     USER_RESOURCE = "/users"
     ACCOUNTS_RESOURCE = "/accounts"
     TRANSACTIONS_RESOURCE = "/transactions"
+    SPENDING_ANALYTICS_RESOURCE = "/analytics/spending"
+    PORTFOLIO_HISTORY_RESOURCE = "/portfolio/history"
     PLAID_CREATE_LINK_TOKEN_RESOURCE = "/plaid/create-link-token"
     PLAID_EXCHANGE_PUBLIC_TOKEN_RESOURCE = "/plaid/exchange-public-token"
     PLAID_SYNC_TRANSACTIONS_RESOURCE = "/plaid/sync-transactions"
@@ -84,6 +86,24 @@ class APIRouter:
                     APIMethod.DELETE_TRANSACTION, request_id
                 )
 
+            #############
+            # ANALYTICS #
+            #############
+
+            case (APIRouter.SPENDING_ANALYTICS_RESOURCE, HTTPMethod.GET):
+                return self.api_factory.get_api(
+                    APIMethod.GET_SPENDING_ANALYTICS, request_id
+                )
+
+            #############
+            # PORTFOLIO #
+            #############
+
+            case (APIRouter.PORTFOLIO_HISTORY_RESOURCE, HTTPMethod.GET):
+                return self.api_factory.get_api(
+                    APIMethod.GET_PORTFOLIO_HISTORY, request_id
+                )
+
             #########
             # USERS #
             #########
@@ -308,3 +308,6 @@ class AddTransaction(WalterAPIMethod):
 
     def is_authenticated_api(self) -> bool:
         return True
+
+    def is_user_data_write_api(self) -> bool:
+        return True
@@ -91,6 +91,9 @@ class DeleteTransaction(WalterAPIMethod):
     def is_authenticated_api(self) -> bool:
         return True
 
+    def is_user_data_write_api(self) -> bool:
+        return True
+
     def _verify_transaction_exists(self, user: User, event: dict) -> Transaction:
         log.info(f"Verifying transaction exists for user '{user.user_id}'")
 
@@ -168,6 +168,9 @@ class EditTransaction(WalterAPIMethod):
     def is_authenticated_api(self) -> bool:
         return True
 
+    def is_user_data_write_api(self) -> bool:
+        return True
+
     @staticmethod
     def _get_date(date: str) -> dt.datetime:
         try:
@@ -1,26 +1,32 @@
 from dataclasses import dataclass
 from datetime import datetime
-from typing import List, Optional, Tuple
+from typing import FrozenSet, List, Optional, Tuple
 
+from src.api.common.etags import ValidatorType
 from src.api.common.exceptions import (
     AccountDoesNotExist,
     BadRequest,
     NotAuthenticated,
     UserDoesNotExist,
 )
+from src.api.common.fields import parse_fields
 from src.api.common.methods import WalterAPIMethod
 from src.api.common.models import HTTPStatus, Status
+from src.api.common.pagination import decode_next_token, encode_next_token
 from src.api.common.response import Response
+from src.api.transactions.get_transactions.models import (
+    TRANSACTION_FIELDS,
+    GetTransactionsResponseTransactions,
+    TransactionsLayout,
+    get_transaction_attributes,
+)
 from src.auth.authenticator import WalterAuthenticator
+from src.config import CONFIG
 from src.database.accounts.models import Account
 from src.database.client import WalterDB
 from src.database.sessions.models import Session
-from src.database.transactions.models import (
-    BankTransaction,
-    InvestmentTransaction,
-    Transaction,
-    TransactionType,
-)
+from src.database.transactions.batch import TransactionBatch
+from src.database.transactions.models import TransactionTotals
 from src.database.users.models import User
 from src.environment import Domain
 from src.metrics.client import DatadogMetricsClient
@@ -36,6 +42,21 @@ class GetTransactions(WalterAPIMethod):
 
     This API gets the transactions for the user over a given
     period of time from the Transactions table in WalterDB.
+
+    Requests with a `limit` return a single page of transactions and an
+    opaque `next_token` to resume from, and `order=desc` returns the most
+    recent transactions first. The income and expense totals of the whole
+    requested window are returned with the first page, and are read from
+    the cash flow rollups once `migrations.cash_flow_rollups_enabled` is set.
+
+    Requests with `layout=normalized` or `layout=columnar` return compact
+    transactions that reference the accounts and merchant logos of the
+    response by ID rather than repeating them for every transaction, see
+    `TransactionsLayout`.
+
+    Requests with `fields`, e.g. `fields=transaction_id,transaction_amount`,
+    only read the DDB attributes of the given transaction fields and only
+    compute and return those fields.
     """
 
     API_NAME = "GetTransactions"
@@ -73,51 +94,83 @@ class GetTransactions(WalterAPIMethod):
         date_range: Tuple[datetime, datetime] = self._get_date_range(event)
         start_date, end_date = date_range
         account_id: Optional[str] = self._get_account_id(event)
+        descending: bool = self._is_descending(event)
+        limit: Optional[int] = self._get_limit(event)
+        layout: TransactionsLayout = self._get_layout(event)
+        fields: Optional[FrozenSet[str]] = parse_fields(
+            WalterAPIMethod.get_query_field(event, "fields"), TRANSACTION_FIELDS
+        )
+        attributes = get_transaction_attributes(fields) if fields else None
 
         # if account_id is provided, get transactions for that account, else get transactions for user
         if account_id:
-            account: Account = self._verify_account_exists(user, account_id)
-            transactions: List[Transaction] = self.db.get_account_transactions(
-                account.account_id, start_date, end_date
+            accounts: List[Account] = [self._verify_account_exists(user, account_id)]
+        else:
+            accounts: List[Account] = self.db.get_accounts(user.user_id)
+
+        # return the complete window if the request is not paginated
+        if limit is None:
+            transactions = self._get_transactions(
+                user, account_id, accounts, start_date, end_date, attributes
             )
-            account_transactions: List[dict] = self._get_account_transactions(
-                [account], transactions
+            if descending:
+                transactions = transactions.reverse()
+            return self._get_transactions_response(
+                user,
+                accounts,
+                transactions,
+                None,
+                transactions.get_totals(),
+                layout,
+                fields,
+            )
+
+        next_token = WalterAPIMethod.get_query_field(event, "next_token")
+        if account_id:
+            exclusive_start_key = (
+                decode_next_token(next_token, "account_id", account_id)
+                if next_token
+                else None
+            )
+            transactions, last_evaluated_key = self.db.get_account_transactions_page(
+                account_id,
+                start_date,
+                end_date,
+                limit,
+                exclusive_start_key,
+                descending,
+                attributes,
             )
         else:
-            accounts: List[Account] = self.db.get_accounts(user.user_id)
-            transactions: List[Transaction] = self.db.get_user_transactions(
-                user.user_id, start_date, end_date
+            exclusive_start_key = (
+                decode_next_token(next_token, "user_id", user.user_id)
+                if next_token
+                else None
             )
-            account_transactions: List[dict] = self._get_account_transactions(
-                accounts, transactions
+            transactions, last_evaluated_key = self.db.get_user_transactions_page(
+                user.user_id,
+                start_date,
+                end_date,
+                limit,
+                exclusive_start_key,
+                descending,
+                attributes,
             )
 
-        total_income = sum(
-            [
-                transaction.transaction_amount
-                for transaction in transactions
-                if transaction.is_income()
-            ]
-        )
-        total_expenses = sum(
-            [
-                transaction.transaction_amount
-                for transaction in transactions
-                if transaction.is_expense()
-            ]
-        )
-        return self._create_response(
-            http_status=HTTPStatus.OK,
-            status=Status.SUCCESS,
-            message="Retrieved transactions!",
-            data={
-                "user_id": user.user_id,
-                "num_transactions": len(transactions),
-                "total_income": total_income,
-                "total_expense": total_expenses,
-                "cash_flow": total_income - total_expenses,
-                "transactions": account_transactions,
-            },
+        # totals span the requested window and are only returned with its
+        # first page, later pages only return their transactions
+        totals = None
+        if next_token is None:
+            totals = self._get_totals(user, account_id, start_date, end_date)
+
+        return self._get_transactions_response(
+            user,
+            accounts,
+            transactions,
+            encode_next_token(last_evaluated_key),
+            totals,
+            layout,
+            fields,
         )
 
     def validate_fields(self, event: dict) -> None:
@@ -126,6 +179,12 @@ class GetTransactions(WalterAPIMethod):
     def is_authenticated_api(self) -> bool:
         return True
 
+    def get_validator_type(self) -> Optional[ValidatorType]:
+        return ValidatorType.DATA_VERSION
+
+    def get_response_cache_ttl_seconds(self) -> Optional[int]:
+        return CONFIG.response_cache.transactions_ttl_seconds
+
     def _verify_account_exists(self, user: User, account_id: str) -> Account:
         """
         Verify that the account exists for the user.
@@ -171,6 +230,103 @@ class GetTransactions(WalterAPIMethod):
 
         return start_date, end_date
 
+    def _is_descending(self, event: dict) -> bool:
+        order = WalterAPIMethod.get_query_field(event, "order") or "asc"
+        if order not in ["asc", "desc"]:
+            raise BadRequest(f"Invalid order '{order}'! Order must be 'asc' or 'desc'.")
+        return order == "desc"
+
+    def _get_layout(self, event: dict) -> TransactionsLayout:
+        layout = WalterAPIMethod.get_query_field(event, "layout") or "rows"
+        try:
+            return TransactionsLayout.from_string(layout)
+        except ValueError:
+            raise BadRequest(
+                f"Invalid layout '{layout}'! Layout must be one of "
+                f"{[layout.value for layout in TransactionsLayout]}."
+            )
+
+    def _get_limit(self, event: dict) -> Optional[int]:
+        log.info("Getting optional page limit from event...")
+        limit_str = WalterAPIMethod.get_query_field(event, "limit")
+        if not limit_str:
+            # requests resuming from a next token are always paginated
+            if WalterAPIMethod.get_query_field(event, "next_token"):
+                return CONFIG.transaction_pagination.default_limit
+            return None
+
+        max_limit = CONFIG.transaction_pagination.max_limit
+        try:
+            limit = int(limit_str)
+        except ValueError:
+            raise BadRequest(f"Invalid limit '{limit_str}'!")
+        if limit < 1 or limit > max_limit:
+            raise BadRequest(f"Limit must be between 1 and {max_limit}!")
+        return limit
+
+    def _get_transactions(
+        self,
+        user: User,
+        account_id: Optional[str],
+        accounts: List[Account],
+        start_date: datetime,
+        end_date: datetime,
+        attributes: Optional[List[str]],
+    ) -> TransactionBatch:
+        if account_id:
+            return self.db.get_account_transaction_batch(
+                account_id, start_date, end_date, attributes
+            )
+        return self.db.get_user_transaction_batch(
+            user.user_id, start_date, end_date, attributes
+        ).filter_accounts(account.account_id for account in accounts)
+
+    def _get_totals(
+        self,
+        user: User,
+        account_id: Optional[str],
+        start_date: datetime,
+        end_date: datetime,
+    ) -> TransactionTotals:
+        if account_id:
+            return self.db.get_account_transaction_totals(
+                account_id, start_date, end_date
+            )
+        return self.db.get_user_transaction_totals(user.user_id, start_date, end_date)
+
+    def _get_transactions_response(
+        self,
+        user: User,
+        accounts: List[Account],
+        transactions: TransactionBatch,
+        next_token: Optional[str],
+        totals: Optional[TransactionTotals],
+        layout: TransactionsLayout,
+        fields: Optional[FrozenSet[str]],
+    ) -> Response:
+        accounts_dict = {account.account_id: account for account in accounts}
+        # skip transactions of accounts that are being deleted, pages are
+        # not filtered when they are read
+        transactions = transactions.filter_accounts(accounts_dict)
+        data = {
+            "user_id": user.user_id,
+            "num_transactions": len(transactions),
+        }
+        if totals is not None:
+            data.update(totals.to_dict())
+        data.update(
+            GetTransactionsResponseTransactions(
+                accounts_dict, transactions, fields
+            ).to_dict(layout)
+        )
+        data["next_token"] = next_token
+        return self._create_response(
+            http_status=HTTPStatus.OK,
+            status=Status.SUCCESS,
+            message="Retrieved transactions!",
+            data=data,
+        )
+
     def _get_account_id(self, event: dict) -> Optional[str]:
         log.info("Getting optional account ID from event...")
         query_params = event.get("queryStringParameters") or {}
@@ -180,69 +336,3 @@ class GetTransactions(WalterAPIMethod):
         else:
             log.info("No account ID found in event!")
         return account_id
-
-    def _get_account_transactions(
-        self, accounts: List[Account], transactions: List[Transaction]
-    ) -> List[dict]:
-        accounts_dict = {}
-        for account in accounts:
-            accounts_dict[account.account_id] = account
-
-        account_transactions = []
-        for transaction in transactions:
-            account = accounts_dict[transaction.account_id]
-            match transaction.transaction_type:
-                case TransactionType.INVESTMENT:
-                    if isinstance(transaction, InvestmentTransaction):
-                        account_transactions.append(
-                            {
-                                "account_id": account.account_id,
-                                "transaction_id": transaction.transaction_id,
-                                "security_id": transaction.security_id,
-                                "account_institution_name": account.institution_name,
-                                "account_name": account.account_name,
-                                "account_type": account.account_type.value,
-                                "account_mask": account.account_mask,
-                                "transaction_date": transaction.transaction_date.split(
-                                    "#"
-                                )[0],
-                                "transaction_type": transaction.transaction_type.value,
-                                "transaction_subtype": transaction.transaction_subtype.value,
-                                "transaction_category": transaction.transaction_category.value,
-                                "price_per_share": transaction.price_per_share,
-                                "quantity": transaction.quantity,
-                                "merchant_logo_url": self._get_merchant_logo_url(
-                                    transaction.merchant_logo_s3_uri
-                                ),
-                                "transaction_amount": transaction.transaction_amount,
-                                "is_plaid_transaction": transaction.is_plaid_transaction(),
-                            }
-                        )
-                case TransactionType.BANKING:
-                    if isinstance(transaction, BankTransaction):
-                        account_transactions.append(
-                            {
-                                "account_id": account.account_id,
-                                "transaction_id": transaction.transaction_id,
-                                "account_institution_name": account.institution_name,
-                                "account_name": account.account_name,
-                                "account_type": account.account_type.value,
-                                "account_mask": account.account_mask,
-                                "transaction_type": transaction.transaction_type.value,
-                                "transaction_subtype": transaction.transaction_subtype.value,
-                                "transaction_category": transaction.transaction_category.value,
-                                "transaction_date": transaction.transaction_date.isoformat(),
-                                "merchant_name": transaction.merchant_name,
-                                "merchant_logo_url": self._get_merchant_logo_url(
-                                    transaction.merchant_logo_s3_uri
-                                ),
-                                "transaction_amount": transaction.transaction_amount,
-                                "is_plaid_transaction": transaction.is_plaid_transaction(),
-                            }
-                        )
-
-        return account_transactions
-
-    def _get_merchant_logo_url(self, merchant_logo_s3_uri: str) -> str:
-        key = merchant_logo_s3_uri.split("public/")[-1]
-        return f"https://d2v0gz9k690ozv.cloudfront.net/public/{key}"
@@ -0,0 +1,433 @@
+from dataclasses import dataclass
+from enum import Enum
+from functools import cached_property
+from itertools import repeat
+from typing import Dict, FrozenSet, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from src.database.accounts.models import Account
+from src.database.transactions.batch import TransactionBatch
+
+MERCHANT_LOGO_BASE_URL = "https://d2v0gz9k690ozv.cloudfront.net/public/"
+"""(str): The CloudFront URL merchant logo keys are served from."""
+
+TRANSACTION_FIELDS: Dict[str, str] = {
+    "account_id": "account_id",
+    "transaction_id": "transaction_id",
+    "account_institution_name": "account_id",
+    "account_name": "account_id",
+    "account_type": "account_id",
+    "account_mask": "account_id",
+    "transaction_type": "transaction_type",
+    "transaction_subtype": "transaction_subtype",
+    "transaction_category": "transaction_category",
+    "transaction_date": "transaction_date",
+    "merchant_name": "merchant_name",
+    "security_id": "security_id",
+    "quantity": "quantity",
+    "price_per_share": "price_per_share",
+    "merchant_logo_url": "merchant_logo_s3_uri",
+    "transaction_amount": "transaction_amount",
+    "is_plaid_transaction": "plaid_transaction_id",
+}
+"""(Dict[str, str]): The fields of GetTransactions transactions and the DDB attribute each field is read from."""
+
+ACCOUNT_FIELDS: Dict[str, str] = {
+    "account_institution_name": "institution_name",
+    "account_name": "account_name",
+    "account_type": "account_type",
+    "account_mask": "account_mask",
+}
+"""(Dict[str, str]): The account fields of transactions and their names in the `accounts` side table."""
+
+INVESTMENT_FIELDS = ["security_id", "quantity", "price_per_share"]
+BANK_FIELDS = ["merchant_name"]
+
+INVESTMENT_ROW_FIELDS = [
+    "account_id",
+    "transaction_id",
+    "security_id",
+    "account_institution_name",
+    "account_name",
+    "account_type",
+    "account_mask",
+    "transaction_date",
+    "transaction_type",
+    "transaction_subtype",
+    "transaction_category",
+    "price_per_share",
+    "quantity",
+    "merchant_logo_url",
+    "transaction_amount",
+    "is_plaid_transaction",
+]
+BANK_ROW_FIELDS = [
+    "account_id",
+    "transaction_id",
+    "account_institution_name",
+    "account_name",
+    "account_type",
+    "account_mask",
+    "transaction_type",
+    "transaction_subtype",
+    "transaction_category",
+    "transaction_date",
+    "merchant_name",
+    "merchant_logo_url",
+    "transaction_amount",
+    "is_plaid_transaction",
+]
+COLUMNAR_FIELDS = [
+    "transaction_id",
+    "account_id",
+    "transaction_type",
+    "transaction_subtype",
+    "transaction_category",
+    "transaction_date",
+    "transaction_amount",
+    "merchant_logo",
+    "is_plaid_transaction",
+    "merchant_name",
+    "security_id",
+    "quantity",
+    "price_per_share",
+]
+# columnar fields that are not decoded as is from the batch columns
+DERIVED_COLUMNAR_FIELDS = [
+    "merchant_logo",
+    "is_plaid_transaction",
+    "quantity",
+    "price_per_share",
+]
+
+
+class TransactionsLayout(Enum):
+    """
+    Transactions Layouts
+
+    The layouts of the transactions of GetTransactions responses:
+
+    - ROWS: One dict per transaction with its account attributes and
+      merchant logo URL (default).
+    - NORMALIZED: Compact dicts per transaction referencing the `accounts`
+      and `merchant_logos` side tables.
+    - COLUMNAR: One list per attribute referencing the same side tables.
+    """
+
+    ROWS = "rows"
+    NORMALIZED = "normalized"
+    COLUMNAR = "columnar"
+
+    @classmethod
+    def from_string(cls, layout_str: str):
+        for layout in TransactionsLayout:
+            if layout.value == layout_str.lower():
+                return layout
+        raise ValueError(f"Invalid layout '{layout_str}'!")
+
+
+def get_merchant_logo_key(merchant_logo_s3_uri: str) -> str:
+    return merchant_logo_s3_uri.split("public/")[-1]
+
+
+def get_merchant_logo_url(merchant_logo_s3_uri: str) -> str:
+    return MERCHANT_LOGO_BASE_URL + get_merchant_logo_key(merchant_logo_s3_uri)
+
+
+def get_transaction_attributes(fields: FrozenSet[str]) -> List[str]:
+    """Get the DDB attributes read for the given transaction fields."""
+    return sorted({TRANSACTION_FIELDS[field] for field in fields})
+
+
+def _zip_columns(columns: Dict[str, list], names: List[str]) -> Iterator[tuple]:
+    if not names:
+        return repeat(())
+    return zip(*[columns[name] for name in names])
+
+
+@dataclass
+class GetTransactionsResponseTransactions:
+    """
+    GetTransactions Response Transactions
+
+    Serializes a batch of transactions into the transactions of a
+    GetTransactions response in the given layout. The normalized and
+    columnar layouts send the attributes of each account and the key of
+    each merchant logo once, in the `accounts` and `merchant_logos` side
+    tables, rather than once per transaction.
+
+    Only the given fields are computed and serialized, if any, and the
+    transactions must be filtered to the given accounts.
+    """
+
+    accounts: Dict[str, Account]
+    transactions: TransactionBatch
+    fields: Optional[FrozenSet[str]] = None
+
+    def to_dict(self, layout: TransactionsLayout) -> dict:
+        match layout:
+            case TransactionsLayout.ROWS:
+                return {"transactions": self.to_rows()}
+            case TransactionsLayout.NORMALIZED:
+                return {**self._get_side_tables(), "transactions": self.to_normalized()}
+            case TransactionsLayout.COLUMNAR:
+                return {**self._get_side_tables(), "transactions": self.to_columnar()}
+
+    def to_rows(self) -> List[dict]:
+        if self.fields is not None:
+            return self._to_sparse_rows()
+
+        transactions = self.transactions
+        columns = transactions.to_columns()
+
+        # account attributes and logo urls are computed once per distinct
+        # account and logo of the batch rather than once per transaction
+        account_attributes = self._get_account_attributes()
+        merchant_logo_urls = {
+            merchant_logo_s3_uri: get_merchant_logo_url(merchant_logo_s3_uri)
+            for merchant_logo_s3_uri in transactions.merchant_logo_s3_uris
+        }
+
+        rows = []
+        for (
+            is_investment,
+            account_id,
+            transaction_id,
+            transaction_type,
+            transaction_subtype,
+            transaction_category,
+            transaction_date,
+            transaction_amount,
+            merchant_logo_s3_uri,
+            plaid_transaction_id,
+            merchant_name,
+            security_id,
+            quantity,
+            price_per_share,
+        ) in zip(
+            transactions.is_investment().tolist(),
+            columns["account_id"],
+            columns["transaction_id"],
+            columns["transaction_type"],
+            columns["transaction_subtype"],
+            columns["transaction_category"],
+            columns["transaction_date"],
+            columns["transaction_amount"],
+            columns["merchant_logo_s3_uri"],
+            columns["plaid_transaction_id"],
+            columns["merchant_name"],
+            columns["security_id"],
+            columns["quantity"],
+            columns["price_per_share"],
+        ):
+            institution_name, account_name, account_type, account_mask = (
+                account_attributes[account_id]
+            )
+            if is_investment:
+                rows.append(
+                    {
+                        "account_id": account_id,
+                        "transaction_id": transaction_id,
+                        "security_id": security_id,
+                        "account_institution_name": institution_name,
+                        "account_name": account_name,
+                        "account_type": account_type,
+                        "account_mask": account_mask,
+                        "transaction_date": transaction_date,
+                        "transaction_type": transaction_type,
+                        "transaction_subtype": transaction_subtype,
+                        "transaction_category": transaction_category,
+                        "price_per_share": price_per_share,
+                        "quantity": quantity,
+                        "merchant_logo_url": merchant_logo_urls[merchant_logo_s3_uri],
+                        "transaction_amount": transaction_amount,
+                        "is_plaid_transaction": plaid_transaction_id is not None,
+                    }
+                )
+            else:
+                rows.append(
+                    {
+                        "account_id": account_id,
+                        "transaction_id": transaction_id,
+                        "account_institution_name": institution_name,
+                        "account_name": account_name,
+                        "account_type": account_type,
+                        "account_mask": account_mask,
+                        "transaction_type": transaction_type,
+                        "transaction_subtype": transaction_subtype,
+                        "transaction_category": transaction_category,
+                        "transaction_date": transaction_date,
+                        "merchant_name": merchant_name,
+                        "merchant_logo_url": merchant_logo_urls[merchant_logo_s3_uri],
+                        "transaction_amount": transaction_amount,
+                        "is_plaid_transaction": plaid_transaction_id is not None,
+                    }
+                )
+
+        return rows
+
+    def to_normalized(self) -> List[dict]:
+        columns = self.to_columnar()
+        common = [
+            name
+            for name in columns
+            if name not in INVESTMENT_FIELDS and name not in BANK_FIELDS
+        ]
+        investment = [name for name in INVESTMENT_FIELDS if name in columns]
+        bank = [name for name in BANK_FIELDS if name in columns]
+        rows = []
+        for is_investment, common_values, investment_values, bank_values in zip(
+            self.transactions.is_investment().tolist(),
+            _zip_columns(columns, common),
+            _zip_columns(columns, investment),
+            _zip_columns(columns, bank),
+        ):
+            row = dict(zip(common, common_values))
+            if is_investment:
+                row.update(zip(investment, investment_values))
+            else:
+                row.update(zip(bank, bank_values))
+            rows.append(row)
+        return rows
+
+    def to_columnar(self) -> Dict[str, list]:
+        transactions = self.transactions
+        names = self._get_columnar_fields()
+        columns = transactions.to_columns(
+            name for name in names if name not in DERIVED_COLUMNAR_FIELDS
+        )
+        if "merchant_logo" in names:
+            columns["merchant_logo"] = self.merchant_logos[1]
+        if "is_plaid_transaction" in names:
+            columns["is_plaid_transaction"] = [
+                plaid_transaction_id is not None
+                for plaid_transaction_id in transactions.plaid_transaction_ids
+            ]
+        # investment attributes of bank transactions are stored as NaN,
+        # which is not valid JSON
+        is_investment = transactions.is_investment()
+        for name, values in [
+            ("quantity", transactions.quantities),
+            ("price_per_share", transactions.prices_per_share),
+        ]:
+            if name in names:
+                columns[name] = np.where(
+                    is_investment, values.astype(object), None
+                ).tolist()
+        return {name: columns[name] for name in names}
+
+    @cached_property
+    def merchant_logos(self) -> Tuple[List[str], List[int]]:
+        """Get the keys of the distinct merchant logos of the batch and the index of the logo of each transaction."""
+        transactions = self.transactions
+        # the string table of a filtered batch may include logos of
+        # excluded transactions, only the logos in use are sent
+        logo_codes, merchant_logos = np.unique(
+            transactions.merchant_logo_codes, return_inverse=True
+        )
+        merchant_logo_keys = [
+            get_merchant_logo_key(transactions.merchant_logo_s3_uris[logo_code])
+            for logo_code in logo_codes.tolist()
+        ]
+        return merchant_logo_keys, merchant_logos.tolist()
+
+    def _to_sparse_rows(self) -> List[dict]:
+        transactions = self.transactions
+        fields = self.fields
+        columns = transactions.to_columns(
+            {TRANSACTION_FIELDS[field] for field in fields}
+        )
+        values: Dict[str, list] = {
+            field: columns[field] for field in fields if field in columns
+        }
+        account_fields = [field for field in ACCOUNT_FIELDS if field in fields]
+        if account_fields:
+            account_attributes = self._get_account_attributes()
+            for index, field in enumerate(ACCOUNT_FIELDS):
+                if field in fields:
+                    values[field] = [
+                        account_attributes[account_id][index]
+                        for account_id in columns["account_id"]
+                    ]
+        if "merchant_logo_url" in fields:
+            merchant_logo_urls = {
+                merchant_logo_s3_uri: get_merchant_logo_url(merchant_logo_s3_uri)
+                for merchant_logo_s3_uri in transactions.merchant_logo_s3_uris
+            }
+            values["merchant_logo_url"] = [
+                merchant_logo_urls[merchant_logo_s3_uri]
+                for merchant_logo_s3_uri in columns["merchant_logo_s3_uri"]
+            ]
+        if "is_plaid_transaction" in fields:
+            values["is_plaid_transaction"] = [
+                plaid_transaction_id is not None
+                for plaid_transaction_id in columns["plaid_transaction_id"]
+            ]
+
+        investment = [field for field in INVESTMENT_ROW_FIELDS if field in fields]
+        bank = [field for field in BANK_ROW_FIELDS if field in fields]
+        rows = []
+        for is_investment, investment_values, bank_values in zip(
+            transactions.is_investment().tolist(),
+            _zip_columns(values, investment),
+            _zip_columns(values, bank),
+        ):
+            if is_investment:
+                rows.append(dict(zip(investment, investment_values)))
+            else:
+                rows.append(dict(zip(bank, bank_values)))
+        return rows
+
+    def _get_account_attributes(self) -> Dict[str, tuple]:
+        account_attributes = {}
+        for account_id in self.transactions.account_ids:
+            account = self.accounts.get(account_id)
+            if account is not None:
+                account_attributes[account_id] = (
+                    account.institution_name,
+                    account.account_name,
+                    account.account_type.value,
+                    account.account_mask,
+                )
+        return account_attributes
+
+    def _get_columnar_fields(self) -> List[str]:
+        fields = self.fields
+        if fields is None:
+            return COLUMNAR_FIELDS
+        # transactions reference the side tables of the selected account
+        # and logo fields by account ID and logo index
+        selected = set(fields)
+        if any(field in fields for field in ACCOUNT_FIELDS):
+            selected.add("account_id")
+        if "merchant_logo_url" in fields:
+            selected.add("merchant_logo")
+        return [name for name in COLUMNAR_FIELDS if name in selected]
+
+    def _get_side_tables(self) -> dict:
+        fields = self.fields
+        side_tables = {}
+        account_fields = [
+            field for field in ACCOUNT_FIELDS if fields is None or field in fields
+        ]
+        if account_fields:
+            transactions = self.transactions
+            accounts = {}
+            for account_code in np.unique(transactions.account_codes).tolist():
+                account = self.accounts[transactions.account_ids[account_code]]
+                attributes = {
+                    "institution_name": account.institution_name,
+                    "account_name": account.account_name,
+                    "account_type": account.account_type.value,
+                    "account_mask": account.account_mask,
+                }
+                accounts[account.account_id] = {
+                    ACCOUNT_FIELDS[field]: attributes[ACCOUNT_FIELDS[field]]
+                    for field in account_fields
+                }
+            side_tables["accounts"] = accounts
+        if fields is None or "merchant_logo_url" in fields:
+            side_tables["merchant_logo_base_url"] = MERCHANT_LOGO_BASE_URL
+            side_tables["merchant_logos"] = self.merchant_logos[0]
+        return side_tables
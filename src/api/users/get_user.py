@@ -2,6 +2,7 @@ import datetime as dt
 from dataclasses import dataclass
 from typing import Optional
 
+from src.api.common.etags import ValidatorType
 from src.api.common.exceptions import NotAuthenticated, UserDoesNotExist
 from src.api.common.methods import HTTPStatus, Status, WalterAPIMethod
 from src.api.common.response import Response
@@ -69,9 +70,6 @@ class GetUser(WalterAPIMethod):
     def execute(self, event: dict, session: Optional[Session]) -> Response:
         user = self._verify_user_exists(session.user_id)
 
-        # update user last active date
-        user.last_active_date = dt.datetime.now(dt.UTC)
-
         # update user profile picture url if it has expired
         now = dt.datetime.now(dt.UTC)
         if user.profile_picture_s3_uri and now > user.profile_picture_url_expiration:
@@ -86,9 +84,7 @@ class GetUser(WalterAPIMethod):
                     expiration_in_seconds=3600,
                 )
             )
-
-        # save user and any updates to db
-        self.db.update_user(user)
+            self.db.update_user(user)
 
         return self._create_response(
             http_status=HTTPStatus.OK,
@@ -114,3 +110,7 @@ class GetUser(WalterAPIMethod):
 
     def is_authenticated_api(self) -> bool:
         return True
+
+    def get_validator_type(self) -> Optional[ValidatorType]:
+        # profile picture URLs are refreshed on read, so the response is hashed
+        return ValidatorType.BODY_HASH
@@ -107,3 +107,6 @@ class UpdateUser(WalterAPIMethod):
 
     def is_authenticated_api(self) -> bool:
         return True
+
+    def is_user_data_write_api(self) -> bool:
+        return True
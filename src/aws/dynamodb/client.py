@@ -1,10 +1,13 @@
 import json
+import random
+import time
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Iterator, List, Optional, Tuple
 
 from botocore.exceptions import ClientError
 from mypy_boto3_dynamodb import DynamoDBClient
 
+from src.aws.dynamodb.exceptions import UnprocessedItemsError
 from src.utils.log import Logger
 
 log = Logger(__name__).get_logger()
@@ -19,6 +22,12 @@ class WalterDDBClient:
     utilized by Walter to interact with all DDB tables.
     """
 
+    BATCH_GET_ITEM_LIMIT = 100
+    BATCH_WRITE_ITEM_LIMIT = 25
+    MAX_BATCH_ATTEMPTS = 8
+    BATCH_RETRY_BASE_DELAY_SECONDS = 0.05
+    BATCH_RETRY_MAX_DELAY_SECONDS = 5.0
+
     client: DynamoDBClient
 
     def __post_init__(self) -> None:
@@ -29,21 +38,68 @@ class WalterDDBClient:
         # create paginators
         self.scan_paginator = self.client.get_paginator("scan")
 
-    def put_item(self, table: str, item: dict) -> None:
+    def put_item(
+        self, table: str, item: dict, return_old: bool = False
+    ) -> Optional[dict]:
         """
         Put an item into the DDB table.
 
         Args:
             table: The name of the DDB table to insert the item.
             item: The item to insert into the DDB table.
+            return_old: Return the item replaced by the put, if any.
 
         Returns:
-            None.
+            The replaced item if `return_old` is set and an item was replaced,
+            else None.
         """
         log.debug(f"Adding item to table '{table}':\n{json.dumps(item, indent=4)}")
         try:
-            self.client.put_item(TableName=table, Item=item)
+            kwargs = {"TableName": table, "Item": item}
+            if return_old:
+                kwargs["ReturnValues"] = "ALL_OLD"
+            return self.client.put_item(**kwargs).get("Attributes")
+        except ClientError as error:
+            log.error(
+                f"Unexpected error occurred putting item to '{table}'!\n"
+                f"Error: {error.response['Error']['Message']}"
+            )
+            raise error
+
+    def conditional_put_item(
+        self,
+        table: str,
+        item: dict,
+        condition_expression: str,
+        attribute_values: Optional[dict] = None,
+        attribute_names: Optional[dict] = None,
+    ) -> bool:
+        """
+        Put an item into the DDB table if the existing item satisfies the condition.
+
+        Args:
+            table: The name of the DDB table to insert the item.
+            item: The item to insert into the DDB table.
+            condition_expression: The condition the existing item must satisfy.
+            attribute_values: The optional expression attribute values.
+            attribute_names: The optional expression attribute names.
+
+        Returns:
+            True if the item was put, False if the condition was not satisfied.
+        """
+        log.debug(
+            f"Conditionally adding item to table '{table}':\n{json.dumps(item, indent=4)}"
+        )
+        kwargs = WalterDDBClient._get_condition_kwargs(
+            condition_expression, attribute_values, attribute_names
+        )
+        try:
+            self.client.put_item(TableName=table, Item=item, **kwargs)
+            return True
         except ClientError as error:
+            if error.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                log.debug(f"Condition not satisfied for item in table '{table}'")
+                return False
             log.error(
                 f"Unexpected error occurred putting item to '{table}'!\n"
                 f"Error: {error.response['Error']['Message']}"
@@ -72,18 +128,33 @@ class WalterDDBClient:
             raise error
 
     def query_index(
-        self, table: str, index_name: str, expression: str, attributes: dict
+        self,
+        table: str,
+        index_name: str,
+        expression: str,
+        attributes: dict,
+        filter_expression: Optional[str] = None,
     ) -> dict | None:
         log.debug(
             f"Querying items in table '{table}' by index '{index_name}' with query:\n{expression}\n{attributes}"
         )
         try:
-            return self.client.query(
-                TableName=table,
-                IndexName=index_name,
-                KeyConditionExpression=expression,
-                ExpressionAttributeValues=attributes,
-            )["Items"]
+            items = []
+            kwargs = {
+                "TableName": table,
+                "IndexName": index_name,
+                "KeyConditionExpression": expression,
+                "ExpressionAttributeValues": attributes,
+            }
+            if filter_expression is not None:
+                kwargs["FilterExpression"] = filter_expression
+            # follow pagination so queries over more than 1MB of items are complete
+            while True:
+                response = self.client.query(**kwargs)
+                items.extend(response["Items"])
+                if "LastEvaluatedKey" not in response:
+                    return items
+                kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
         except ClientError as error:
             log.error(
                 f"Unexpected error occurred querying items from table '{table}'!\n"
@@ -94,6 +165,55 @@ class WalterDDBClient:
             # i.e. the item does not exist
             return None
 
+    def query_index_pages(
+        self,
+        table: str,
+        index_name: str,
+        expression: str,
+        attributes: dict,
+        projection: Optional[List[str]] = None,
+    ) -> Iterator[List[dict]]:
+        """
+        Query items in a DDB table by index one page at a time.
+
+        Unlike `query_index`, this method yields each page as soon as it is
+        returned by DDB so callers can decode pages without holding the raw
+        items of the complete query in memory.
+
+        Args:
+            table: The name of the DDB table to query.
+            index_name: The name of the index to query.
+            expression: The key condition expression of the query.
+            attributes: The expression attribute values of the query.
+            projection: The names of the attributes to read from each item, if not all.
+
+        Returns:
+            An iterator over the pages of items returned by the query.
+        """
+        log.debug(
+            f"Querying pages of items in table '{table}' by index '{index_name}' with query:\n{expression}\n{attributes}"
+        )
+        kwargs = {
+            "TableName": table,
+            "IndexName": index_name,
+            "KeyConditionExpression": expression,
+            "ExpressionAttributeValues": attributes,
+            **WalterDDBClient._get_projection_kwargs(projection),
+        }
+        try:
+            while True:
+                response = self.client.query(**kwargs)
+                yield response["Items"]
+                if "LastEvaluatedKey" not in response:
+                    return
+                kwargs["ExclusiveStartKey"] = response["LastEvaluatedKey"]
+        except ClientError as error:
+            log.error(
+                f"Unexpected error occurred querying items from table '{table}'!\n"
+                f"Error: {error.response['Error']['Message']}"
+            )
+            raise error
+
     def get_item(self, table: str, key: dict) -> Optional[dict]:
         """
         Get an item from a DDB table given its primary key.
@@ -121,6 +241,48 @@ class WalterDDBClient:
             # i.e. the item does not exist
             return None
 
+    def batch_get_items(self, table: str, keys: List[dict]) -> List[dict]:
+        """
+        Get items from a DDB table given their primary keys in batches.
+
+        Keys are requested in chunks of the BatchGetItem limit and any
+        unprocessed keys returned by DDB are retried with exponential backoff
+        and jitter, up to `MAX_BATCH_ATTEMPTS` requests per chunk. Keys for
+        items that do not exist are omitted from the returned list.
+
+        Args:
+            table: The name of the DDB table.
+            keys: The primary keys of the items to retrieve.
+
+        Returns:
+            The list of DDB items that exist for the given primary keys.
+        """
+        log.debug(f"Batch getting {len(keys)} items from table '{table}'")
+        items = []
+        try:
+            for start in range(0, len(keys), WalterDDBClient.BATCH_GET_ITEM_LIMIT):
+                request = {
+                    table: {
+                        "Keys": keys[
+                            start : start + WalterDDBClient.BATCH_GET_ITEM_LIMIT
+                        ]
+                    }
+                }
+                attempt = 0
+                while request:
+                    self._wait_for_batch_retry(table, attempt)
+                    response = self.client.batch_get_item(RequestItems=request)
+                    items.extend(response["Responses"].get(table, []))
+                    request = response.get("UnprocessedKeys")
+                    attempt += 1
+            return items
+        except ClientError as error:
+            log.error(
+                f"Unexpected error occurred batch getting items from table '{table}'!\n"
+                f"Error: {error.response['Error']['Message']}"
+            )
+            raise error
+
     def scan_table(self, table: str) -> List[dict]:
         """
         Scan the DDB table and return the list of items contained in the table.
@@ -147,22 +309,338 @@ class WalterDDBClient:
                 f"Error: {error.response['Error']['Message']}"
             )
 
-    def delete_item(self, table: str, key: dict) -> None:
+    def query_index_page(
+        self,
+        table: str,
+        index_name: str,
+        expression: str,
+        attributes: dict,
+        exclusive_start_key: Optional[dict] = None,
+        limit: Optional[int] = None,
+        scan_index_forward: bool = True,
+        projection: Optional[List[str]] = None,
+    ) -> Tuple[List[dict], Optional[dict]]:
+        """
+        Query a single page of items in a DDB table by index.
+
+        Args:
+            table: The name of the DDB table to query.
+            index_name: The name of the index to query.
+            expression: The key condition expression of the query.
+            attributes: The expression attribute values of the query.
+            exclusive_start_key: The key to resume the query from, if any.
+            limit: The maximum number of items to evaluate, if any.
+            scan_index_forward: Query in ascending sort key order if True, else descending.
+            projection: The names of the attributes to read from each item, if not all.
+
+        Returns:
+            The queried items and the key to resume the query from, or None if
+            the query is complete.
+        """
+        log.debug(
+            f"Querying page of items in table '{table}' by index '{index_name}' with query:\n{expression}\n{attributes}"
+        )
+        kwargs = {
+            "TableName": table,
+            "IndexName": index_name,
+            "KeyConditionExpression": expression,
+            "ExpressionAttributeValues": attributes,
+            "ScanIndexForward": scan_index_forward,
+            **WalterDDBClient._get_projection_kwargs(projection),
+        }
+        if exclusive_start_key:
+            kwargs["ExclusiveStartKey"] = exclusive_start_key
+        if limit:
+            kwargs["Limit"] = limit
+        try:
+            response = self.client.query(**kwargs)
+            return response["Items"], response.get("LastEvaluatedKey")
+        except ClientError as error:
+            log.error(
+                f"Unexpected error occurred querying items from table '{table}'!\n"
+                f"Error: {error.response['Error']['Message']}"
+            )
+            raise error
+
+    def scan_table_pages(
+        self,
+        table: str,
+        segment: Optional[int] = None,
+        total_segments: Optional[int] = None,
+    ) -> Iterator[List[dict]]:
+        """
+        Scan the DDB table one page at a time.
+
+        Unlike `scan_table`, this method yields each scanned page as soon as it
+        is returned by DDB so callers can process tables larger than memory.
+        If a segment is given, only that segment of a parallel scan of the
+        table is scanned so multiple workers can each scan a disjoint subset
+        of the table items.
+
+        Args:
+            table: The name of the DDB table to scan.
+            segment: The parallel scan segment to scan, if any.
+            total_segments: The total number of parallel scan segments.
+
+        Returns:
+            An iterator over the pages of items contained in the DDB table.
+        """
+        log.debug(f"Scanning table '{table}' by page")
+        kwargs = {"TableName": table}
+        if segment is not None:
+            log.debug(f"Scanning segment {segment} of {total_segments}")
+            kwargs["Segment"] = segment
+            kwargs["TotalSegments"] = total_segments
+        try:
+            for index, page in enumerate(self.scan_paginator.paginate(**kwargs)):
+                log.debug(f"Scanned page {index + 1} of table '{table}'")
+                yield page["Items"]
+        except ClientError as error:
+            log.error(
+                f"Unexpected error occurred attempting to scan table '{table}'!\n"
+                f"Error: {error.response['Error']['Message']}"
+            )
+            raise error
+
+    def scan_page(
+        self,
+        table: str,
+        exclusive_start_key: Optional[dict] = None,
+        limit: Optional[int] = None,
+    ) -> Tuple[List[dict], Optional[dict]]:
+        """
+        Scan a single page of the DDB table.
+
+        Args:
+            table: The name of the DDB table to scan.
+            exclusive_start_key: The key to resume the scan from, if any.
+            limit: The maximum number of items to evaluate, if any.
+
+        Returns:
+            The scanned items and the key to resume the scan from, or None if
+            the scan is complete.
+        """
+        log.debug(f"Scanning page of table '{table}'")
+        kwargs = {"TableName": table}
+        if exclusive_start_key:
+            kwargs["ExclusiveStartKey"] = exclusive_start_key
+        if limit:
+            kwargs["Limit"] = limit
+        try:
+            response = self.client.scan(**kwargs)
+            return response["Items"], response.get("LastEvaluatedKey")
+        except ClientError as error:
+            log.error(
+                f"Unexpected error occurred attempting to scan table '{table}'!\n"
+                f"Error: {error.response['Error']['Message']}"
+            )
+            raise error
+
+    def update_item(
+        self,
+        table: str,
+        key: dict,
+        update_expression: str,
+        attribute_values: dict,
+        condition_expression: Optional[str] = None,
+        attribute_names: Optional[dict] = None,
+    ) -> bool:
+        """
+        Update attributes of an item in the DDB table.
+
+        Args:
+            table: The name of the DDB table.
+            key: The primary key of the item to update.
+            update_expression: The update expression to apply to the item.
+            attribute_values: The expression attribute values.
+            condition_expression: The optional condition the item must satisfy.
+            attribute_names: The optional expression attribute names.
+
+        Returns:
+            True if the item was updated, False if the condition was not satisfied.
+        """
+        log.debug(
+            f"Updating item in table '{table}' with key:\n{json.dumps(key, indent=4)}"
+        )
+        kwargs = {
+            "TableName": table,
+            "Key": key,
+            "UpdateExpression": update_expression,
+        }
+        if attribute_values:
+            kwargs["ExpressionAttributeValues"] = attribute_values
+        if condition_expression:
+            kwargs["ConditionExpression"] = condition_expression
+        if attribute_names:
+            kwargs["ExpressionAttributeNames"] = attribute_names
+        try:
+            self.client.update_item(**kwargs)
+            return True
+        except ClientError as error:
+            if error.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                log.debug(f"Condition not satisfied for item in table '{table}'")
+                return False
+            log.error(
+                f"Unexpected error occurred updating item in table '{table}'!\n"
+                f"Error: {error.response['Error']['Message']}"
+            )
+            raise error
+
+    def batch_write_items(
+        self,
+        table: str,
+        put_items: Optional[List[dict]] = None,
+        delete_keys: Optional[List[dict]] = None,
+    ) -> None:
+        """
+        Put and delete items in a DDB table in batches.
+
+        Requests are sent in chunks of the BatchWriteItem limit and any
+        unprocessed items returned by DDB are retried with exponential backoff
+        and jitter, up to `MAX_BATCH_ATTEMPTS` requests per chunk. A batch
+        must not put and delete the same key.
+
+        Args:
+            table: The name of the DDB table.
+            put_items: The items to put into the DDB table.
+            delete_keys: The primary keys of the items to delete.
+
+        Returns:
+            None.
+        """
+        requests = [{"PutRequest": {"Item": item}} for item in put_items or []]
+        requests.extend({"DeleteRequest": {"Key": key}} for key in delete_keys or [])
+        log.debug(f"Batch writing {len(requests)} requests to table '{table}'")
+        try:
+            for start in range(
+                0, len(requests), WalterDDBClient.BATCH_WRITE_ITEM_LIMIT
+            ):
+                request = {
+                    table: requests[
+                        start : start + WalterDDBClient.BATCH_WRITE_ITEM_LIMIT
+                    ]
+                }
+                attempt = 0
+                while request:
+                    self._wait_for_batch_retry(table, attempt)
+                    response = self.client.batch_write_item(RequestItems=request)
+                    request = response.get("UnprocessedItems")
+                    attempt += 1
+        except ClientError as error:
+            log.error(
+                f"Unexpected error occurred batch writing items to table '{table}'!\n"
+                f"Error: {error.response['Error']['Message']}"
+            )
+            raise error
+
+    def _wait_for_batch_retry(self, table: str, attempt: int) -> None:
+        """
+        Wait before resending the unprocessed requests of a batch.
+
+        Uses exponential backoff with full jitter as recommended by AWS, so
+        throttled batches back off instead of adding to the throttling.
+        Raises once the batch has been attempted `MAX_BATCH_ATTEMPTS` times.
+        """
+        if attempt == 0:
+            return
+        if attempt >= WalterDDBClient.MAX_BATCH_ATTEMPTS:
+            raise UnprocessedItemsError(
+                f"Unable to process batch requests to table '{table}' after {attempt} attempts!"
+            )
+        delay = min(
+            WalterDDBClient.BATCH_RETRY_MAX_DELAY_SECONDS,
+            WalterDDBClient.BATCH_RETRY_BASE_DELAY_SECONDS * 2**attempt,
+        )
+        log.debug(
+            f"Retrying unprocessed batch requests to table '{table}' (attempt {attempt + 1})"
+        )
+        time.sleep(random.uniform(0, delay))
+
+    def delete_item(
+        self, table: str, key: dict, return_old: bool = False
+    ) -> Optional[dict]:
         """
         Delete an item, if it exists, from the DDB table given its primary key.
 
         Args:
             table: The name of the DDB table to delete the item.
             key: The primary key of the item to delete.
+            return_old: Return the deleted item, if any.
 
         Returns:
-            None
+            The deleted item if `return_old` is set and the item existed, else
+            None.
         """
         log.debug(f"Deleting item from table '{table}' with key:\n{key}")
         try:
-            self.client.delete_item(TableName=table, Key=key)
+            kwargs = {"TableName": table, "Key": key}
+            if return_old:
+                kwargs["ReturnValues"] = "ALL_OLD"
+            return self.client.delete_item(**kwargs).get("Attributes")
+        except ClientError as error:
+            log.error(
+                f"Unexpected error occurred attempting to delete item from table '{table}'!\n"
+                f"Error: {error.response['Error']['Message']}"
+            )
+
+    def conditional_delete_item(
+        self,
+        table: str,
+        key: dict,
+        condition_expression: str,
+        attribute_values: Optional[dict] = None,
+        attribute_names: Optional[dict] = None,
+    ) -> bool:
+        """
+        Delete an item from the DDB table if it satisfies the condition.
+
+        Args:
+            table: The name of the DDB table to delete the item.
+            key: The primary key of the item to delete.
+            condition_expression: The condition the item must satisfy.
+            attribute_values: The optional expression attribute values.
+            attribute_names: The optional expression attribute names.
+
+        Returns:
+            True if the item was deleted, False if the condition was not satisfied.
+        """
+        log.debug(f"Conditionally deleting item from table '{table}' with key:\n{key}")
+        kwargs = WalterDDBClient._get_condition_kwargs(
+            condition_expression, attribute_values, attribute_names
+        )
+        try:
+            self.client.delete_item(TableName=table, Key=key, **kwargs)
+            return True
         except ClientError as error:
+            if error.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                log.debug(f"Condition not satisfied for item in table '{table}'")
+                return False
             log.error(
                 f"Unexpected error occurred attempting to delete item from table '{table}'!\n"
                 f"Error: {error.response['Error']['Message']}"
             )
+            raise error
+
+    @staticmethod
+    def _get_condition_kwargs(
+        condition_expression: str,
+        attribute_values: Optional[dict],
+        attribute_names: Optional[dict],
+    ) -> dict:
+        kwargs = {"ConditionExpression": condition_expression}
+        if attribute_values:
+            kwargs["ExpressionAttributeValues"] = attribute_values
+        if attribute_names:
+            kwargs["ExpressionAttributeNames"] = attribute_names
+        return kwargs
+
+    @staticmethod
+    def _get_projection_kwargs(projection: Optional[List[str]]) -> dict:
+        """Get the projection expression of a request, names are aliased as some are DDB reserved words."""
+        if not projection:
+            return {}
+        names = {f"#p{index}": name for index, name in enumerate(projection)}
+        return {
+            "ProjectionExpression": ", ".join(names),
+            "ExpressionAttributeNames": names,
+        }
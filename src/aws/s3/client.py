@@ -79,6 +79,24 @@ class WalterS3Client:
             )
             raise error
 
+    def get_object_bytes(self, bucket: str, key: str) -> bytes | None:
+        uri = WalterS3Client.get_uri(bucket, key)
+        log.debug(f"Getting object bytes from S3 with URI '{uri}'")
+        try:
+            contents = self.client.get_object(Bucket=bucket, Key=key)["Body"].read()
+            log.debug(f"Retrieved object bytes from S3 with URI '{uri}'")
+            return contents
+        except ClientError as error:
+            # return none if key does not exist
+            if error.response["Error"]["Code"] == "NoSuchKey":
+                log.debug(f"Object with URI '{uri}' does not exist!")
+                return None
+            log.error(
+                f"Unexpected error occurred getting object bytes from S3 '{uri}'!",
+                error,
+            )
+            raise error
+
     def does_object_exist(self, bucket: str, key: str) -> bool:
         uri = WalterS3Client.get_uri(bucket, key)
         log.debug(f"Checking if object exists in S3 with URI '{uri}'")
@@ -109,7 +127,7 @@ class WalterS3Client:
             raise error
 
     def put_object(
-        self, bucket: str, key: str, contents: str, content_type: str = None
+        self, bucket: str, key: str, contents: str | bytes, content_type: str = None
     ) -> str:
         s3_uri = WalterS3Client.get_uri(bucket, key)
         log.debug(f"Putting object to S3 with URI '{s3_uri}'")
@@ -119,7 +137,7 @@ class WalterS3Client:
 
             # add content type to keyword args if given
             if content_type:
-                kwargs["ContentType"] = "image/jpeg"
+                kwargs["ContentType"] = content_type
 
             self.client.put_object(**kwargs)
             log.debug(f"Put object to S3 with URI '{s3_uri}' successfully!")
@@ -24,10 +24,18 @@ class ExpenseCategorizationConfig:
     """Expense Categorization Configurations"""
 
     num_hidden_layers: int = 32
+    num_hashed_features: int = 4096
+    training_batch_size: int = 512
+    training_epochs: int = 5
+    holdout_every: int = 5
 
     def to_dict(self) -> dict:
         return {
             "num_hidden_layers": self.num_hidden_layers,
+            "num_hashed_features": self.num_hashed_features,
+            "training_batch_size": self.training_batch_size,
+            "training_epochs": self.training_epochs,
+            "holdout_every": self.holdout_every,
         }
 
 
@@ -37,11 +45,13 @@ class AuthConfig:
 
     access_token_expiration_minutes: int
     refresh_token_expiration_days: int
+    last_active_write_interval_minutes: int = 15
 
     def to_dict(self) -> dict:
         return {
             "access_token_expiration_minutes": self.access_token_expiration_minutes,
             "refresh_token_expiration_days": self.refresh_token_expiration_days,
+            "last_active_write_interval_minutes": self.last_active_write_interval_minutes,
         }
 
 
@@ -79,6 +89,186 @@ class PlaidConfig:
         }
 
 
+@dataclass(frozen=True)
+class PolygonConfig:
+    """Polygon Configurations"""
+
+    requests_per_minute: int = 5
+    max_concurrent_requests: int = 4
+    use_snapshots: bool = False
+    price_cache_ttl_seconds: int = 60
+    ticker_details_cache_ttl_seconds: int = 86400
+    ddb_cache_enabled: bool = False
+
+    def to_dict(self) -> dict:
+        return {
+            "requests_per_minute": self.requests_per_minute,
+            "max_concurrent_requests": self.max_concurrent_requests,
+            "use_snapshots": self.use_snapshots,
+            "price_cache_ttl_seconds": self.price_cache_ttl_seconds,
+            "ticker_details_cache_ttl_seconds": self.ticker_details_cache_ttl_seconds,
+            "ddb_cache_enabled": self.ddb_cache_enabled,
+        }
+
+
+@dataclass(frozen=True)
+class PriceRefreshConfig:
+    """Price Refresh Configurations"""
+
+    base_refresh_minutes: int = 15
+    min_refresh_minutes: int = 5
+    unheld_refresh_minutes: int = 240
+    volatility_threshold: float = 0.01
+    market_close_delay_minutes: int = 15
+    holder_counts_ttl_minutes: int = 60
+    max_refreshes_per_run: int = 10
+
+    def to_dict(self) -> dict:
+        return {
+            "base_refresh_minutes": self.base_refresh_minutes,
+            "min_refresh_minutes": self.min_refresh_minutes,
+            "unheld_refresh_minutes": self.unheld_refresh_minutes,
+            "volatility_threshold": self.volatility_threshold,
+            "market_close_delay_minutes": self.market_close_delay_minutes,
+            "holder_counts_ttl_minutes": self.holder_counts_ttl_minutes,
+            "max_refreshes_per_run": self.max_refreshes_per_run,
+        }
+
+
+@dataclass(frozen=True)
+class SpendingAnalyticsConfig:
+    """Spending Analytics Configurations"""
+
+    default_range_days: int = 30
+    max_range_days: int = 366
+    default_num_merchants: int = 10
+    max_num_merchants: int = 100
+
+    def to_dict(self) -> dict:
+        return {
+            "default_range_days": self.default_range_days,
+            "max_range_days": self.max_range_days,
+            "default_num_merchants": self.default_num_merchants,
+            "max_num_merchants": self.max_num_merchants,
+        }
+
+
+@dataclass(frozen=True)
+class PortfolioHistoryConfig:
+    """Portfolio History Configurations"""
+
+    max_range_days: int = 3660
+    max_points: int = 366
+    max_concurrent_requests: int = 8
+
+    def to_dict(self) -> dict:
+        return {
+            "max_range_days": self.max_range_days,
+            "max_points": self.max_points,
+            "max_concurrent_requests": self.max_concurrent_requests,
+        }
+
+
+@dataclass(frozen=True)
+class TransactionPaginationConfig:
+    """Transaction Pagination Configurations"""
+
+    default_limit: int = 50
+    max_limit: int = 500
+
+    def to_dict(self) -> dict:
+        return {
+            "default_limit": self.default_limit,
+            "max_limit": self.max_limit,
+        }
+
+
+@dataclass(frozen=True)
+class AccountBalancesConfig:
+    """Account Balances Configurations"""
+
+    balance_tolerance: float = 0.01
+    max_balance_age_minutes: int = 60
+
+    def to_dict(self) -> dict:
+        return {
+            "balance_tolerance": self.balance_tolerance,
+            "max_balance_age_minutes": self.max_balance_age_minutes,
+        }
+
+
+@dataclass(frozen=True)
+class AccountDeletionConfig:
+    """Account Deletion Configurations"""
+
+    page_size: int = 100
+    max_pages_per_run: int = 20
+
+    def to_dict(self) -> dict:
+        return {
+            "page_size": self.page_size,
+            "max_pages_per_run": self.max_pages_per_run,
+        }
+
+
+@dataclass(frozen=True)
+class ResponseEncodingConfig:
+    """Response Encoding Configurations"""
+
+    compression_min_bytes: int = 1024
+    compression_level: int = 5
+
+    def to_dict(self) -> dict:
+        return {
+            "compression_min_bytes": self.compression_min_bytes,
+            "compression_level": self.compression_level,
+        }
+
+
+@dataclass(frozen=True)
+class ConditionalRequestsConfig:
+    """Conditional Requests Configurations"""
+
+    validator_max_age_seconds: int = 300
+
+    def to_dict(self) -> dict:
+        return {
+            "validator_max_age_seconds": self.validator_max_age_seconds,
+        }
+
+
+@dataclass(frozen=True)
+class ResponseCacheConfig:
+    """Response Cache Configurations"""
+
+    max_entries: int = 256
+    accounts_ttl_seconds: int = 60
+    transactions_ttl_seconds: int = 300
+    ddb_cache_enabled: bool = False
+
+    def to_dict(self) -> dict:
+        return {
+            "max_entries": self.max_entries,
+            "accounts_ttl_seconds": self.accounts_ttl_seconds,
+            "transactions_ttl_seconds": self.transactions_ttl_seconds,
+            "ddb_cache_enabled": self.ddb_cache_enabled,
+        }
+
+
+@dataclass(frozen=True)
+class MigrationsConfig:
+    """Migrations Configurations"""
+
+    holding_transactions_index_enabled: bool = False
+    cash_flow_rollups_enabled: bool = False
+
+    def to_dict(self) -> dict:
+        return {
+            "holding_transactions_index_enabled": self.holding_transactions_index_enabled,
+            "cash_flow_rollups_enabled": self.cash_flow_rollups_enabled,
+        }
+
+
 @dataclass(frozen=True)
 class WalterConfig:
     """
@@ -92,6 +282,17 @@ class WalterConfig:
     auth: AuthConfig
     canaries: CanariesConfig
     plaid: PlaidConfig = PlaidConfig
+    polygon: PolygonConfig = PolygonConfig()
+    price_refresh: PriceRefreshConfig = PriceRefreshConfig()
+    portfolio_history: PortfolioHistoryConfig = PortfolioHistoryConfig()
+    spending_analytics: SpendingAnalyticsConfig = SpendingAnalyticsConfig()
+    transaction_pagination: TransactionPaginationConfig = TransactionPaginationConfig()
+    account_balances: AccountBalancesConfig = AccountBalancesConfig()
+    account_deletion: AccountDeletionConfig = AccountDeletionConfig()
+    response_encoding: ResponseEncodingConfig = ResponseEncodingConfig()
+    conditional_requests: ConditionalRequestsConfig = ConditionalRequestsConfig()
+    response_cache: ResponseCacheConfig = ResponseCacheConfig()
+    migrations: MigrationsConfig = MigrationsConfig()
 
     def to_dict(self) -> dict:
         return {
@@ -100,6 +301,17 @@ class WalterConfig:
                 "auth": self.auth.to_dict(),
                 "canaries": self.canaries.to_dict(),
                 "plaid": self.plaid.to_dict(),
+                "polygon": self.polygon.to_dict(),
+                "price_refresh": self.price_refresh.to_dict(),
+                "portfolio_history": self.portfolio_history.to_dict(),
+                "spending_analytics": self.spending_analytics.to_dict(),
+                "transaction_pagination": self.transaction_pagination.to_dict(),
+                "account_balances": self.account_balances.to_dict(),
+                "account_deletion": self.account_deletion.to_dict(),
+                "response_encoding": self.response_encoding.to_dict(),
+                "conditional_requests": self.conditional_requests.to_dict(),
+                "response_cache": self.response_cache.to_dict(),
+                "migrations": self.migrations.to_dict(),
             }
         }
 
@@ -131,7 +343,17 @@ def get_walter_config() -> WalterConfig:
             expense_categorization=ExpenseCategorizationConfig(
                 num_hidden_layers=config_yaml["expense_categorization"][
                     "num_hidden_layers"
-                ]
+                ],
+                num_hashed_features=config_yaml["expense_categorization"][
+                    "num_hashed_features"
+                ],
+                training_batch_size=config_yaml["expense_categorization"][
+                    "training_batch_size"
+                ],
+                training_epochs=config_yaml["expense_categorization"][
+                    "training_epochs"
+                ],
+                holdout_every=config_yaml["expense_categorization"]["holdout_every"],
             ),
             auth=AuthConfig(
                 access_token_expiration_minutes=config_yaml["auth"][
@@ -140,6 +362,9 @@ def get_walter_config() -> WalterConfig:
                 refresh_token_expiration_days=config_yaml["auth"][
                     "refresh_token_expiration_days"
                 ],
+                last_active_write_interval_minutes=config_yaml["auth"][
+                    "last_active_write_interval_minutes"
+                ],
             ),
             canaries=CanariesConfig(
                 endpoint=config_yaml["canaries"]["endpoint"],
@@ -154,6 +379,103 @@ def get_walter_config() -> WalterConfig:
                     "sync_transactions_webhook_url"
                 ],
             ),
+            polygon=PolygonConfig(
+                requests_per_minute=config_yaml["polygon"]["requests_per_minute"],
+                max_concurrent_requests=config_yaml["polygon"][
+                    "max_concurrent_requests"
+                ],
+                use_snapshots=config_yaml["polygon"]["use_snapshots"],
+                price_cache_ttl_seconds=config_yaml["polygon"][
+                    "price_cache_ttl_seconds"
+                ],
+                ticker_details_cache_ttl_seconds=config_yaml["polygon"][
+                    "ticker_details_cache_ttl_seconds"
+                ],
+                ddb_cache_enabled=config_yaml["polygon"]["ddb_cache_enabled"],
+            ),
+            price_refresh=PriceRefreshConfig(
+                base_refresh_minutes=config_yaml["price_refresh"][
+                    "base_refresh_minutes"
+                ],
+                min_refresh_minutes=config_yaml["price_refresh"]["min_refresh_minutes"],
+                unheld_refresh_minutes=config_yaml["price_refresh"][
+                    "unheld_refresh_minutes"
+                ],
+                volatility_threshold=config_yaml["price_refresh"][
+                    "volatility_threshold"
+                ],
+                market_close_delay_minutes=config_yaml["price_refresh"][
+                    "market_close_delay_minutes"
+                ],
+                holder_counts_ttl_minutes=config_yaml["price_refresh"][
+                    "holder_counts_ttl_minutes"
+                ],
+                max_refreshes_per_run=config_yaml["price_refresh"][
+                    "max_refreshes_per_run"
+                ],
+            ),
+            portfolio_history=PortfolioHistoryConfig(
+                max_range_days=config_yaml["portfolio_history"]["max_range_days"],
+                max_points=config_yaml["portfolio_history"]["max_points"],
+                max_concurrent_requests=config_yaml["portfolio_history"][
+                    "max_concurrent_requests"
+                ],
+            ),
+            spending_analytics=SpendingAnalyticsConfig(
+                default_range_days=config_yaml["spending_analytics"][
+                    "default_range_days"
+                ],
+                max_range_days=config_yaml["spending_analytics"]["max_range_days"],
+                default_num_merchants=config_yaml["spending_analytics"][
+                    "default_num_merchants"
+                ],
+                max_num_merchants=config_yaml["spending_analytics"][
+                    "max_num_merchants"
+                ],
+            ),
+            transaction_pagination=TransactionPaginationConfig(
+                default_limit=config_yaml["transaction_pagination"]["default_limit"],
+                max_limit=config_yaml["transaction_pagination"]["max_limit"],
+            ),
+            account_balances=AccountBalancesConfig(
+                balance_tolerance=config_yaml["account_balances"]["balance_tolerance"],
+                max_balance_age_minutes=config_yaml["account_balances"][
+                    "max_balance_age_minutes"
+                ],
+            ),
+            account_deletion=AccountDeletionConfig(
+                page_size=config_yaml["account_deletion"]["page_size"],
+                max_pages_per_run=config_yaml["account_deletion"]["max_pages_per_run"],
+            ),
+            response_encoding=ResponseEncodingConfig(
+                compression_min_bytes=config_yaml["response_encoding"][
+                    "compression_min_bytes"
+                ],
+                compression_level=config_yaml["response_encoding"]["compression_level"],
+            ),
+            conditional_requests=ConditionalRequestsConfig(
+                validator_max_age_seconds=config_yaml["conditional_requests"][
+                    "validator_max_age_seconds"
+                ],
+            ),
+            response_cache=ResponseCacheConfig(
+                max_entries=config_yaml["response_cache"]["max_entries"],
+                accounts_ttl_seconds=config_yaml["response_cache"][
+                    "accounts_ttl_seconds"
+                ],
+                transactions_ttl_seconds=config_yaml["response_cache"][
+                    "transactions_ttl_seconds"
+                ],
+                ddb_cache_enabled=config_yaml["response_cache"]["ddb_cache_enabled"],
+            ),
+            migrations=MigrationsConfig(
+                holding_transactions_index_enabled=config_yaml["migrations"][
+                    "holding_transactions_index_enabled"
+                ],
+                cash_flow_rollups_enabled=config_yaml["migrations"][
+                    "cash_flow_rollups_enabled"
+                ],
+            ),
         )
     except Exception as exception:
         log.error(
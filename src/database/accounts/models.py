@@ -4,6 +4,8 @@ from datetime import datetime, timezone
 from enum import Enum
 from typing import Optional
 
+from src.database.codecs import Field, FieldType, ModelCodec, get_enum_lookup
+from src.database.models import Model
 from src.environment import DOMAIN
 
 
@@ -23,9 +25,30 @@ class AccountType(Enum):
         raise ValueError(f"Invalid account type '{account_type_str}'!")
 
 
-class Account(ABC):
+class Account(Model, ABC):
     """Account Model"""
 
+    __slots__ = (
+        "account_id",
+        "user_id",
+        "account_type",
+        "account_subtype",
+        "institution_name",
+        "account_name",
+        "account_mask",
+        "balance",
+        "balance_last_updated_at",
+        "created_at",
+        "updated_at",
+        "plaid_institution_id",
+        "plaid_account_id",
+        "plaid_access_token",
+        "plaid_item_id",
+        "plaid_cursor",
+        "plaid_last_sync_at",
+        "logo_s3_uri",
+    )
+
     def __init__(
         self,
         account_id: str,
@@ -90,77 +113,6 @@ class Account(ABC):
             "logo_s3_uri": self.logo_s3_uri,
         }
 
-    def get_common_attributes_ddb_item(self) -> dict:
-        ddb_item = {
-            "user_id": {
-                "S": self.user_id,
-            },
-            "account_id": {
-                "S": self.account_id,
-            },
-            "account_type": {
-                "S": self.account_type.name.lower(),
-            },
-            "account_subtype": {
-                "S": self.account_subtype,
-            },
-            "institution_name": {
-                "S": self.institution_name,
-            },
-            "account_name": {
-                "S": self.account_name,
-            },
-            "account_mask": {
-                "S": self.account_mask,
-            },
-            "balance": {
-                "N": str(self.balance),
-            },
-            "balance_last_updated_at": {
-                "S": self.balance_last_updated_at.isoformat(),
-            },
-            "created_at": {
-                "S": self.created_at.isoformat(),
-            },
-            "updated_at": {
-                "S": self.updated_at.isoformat(),
-            },
-            "logo_s3_uri": {
-                "S": self.logo_s3_uri,
-            },
-        }
-
-        # add optional fields to return item
-        if self.plaid_institution_id:
-            ddb_item["plaid_institution_id"] = {
-                "S": self.plaid_institution_id,
-            }
-
-        if self.plaid_account_id:
-            ddb_item["plaid_account_id"] = {
-                "S": self.plaid_account_id,
-            }
-
-        if self.plaid_access_token:
-            ddb_item["plaid_access_token"] = {
-                "S": self.plaid_access_token,
-            }
-
-        if self.plaid_item_id:
-            ddb_item["plaid_item_id"] = {
-                "S": self.plaid_item_id,
-            }
-
-        if self.plaid_cursor:
-            ddb_item["plaid_cursor"] = {
-                "S": self.plaid_cursor,
-            }
-
-        if self.plaid_last_sync_at:
-            ddb_item["plaid_last_sync_at"] = {"S": self.plaid_last_sync_at.isoformat()}
-
-        return ddb_item
-
     def is_linked_with_plaid(self) -> bool:
         # plaid cursor and last sync are nullable plaid vars so not great for
         # determining if the account is linked with plaid
@@ -172,9 +124,8 @@ class Account(ABC):
     def to_dict(self) -> dict:
         pass
 
-    @abstractmethod
     def to_ddb_item(self) -> dict:
-        pass
+        return ACCOUNT_CODECS[self.account_type].encode(self)
 
     @staticmethod
     def generate_account_id() -> str:
@@ -266,22 +217,14 @@ class Account(ABC):
 
     @classmethod
     def from_ddb_item(cls, ddb_item: dict):
-        account_type = AccountType.from_string(ddb_item["account_type"]["S"])
-        match account_type:
-            case AccountType.DEPOSITORY:
-                return DepositoryAccount.from_ddb_item(ddb_item)
-            case AccountType.CREDIT:
-                return CreditAccount.from_ddb_item(ddb_item)
-            case AccountType.INVESTMENT:
-                return InvestmentAccount.from_ddb_item(ddb_item)
-            case AccountType.LOAN:
-                return LoanAccount.from_ddb_item(ddb_item)
-            case _:
-                raise ValueError(f"Unknown account type: {account_type}")
+        account_type = ACCOUNT_TYPES.decode(ddb_item["account_type"]["S"])
+        return ACCOUNT_CODECS[account_type].decode(ddb_item)
 
 
 class DepositoryAccount(Account):
 
+    __slots__ = ()
+
     def __init__(
         self,
         account_id: str,
@@ -329,9 +272,6 @@ class DepositoryAccount(Account):
     def to_dict(self) -> dict:
         return self.get_common_attributes_dict()
 
-    def to_ddb_item(self) -> dict:
-        return self.get_common_attributes_ddb_item()
-
     @classmethod
     def create(
         cls,
@@ -371,38 +311,13 @@ class DepositoryAccount(Account):
 
     @classmethod
     def from_ddb_item(cls, ddb_item: dict):
-        plaid_last_sync_at = None
-        if ddb_item.get("plaid_last_sync_at", {}).get("S"):
-            plaid_last_sync_at = datetime.fromisoformat(
-                ddb_item["plaid_last_sync_at"]["S"]
-            )
-
-        return DepositoryAccount(
-            user_id=ddb_item["user_id"]["S"],
-            account_id=ddb_item["account_id"]["S"],
-            account_type=AccountType.from_string(ddb_item["account_type"]["S"]),
-            account_subtype=ddb_item["account_subtype"]["S"],
-            institution_name=ddb_item["institution_name"]["S"],
-            account_name=ddb_item["account_name"]["S"],
-            account_mask=ddb_item["account_mask"]["S"],
-            balance=float(ddb_item["balance"]["N"]),
-            balance_last_updated_at=datetime.fromisoformat(
-                ddb_item["balance_last_updated_at"]["S"]
-            ),
-            created_at=datetime.fromisoformat(ddb_item["created_at"]["S"]),
-            updated_at=datetime.fromisoformat(ddb_item["updated_at"]["S"]),
-            plaid_institution_id=ddb_item.get("plaid_institution_id", {}).get("S"),
-            plaid_account_id=ddb_item.get("plaid_account_id", {}).get("S"),
-            logo_s3_uri=ddb_item["logo_s3_uri"]["S"],
-            plaid_access_token=ddb_item.get("plaid_access_token", {}).get("S"),
-            plaid_cursor=ddb_item.get("plaid_cursor", {}).get("S"),
-            plaid_item_id=ddb_item.get("plaid_item_id", {}).get("S"),
-            plaid_last_sync_at=plaid_last_sync_at,
-        )
+        return ACCOUNT_CODECS[AccountType.DEPOSITORY].decode(ddb_item)
 
 
 class CreditAccount(Account):
 
+    __slots__ = ()
+
     def __init__(
         self,
         account_id: str,
@@ -450,9 +365,6 @@ class CreditAccount(Account):
     def to_dict(self) -> dict:
         return self.get_common_attributes_dict()
 
-    def to_ddb_item(self) -> dict:
-        return self.get_common_attributes_ddb_item()
-
     @classmethod
     def create(
         cls,
@@ -492,37 +404,13 @@ class CreditAccount(Account):
 
     @classmethod
     def from_ddb_item(cls, ddb_item: dict):
-        plaid_last_sync_at = None
-        if ddb_item.get("plaid_last_sync_at", {}).get("S"):
-            plaid_last_sync_at = datetime.fromisoformat(
-                ddb_item["plaid_last_sync_at"]["S"]
-            )
-        return CreditAccount(
-            user_id=ddb_item["user_id"]["S"],
-            account_id=ddb_item["account_id"]["S"],
-            account_type=AccountType.from_string(ddb_item["account_type"]["S"]),
-            account_subtype=ddb_item["account_subtype"]["S"],
-            institution_name=ddb_item["institution_name"]["S"],
-            account_name=ddb_item["account_name"]["S"],
-            account_mask=ddb_item["account_mask"]["S"],
-            balance=float(ddb_item["balance"]["N"]),
-            balance_last_updated_at=datetime.fromisoformat(
-                ddb_item["balance_last_updated_at"]["S"]
-            ),
-            created_at=datetime.fromisoformat(ddb_item["created_at"]["S"]),
-            updated_at=datetime.fromisoformat(ddb_item["updated_at"]["S"]),
-            plaid_institution_id=ddb_item.get("plaid_institution_id", {}).get("S"),
-            plaid_account_id=ddb_item.get("plaid_account_id", {}).get("S"),
-            logo_s3_uri=ddb_item["logo_s3_uri"]["S"],
-            plaid_access_token=ddb_item.get("plaid_access_token", {}).get("S"),
-            plaid_item_id=ddb_item.get("plaid_item_id", {}).get("S"),
-            plaid_cursor=ddb_item.get("plaid_cursor", {}).get("S"),
-            plaid_last_sync_at=plaid_last_sync_at,
-        )
+        return ACCOUNT_CODECS[AccountType.CREDIT].decode(ddb_item)
 
 
 class InvestmentAccount(Account):
 
+    __slots__ = ()
+
     def __init__(
         self,
         account_id: str,
@@ -570,9 +458,6 @@ class InvestmentAccount(Account):
     def to_dict(self) -> dict:
         return self.get_common_attributes_dict()
 
-    def to_ddb_item(self) -> dict:
-        return self.get_common_attributes_ddb_item()
-
     @classmethod
     def create(
         cls,
@@ -612,37 +497,13 @@ class InvestmentAccount(Account):
 
     @classmethod
     def from_ddb_item(cls, ddb_item: dict):
-        plaid_last_sync_at = None
-        if ddb_item.get("plaid_last_sync_at", {}).get("S"):
-            plaid_last_sync_at = datetime.fromisoformat(
-                ddb_item["plaid_last_sync_at"]["S"]
-            )
-        return InvestmentAccount(
-            user_id=ddb_item["user_id"]["S"],
-            account_id=ddb_item["account_id"]["S"],
-            account_type=AccountType.from_string(ddb_item["account_type"]["S"]),
-            account_subtype=ddb_item["account_subtype"]["S"],
-            institution_name=ddb_item["institution_name"]["S"],
-            account_name=ddb_item["account_name"]["S"],
-            account_mask=ddb_item["account_mask"]["S"],
-            balance=float(ddb_item["balance"]["N"]),
-            balance_last_updated_at=datetime.fromisoformat(
-                ddb_item["balance_last_updated_at"]["S"]
-            ),
-            created_at=datetime.fromisoformat(ddb_item["created_at"]["S"]),
-            updated_at=datetime.fromisoformat(ddb_item["updated_at"]["S"]),
-            logo_s3_uri=ddb_item["logo_s3_uri"]["S"],
-            plaid_institution_id=ddb_item.get("plaid_institution_id", {}).get("S"),
-            plaid_account_id=ddb_item.get("plaid_account_id", {}).get("S"),
-            plaid_access_token=ddb_item.get("plaid_access_token", {}).get("S"),
-            plaid_item_id=ddb_item.get("plaid_item_id", {}).get("S"),
-            plaid_cursor=ddb_item.get("plaid_cursor", {}).get("S"),
-            plaid_last_sync_at=plaid_last_sync_at,
-        )
+        return ACCOUNT_CODECS[AccountType.INVESTMENT].decode(ddb_item)
 
 
 class LoanAccount(Account):
 
+    __slots__ = ()
+
     def __init__(
         self,
         account_id: str,
@@ -690,38 +551,9 @@ class LoanAccount(Account):
     def to_dict(self) -> dict:
         return self.get_common_attributes_dict()
 
-    def to_ddb_item(self) -> dict:
-        return self.get_common_attributes_ddb_item()
-
     @classmethod
     def from_ddb_item(cls, ddb_item: dict):
-        plaid_last_sync_at = None
-        if ddb_item.get("plaid_last_sync_at", {}).get("S"):
-            plaid_last_sync_at = datetime.fromisoformat(
-                ddb_item["plaid_last_sync_at"]["S"]
-            )
-        return LoanAccount(
-            user_id=ddb_item["user_id"]["S"],
-            account_id=ddb_item["account_id"]["S"],
-            account_type=AccountType.from_string(ddb_item["account_type"]["S"]),
-            account_subtype=ddb_item["account_subtype"]["S"],
-            institution_name=ddb_item["institution_name"]["S"],
-            account_name=ddb_item["account_name"]["S"],
-            account_mask=ddb_item["account_mask"]["S"],
-            balance=float(ddb_item["balance"]["N"]),
-            balance_last_updated_at=datetime.fromisoformat(
-                ddb_item["balance_last_updated_at"]["S"]
-            ),
-            created_at=datetime.fromisoformat(ddb_item["created_at"]["S"]),
-            updated_at=datetime.fromisoformat(ddb_item["updated_at"]["S"]),
-            logo_s3_uri=ddb_item["logo_s3_uri"]["S"],
-            plaid_institution_id=ddb_item.get("plaid_institution_id", {}).get("S"),
-            plaid_account_id=ddb_item.get("plaid_account_id", {}).get("S"),
-            plaid_access_token=ddb_item.get("plaid_access_token", {}).get("S"),
-            plaid_cursor=ddb_item.get("plaid_cursor", {}).get("S"),
-            plaid_item_id=ddb_item.get("plaid_item_id", {}).get("S"),
-            plaid_last_sync_at=plaid_last_sync_at,
-        )
+        return ACCOUNT_CODECS[AccountType.LOAN].decode(ddb_item)
 
     @classmethod
     def create(
@@ -759,3 +591,36 @@ class LoanAccount(Account):
             plaid_cursor=plaid_cursor,
             plaid_last_sync_at=plaid_last_sync_at,
         )
+
+
+ACCOUNT_FIELDS = [
+    Field("user_id"),
+    Field("account_id"),
+    Field("account_type", FieldType.ENUM, enum=AccountType),
+    Field("account_subtype"),
+    Field("institution_name"),
+    Field("account_name"),
+    Field("account_mask"),
+    Field("balance", FieldType.FLOAT),
+    Field("balance_last_updated_at", FieldType.DATETIME),
+    Field("created_at", FieldType.DATETIME),
+    Field("updated_at", FieldType.DATETIME),
+    Field("logo_s3_uri"),
+    Field("plaid_institution_id", optional=True),
+    Field("plaid_account_id", optional=True),
+    Field("plaid_access_token", optional=True),
+    Field("plaid_item_id", optional=True),
+    Field("plaid_cursor", optional=True),
+    Field("plaid_last_sync_at", FieldType.DATETIME, optional=True),
+]
+"""(List[Field]): The schema of the account items of every account type."""
+
+ACCOUNT_CODECS = {
+    AccountType.DEPOSITORY: ModelCodec(DepositoryAccount, ACCOUNT_FIELDS),
+    AccountType.CREDIT: ModelCodec(CreditAccount, ACCOUNT_FIELDS),
+    AccountType.INVESTMENT: ModelCodec(InvestmentAccount, ACCOUNT_FIELDS),
+    AccountType.LOAN: ModelCodec(LoanAccount, ACCOUNT_FIELDS),
+}
+"""(Dict[AccountType, ModelCodec]): The codec of the accounts of each account type."""
+
+ACCOUNT_TYPES = get_enum_lookup(AccountType)
@@ -1,7 +1,7 @@
 import json
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 from src.aws.dynamodb.client import WalterDDBClient
 from src.database.accounts.models import Account
@@ -13,7 +13,13 @@ log = Logger(__name__).get_logger()
 
 @dataclass
 class AccountsTable:
-    """Accounts Table"""
+    """
+    Accounts Table
+
+    Accounts being deleted are marked with a `deleting_at` attribute until
+    the PurgeAccount workflow has purged their transactions and holdings and
+    deleted the account item. Marked accounts are hidden from all reads.
+    """
 
     TABLE_NAME_FORMAT = "Accounts-{domain}"
     PLAID_ACCOUNT_ID_INDEX_NAME_FORMAT = "Accounts-PlaidAccountIdIndex-{domain}"
@@ -106,7 +112,7 @@ class AccountsTable:
         account = self.ddb.get_item(
             self.table_name, AccountsTable._get_primary_key(user_id, account_id)
         )
-        if account is None:
+        if account is None or AccountsTable._is_deleting(account):
             log.info(f"Account '{account_id}' not found!")
             return None
         return Account.from_ddb_item(account)
@@ -121,6 +127,7 @@ class AccountsTable:
             "plaid_account_id = :plaid_account_id",
             {":plaid_account_id": {"S": plaid_account_id}},
         )
+        items = [item for item in items if not AccountsTable._is_deleting(item)]
         if not items:
             log.info(f"Account with Plaid account ID '{plaid_account_id}' not found!")
             return None
@@ -135,9 +142,24 @@ class AccountsTable:
         accounts = self.ddb.query(
             self.table_name, AccountsTable._get_accounts_by_user_key(user_id)
         )
+        accounts = [
+            account for account in accounts if not AccountsTable._is_deleting(account)
+        ]
         log.info(f"Found {len(accounts)} account(s) for user!")
         return [Account.from_ddb_item(account) for account in accounts]
 
+    def get_deleting_account_ids(self, user_id: str) -> List[str]:
+        """Get the IDs of the accounts of a user that are marked as deleting."""
+        log.info(f"Getting accounts being deleted for user '{user_id}'")
+        accounts = self.ddb.query(
+            self.table_name, AccountsTable._get_accounts_by_user_key(user_id)
+        )
+        return [
+            account["account_id"]["S"]
+            for account in accounts
+            if AccountsTable._is_deleting(account)
+        ]
+
     def get_accounts_by_plaid_item_id(self, plaid_item_id: str) -> List[Account]:
         log.info(f"Getting all accounts with Plaid item ID '{plaid_item_id}'")
         accounts = self.ddb.query_index(
@@ -146,20 +168,156 @@ class AccountsTable:
             "plaid_item_id = :plaid_item_id",
             {":plaid_item_id": {"S": plaid_item_id}},
         )
+        accounts = [
+            account for account in accounts if not AccountsTable._is_deleting(account)
+        ]
         log.info(
             f"Found {len(accounts)} account(s) with Plaid item ID '{plaid_item_id}'!"
         )
         return [Account.from_ddb_item(account) for account in accounts]
 
-    def update_account(self, account: Account) -> Account:
+    def iter_account_pages(
+        self, segment: Optional[int] = None, total_segments: Optional[int] = None
+    ) -> Iterator[List[Account]]:
+        """Stream all accounts, or a parallel scan segment of them, one page at a time."""
+        log.info(f"Streaming accounts (segment {segment} of {total_segments})")
+        for items in self.ddb.scan_table_pages(
+            self.table_name, segment, total_segments
+        ):
+            yield [
+                Account.from_ddb_item(item)
+                for item in items
+                if not AccountsTable._is_deleting(item)
+            ]
+
+    def update_account(self, account: Account) -> Optional[Account]:
+        """
+        Put an existing account that is not being deleted.
+
+        The put is conditional so an account read before it was marked as
+        deleting cannot clear the mark, and an account deleted in the meantime
+        is not recreated.
+
+        Returns:
+            The updated account, or None if the account no longer exists or is
+            being deleted.
+        """
         log.info(
             f"Updating account '{account.account_id}' for user '{account.user_id}'"
         )
         account.updated_at = datetime.now(timezone.utc)
-        self.ddb.put_item(self.table_name, account.to_ddb_item())
+        updated = self.ddb.conditional_put_item(
+            self.table_name,
+            account.to_ddb_item(),
+            "attribute_exists(account_id) AND attribute_not_exists(deleting_at)",
+        )
+        if not updated:
+            log.info(
+                f"Account '{account.account_id}' not updated as it no longer exists or is being deleted!"
+            )
+            return None
         log.info(f"Account '{account.account_id}' put successfully!")
         return account
 
+    def update_account_balance(
+        self, user_id: str, account_id: str, balance: float, updated_at: datetime
+    ) -> bool:
+        """
+        Set the balance of an existing account with a conditional partial update.
+
+        The update is skipped if the account no longer exists or its balance
+        was already updated at or after the given time by a concurrent request.
+
+        Returns:
+            True if the balance was updated, False otherwise.
+        """
+        log.info(f"Updating balance of account '{account_id}' for user '{user_id}'")
+        updated = self.ddb.update_item(
+            table=self.table_name,
+            key=AccountsTable._get_primary_key(user_id, account_id),
+            update_expression="SET balance = :balance, balance_last_updated_at = :updated_at, updated_at = :updated_at",
+            attribute_values={
+                ":balance": {"N": str(balance)},
+                ":updated_at": {"S": updated_at.isoformat()},
+            },
+            condition_expression="attribute_exists(account_id) AND balance_last_updated_at < :updated_at",
+        )
+        if not updated:
+            log.info(f"Balance of account '{account_id}' not updated!")
+        return updated
+
+    def mark_account_deleting(
+        self, user_id: str, account_id: str, deleting_at: datetime
+    ) -> bool:
+        """
+        Mark an existing account as being deleted.
+
+        Returns:
+            True if the account was marked, False if the account does not exist
+            or is already being deleted.
+        """
+        log.info(f"Marking account '{account_id}' for user '{user_id}' as deleting")
+        return self.ddb.update_item(
+            table=self.table_name,
+            key=AccountsTable._get_primary_key(user_id, account_id),
+            update_expression="SET deleting_at = :deleting_at, deleted_transactions = :zero, deleted_holdings = :zero",
+            attribute_values={
+                ":deleting_at": {"S": deleting_at.isoformat()},
+                ":zero": {"N": "0"},
+            },
+            condition_expression="attribute_exists(account_id) AND attribute_not_exists(deleting_at)",
+        )
+
+    def unmark_account_deleting(self, user_id: str, account_id: str) -> None:
+        """Remove the deleting mark of an account, e.g. if its purge could not be queued."""
+        log.info(f"Unmarking account '{account_id}' for user '{user_id}' as deleting")
+        self.ddb.update_item(
+            table=self.table_name,
+            key=AccountsTable._get_primary_key(user_id, account_id),
+            update_expression="REMOVE deleting_at, deleted_transactions, deleted_holdings",
+            attribute_values={},
+            condition_expression="attribute_exists(account_id)",
+        )
+
+    def update_account_deletion_progress(
+        self,
+        user_id: str,
+        account_id: str,
+        num_deleted_transactions: int,
+        num_deleted_holdings: int,
+    ) -> bool:
+        """
+        Add to the number of purged transactions and holdings of an account being deleted.
+
+        Returns:
+            True if the progress was updated, False if the account is not being deleted.
+        """
+        return self.ddb.update_item(
+            table=self.table_name,
+            key=AccountsTable._get_primary_key(user_id, account_id),
+            update_expression="ADD deleted_transactions :num_transactions, deleted_holdings :num_holdings",
+            attribute_values={
+                ":num_transactions": {"N": str(num_deleted_transactions)},
+                ":num_holdings": {"N": str(num_deleted_holdings)},
+            },
+            condition_expression="attribute_exists(deleting_at)",
+        )
+
+    def delete_marked_account(self, user_id: str, account_id: str) -> bool:
+        """
+        Delete an account marked as being deleted.
+
+        Returns:
+            True if the account was deleted, False if the account does not
+            exist or is not marked as being deleted.
+        """
+        log.info(f"Deleting marked account '{account_id}' for user '{user_id}'")
+        return self.ddb.conditional_delete_item(
+            table=self.table_name,
+            key=AccountsTable._get_primary_key(user_id, account_id),
+            condition_expression="attribute_exists(deleting_at)",
+        )
+
     def delete_account(self, user_id: str, account_id: str) -> None:
         log.info(f"Deleting account '{account_id}' for user '{user_id}'")
         self.ddb.delete_item(
@@ -168,6 +326,10 @@ class AccountsTable:
         )
         log.info(f"Account '{account_id}' deleted successfully!")
 
+    @staticmethod
+    def _is_deleting(item: dict) -> bool:
+        return "deleting_at" in item
+
     @staticmethod
     def _get_primary_key(user_id: str, account_id: str) -> dict:
         return {
@@ -0,0 +1,91 @@
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Optional, Tuple
+
+from src.aws.dynamodb.client import WalterDDBClient
+from src.environment import Domain
+from src.utils.log import Logger
+
+log = Logger(__name__).get_logger()
+
+
+@dataclass
+class CacheTable:
+    """Cache Table
+
+    Responsible for getting and putting cache entries in the DynamoDB
+    Cache table. Entries are JSON strings keyed by cache key and expire
+    via the table TTL attribute. As DDB deletes expired items lazily,
+    expired entries are also filtered on read.
+
+    The table also stores version stamps, i.e. counters without TTL that
+    are incremented on each change of the data they version.
+    """
+
+    TABLE_NAME_FORMAT = "Cache-{domain}"
+
+    ddb: WalterDDBClient
+    domain: Domain
+
+    table_name: str = None  # set during post-init
+
+    def __post_init__(self) -> None:
+        self.table_name = self.TABLE_NAME_FORMAT.format(domain=self.domain.value)
+        log.debug(f"Initializing Cache Table with name '{self.table_name}'")
+
+    def get_entry(self, cache_key: str) -> Optional[Tuple[str, datetime]]:
+        """Get the value and expiry of the cache entry, or None if missing or expired."""
+        log.debug(f"Getting cache entry '{cache_key}' from table '{self.table_name}'")
+        item = self.ddb.get_item(
+            self.table_name, CacheTable._get_primary_key(cache_key)
+        )
+        if item is None:
+            return None
+        expires_at = datetime.fromtimestamp(int(item["ttl"]["N"]), timezone.utc)
+        if expires_at <= datetime.now(timezone.utc):
+            log.debug(f"Cache entry '{cache_key}' expired!")
+            return None
+        return item["value"]["S"], expires_at
+
+    def put_entry(self, cache_key: str, value: str, expires_at: datetime) -> None:
+        log.debug(f"Putting cache entry '{cache_key}' to table '{self.table_name}'")
+        self.ddb.put_item(
+            self.table_name,
+            {
+                "cache_key": {"S": cache_key},
+                "value": {"S": value},
+                "ttl": {"N": str(int(expires_at.timestamp()))},
+            },
+        )
+
+    def get_version(self, version_key: str) -> Optional[str]:
+        """
+        Get the version stamp of the given key, or None if it was never bumped.
+
+        Stamps combine the counter with a random epoch set when the counter
+        is created, so a deleted and recreated counter never repeats a stamp.
+        """
+        log.debug(f"Getting version '{version_key}' from table '{self.table_name}'")
+        item = self.ddb.get_item(
+            self.table_name, CacheTable._get_primary_key(version_key)
+        )
+        if item is None:
+            return None
+        return f"{item['epoch']['S']}.{item['version']['N']}"
+
+    def bump_version(self, version_key: str) -> None:
+        log.debug(f"Bumping version '{version_key}' in table '{self.table_name}'")
+        self.ddb.update_item(
+            table=self.table_name,
+            key=CacheTable._get_primary_key(version_key),
+            update_expression="SET epoch = if_not_exists(epoch, :epoch) ADD version :one",
+            attribute_values={
+                ":epoch": {"S": uuid.uuid4().hex},
+                ":one": {"N": "1"},
+            },
+        )
+
+    @staticmethod
+    def _get_primary_key(cache_key: str) -> dict:
+        return {"cache_key": {"S": cache_key}}
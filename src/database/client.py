@@ -1,18 +1,27 @@
 import datetime as dt
-from dataclasses import dataclass
-from typing import List, Optional
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 from src.auth.authenticator import WalterAuthenticator
 from src.aws.dynamodb.client import WalterDDBClient
+from src.config import CONFIG
 from src.database.accounts.models import Account
 from src.database.accounts.table import AccountsTable
+from src.database.cache.table import CacheTable
 from src.database.holdings.models import Holding
 from src.database.holdings.table import HoldingsTable
+from src.database.rollups.models import CashFlowRollup
+from src.database.rollups.table import CashFlowRollupsTable
 from src.database.securities.models import Security
 from src.database.securities.table import SecuritiesTable
 from src.database.sessions.models import Session
 from src.database.sessions.table import SessionsTable
-from src.database.transactions.models import InvestmentTransaction, Transaction
+from src.database.transactions.batch import TransactionBatch
+from src.database.transactions.models import (
+    InvestmentTransaction,
+    Transaction,
+    TransactionTotals,
+)
 from src.database.transactions.table import TransactionsTable
 from src.database.users.models import User
 from src.database.users.table import UsersTable
@@ -32,6 +41,15 @@ class WalterDB:
     authenticator: WalterAuthenticator
     domain: Domain
 
+    # read holding transactions from the account security index only once
+    # existing transactions have been backfilled into it
+    holding_transactions_index_enabled: bool = field(
+        default_factory=lambda: CONFIG.migrations.holding_transactions_index_enabled
+    )
+    cash_flow_rollups_enabled: bool = field(
+        default_factory=lambda: CONFIG.migrations.cash_flow_rollups_enabled
+    )
+
     # all tables created in post init
     users_table: UsersTable = None
     sessions_table: SessionsTable = None
@@ -39,6 +57,8 @@ class WalterDB:
     transactions_table: TransactionsTable = None
     securities_table: SecuritiesTable = None
     holdings_table: HoldingsTable = None
+    cache_table: CacheTable = None
+    rollups_table: CashFlowRollupsTable = None
 
     def __post_init__(self) -> None:
         self.users_table = UsersTable(self.ddb, self.domain)
@@ -47,6 +67,8 @@ class WalterDB:
         self.transactions_table = TransactionsTable(self.ddb, self.domain)
         self.securities_table = SecuritiesTable(self.ddb, self.domain)
         self.holdings_table = HoldingsTable(self.ddb, self.domain)
+        self.cache_table = CacheTable(self.ddb, self.domain)
+        self.rollups_table = CashFlowRollupsTable(self.ddb, self.domain)
 
     #########
     # USERS #
@@ -80,6 +102,13 @@ class WalterDB:
     def update_user(self, user: User) -> None:
         self.users_table.update_user(user)
 
+    def update_user_last_active_date(
+        self, user_id: str, last_active_date: dt.datetime, min_interval: dt.timedelta
+    ) -> bool:
+        return self.users_table.update_last_active_date(
+            user_id, last_active_date, min_interval
+        )
+
     def update_user_password(self, email: str, password_hash: str) -> None:
         user = self.users_table.get_user_by_email(email)
         user.password_hash = password_hash.decode()
@@ -112,7 +141,7 @@ class WalterDB:
     ################
 
     def add_transaction(self, transaction: Transaction) -> Transaction:
-        return self.transactions_table.put_transaction(transaction)
+        return self._put_transaction(transaction)
 
     def get_user_transaction(
         self, user_id: str, transaction_id: str
@@ -139,34 +168,146 @@ class WalterDB:
             account_id, start_date, end_date
         )
 
+    def get_user_transaction_batch(
+        self,
+        user_id: str,
+        start_date: dt.datetime = dt.datetime.min,
+        end_date: dt.datetime = dt.datetime.max,
+        attributes: Optional[Iterable[str]] = None,
+    ) -> TransactionBatch:
+        return self.transactions_table.get_user_transaction_batch(
+            user_id, start_date, end_date, attributes
+        )
+
+    def get_account_transaction_batch(
+        self,
+        account_id: str,
+        start_date: dt.datetime = dt.datetime.min,
+        end_date: dt.datetime = dt.datetime.max,
+        attributes: Optional[Iterable[str]] = None,
+    ) -> TransactionBatch:
+        return self.transactions_table.get_account_transaction_batch(
+            account_id, start_date, end_date, attributes
+        )
+
+    def get_user_transactions_page(
+        self,
+        user_id: str,
+        start_date: dt.datetime,
+        end_date: dt.datetime,
+        limit: int,
+        exclusive_start_key: Optional[dict] = None,
+        descending: bool = False,
+        attributes: Optional[Iterable[str]] = None,
+    ) -> Tuple[TransactionBatch, Optional[dict]]:
+        return self.transactions_table.get_user_transactions_page(
+            user_id,
+            start_date,
+            end_date,
+            limit,
+            exclusive_start_key,
+            descending,
+            attributes,
+        )
+
+    def get_account_transactions_page(
+        self,
+        account_id: str,
+        start_date: dt.datetime,
+        end_date: dt.datetime,
+        limit: int,
+        exclusive_start_key: Optional[dict] = None,
+        descending: bool = False,
+        attributes: Optional[Iterable[str]] = None,
+    ) -> Tuple[TransactionBatch, Optional[dict]]:
+        return self.transactions_table.get_account_transactions_page(
+            account_id,
+            start_date,
+            end_date,
+            limit,
+            exclusive_start_key,
+            descending,
+            attributes,
+        )
+
+    def get_user_transaction_totals(
+        self, user_id: str, start_date: dt.datetime, end_date: dt.datetime
+    ) -> TransactionTotals:
+        # transactions of accounts being deleted are excluded until they are purged
+        deleting_account_ids = set(
+            self.accounts_table.get_deleting_account_ids(user_id)
+        )
+        if not self.cash_flow_rollups_enabled:
+            # only the attributes required by the batch are read for the totals
+            batch = self.transactions_table.get_user_transaction_batch(
+                user_id, start_date, end_date, attributes=[]
+            )
+            if deleting_account_ids:
+                batch = batch.filter_accounts(
+                    set(batch.account_ids) - deleting_account_ids
+                )
+            return batch.get_totals()
+        return self.rollups_table.get_totals(
+            CashFlowRollup.get_user_owner_id(user_id),
+            start_date.date(),
+            end_date.date(),
+            [
+                CashFlowRollup.get_account_owner_id(account_id)
+                for account_id in deleting_account_ids
+            ],
+        )
+
+    def get_account_transaction_totals(
+        self, account_id: str, start_date: dt.datetime, end_date: dt.datetime
+    ) -> TransactionTotals:
+        if not self.cash_flow_rollups_enabled:
+            return self.transactions_table.get_account_transaction_batch(
+                account_id, start_date, end_date, attributes=[]
+            ).get_totals()
+        return self.rollups_table.get_totals(
+            CashFlowRollup.get_account_owner_id(account_id),
+            start_date.date(),
+            end_date.date(),
+        )
+
     def get_transactions_by_holding(
-        self, account_id: str, security_id: str
+        self,
+        account_id: str,
+        security_id: str,
+        start_date: dt.datetime = dt.datetime.min,
     ) -> List[InvestmentTransaction]:
         log.info(
             f"Getting transactions for holding '{security_id}' in account '{account_id}'"
         )
-        transactions = self.transactions_table.get_account_transactions(account_id)
-
-        log.info(
-            f"Found {len(transactions)} transactions in account '{account_id}'! Filtering transactions for holding '{security_id}'"
+        if self.holding_transactions_index_enabled:
+            return self.transactions_table.get_holding_transactions(
+                account_id, security_id, start_date
+            )
+        return self.transactions_table.get_account_security_transactions(
+            account_id, security_id, start_date
         )
-        holding_transactions = []
-        for transaction in transactions:
-            if isinstance(transaction, InvestmentTransaction):
-                if transaction.security_id == security_id:
-                    holding_transactions.append(transaction)
 
-        log.info(
-            f"Found {len(holding_transactions)} transactions for holding '{security_id}' in account '{account_id}'"
+    def get_transaction_keys_by_plaid_transaction_ids(
+        self, plaid_transaction_ids: List[str]
+    ) -> Dict[str, Tuple[str, str]]:
+        return self.transactions_table.get_transaction_keys_by_plaid_transaction_ids(
+            plaid_transaction_ids
         )
 
-        return holding_transactions
+    def get_transactions_by_keys(
+        self, keys: List[Tuple[str, str]]
+    ) -> List[Transaction]:
+        return self.transactions_table.get_transactions(keys)
 
     def update_transaction(self, transaction: Transaction) -> Transaction:
-        return self.transactions_table.put_transaction(transaction)
+        return self._put_transaction(transaction)
 
     def delete_transaction(self, user_id: str, transaction_id: str) -> None:
-        return self.transactions_table.delete_transaction(user_id, transaction_id)
+        transaction = self.transactions_table.delete_transaction(
+            user_id, transaction_id
+        )
+        if transaction is not None:
+            self._update_cash_flow_rollups(removed=[transaction], added=[])
 
     def delete_account_transactions(self, account_id: str) -> None:
         transactions = self.transactions_table.get_transactions_by_account(account_id)
@@ -175,9 +316,75 @@ class WalterDB:
                 transaction.user_id, transaction.transaction_id
             )
 
+    def get_account_transaction_keys_page(
+        self,
+        account_id: str,
+        exclusive_start_key: Optional[dict] = None,
+        limit: Optional[int] = None,
+    ) -> Tuple[List[Tuple[str, str]], Optional[dict]]:
+        return self.transactions_table.get_account_transaction_keys_page(
+            account_id, exclusive_start_key, limit
+        )
+
+    def delete_transactions(self, keys: List[Tuple[str, str]]) -> None:
+        return self.transactions_table.delete_transactions(keys)
+
     def get_transactions(self) -> List[Transaction]:
         return self.transactions_table.get_all_transactions()
 
+    def stream_transactions(self) -> Iterator[Transaction]:
+        for page in self.transactions_table.iter_transaction_pages():
+            yield from page
+
+    def get_transaction_items_page(
+        self, exclusive_start_key: Optional[dict] = None, limit: Optional[int] = None
+    ) -> Tuple[List[dict], Optional[dict]]:
+        return self.transactions_table.get_items_page(exclusive_start_key, limit)
+
+    def backfill_transaction_account_security_id(self, item: dict) -> bool:
+        return self.transactions_table.backfill_account_security_id(item)
+
+    def _put_transaction(self, transaction: Transaction) -> Transaction:
+        # the replaced transaction, if any, is removed from the rollups so
+        # edits and redelivered Plaid transactions are not counted twice
+        previous = self.transactions_table.replace_transaction(transaction)
+        self._update_cash_flow_rollups(
+            removed=[previous] if previous is not None else [], added=[transaction]
+        )
+        return transaction
+
+    def _update_cash_flow_rollups(
+        self, removed: List[Transaction], added: List[Transaction]
+    ) -> None:
+        # a failed rollup update must not fail the transaction write, the
+        # drift is repaired by the daily ReconcileCashFlowRollups run
+        try:
+            self.rollups_table.update_rollups(removed, added)
+        except Exception as exception:
+            log.error(f"Unable to update cash flow rollups: {exception}")
+
+    #####################
+    # CASH FLOW ROLLUPS #
+    #####################
+
+    def put_cash_flow_rollups(self, rollups: List[CashFlowRollup]) -> None:
+        return self.rollups_table.put_rollups(rollups)
+
+    def get_cash_flow_rollup_items(self, owner_id: str) -> Dict[str, dict]:
+        return self.rollups_table.get_rollup_items(owner_id)
+
+    def reconcile_cash_flow_rollups(
+        self,
+        owner_id: str,
+        items: Dict[str, dict],
+        expected: List[CashFlowRollup],
+        dry_run: bool = False,
+    ) -> Tuple[int, int]:
+        return self.rollups_table.reconcile_rollups(owner_id, items, expected, dry_run)
+
+    def delete_account_cash_flow_rollups(self, user_id: str, account_id: str) -> None:
+        return self.rollups_table.delete_account_rollups(user_id, account_id)
+
     ############
     # ACCOUNTS #
     ############
@@ -225,15 +432,55 @@ class WalterDB:
     def get_accounts_by_plaid_item_id(self, plaid_item_id: str) -> List[Account]:
         return self.accounts_table.get_accounts_by_plaid_item_id(plaid_item_id)
 
+    def get_deleting_account_ids(self, user_id: str) -> List[str]:
+        return self.accounts_table.get_deleting_account_ids(user_id)
+
     def get_accounts(self, user_id: str) -> List[Account]:
         return self.accounts_table.get_accounts(user_id)
 
-    def update_account(self, account: Account) -> Account:
+    def stream_accounts(
+        self, segment: Optional[int] = None, total_segments: Optional[int] = None
+    ) -> Iterator[Account]:
+        for page in self.accounts_table.iter_account_pages(segment, total_segments):
+            yield from page
+
+    def update_account(self, account: Account) -> Optional[Account]:
         return self.accounts_table.update_account(account)
 
+    def update_account_balance(
+        self, user_id: str, account_id: str, balance: float, updated_at: dt.datetime
+    ) -> bool:
+        return self.accounts_table.update_account_balance(
+            user_id, account_id, balance, updated_at
+        )
+
     def delete_account(self, user_id: str, account_id: str) -> None:
         return self.accounts_table.delete_account(user_id, account_id)
 
+    def delete_marked_account(self, user_id: str, account_id: str) -> bool:
+        return self.accounts_table.delete_marked_account(user_id, account_id)
+
+    def mark_account_deleting(
+        self, user_id: str, account_id: str, deleting_at: dt.datetime
+    ) -> bool:
+        return self.accounts_table.mark_account_deleting(
+            user_id, account_id, deleting_at
+        )
+
+    def unmark_account_deleting(self, user_id: str, account_id: str) -> None:
+        return self.accounts_table.unmark_account_deleting(user_id, account_id)
+
+    def update_account_deletion_progress(
+        self,
+        user_id: str,
+        account_id: str,
+        num_deleted_transactions: int,
+        num_deleted_holdings: int,
+    ) -> bool:
+        return self.accounts_table.update_account_deletion_progress(
+            user_id, account_id, num_deleted_transactions, num_deleted_holdings
+        )
+
     def delete_accounts(self, user_id: str) -> None:
         accounts = self.accounts_table.get_accounts(user_id)
         for account in accounts:
@@ -261,6 +508,9 @@ class WalterDB:
     def put_security(self, security: Security) -> Security:
         return self.securities_table.update_security(security)
 
+    def put_securities(self, securities: List[Security]) -> None:
+        return self.securities_table.put_securities(securities)
+
     ############
     # HOLDINGS #
     ############
@@ -277,7 +527,45 @@ class WalterDB:
     def delete_holding(self, account_id: str, security_id: str) -> None:
         return self.holdings_table.delete_holding(account_id, security_id)
 
+    def put_holdings(self, holdings: List[Holding]) -> None:
+        return self.holdings_table.put_holdings(holdings)
+
+    def delete_holdings(self, account_id: str, security_ids: List[str]) -> None:
+        return self.holdings_table.delete_holdings(account_id, security_ids)
+
+    def get_security_holder_counts(self) -> Dict[str, int]:
+        return self.holdings_table.get_security_holder_counts()
+
     def delete_account_holdings(self, account_id: str) -> None:
         holdings = self.holdings_table.get_holdings(account_id)
         for holding in holdings:
             self.holdings_table.delete_holding(account_id, holding.security_id)
+
+    #########
+    # CACHE #
+    #########
+
+    def get_cache_entry(self, cache_key: str) -> Optional[Tuple[str, dt.datetime]]:
+        return self.cache_table.get_entry(cache_key)
+
+    def put_cache_entry(
+        self, cache_key: str, value: str, expires_at: dt.datetime
+    ) -> None:
+        return self.cache_table.put_entry(cache_key, value, expires_at)
+
+    def get_user_data_version(self, user_id: str) -> Optional[str]:
+        return self.cache_table.get_version(
+            WalterDB._get_user_data_version_key(user_id)
+        )
+
+    def bump_user_data_version(self, user_id: str) -> None:
+        """
+        Bump the data version of the user after writing any of their data,
+        e.g. accounts, transactions, or holdings, invalidating the ETags of
+        their responses.
+        """
+        self.cache_table.bump_version(WalterDB._get_user_data_version_key(user_id))
+
+    @staticmethod
+    def _get_user_data_version_key(user_id: str) -> str:
+        return f"user_data_version#{user_id}"
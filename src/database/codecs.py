@@ -0,0 +1,247 @@
+from dataclasses import dataclass, field
+from datetime import datetime, tzinfo
+from enum import Enum
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Optional, Type
+
+MISSING = object()
+"""(object): The default of fields that are always stored."""
+
+
+class FieldType(Enum):
+    """Field Types"""
+
+    STRING = "string"
+    FLOAT = "float"
+    INTEGER = "integer"
+    BOOLEAN = "boolean"
+    DATETIME = "datetime"
+    DATE = "date"
+    ENUM = "enum"
+
+
+ATTRIBUTE_TYPES: Dict[FieldType, str] = {
+    FieldType.STRING: "S",
+    FieldType.FLOAT: "N",
+    FieldType.INTEGER: "N",
+    FieldType.BOOLEAN: "BOOL",
+    FieldType.DATETIME: "S",
+    FieldType.DATE: "S",
+    FieldType.ENUM: "S",
+}
+"""(Dict[FieldType, str]): The DDB attribute type each field type is stored as."""
+
+
+@dataclass(frozen=True)
+class Field:
+    """
+    Field
+
+    A model attribute stored as a DDB attribute of the same name.
+
+    Attributes:
+        name: The name of the model and DDB attribute.
+        type: The type of the attribute.
+        optional: Whether the attribute is omitted from items when empty and
+            decoded as `default` when absent.
+        default: The value decoded when the attribute is absent, fields with
+            a default are always stored but may be absent from older items.
+        enum: The enum of enum fields, stored as the enum values.
+        arg: The model constructor argument, defaults to the attribute name.
+        init: Whether the attribute is passed to the model constructor.
+        missing: The string stored for empty attributes in place of omitting
+            them, e.g. "N/A", decoded as None.
+        suffix: The attribute appended to date fields, e.g. the unique ID of
+            a sort key "date#id", ignored when decoded.
+        timezone: The timezone set on decoded datetimes.
+    """
+
+    name: str
+    type: FieldType = FieldType.STRING
+    optional: bool = False
+    default: Any = MISSING
+    enum: Optional[Type[Enum]] = None
+    arg: Optional[str] = None
+    init: bool = True
+    missing: Optional[str] = None
+    suffix: Optional[str] = None
+    timezone: Optional[tzinfo] = None
+
+    def __post_init__(self) -> None:
+        if not self.name.isidentifier():
+            raise ValueError(f"Invalid field name '{self.name}'!")
+        if (self.type == FieldType.ENUM) != (self.enum is not None):
+            raise ValueError(
+                f"Field '{self.name}' must set an enum if and only if it is an enum field!"
+            )
+        if self.optional and self.default is MISSING:
+            object.__setattr__(self, "default", None)
+
+
+class EnumLookup:
+    """
+    Enum Lookup
+
+    Decodes raw DDB strings to enum members with a dict lookup. Values that
+    are not stored in their canonical form, e.g. "Investment" for
+    "investment", fall back to the `from_string` of the enum once and are
+    cached.
+    """
+
+    def __init__(self, enum: Type[Enum]) -> None:
+        self.enum = enum
+        self.members: Dict[str, Enum] = {member.value: member for member in enum}
+
+    def decode(self, value: str) -> Enum:
+        member = self.members.get(value)
+        if member is None:
+            member = self.members[value] = self.enum.from_string(value)
+        return member
+
+
+@lru_cache(maxsize=None)
+def get_enum_lookup(enum: Type[Enum]) -> EnumLookup:
+    """Get the lookup of an enum, lookups are shared by every codec of the process."""
+    return EnumLookup(enum)
+
+
+@dataclass
+class ModelCodec:
+    """
+    Model Codec
+
+    Encodes models to DDB items and decodes DDB items to models as declared
+    by a schema of fields. The encode and decode functions of each schema
+    are generated and compiled once, when the codec is created at import,
+    so every item is converted by straight-line code specialized to the
+    model, without per-field dispatch or generic conversion.
+
+    Computed attributes are derived from the model when encoded, e.g.
+    composite GSI keys, and are not decoded.
+    """
+
+    model: type
+    fields: List[Field]
+    computed: Dict[str, Callable[[Any], str]] = field(default_factory=dict)
+
+    def __post_init__(self) -> None:
+        self.namespace: Dict[str, Any] = {
+            "model": self.model,
+            "fromisoformat": datetime.fromisoformat,
+        }
+        self.encode: Callable[[Any], dict] = self._compile(
+            "encode", self._get_encode_source()
+        )
+        self.decode: Callable[[dict], Any] = self._compile(
+            "decode", self._get_decode_source()
+        )
+
+    def _compile(self, name: str, source: str) -> Callable:
+        code = compile(source, f"<{self.model.__name__} {name}>", "exec")
+        exec(code, self.namespace)
+        return self.namespace[name]
+
+    def _get_encode_source(self) -> str:
+        stored = []
+        optional = []
+        for index, model_field in enumerate(self.fields):
+            value = f"obj.{model_field.name}"
+            attribute_type = ATTRIBUTE_TYPES[model_field.type]
+            if model_field.missing is not None:
+                stored.append(
+                    f'"{model_field.name}": {{"{attribute_type}": '
+                    f"{self._encode(model_field, value)} if {value} else "
+                    f"{model_field.missing!r}}},"
+                )
+            elif model_field.optional:
+                optional.append(
+                    f"    value = {value}\n"
+                    f"    if value:\n"
+                    f'        item["{model_field.name}"] = {{"{attribute_type}": '
+                    f"{self._encode(model_field, 'value')}}}"
+                )
+            else:
+                stored.append(
+                    f'"{model_field.name}": {{"{attribute_type}": '
+                    f"{self._encode(model_field, value)}}},"
+                )
+        for index, name in enumerate(self.computed):
+            self.namespace[f"computed_{index}"] = self.computed[name]
+            stored.append(f'"{name}": {{"S": computed_{index}(obj)}},')
+        lines = ["def encode(obj):", "    item = {"]
+        lines += [f"        {line}" for line in stored]
+        lines.append("    }")
+        lines += optional
+        lines.append("    return item")
+        return "\n".join(lines) + "\n"
+
+    def _encode(self, model_field: Field, value: str) -> str:
+        match model_field.type:
+            case FieldType.STRING | FieldType.BOOLEAN:
+                return value
+            case FieldType.FLOAT | FieldType.INTEGER:
+                return f"str({value})"
+            case FieldType.DATETIME:
+                return f"{value}.isoformat()"
+            case FieldType.DATE:
+                if model_field.suffix:
+                    return f'{value}.isoformat() + "#" + obj.{model_field.suffix}'
+                return f"{value}.isoformat()"
+            case FieldType.ENUM:
+                # the value attribute of enum members is a property, read
+                # the underlying attribute directly
+                return f"{value}._value_"
+
+    def _get_decode_source(self) -> str:
+        lines = ["def decode(item):"]
+        args = []
+        for index, model_field in enumerate(self.fields):
+            attribute_type = ATTRIBUTE_TYPES[model_field.type]
+            name = f"v{index}"
+            if model_field.missing is not None:
+                lines.append(
+                    f'    raw = item["{model_field.name}"]["{attribute_type}"]'
+                )
+                lines.append(
+                    f"    {name} = None if raw == {model_field.missing!r} else "
+                    f"{self._decode(index, model_field, 'raw')}"
+                )
+            elif model_field.default is not MISSING:
+                # fast path for absent attributes, empty strings are never
+                # stored so they are decoded as absent too
+                self.namespace[f"default_{index}"] = model_field.default
+                lines.append(f'    value = item.get("{model_field.name}")')
+                lines.append(
+                    f'    raw = value.get("{attribute_type}") if value is not None else None'
+                )
+                lines.append(
+                    f'    {name} = default_{index} if raw is None or raw == "" else '
+                    f"{self._decode(index, model_field, 'raw')}"
+                )
+            else:
+                raw = f'item["{model_field.name}"]["{attribute_type}"]'
+                lines.append(f"    {name} = {self._decode(index, model_field, raw)}")
+            if model_field.init:
+                args.append(f"{model_field.arg or model_field.name}={name}")
+        lines.append(f"    return model({', '.join(args)})")
+        return "\n".join(lines) + "\n"
+
+    def _decode(self, index: int, model_field: Field, raw: str) -> str:
+        match model_field.type:
+            case FieldType.STRING | FieldType.BOOLEAN:
+                return raw
+            case FieldType.FLOAT:
+                return f"float({raw})"
+            case FieldType.INTEGER:
+                return f"int({raw})"
+            case FieldType.DATETIME:
+                if model_field.timezone is not None:
+                    self.namespace[f"timezone_{index}"] = model_field.timezone
+                    return f"fromisoformat({raw}).replace(tzinfo=timezone_{index})"
+                return f"fromisoformat({raw})"
+            case FieldType.DATE:
+                # dates may be stored with a time and a suffix
+                return f'fromisoformat({raw}.partition("#")[0]).date()'
+            case FieldType.ENUM:
+                self.namespace[f"enum_{index}"] = get_enum_lookup(model_field.enum)
+                return f"enum_{index}.decode({raw})"
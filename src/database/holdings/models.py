@@ -1,9 +1,13 @@
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from typing import Optional
 
+from src.database.codecs import Field, FieldType, ModelCodec
+from src.database.models import Model
 
-@dataclass
-class Holding:
+
+@dataclass(slots=True)
+class Holding(Model):
     """Holding Model"""
 
     account_id: str
@@ -13,6 +17,10 @@ class Holding:
     average_cost_basis: float
     created_at: datetime
     updated_at: datetime
+    # sort key (date#transaction_id) of the latest transaction applied to the
+    # holding, only set for holdings maintained by the holding updater
+    last_transaction_key: Optional[str] = None
+    updates_since_reconciliation: int = 0
 
     def to_dict(self) -> dict:
         return {
@@ -26,15 +34,7 @@ class Holding:
         }
 
     def to_ddb_item(self) -> dict:
-        return {
-            "account_id": {"S": self.account_id},
-            "security_id": {"S": self.security_id},
-            "quantity": {"N": str(self.quantity)},
-            "total_cost_basis": {"N": str(self.total_cost_basis)},
-            "average_cost_basis": {"N": str(self.average_cost_basis)},
-            "created_at": {"S": self.created_at.isoformat()},
-            "updated_at": {"S": self.updated_at.isoformat()},
-        }
+        return HOLDING_CODEC.encode(self)
 
     @classmethod
     def create_new_holding(
@@ -57,12 +57,20 @@ class Holding:
 
     @classmethod
     def from_ddb_item(cls, ddb_item: dict):
-        return Holding(
-            account_id=ddb_item["account_id"]["S"],
-            security_id=ddb_item["security_id"]["S"],
-            quantity=float(ddb_item["quantity"]["N"]),
-            total_cost_basis=float(ddb_item["total_cost_basis"]["N"]),
-            average_cost_basis=float(ddb_item["average_cost_basis"]["N"]),
-            created_at=datetime.fromisoformat(ddb_item["created_at"]["S"]),
-            updated_at=datetime.fromisoformat(ddb_item["updated_at"]["S"]),
-        )
+        return HOLDING_CODEC.decode(ddb_item)
+
+
+HOLDING_CODEC = ModelCodec(
+    Holding,
+    [
+        Field("account_id"),
+        Field("security_id"),
+        Field("quantity", FieldType.FLOAT),
+        Field("total_cost_basis", FieldType.FLOAT),
+        Field("average_cost_basis", FieldType.FLOAT),
+        Field("created_at", FieldType.DATETIME),
+        Field("updated_at", FieldType.DATETIME),
+        Field("updates_since_reconciliation", FieldType.INTEGER, default=0),
+        Field("last_transaction_key", optional=True),
+    ],
+)
@@ -1,6 +1,7 @@
+from collections import Counter
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from src.aws.dynamodb.client import WalterDDBClient
 from src.database.holdings.models import Holding
@@ -87,6 +88,36 @@ class HoldingsTable:
             f"Holding for account '{account_id}' and security '{security_id}' deleted successfully!"
         )
 
+    def put_holdings(self, holdings: List[Holding]) -> None:
+        log.info(f"Batch putting {len(holdings)} holding(s)")
+        self.ddb.batch_write_items(
+            table=self.table_name,
+            put_items=[holding.to_ddb_item() for holding in holdings],
+        )
+        log.info("Holdings put successfully!")
+
+    def delete_holdings(self, account_id: str, security_ids: List[str]) -> None:
+        log.info(
+            f"Batch deleting {len(security_ids)} holding(s) for account '{account_id}'"
+        )
+        self.ddb.batch_write_items(
+            table=self.table_name,
+            delete_keys=[
+                HoldingsTable._get_primary_key(account_id, security_id)
+                for security_id in security_ids
+            ],
+        )
+        log.info("Holdings deleted successfully!")
+
+    def get_security_holder_counts(self) -> Dict[str, int]:
+        """Count the number of holdings of each security across all accounts."""
+        log.info(f"Counting holders of each security in table '{self.table_name}'")
+        holder_counts = Counter()
+        for items in self.ddb.scan_table_pages(self.table_name):
+            holder_counts.update(item["security_id"]["S"] for item in items)
+        log.info(f"Counted holders of {len(holder_counts)} securities")
+        return dict(holder_counts)
+
     @staticmethod
     def _get_primary_key(account_id: str, security_id: str) -> dict:
         return {
@@ -0,0 +1,118 @@
+from functools import lru_cache
+from typing import Callable, Optional, Tuple, TypeVar
+
+M = TypeVar("M", bound="Model")
+
+
+class FrozenModelError(AttributeError):
+    """Raised when the attributes of a frozen model are modified."""
+
+
+class Model:
+    """
+    Model
+
+    The base of the domain models of WalterDB. Models declare their
+    attributes in `__slots__`, so instances are stored without a
+    per-instance `__dict__`, which makes them smaller and faster to create,
+    e.g. when syncs and price updates create them by the thousand.
+
+    Models are mutable. `freeze` gets an immutable copy of a model that
+    raises `FrozenModelError` when modified, e.g. for models shared through
+    caches, `thaw` gets a mutable copy of a frozen model, and `replace` gets
+    a copy with changes of either. Copies are shallow and set the attributes
+    directly without calling the model constructor again.
+    """
+
+    __slots__ = ()
+
+    _mutable_class: Optional[type] = None
+
+    def replace(self: M, **changes) -> M:
+        """Get a copy of the model with the given attributes changed."""
+        return _copy(self, type(self), changes)
+
+    def freeze(self: M) -> M:
+        """Get an immutable copy of the model."""
+        if self.is_frozen():
+            return self
+        return _copy(self, _get_frozen_class(type(self)), {})
+
+    def thaw(self: M) -> M:
+        """Get a mutable copy of the model."""
+        return _copy(self, type(self)._mutable_class or type(self), {})
+
+    def is_frozen(self) -> bool:
+        return type(self)._mutable_class is not None
+
+    def __copy__(self: M) -> M:
+        return self.replace()
+
+
+@lru_cache(maxsize=None)
+def get_slots(cls: type) -> Tuple[str, ...]:
+    """Get the names of the attributes of a slotted model class, base class attributes first."""
+    slots = []
+    for klass in reversed(cls.__mro__):
+        names = klass.__dict__.get("__slots__", ())
+        if isinstance(names, str):
+            names = (names,)
+        slots.extend(name for name in names if name not in ("__dict__", "__weakref__"))
+    return tuple(slots)
+
+
+def _copy(model: Model, cls: type, changes: dict) -> Model:
+    mutable_class = cls._mutable_class or cls
+    copy = _get_copier(mutable_class)(model)
+    if changes:
+        unknown = changes.keys() - set(get_slots(mutable_class))
+        if unknown:
+            raise TypeError(
+                f"{cls.__name__} has no attributes {sorted(unknown)} to replace!"
+            )
+        for name, value in changes.items():
+            setattr(copy, name, value)
+    if cls is not mutable_class:
+        # frozen classes have the layout of their model class
+        object.__setattr__(copy, "__class__", cls)
+    return copy
+
+
+@lru_cache(maxsize=None)
+def _get_copier(cls: type) -> Callable[[Model], Model]:
+    """Compile a function copying the attributes of a model class one by one, as `copy.copy` is slow for slots."""
+    lines = ["def copy(model):", "    copy = new(cls)"]
+    lines += [f"    copy.{name} = model.{name}" for name in get_slots(cls)]
+    lines.append("    return copy")
+    namespace = {"new": object.__new__, "cls": cls}
+    exec(compile("\n".join(lines) + "\n", f"<{cls.__name__} copy>", "exec"), namespace)
+    return namespace["copy"]
+
+
+def _raise_frozen(model: Model, name: str, *args) -> None:
+    raise FrozenModelError(
+        f"Cannot modify attribute '{name}' of frozen {type(model).__name__}!"
+    )
+
+
+def _freeze(model: Model) -> Model:
+    return model.freeze()
+
+
+@lru_cache(maxsize=None)
+def _get_frozen_class(cls: type) -> type:
+    # the frozen class of a model adds no slots, so it has the same layout
+    # as the model class and frozen models are instances of the model class
+    return type(cls)(
+        f"Frozen{cls.__name__}",
+        (cls,),
+        {
+            "__slots__": (),
+            "__module__": cls.__module__,
+            "__setattr__": _raise_frozen,
+            "__delattr__": _raise_frozen,
+            # frozen classes are not importable, pickle the mutable model
+            "__reduce__": lambda model: (_freeze, (model.thaw(),)),
+            "_mutable_class": cls,
+        },
+    )
@@ -0,0 +1,152 @@
+from dataclasses import dataclass, field
+from datetime import date
+from typing import Dict, Iterable, List, Tuple
+
+from src.database.transactions.models import Transaction, TransactionTotals
+
+
+@dataclass
+class CashFlowRollup:
+    """
+    Cash Flow Rollup Model
+
+    The income, expense, number of transactions, and per-category totals of
+    the transactions of an owner (a user or an account) in a bucket (a month
+    or a day). Every transaction counts towards four rollups: the month and
+    day buckets of its user and of its account.
+    """
+
+    USER_OWNER_FORMAT = "user#{user_id}"
+    ACCOUNT_OWNER_FORMAT = "account#{account_id}"
+    MONTH_BUCKET_FORMAT = "M#{month}"
+    DAY_BUCKET_FORMAT = "D#{day}"
+    CATEGORY_ATTRIBUTE_PREFIX = "category#"
+
+    owner_id: str
+    bucket: str
+    income: float = 0.0
+    expense: float = 0.0
+    num_transactions: int = 0
+    category_totals: Dict[str, float] = field(default_factory=dict)
+
+    def add_transaction(self, transaction: Transaction, sign: int = 1) -> None:
+        amount = sign * transaction.transaction_amount
+        self.num_transactions += sign
+        if transaction.is_income():
+            self.income += amount
+        elif transaction.is_expense():
+            self.expense += amount
+        category = transaction.transaction_category.value
+        self.category_totals[category] = (
+            self.category_totals.get(category, 0.0) + amount
+        )
+
+    def add_rollup(self, rollup: "CashFlowRollup", sign: int = 1) -> None:
+        self.num_transactions += sign * rollup.num_transactions
+        self.income += sign * rollup.income
+        self.expense += sign * rollup.expense
+        for category, total in rollup.category_totals.items():
+            self.category_totals[category] = (
+                self.category_totals.get(category, 0.0) + sign * total
+            )
+
+    def is_empty(self, tolerance: float = 1e-6) -> bool:
+        return (
+            self.num_transactions == 0
+            and abs(self.income) < tolerance
+            and abs(self.expense) < tolerance
+            and all(abs(total) < tolerance for total in self.category_totals.values())
+        )
+
+    def matches(self, other: "CashFlowRollup", tolerance: float = 1e-6) -> bool:
+        difference = CashFlowRollup(self.owner_id, self.bucket)
+        difference.add_rollup(self)
+        difference.add_rollup(other, sign=-1)
+        return difference.is_empty(tolerance)
+
+    def get_key(self) -> Tuple[str, str]:
+        return self.owner_id, self.bucket
+
+    def to_totals(self) -> TransactionTotals:
+        return TransactionTotals(
+            num_transactions=self.num_transactions,
+            total_income=self.income,
+            total_expense=self.expense,
+            category_totals=dict(self.category_totals),
+        )
+
+    def to_ddb_item(self) -> dict:
+        item = {
+            "owner_id": {"S": self.owner_id},
+            "bucket": {"S": self.bucket},
+            "income": {"N": str(self.income)},
+            "expense": {"N": str(self.expense)},
+            "num_transactions": {"N": str(self.num_transactions)},
+        }
+        for category, total in self.category_totals.items():
+            item[CashFlowRollup.CATEGORY_ATTRIBUTE_PREFIX + category] = {
+                "N": str(total)
+            }
+        return item
+
+    @classmethod
+    def from_ddb_item(cls, item: dict) -> "CashFlowRollup":
+        return CashFlowRollup(
+            owner_id=item["owner_id"]["S"],
+            bucket=item["bucket"]["S"],
+            income=float(item.get("income", {"N": "0"})["N"]),
+            expense=float(item.get("expense", {"N": "0"})["N"]),
+            num_transactions=int(item.get("num_transactions", {"N": "0"})["N"]),
+            category_totals={
+                name[len(CashFlowRollup.CATEGORY_ATTRIBUTE_PREFIX) :]: float(value["N"])
+                for name, value in item.items()
+                if name.startswith(CashFlowRollup.CATEGORY_ATTRIBUTE_PREFIX)
+            },
+        )
+
+    @classmethod
+    def from_transactions(
+        cls, transactions: Iterable[Transaction], sign: int = 1
+    ) -> Dict[Tuple[str, str], "CashFlowRollup"]:
+        """Roll up the given transactions into their rollups keyed by owner ID and bucket."""
+        rollups: Dict[Tuple[str, str], CashFlowRollup] = {}
+        for transaction in transactions:
+            for owner_id in CashFlowRollup.get_owner_ids(transaction):
+                for bucket in CashFlowRollup.get_buckets(transaction.transaction_date):
+                    rollup = rollups.get((owner_id, bucket))
+                    if rollup is None:
+                        rollup = rollups[(owner_id, bucket)] = CashFlowRollup(
+                            owner_id, bucket
+                        )
+                    rollup.add_transaction(transaction, sign)
+        return rollups
+
+    @staticmethod
+    def get_owner_ids(transaction: Transaction) -> List[str]:
+        return [
+            CashFlowRollup.get_user_owner_id(transaction.user_id),
+            CashFlowRollup.get_account_owner_id(transaction.account_id),
+        ]
+
+    @staticmethod
+    def get_user_owner_id(user_id: str) -> str:
+        return CashFlowRollup.USER_OWNER_FORMAT.format(user_id=user_id)
+
+    @staticmethod
+    def get_account_owner_id(account_id: str) -> str:
+        return CashFlowRollup.ACCOUNT_OWNER_FORMAT.format(account_id=account_id)
+
+    @staticmethod
+    def get_buckets(day: date) -> List[str]:
+        return [
+            CashFlowRollup.get_month_bucket(day),
+            CashFlowRollup.get_day_bucket(day),
+        ]
+
+    @staticmethod
+    def get_month_bucket(day: date) -> str:
+        return CashFlowRollup.MONTH_BUCKET_FORMAT.format(month=day.isoformat()[:7])
+
+    @staticmethod
+    def get_day_bucket(day: date) -> str:
+        return CashFlowRollup.DAY_BUCKET_FORMAT.format(day=day.isoformat())
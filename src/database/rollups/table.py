@@ -0,0 +1,295 @@
+import calendar
+import datetime as dt
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.aws.dynamodb.client import WalterDDBClient
+from src.database.rollups.models import CashFlowRollup
+from src.database.transactions.models import Transaction, TransactionTotals
+from src.environment import Domain
+from src.utils.log import Logger
+
+log = Logger(__name__).get_logger()
+
+
+@dataclass
+class CashFlowRollupsTable:
+    """Cash Flow Rollups Table
+
+    Responsible for maintaining the monthly and daily cash flow rollups of
+    users and accounts in the DynamoDB CashFlowRollups table. Rollups are
+    keyed by owner ID and bucket and updated incrementally with atomic ADD
+    updates whenever transactions are written, so concurrent writers never
+    overwrite each other's changes.
+
+    Totals over a date range are read from the monthly buckets of the whole
+    months in the range and the daily buckets of the partial months at its
+    edges, i.e. at most a few dozen rows for typical ranges.
+    """
+
+    TABLE_NAME_FORMAT = "CashFlowRollups-{domain}"
+
+    ddb: WalterDDBClient
+    domain: Domain
+
+    table_name: str = None  # set during post-init
+
+    def __post_init__(self) -> None:
+        self.table_name = self.TABLE_NAME_FORMAT.format(domain=self.domain.value)
+        log.debug(f"Initializing CashFlowRollups Table with name '{self.table_name}'")
+
+    def update_rollups(
+        self, removed: List[Transaction], added: List[Transaction]
+    ) -> None:
+        """Update the rollups of the given removed and added transactions."""
+        deltas = CashFlowRollup.from_transactions(removed, sign=-1)
+        for key, rollup in CashFlowRollup.from_transactions(added).items():
+            if key in deltas:
+                deltas[key].add_rollup(rollup)
+            else:
+                deltas[key] = rollup
+        for delta in deltas.values():
+            self._add(delta)
+
+    def get_totals(
+        self,
+        owner_id: str,
+        start_date: dt.date,
+        end_date: dt.date,
+        excluded_owner_ids: Iterable[str] = (),
+    ) -> TransactionTotals:
+        """
+        Get the totals of the transactions of an owner between start_date and end_date (inclusive).
+
+        The totals of the excluded owners, e.g. the accounts of a user that
+        are being deleted, are subtracted from the totals of the owner.
+        """
+        log.info(
+            f"Getting cash flow totals for '{owner_id}' between '{start_date}' and '{end_date}'"
+        )
+        totals = CashFlowRollup(owner_id, "total")
+        if start_date > end_date:
+            return totals.to_totals()
+
+        first_month = CashFlowRollupsTable._get_first_whole_month(start_date)
+        last_month = CashFlowRollupsTable._get_last_whole_month(end_date)
+        if first_month is None or last_month is None or first_month > last_month:
+            # no whole months in the range, read the daily buckets only
+            ranges = [(start_date, end_date, False)]
+        else:
+            ranges = [(first_month, last_month, True)]
+            if start_date < first_month:
+                ranges.append((start_date, first_month - dt.timedelta(days=1), False))
+            last_day = last_month.replace(
+                day=calendar.monthrange(last_month.year, last_month.month)[1]
+            )
+            if last_day < end_date:
+                ranges.append((last_day + dt.timedelta(days=1), end_date, False))
+
+        num_rows = 0
+        owners = [(owner_id, 1)] + [(excluded, -1) for excluded in excluded_owner_ids]
+        for owner, sign in owners:
+            for lower, upper, monthly in ranges:
+                for rollup in self._query(owner, lower, upper, monthly):
+                    totals.add_rollup(rollup, sign)
+                    num_rows += 1
+        log.info(f"Totaled {num_rows} cash flow rollup(s) for '{owner_id}'")
+        return totals.to_totals()
+
+    def get_rollups(self, owner_id: str) -> List[CashFlowRollup]:
+        items = self.ddb.query(
+            self.table_name, CashFlowRollupsTable._get_owner_key(owner_id)
+        )
+        return [CashFlowRollup.from_ddb_item(item) for item in items]
+
+    def put_rollups(self, rollups: List[CashFlowRollup]) -> None:
+        log.info(f"Batch putting {len(rollups)} cash flow rollup(s)")
+        self.ddb.batch_write_items(
+            table=self.table_name,
+            put_items=[rollup.to_ddb_item() for rollup in rollups],
+        )
+
+    def get_rollup_items(self, owner_id: str) -> Dict[str, dict]:
+        """Get the rollup items of an owner keyed by bucket, e.g. to snapshot them before reconciling."""
+        items = self.ddb.query(
+            self.table_name, CashFlowRollupsTable._get_owner_key(owner_id)
+        )
+        return {item["bucket"]["S"]: item for item in items}
+
+    def reconcile_rollups(
+        self,
+        owner_id: str,
+        items: Dict[str, dict],
+        expected: List[CashFlowRollup],
+        dry_run: bool = False,
+    ) -> Tuple[int, int]:
+        """
+        Reconcile the rollup items of an owner with the expected rollups.
+
+        Drifted and missing rollups are rewritten and rollups not in the
+        expected rollups are deleted. Every write is conditional on the row
+        still being the given item, so the items must be read before the
+        transactions the expected rollups are built from. Rows changed by a
+        transaction written after the items were read then fail the
+        condition and are left to the next reconcile instead of overwritten.
+
+        Returns:
+            The number of drifted and stale rollups of the owner.
+        """
+        expected = {rollup.bucket: rollup for rollup in expected}
+        drifted = [
+            rollup
+            for bucket, rollup in expected.items()
+            if bucket not in items
+            or not rollup.matches(CashFlowRollup.from_ddb_item(items[bucket]))
+        ]
+        stale = [bucket for bucket in items if bucket not in expected]
+        if dry_run:
+            return len(drifted), len(stale)
+
+        num_skipped = 0
+        for rollup in drifted:
+            if not self.ddb.conditional_put_item(
+                self.table_name,
+                rollup.to_ddb_item(),
+                *CashFlowRollupsTable._get_unchanged_condition(
+                    items.get(rollup.bucket)
+                ),
+            ):
+                num_skipped += 1
+        for bucket in stale:
+            if not self.ddb.conditional_delete_item(
+                self.table_name,
+                CashFlowRollupsTable._get_primary_key(owner_id, bucket),
+                *CashFlowRollupsTable._get_unchanged_condition(items[bucket]),
+            ):
+                num_skipped += 1
+        if num_skipped:
+            log.warning(
+                f"Skipped {num_skipped} cash flow rollup(s) of '{owner_id}' changed while reconciling"
+            )
+        return len(drifted), len(stale)
+
+    def delete_account_rollups(self, user_id: str, account_id: str) -> None:
+        """
+        Delete the rollups of an account and subtract them from the rollups of its user.
+
+        Each account rollup is deleted before it is subtracted, so a retry
+        after a failure never subtracts the same rollup twice.
+        """
+        log.info(f"Deleting cash flow rollups of account '{account_id}'")
+        user_owner_id = CashFlowRollup.get_user_owner_id(user_id)
+        for rollup in self.get_rollups(CashFlowRollup.get_account_owner_id(account_id)):
+            item = self.ddb.delete_item(
+                self.table_name,
+                CashFlowRollupsTable._get_primary_key(rollup.owner_id, rollup.bucket),
+                return_old=True,
+            )
+            if item is None:
+                continue
+            delta = CashFlowRollup(user_owner_id, rollup.bucket)
+            delta.add_rollup(CashFlowRollup.from_ddb_item(item), sign=-1)
+            self._add(delta)
+
+    def _add(self, delta: CashFlowRollup) -> None:
+        if delta.is_empty():
+            return
+        attribute_names = {}
+        attribute_values = {
+            ":income": {"N": str(delta.income)},
+            ":expense": {"N": str(delta.expense)},
+            ":num_transactions": {"N": str(delta.num_transactions)},
+        }
+        additions = [
+            "income :income",
+            "expense :expense",
+            "num_transactions :num_transactions",
+        ]
+        for i, (category, total) in enumerate(sorted(delta.category_totals.items())):
+            attribute_names[f"#c{i}"] = (
+                CashFlowRollup.CATEGORY_ATTRIBUTE_PREFIX + category
+            )
+            attribute_values[f":c{i}"] = {"N": str(total)}
+            additions.append(f"#c{i} :c{i}")
+        self.ddb.update_item(
+            table=self.table_name,
+            key=CashFlowRollupsTable._get_primary_key(delta.owner_id, delta.bucket),
+            update_expression="ADD " + ", ".join(additions),
+            attribute_values=attribute_values,
+            attribute_names=attribute_names,
+        )
+
+    def _query(
+        self, owner_id: str, lower: dt.date, upper: dt.date, monthly: bool
+    ) -> List[CashFlowRollup]:
+        get_bucket = (
+            CashFlowRollup.get_month_bucket
+            if monthly
+            else CashFlowRollup.get_day_bucket
+        )
+        items = self.ddb.query(
+            self.table_name,
+            {
+                "owner_id": {
+                    "AttributeValueList": [{"S": owner_id}],
+                    "ComparisonOperator": "EQ",
+                },
+                "bucket": {
+                    "AttributeValueList": [
+                        {"S": get_bucket(lower)},
+                        {"S": get_bucket(upper)},
+                    ],
+                    "ComparisonOperator": "BETWEEN",
+                },
+            },
+        )
+        return [CashFlowRollup.from_ddb_item(item) for item in items]
+
+    @staticmethod
+    def _get_first_whole_month(start_date: dt.date) -> Optional[dt.date]:
+        if start_date.day == 1:
+            return start_date
+        if start_date.month < 12:
+            return dt.date(start_date.year, start_date.month + 1, 1)
+        if start_date.year < dt.MAXYEAR:
+            return dt.date(start_date.year + 1, 1, 1)
+        return None
+
+    @staticmethod
+    def _get_last_whole_month(end_date: dt.date) -> Optional[dt.date]:
+        if end_date.day == calendar.monthrange(end_date.year, end_date.month)[1]:
+            return end_date.replace(day=1)
+        if end_date.month > 1:
+            return dt.date(end_date.year, end_date.month - 1, 1)
+        if end_date.year > dt.MINYEAR:
+            return dt.date(end_date.year - 1, 12, 1)
+        return None
+
+    @staticmethod
+    def _get_owner_key(owner_id: str) -> dict:
+        return {
+            "owner_id": {
+                "AttributeValueList": [{"S": owner_id}],
+                "ComparisonOperator": "EQ",
+            }
+        }
+
+    @staticmethod
+    def _get_unchanged_condition(
+        item: Optional[dict],
+    ) -> Tuple[str, Optional[dict], Optional[dict]]:
+        """Get the condition, values and names that a rollup row is still the given item, or still missing."""
+        if item is None:
+            return "attribute_not_exists(owner_id)", None, None
+        conditions = []
+        attribute_names = {}
+        attribute_values = {}
+        for i, (name, value) in enumerate(sorted(item.items())):
+            attribute_names[f"#a{i}"] = name
+            attribute_values[f":a{i}"] = value
+            conditions.append(f"#a{i} = :a{i}")
+        return " AND ".join(conditions), attribute_values, attribute_names
+
+    @staticmethod
+    def _get_primary_key(owner_id: str, bucket: str) -> dict:
+        return {"owner_id": {"S": owner_id}, "bucket": {"S": bucket}}
@@ -0,0 +1,101 @@
+from dataclasses import dataclass, field, replace
+from datetime import datetime
+from typing import Dict, Optional
+
+from src.database.securities.models import Security
+from src.utils.log import Logger
+from src.utils.ttl_cache import TTLCache
+
+log = Logger(__name__).get_logger()
+
+
+@dataclass
+class SecurityCacheStats:
+    """
+    Security Cache Stats
+
+    Counts of security cache lookups served from memory and missed (i.e.
+    requiring a read from the Securities table).
+    """
+
+    hits: int = 0
+    misses: int = 0
+
+    def hit_rate(self) -> Optional[float]:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else None
+
+    def to_dict(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate(),
+        }
+
+
+@dataclass
+class SecurityCache:
+    """
+    Security Cache
+
+    Read-through cache of securities keyed by security ID with a ticker to
+    security ID index. Each entry is valid until the `price_expires_at` of
+    its security, the time at which the UpdateSecurityPrices workflow
+    refreshes the row, so cached rows are never older than the price
+    refresh schedule. Entries are replaced whenever a security is written
+    through the Securities table of the same process.
+
+    Securities are mutable, so entries are stored frozen and callers get
+    mutable copies, which keeps callers from modifying cached entries. The
+    ticker index and stats are guarded by the lock of the entries.
+    """
+
+    entries: TTLCache[Security] = field(default_factory=TTLCache)
+    ticker_index: Dict[str, str] = field(default_factory=dict)
+    stats: SecurityCacheStats = field(default_factory=SecurityCacheStats)
+
+    def get(self, security_id: str, now: datetime) -> Optional[Security]:
+        with self.entries.lock:
+            return self._get(security_id, now)
+
+    def get_by_ticker(self, ticker: str, now: datetime) -> Optional[Security]:
+        with self.entries.lock:
+            security_id = self.ticker_index.get(ticker)
+            if security_id is None:
+                self.stats.misses += 1
+                return None
+            return self._get(security_id, now)
+
+    def put(self, security: Security) -> None:
+        with self.entries.lock:
+            self.entries.put(
+                security.security_id, security.freeze(), security.price_expires_at
+            )
+            ticker = getattr(security, "ticker", None)
+            if ticker is not None:
+                self.ticker_index[ticker] = security.security_id
+
+    def invalidate(self, security_id: str) -> None:
+        self.entries.pop(security_id)
+
+    def clear(self) -> None:
+        with self.entries.lock:
+            self.entries.clear()
+            self.ticker_index.clear()
+            self.stats = SecurityCacheStats()
+
+    def get_stats(self) -> SecurityCacheStats:
+        with self.entries.lock:
+            return replace(self.stats)
+
+    def _get(self, security_id: str, now: datetime) -> Optional[Security]:
+        security = self.entries.get(security_id, now)
+        if security is None:
+            self.stats.misses += 1
+            return None
+        self.stats.hits += 1
+        return security.thaw()
+
+
+SECURITY_CACHE = SecurityCache()
+"""(SecurityCache): Securities read or written by the Securities tables of the process, each until its next scheduled price refresh."""
@@ -1,37 +1,211 @@
 from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta, timezone
+from functools import lru_cache
+from typing import Callable, FrozenSet, Optional
+from zoneinfo import ZoneInfo
+
+
+@lru_cache(maxsize=16)
+def get_us_market_holidays(year: int) -> FrozenSet[date]:
+    """
+    Get the full-day holidays of the US stock markets (NYSE/NASDAQ) for the given year.
+
+    Holidays falling on a Sunday are observed the following Monday and
+    holidays falling on a Saturday are observed the preceding Friday, except
+    New Year's Day which is then not observed.
+    """
+
+    def nth_weekday(month: int, weekday: int, n: int) -> date:
+        first = date(year, month, 1)
+        return first + timedelta(days=(weekday - first.weekday()) % 7 + 7 * (n - 1))
+
+    def last_weekday(month: int, weekday: int) -> date:
+        last = date(year, month + 1, 1) - timedelta(days=1)
+        return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+    def observed(holiday: date) -> Optional[date]:
+        if holiday.weekday() == 5:
+            return None if holiday.month == 1 else holiday - timedelta(days=1)
+        if holiday.weekday() == 6:
+            return holiday + timedelta(days=1)
+        return holiday
+
+    # anonymous gregorian algorithm for easter sunday
+    a, b, c = year % 19, year // 100, year % 100
+    d, e = b // 4, b % 4
+    g = (8 * b + 13) // 25
+    h = (19 * a + b - d - g + 15) % 30
+    i, k = c // 4, c % 4
+    j = (32 + 2 * e + 2 * i - h - k) % 7
+    m = (a + 11 * h + 19 * j) // 433
+    easter_month = (h + j - 7 * m + 90) // 25
+    easter = date(year, easter_month, (h + j - 7 * m + 33 * easter_month + 19) % 32)
+
+    holidays = {
+        observed(date(year, 1, 1)),  # new year's day
+        nth_weekday(1, 0, 3),  # martin luther king jr. day
+        nth_weekday(2, 0, 3),  # washington's birthday
+        easter - timedelta(days=2),  # good friday
+        last_weekday(5, 0),  # memorial day
+        observed(date(year, 7, 4)),  # independence day
+        nth_weekday(9, 0, 1),  # labor day
+        nth_weekday(11, 3, 4),  # thanksgiving day
+        observed(date(year, 12, 25)),  # christmas day
+    }
+    if year >= 2022:
+        holidays.add(observed(date(year, 6, 19)))  # juneteenth
+    holidays.discard(None)
+    return frozenset(holidays)
+
+
+@dataclass(frozen=True)
+class TradingCalendar:
+    """
+    Trading Calendar
+
+    The regular trading session of an exchange, open from `open_time` to
+    `close_time` in the exchange's local timezone on weekdays that are not
+    exchange holidays. Early closes are not modeled.
+    """
+
+    timezone: str
+    open_time: time
+    close_time: time
+    holidays: Callable[[int], FrozenSet[date]] = lambda year: frozenset()
+
+    def is_trading_day(self, day: date) -> bool:
+        return day.weekday() < 5 and day not in self.holidays(day.year)
+
+    def is_open(self, at: datetime) -> bool:
+        local = at.astimezone(ZoneInfo(self.timezone))
+        return (
+            self.is_trading_day(local.date())
+            and self.open_time <= local.time() < self.close_time
+        )
+
+    def get_next_open(self, at: datetime) -> datetime:
+        """Get the next session open strictly after the given time."""
+        return self._get_next_session_time(at, self.open_time)
+
+    def get_next_close(self, at: datetime) -> datetime:
+        """Get the next session close strictly after the given time."""
+        return self._get_next_session_time(at, self.close_time)
+
+    def _get_next_session_time(self, at: datetime, session_time: time) -> datetime:
+        tz = ZoneInfo(self.timezone)
+        day = at.astimezone(tz).date()
+        while True:
+            candidate = datetime.combine(day, session_time, tzinfo=tz)
+            if self.is_trading_day(day) and candidate > at:
+                return candidate.astimezone(timezone.utc)
+            day += timedelta(days=1)
+
+
+US_TRADING_CALENDAR = TradingCalendar(
+    timezone="America/New_York",
+    open_time=time(9, 30),
+    close_time=time(16, 0),
+    holidays=get_us_market_holidays,
+)
 
 
 @dataclass
 class MarketExchange:
     name: str
     key_name: str
+    calendar: Optional[TradingCalendar] = None  # none if the exchange trades 24/7
+
+    def is_open(self, at: datetime) -> bool:
+        return self.calendar is None or self.calendar.is_open(at)
 
 
 # Market exchange code to MarketExchange mapping - only popular exchanges
 MARKET_EXCHANGES = {
     # Major US Stock Exchanges
-    "XNAS": MarketExchange(name="NASDAQ Global Select Market", key_name="nasdaq"),
-    "XNYS": MarketExchange(name="New York Stock Exchange", key_name="nyse"),
-    "ARCX": MarketExchange(name="NYSE Arca", key_name="nyse_arca"),
-    "BATS": MarketExchange(name="Cboe BZX Exchange", key_name="cboe_bzx"),
-    "XASE": MarketExchange(name="NYSE American", key_name="nyse_american"),
-    "IEXG": MarketExchange(name="Investors Exchange", key_name="iex"),
+    "XNAS": MarketExchange(
+        name="NASDAQ Global Select Market",
+        key_name="nasdaq",
+        calendar=US_TRADING_CALENDAR,
+    ),
+    "XNYS": MarketExchange(
+        name="New York Stock Exchange", key_name="nyse", calendar=US_TRADING_CALENDAR
+    ),
+    "ARCX": MarketExchange(
+        name="NYSE Arca", key_name="nyse_arca", calendar=US_TRADING_CALENDAR
+    ),
+    "BATS": MarketExchange(
+        name="Cboe BZX Exchange", key_name="cboe_bzx", calendar=US_TRADING_CALENDAR
+    ),
+    "XASE": MarketExchange(
+        name="NYSE American", key_name="nyse_american", calendar=US_TRADING_CALENDAR
+    ),
+    "IEXG": MarketExchange(
+        name="Investors Exchange", key_name="iex", calendar=US_TRADING_CALENDAR
+    ),
     # Over-the-Counter Markets
-    "OTCM": MarketExchange(name="OTC Markets", key_name="otc_markets"),
-    "OTCP": MarketExchange(name="OTC Pink Sheets", key_name="otc_pink"),
-    "OTCQ": MarketExchange(name="OTCQX Best Market", key_name="otcqx"),
-    "OTCX": MarketExchange(name="OTCQB Venture Market", key_name="otcqb"),
+    "OTCM": MarketExchange(
+        name="OTC Markets", key_name="otc_markets", calendar=US_TRADING_CALENDAR
+    ),
+    "OTCP": MarketExchange(
+        name="OTC Pink Sheets", key_name="otc_pink", calendar=US_TRADING_CALENDAR
+    ),
+    "OTCQ": MarketExchange(
+        name="OTCQX Best Market", key_name="otcqx", calendar=US_TRADING_CALENDAR
+    ),
+    "OTCX": MarketExchange(
+        name="OTCQB Venture Market", key_name="otcqb", calendar=US_TRADING_CALENDAR
+    ),
     # International Exchanges
-    "XTSE": MarketExchange(name="Toronto Stock Exchange", key_name="tsx"),
-    "XLON": MarketExchange(name="London Stock Exchange", key_name="lse"),
-    "XPAR": MarketExchange(name="Euronext Paris", key_name="euronext_paris"),
-    "XFRA": MarketExchange(name="Deutsche Börse Frankfurt", key_name="frankfurt"),
-    "XSWX": MarketExchange(name="SIX Swiss Exchange", key_name="swiss"),
-    "XSTO": MarketExchange(name="Nasdaq Stockholm", key_name="nasdaq_stockholm"),
-    "XHKG": MarketExchange(name="Hong Kong Stock Exchange", key_name="hkex"),
-    "XSHG": MarketExchange(name="Shanghai Stock Exchange", key_name="sse"),
-    "XTKS": MarketExchange(name="Tokyo Stock Exchange", key_name="tse"),
-    "XASX": MarketExchange(name="Australian Securities Exchange", key_name="asx"),
+    "XTSE": MarketExchange(
+        name="Toronto Stock Exchange",
+        key_name="tsx",
+        calendar=TradingCalendar("America/Toronto", time(9, 30), time(16, 0)),
+    ),
+    "XLON": MarketExchange(
+        name="London Stock Exchange",
+        key_name="lse",
+        calendar=TradingCalendar("Europe/London", time(8, 0), time(16, 30)),
+    ),
+    "XPAR": MarketExchange(
+        name="Euronext Paris",
+        key_name="euronext_paris",
+        calendar=TradingCalendar("Europe/Paris", time(9, 0), time(17, 30)),
+    ),
+    "XFRA": MarketExchange(
+        name="Deutsche Börse Frankfurt",
+        key_name="frankfurt",
+        calendar=TradingCalendar("Europe/Berlin", time(9, 0), time(17, 30)),
+    ),
+    "XSWX": MarketExchange(
+        name="SIX Swiss Exchange",
+        key_name="swiss",
+        calendar=TradingCalendar("Europe/Zurich", time(9, 0), time(17, 30)),
+    ),
+    "XSTO": MarketExchange(
+        name="Nasdaq Stockholm",
+        key_name="nasdaq_stockholm",
+        calendar=TradingCalendar("Europe/Stockholm", time(9, 0), time(17, 30)),
+    ),
+    "XHKG": MarketExchange(
+        name="Hong Kong Stock Exchange",
+        key_name="hkex",
+        calendar=TradingCalendar("Asia/Hong_Kong", time(9, 30), time(16, 0)),
+    ),
+    "XSHG": MarketExchange(
+        name="Shanghai Stock Exchange",
+        key_name="sse",
+        calendar=TradingCalendar("Asia/Shanghai", time(9, 30), time(15, 0)),
+    ),
+    "XTKS": MarketExchange(
+        name="Tokyo Stock Exchange",
+        key_name="tse",
+        calendar=TradingCalendar("Asia/Tokyo", time(9, 0), time(15, 30)),
+    ),
+    "XASX": MarketExchange(
+        name="Australian Securities Exchange",
+        key_name="asx",
+        calendar=TradingCalendar("Australia/Sydney", time(10, 0), time(16, 0)),
+    ),
     # Crypto Exchanges
     "COIN": MarketExchange(name="Coinbase", key_name="coinbase"),
     "BINA": MarketExchange(name="Binance", key_name="binance"),
@@ -39,11 +213,24 @@ MARKET_EXCHANGES = {
     "BITF": MarketExchange(name="Bitfinex", key_name="bitfinex"),
     "BSTM": MarketExchange(name="Bitstamp", key_name="bitstamp"),
     "GEMS": MarketExchange(name="Gemini", key_name="gemini"),
-    # Default/Unknown
-    "UNK": MarketExchange(name="Unknown Exchange", key_name="unknown"),
-    "": MarketExchange(name="Not Specified", key_name="not_specified"),
+    # Default/Unknown - assumed to be US listings
+    "UNK": MarketExchange(
+        name="Unknown Exchange", key_name="unknown", calendar=US_TRADING_CALENDAR
+    ),
+    "": MarketExchange(
+        name="Not Specified", key_name="not_specified", calendar=US_TRADING_CALENDAR
+    ),
+}
+
+MARKET_EXCHANGES_BY_KEY_NAME = {
+    exchange.key_name: exchange for exchange in MARKET_EXCHANGES.values()
 }
 
 
 def get_market_exchange(exchange_code: str) -> MarketExchange:
     return MARKET_EXCHANGES.get(exchange_code.upper(), MARKET_EXCHANGES["UNK"])
+
+
+def get_market_exchange_by_key_name(key_name: str) -> MarketExchange:
+    """Get the market exchange of a stock from the exchange key name stored on the stock."""
+    return MARKET_EXCHANGES_BY_KEY_NAME.get(key_name.lower(), MARKET_EXCHANGES["UNK"])
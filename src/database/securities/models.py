@@ -2,6 +2,9 @@ from abc import ABC, abstractmethod
 from datetime import datetime, timedelta, timezone
 from enum import Enum
 
+from src.database.codecs import Field, FieldType, ModelCodec, get_enum_lookup
+from src.database.models import Model
+
 
 class SecurityType(Enum):
     """Security Types"""
@@ -17,9 +20,18 @@ class SecurityType(Enum):
         raise ValueError(f"Invalid security type '{security_type_str}'!")
 
 
-class Security(ABC):
+class Security(Model, ABC):
     """Security Model"""
 
+    __slots__ = (
+        "security_id",
+        "security_name",
+        "security_type",
+        "current_price",
+        "price_updated_at",
+        "price_expires_at",
+    )
+
     def __init__(
         self,
         security_id: str,
@@ -46,16 +58,6 @@ class Security(ABC):
             "price_expires_at": self.price_expires_at.isoformat(),
         }
 
-    def _get_common_attributes_ddb_item(self) -> dict:
-        return {
-            "security_id": {"S": self.security_id},
-            "security_name": {"S": self.security_name},
-            "security_type": {"S": self.security_type.value},
-            "current_price": {"N": str(self.current_price)},
-            "price_updated_at": {"S": self.price_updated_at.isoformat()},
-            "price_expires_at": {"S": self.price_expires_at.isoformat()},
-        }
-
     @abstractmethod
     def _generate_security_id(self, **kwargs) -> str:
         """Generate Security ID"""
@@ -65,14 +67,20 @@ class Security(ABC):
     def to_dict(self) -> dict:
         pass
 
-    @abstractmethod
     def to_ddb_item(self) -> dict:
-        pass
+        return SECURITY_CODECS[self.security_type].encode(self)
+
+    @classmethod
+    def from_ddb_item(cls, item: dict):
+        security_type = SECURITY_TYPES.decode(item["security_type"]["S"])
+        return SECURITY_CODECS[security_type].decode(item)
 
 
 class Stock(Security):
     """Stock Model"""
 
+    __slots__ = ("ticker", "exchange")
+
     def __init__(
         self,
         name: str,
@@ -108,31 +116,9 @@ class Stock(Security):
             "exchange": self.exchange,
         }
 
-    def to_ddb_item(self) -> dict:
-        return {
-            **self._get_common_attributes_ddb_item(),
-            "ticker": {"S": self.ticker},
-            "exchange": {"S": self.exchange},
-        }
-
     @classmethod
     def from_ddb_item(cls, item: dict):
-        security_id = item["security_id"]["S"]
-        ticker = item["ticker"]["S"]
-        name = item["security_name"]["S"]
-        exchange = item["exchange"]["S"]
-        price = float(item["current_price"]["N"])
-        price_updated_at = datetime.fromisoformat(item["price_updated_at"]["S"])
-        price_expires_at = datetime.fromisoformat(item["price_expires_at"]["S"])
-        return Stock(
-            name,
-            ticker,
-            exchange,
-            price,
-            price_updated_at,
-            price_expires_at,
-            security_id,
-        )
+        return SECURITY_CODECS[SecurityType.STOCK].decode(item)
 
     @classmethod
     def create(cls, name: str, ticker: str, exchange: str, price: float):
@@ -150,6 +136,8 @@ class Stock(Security):
 class Crypto(Security):
     """Crypto Model"""
 
+    __slots__ = ("ticker",)
+
     def __init__(
         self,
         name: str,
@@ -178,23 +166,9 @@ class Crypto(Security):
     def to_dict(self) -> dict:
         return {**self._get_common_attributes_dict(), "ticker": self.ticker}
 
-    def to_ddb_item(self) -> dict:
-        return {
-            **self._get_common_attributes_ddb_item(),
-            "ticker": {"S": self.ticker},
-        }
-
     @classmethod
     def from_ddb_item(cls, item: dict):
-        security_id = item["security_id"]["S"]
-        name = item["security_name"]["S"]
-        ticker = item["ticker"]["S"]
-        price = float(item["current_price"]["N"])
-        price_updated_at = datetime.fromisoformat(item["price_updated_at"]["S"])
-        price_expires_at = datetime.fromisoformat(item["price_expires_at"]["S"])
-        return Crypto(
-            name, ticker, price, price_updated_at, price_expires_at, security_id
-        )
+        return SECURITY_CODECS[SecurityType.CRYPTO].decode(item)
 
     @classmethod
     def create(cls, name: str, ticker: str, price: float):
@@ -206,3 +180,23 @@ class Crypto(Security):
             price_updated_at=now,
             price_expires_at=now + timedelta(minutes=15),
         )
+
+
+SECURITY_FIELDS = [
+    Field("security_id"),
+    Field("security_name", arg="name"),
+    Field("security_type", FieldType.ENUM, enum=SecurityType, init=False),
+    Field("current_price", FieldType.FLOAT, arg="price"),
+    Field("price_updated_at", FieldType.DATETIME),
+    Field("price_expires_at", FieldType.DATETIME),
+    Field("ticker"),
+]
+"""(List[Field]): The schema of the attributes common to every security item."""
+
+SECURITY_CODECS = {
+    SecurityType.STOCK: ModelCodec(Stock, [*SECURITY_FIELDS, Field("exchange")]),
+    SecurityType.CRYPTO: ModelCodec(Crypto, SECURITY_FIELDS),
+}
+"""(Dict[SecurityType, ModelCodec]): The codec of the securities of each security type."""
+
+SECURITY_TYPES = get_enum_lookup(SecurityType)
@@ -1,8 +1,10 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from typing import List, Optional, Union
 
 from src.aws.dynamodb.client import WalterDDBClient
-from src.database.securities.models import Crypto, Security, SecurityType, Stock
+from src.database.securities.cache import SECURITY_CACHE, SecurityCache
+from src.database.securities.models import Crypto, Security, Stock
 from src.environment import Domain
 from src.utils.log import Logger
 
@@ -15,12 +17,17 @@ class SecuritiesTable:
 
     Responsible for creating, updating, getting, listing, and deleting
     securities in the DynamoDB Securities table.
+
+    Securities are read through a process-level `SecurityCache` as they are
+    the hottest rows shared across users. Writes replace the cached entry
+    of the security so reads in the same process never see a stale row.
     """
 
     TABLE_NAME_FORMAT = "Securities-{domain}"
 
     ddb: WalterDDBClient
     domain: Domain
+    cache: SecurityCache = field(default_factory=lambda: SECURITY_CACHE)
 
     table_name: str = None  # set during post-init
 
@@ -32,10 +39,15 @@ class SecuritiesTable:
         security_type = security.security_type.value
         log.info(f"Creating new {security_type} security")
         self.ddb.put_item(self.table_name, security.to_ddb_item())
+        self.cache.put(security)
         log.info(f"{security_type} security created successfully!")
         return security
 
     def get_security(self, security_id: str) -> Optional[Security]:
+        cached_security = self.cache.get(security_id, datetime.now(timezone.utc))
+        if cached_security is not None:
+            log.debug(f"Security '{security_id}' found in cache")
+            return cached_security
         log.info(f"Getting security '{security_id}' from table '{self.table_name}'")
         item = self.ddb.get_item(
             table=self.table_name,
@@ -44,9 +56,15 @@ class SecuritiesTable:
         if item is None:
             log.info(f"Security '{security_id}' not found!")
             return None
-        return SecuritiesTable._from_ddb_item(item)
+        security = SecuritiesTable._from_ddb_item(item)
+        self.cache.put(security)
+        return security
 
     def get_security_by_ticker(self, ticker: str) -> Optional[Security]:
+        cached_security = self.cache.get_by_ticker(ticker, datetime.now(timezone.utc))
+        if cached_security is not None:
+            log.debug(f"Security with ticker '{ticker}' found in cache")
+            return cached_security
         log.info(
             f"Getting security by ticker '{ticker}' from table '{self.table_name}'"
         )
@@ -59,26 +77,42 @@ class SecuritiesTable:
         if not items:
             log.info(f"Security with ticker '{ticker}' not found!")
             return None
-        return SecuritiesTable._from_ddb_item(items[0])
+        security = SecuritiesTable._from_ddb_item(items[0])
+        self.cache.put(security)
+        return security
 
     def get_securities(self) -> List[Security]:
         log.info(f"Getting all securities from table '{self.table_name}'")
         securities = []
         for item in self.ddb.scan_table(self.table_name):
-            securities.append(SecuritiesTable._from_ddb_item(item))
+            security = SecuritiesTable._from_ddb_item(item)
+            self.cache.put(security)
+            securities.append(security)
         return securities
 
     def update_security(self, security: Security) -> Security:
         log.info(f"Updating security '{security.security_id}'")
         self.ddb.put_item(self.table_name, security.to_ddb_item())
+        self.cache.put(security)
         log.info(f"Security '{security.security_id}' updated successfully!")
         return security
 
+    def put_securities(self, securities: List[Security]) -> None:
+        log.info(f"Batch putting {len(securities)} securities")
+        self.ddb.batch_write_items(
+            table=self.table_name,
+            put_items=[security.to_ddb_item() for security in securities],
+        )
+        for security in securities:
+            self.cache.put(security)
+        log.info("Securities put successfully!")
+
     def delete_security(self, security_id: str) -> None:
         log.info(f"Deleting security '{security_id}' from table '{self.table_name}'")
         self.ddb.delete_item(
             table=self.table_name, key=SecuritiesTable._get_primary_key(security_id)
         )
+        self.cache.invalidate(security_id)
         log.info(f"Security '{security_id}' deleted successfully!")
 
     @staticmethod
@@ -89,11 +123,4 @@ class SecuritiesTable:
 
     @staticmethod
     def _from_ddb_item(item: dict) -> Union[Stock, Crypto]:
-        security_type = SecurityType.from_string(item["security_type"]["S"])
-        match security_type:
-            case SecurityType.STOCK:
-                return Stock.from_ddb_item(item)
-            case SecurityType.CRYPTO:
-                return Crypto.from_ddb_item(item)
-            case _:
-                raise ValueError(f"Invalid security type '{security_type}'!")
+        return Security.from_ddb_item(item)
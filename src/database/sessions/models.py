@@ -2,9 +2,12 @@ from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from typing import Optional
 
+from src.database.codecs import Field, FieldType, ModelCodec
+from src.database.models import Model
 
-@dataclass
-class Session:
+
+@dataclass(slots=True)
+class Session(Model):
     """Session Model"""
 
     user_id: str
@@ -18,24 +21,7 @@ class Session:
     ttl: Optional[int] = None
 
     def to_ddb_item(self) -> dict:
-        ddb_item = {
-            "user_id": {"S": self.user_id},
-            "token_id": {"S": self.token_id},
-            "ip_address": {"S": self.ip_address},
-            "device": {"S": self.device},
-            "session_start": {"S": self.session_start.isoformat()},
-            "session_expiration": {"S": self.session_expiration.isoformat()},
-            "revoked": {"BOOL": self.revoked},
-        }
-
-        # add optional fields to return item
-        if self.session_end:
-            ddb_item["session_end"] = {"S": self.session_end.isoformat()}
-
-        if self.ttl:
-            ddb_item["ttl"] = {"N": str(self.ttl)}
-
-        return ddb_item
+        return SESSION_CODEC.encode(self)
 
     @classmethod
     def create(
@@ -63,16 +49,20 @@ class Session:
 
     @classmethod
     def from_ddb_item(cls, ddb_item: dict):
-        return Session(
-            user_id=ddb_item["user_id"]["S"],
-            token_id=ddb_item["token_id"]["S"],
-            ip_address=ddb_item["ip_address"]["S"],
-            device=ddb_item["device"]["S"],
-            session_start=datetime.fromisoformat(ddb_item["session_start"]["S"]),
-            session_expiration=datetime.fromisoformat(
-                ddb_item["session_expiration"]["S"]
-            ),
-            revoked=ddb_item["revoked"]["BOOL"],
-            session_end=ddb_item.get("session_end", {}).get("S"),
-            ttl=ddb_item.get("ttl", {}).get("N"),
-        )
+        return SESSION_CODEC.decode(ddb_item)
+
+
+SESSION_CODEC = ModelCodec(
+    Session,
+    [
+        Field("user_id"),
+        Field("token_id"),
+        Field("ip_address"),
+        Field("device"),
+        Field("session_start", FieldType.DATETIME),
+        Field("session_expiration", FieldType.DATETIME),
+        Field("revoked", FieldType.BOOLEAN),
+        Field("session_end", FieldType.DATETIME, optional=True),
+        Field("ttl", FieldType.INTEGER, optional=True),
+    ],
+)
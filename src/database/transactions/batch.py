@@ -0,0 +1,557 @@
+import datetime as dt
+from dataclasses import dataclass
+from enum import Enum
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence
+
+import numpy as np
+
+from src.database.transactions.models import (
+    BankingTransactionSubType,
+    BankTransaction,
+    InvestmentTransaction,
+    InvestmentTransactionSubType,
+    Transaction,
+    TransactionCategory,
+    TransactionSubType,
+    TransactionTotals,
+    TransactionType,
+)
+
+TRANSACTION_TYPES: List[TransactionType] = list(TransactionType)
+"""(List[TransactionType]): The transaction types of the transaction type codes."""
+
+TRANSACTION_SUBTYPES: List[TransactionSubType] = [
+    *InvestmentTransactionSubType,
+    *BankingTransactionSubType,
+]
+"""(List[TransactionSubType]): The transaction subtypes of the transaction subtype codes, the investment and banking subtype values are disjoint."""
+
+TRANSACTION_CATEGORIES: List[TransactionCategory] = list(TransactionCategory)
+"""(List[TransactionCategory]): The transaction categories of the transaction category codes."""
+
+EPOCH_ORDINAL = dt.date(1970, 1, 1).toordinal()
+
+NO_CODE = -1
+"""(int): The code of absent optional strings, e.g. the merchant of an investment transaction."""
+
+REQUIRED_ATTRIBUTES: List[str] = [
+    "user_id",
+    "account_id",
+    "transaction_id",
+    "transaction_date",
+    "transaction_type",
+    "transaction_subtype",
+    "transaction_category",
+    "transaction_amount",
+]
+"""(List[str]): The attributes decoded from every item, the other attributes may be projected away."""
+
+
+class _EnumCodes:
+    """Codes of the members of an enum, cached by their raw DDB string values."""
+
+    def __init__(self, members: List[Enum], parse: Callable[[str], Enum]) -> None:
+        self.members = members
+        self.parse = parse
+        self.member_codes = {member: code for code, member in enumerate(members)}
+        self.codes: Dict[str, int] = {}
+
+    def encode(self, value: str) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = self.member_codes[self.parse(value)]
+        return code
+
+
+def _parse_subtype(value: str) -> TransactionSubType:
+    try:
+        return InvestmentTransactionSubType.from_string(value)
+    except ValueError:
+        return BankingTransactionSubType.from_string(value)
+
+
+# enum codes are shared by all batches of the process as the raw values of
+# each enum member are the same for every table
+TYPE_CODES = _EnumCodes(TRANSACTION_TYPES, TransactionType.from_string)
+SUBTYPE_CODES = _EnumCodes(TRANSACTION_SUBTYPES, _parse_subtype)
+CATEGORY_CODES = _EnumCodes(TRANSACTION_CATEGORIES, TransactionCategory.from_string)
+
+INVESTMENT_TYPE_CODE = TRANSACTION_TYPES.index(TransactionType.INVESTMENT)
+INCOME_SUBTYPE_CODES = [
+    TRANSACTION_SUBTYPES.index(BankingTransactionSubType.CREDIT),
+    TRANSACTION_SUBTYPES.index(BankingTransactionSubType.INTEREST),
+]
+EXPENSE_SUBTYPE_CODES = [TRANSACTION_SUBTYPES.index(BankingTransactionSubType.DEBIT)]
+
+
+class _StringTable:
+    """Interned strings of a batch, each distinct string is stored once."""
+
+    def __init__(self) -> None:
+        self.values: List[str] = []
+        self.codes: Dict[str, int] = {}
+
+    def encode(self, value: str) -> int:
+        code = self.codes.get(value)
+        if code is None:
+            code = self.codes[value] = len(self.values)
+            self.values.append(value)
+        return code
+
+
+def _decode(values: List, codes: np.ndarray) -> list:
+    """Decode codes to their values, absent codes are decoded to None."""
+    return np.array([*values, None], dtype=object)[codes].tolist()
+
+
+@dataclass
+class TransactionBatch:
+    """
+    Transaction Batch
+
+    A compact columnar representation of a list of transactions decoded
+    straight from DDB items. Amounts, quantities, and prices are stored as
+    float64 arrays, dates as int32 days since the epoch, and types, subtypes,
+    and categories as int8 codes of their enum members. Accounts, merchants,
+    logos, and securities are interned in string tables and stored as int32
+    codes, so repeated strings are stored once per batch.
+
+    Rows are read through lazy `TransactionRow` views and the whole batch is
+    serialized column by column with `to_columns` and `to_dicts`. Batches
+    never hold `Transaction` objects, use `to_transactions` where the models
+    are required.
+    """
+
+    transaction_ids: List[str]
+    user_codes: np.ndarray  # int32
+    account_codes: np.ndarray  # int32
+    type_codes: np.ndarray  # int8
+    subtype_codes: np.ndarray  # int8
+    category_codes: np.ndarray  # int8
+    days: np.ndarray  # int32
+    amounts: np.ndarray  # float64
+    merchant_logo_codes: np.ndarray  # int32, NO_CODE if projected away
+    merchant_codes: np.ndarray  # int32, NO_CODE for investment transactions
+    security_codes: np.ndarray  # int32, NO_CODE for bank transactions
+    quantities: np.ndarray  # float64, NaN for bank transactions
+    prices_per_share: np.ndarray  # float64, NaN for bank transactions
+    plaid_transaction_ids: List[Optional[str]]
+    plaid_account_codes: np.ndarray  # int32, NO_CODE if not a Plaid transaction
+    user_ids: List[str]
+    account_ids: List[str]
+    merchant_logo_s3_uris: List[str]
+    merchant_names: List[str]
+    security_ids: List[str]
+    plaid_account_ids: List[str]
+
+    def __len__(self) -> int:
+        return len(self.transaction_ids)
+
+    def __getitem__(self, index: int) -> "TransactionRow":
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("Transaction batch index out of range!")
+        return TransactionRow(self, index)
+
+    def __iter__(self) -> Iterator["TransactionRow"]:
+        for index in range(len(self)):
+            yield TransactionRow(self, index)
+
+    @classmethod
+    def empty(cls) -> "TransactionBatch":
+        return TransactionBatch.from_ddb_items([])
+
+    @classmethod
+    def from_ddb_items(cls, items: Iterable[dict]) -> "TransactionBatch":
+        """
+        Decode DDB transaction items into a batch.
+
+        Items are decoded in a single pass without creating any Transaction
+        objects. Enum values are mapped to codes with dict lookups cached
+        across batches, dates are parsed once per distinct day, and the
+        items may be any iterable, e.g. the chained pages of a query, so the
+        raw items of a page can be freed once decoded. Items must include
+        the `REQUIRED_ATTRIBUTES`, absent optional attributes are decoded as
+        absent, e.g. the attributes projected away by a query.
+        """
+        transaction_ids = []
+        user_codes = []
+        account_codes = []
+        type_codes = []
+        subtype_codes = []
+        category_codes = []
+        days = []
+        amounts = []
+        merchant_logo_codes = []
+        merchant_codes = []
+        security_codes = []
+        quantities = []
+        prices_per_share = []
+        plaid_transaction_ids = []
+        plaid_account_codes = []
+
+        users = _StringTable()
+        accounts = _StringTable()
+        merchant_logos = _StringTable()
+        merchants = _StringTable()
+        securities = _StringTable()
+        plaid_accounts = _StringTable()
+        day_numbers: Dict[str, int] = {}
+        nan = float("nan")
+
+        for item in items:
+            transaction_ids.append(item["transaction_id"]["S"])
+            user_codes.append(users.encode(item["user_id"]["S"]))
+            account_codes.append(accounts.encode(item["account_id"]["S"]))
+            type_codes.append(TYPE_CODES.encode(item["transaction_type"]["S"]))
+            subtype_codes.append(SUBTYPE_CODES.encode(item["transaction_subtype"]["S"]))
+            category_codes.append(
+                CATEGORY_CODES.encode(item["transaction_category"]["S"])
+            )
+
+            # remove uuid suffix, dates may be stored with a time
+            day = item["transaction_date"]["S"].partition("#")[0]
+            day_number = day_numbers.get(day)
+            if day_number is None:
+                day_number = day_numbers[day] = (
+                    dt.datetime.fromisoformat(day).toordinal() - EPOCH_ORDINAL
+                )
+            days.append(day_number)
+
+            amounts.append(float(item["transaction_amount"]["N"]))
+            merchant_logo_s3_uri = item.get("merchant_logo_s3_uri")
+            merchant_logo_codes.append(
+                merchant_logos.encode(merchant_logo_s3_uri["S"])
+                if merchant_logo_s3_uri
+                else NO_CODE
+            )
+
+            merchant_name = item.get("merchant_name")
+            merchant_codes.append(
+                merchants.encode(merchant_name["S"]) if merchant_name else NO_CODE
+            )
+            security_id = item.get("security_id")
+            security_codes.append(
+                securities.encode(security_id["S"]) if security_id else NO_CODE
+            )
+            quantity = item.get("quantity")
+            quantities.append(float(quantity["N"]) if quantity else nan)
+            price_per_share = item.get("price_per_share")
+            prices_per_share.append(
+                float(price_per_share["N"]) if price_per_share else nan
+            )
+
+            plaid_transaction_id = item.get("plaid_transaction_id")
+            plaid_transaction_ids.append(
+                plaid_transaction_id["S"] if plaid_transaction_id else None
+            )
+            plaid_account_id = item.get("plaid_account_id")
+            plaid_account_codes.append(
+                plaid_accounts.encode(plaid_account_id["S"])
+                if plaid_account_id
+                else NO_CODE
+            )
+
+        return TransactionBatch(
+            transaction_ids=transaction_ids,
+            user_codes=np.array(user_codes, dtype=np.int32),
+            account_codes=np.array(account_codes, dtype=np.int32),
+            type_codes=np.array(type_codes, dtype=np.int8),
+            subtype_codes=np.array(subtype_codes, dtype=np.int8),
+            category_codes=np.array(category_codes, dtype=np.int8),
+            days=np.array(days, dtype=np.int32),
+            amounts=np.array(amounts, dtype=np.float64),
+            merchant_logo_codes=np.array(merchant_logo_codes, dtype=np.int32),
+            merchant_codes=np.array(merchant_codes, dtype=np.int32),
+            security_codes=np.array(security_codes, dtype=np.int32),
+            quantities=np.array(quantities, dtype=np.float64),
+            prices_per_share=np.array(prices_per_share, dtype=np.float64),
+            plaid_transaction_ids=plaid_transaction_ids,
+            plaid_account_codes=np.array(plaid_account_codes, dtype=np.int32),
+            user_ids=users.values,
+            account_ids=accounts.values,
+            merchant_logo_s3_uris=merchant_logos.values,
+            merchant_names=merchants.values,
+            security_ids=securities.values,
+            plaid_account_ids=plaid_accounts.values,
+        )
+
+    def take(self, indices: Sequence[int]) -> "TransactionBatch":
+        """Get the rows at the given indices, the string tables are shared with this batch."""
+        indices = np.asarray(indices, dtype=np.intp)
+        return TransactionBatch(
+            transaction_ids=[self.transaction_ids[index] for index in indices],
+            user_codes=self.user_codes[indices],
+            account_codes=self.account_codes[indices],
+            type_codes=self.type_codes[indices],
+            subtype_codes=self.subtype_codes[indices],
+            category_codes=self.category_codes[indices],
+            days=self.days[indices],
+            amounts=self.amounts[indices],
+            merchant_logo_codes=self.merchant_logo_codes[indices],
+            merchant_codes=self.merchant_codes[indices],
+            security_codes=self.security_codes[indices],
+            quantities=self.quantities[indices],
+            prices_per_share=self.prices_per_share[indices],
+            plaid_transaction_ids=[
+                self.plaid_transaction_ids[index] for index in indices
+            ],
+            plaid_account_codes=self.plaid_account_codes[indices],
+            user_ids=self.user_ids,
+            account_ids=self.account_ids,
+            merchant_logo_s3_uris=self.merchant_logo_s3_uris,
+            merchant_names=self.merchant_names,
+            security_ids=self.security_ids,
+            plaid_account_ids=self.plaid_account_ids,
+        )
+
+    def reverse(self) -> "TransactionBatch":
+        return self.take(np.arange(len(self) - 1, -1, -1))
+
+    def filter_accounts(self, account_ids: Iterable[str]) -> "TransactionBatch":
+        """Get the rows of the given accounts."""
+        account_ids = set(account_ids)
+        included = np.array(
+            [account_id in account_ids for account_id in self.account_ids] + [False]
+        )
+        return self.take(np.flatnonzero(included[self.account_codes]))
+
+    def get_dates(self) -> np.ndarray:
+        return self.days.astype("datetime64[D]")
+
+    def is_investment(self) -> np.ndarray:
+        return self.type_codes == INVESTMENT_TYPE_CODE
+
+    def is_income(self) -> np.ndarray:
+        """Banking credits and interest are income, see `Transaction.is_income`."""
+        return np.isin(self.subtype_codes, INCOME_SUBTYPE_CODES)
+
+    def is_expense(self) -> np.ndarray:
+        """Banking debits are expenses, see `Transaction.is_expense`."""
+        return np.isin(self.subtype_codes, EXPENSE_SUBTYPE_CODES)
+
+    def get_totals(self) -> TransactionTotals:
+        category_codes = self.category_codes.astype(np.intp)
+        num_categories = len(TRANSACTION_CATEGORIES)
+        category_totals = np.bincount(
+            category_codes, weights=self.amounts, minlength=num_categories
+        )
+        category_counts = np.bincount(category_codes, minlength=num_categories)
+        return TransactionTotals(
+            num_transactions=len(self),
+            total_income=float(self.amounts[self.is_income()].sum()),
+            total_expense=float(self.amounts[self.is_expense()].sum()),
+            category_totals={
+                category.value: float(category_totals[code])
+                for code, category in enumerate(TRANSACTION_CATEGORIES)
+                if category_counts[code] > 0
+            },
+        )
+
+    def to_columns(self, names: Optional[Iterable[str]] = None) -> Dict[str, list]:
+        """
+        Decode the batch into one list of Python values per attribute.
+
+        Every column is decoded with vectorized lookups, e.g. each distinct
+        string is looked up once per batch rather than once per row. Only
+        the columns of the given attribute names are decoded, if any.
+        """
+        decoders: Dict[str, Callable[[], list]] = {
+            "transaction_id": lambda: self.transaction_ids,
+            "account_id": lambda: _decode(self.account_ids, self.account_codes),
+            "user_id": lambda: _decode(self.user_ids, self.user_codes),
+            "transaction_type": lambda: _decode(
+                [member.value for member in TRANSACTION_TYPES], self.type_codes
+            ),
+            "transaction_subtype": lambda: _decode(
+                [member.value for member in TRANSACTION_SUBTYPES], self.subtype_codes
+            ),
+            "transaction_category": lambda: _decode(
+                [member.value for member in TRANSACTION_CATEGORIES],
+                self.category_codes,
+            ),
+            "transaction_date": lambda: np.datetime_as_string(
+                self.get_dates()
+            ).tolist(),
+            "transaction_amount": lambda: self.amounts.tolist(),
+            "merchant_logo_s3_uri": lambda: _decode(
+                self.merchant_logo_s3_uris, self.merchant_logo_codes
+            ),
+            "plaid_transaction_id": lambda: self.plaid_transaction_ids,
+            "plaid_account_id": lambda: _decode(
+                self.plaid_account_ids, self.plaid_account_codes
+            ),
+            "merchant_name": lambda: _decode(self.merchant_names, self.merchant_codes),
+            "security_id": lambda: _decode(self.security_ids, self.security_codes),
+            "quantity": lambda: self.quantities.tolist(),
+            "price_per_share": lambda: self.prices_per_share.tolist(),
+        }
+        if names is None:
+            names = decoders
+        return {name: decoders[name]() for name in names}
+
+    def to_dicts(self) -> List[dict]:
+        """Serialize the batch into the dicts of `Transaction.to_dict` of each row."""
+        columns = self.to_columns()
+        common = [
+            "transaction_id",
+            "account_id",
+            "user_id",
+            "transaction_type",
+            "transaction_subtype",
+            "transaction_category",
+            "transaction_date",
+            "transaction_amount",
+            "merchant_logo_s3_uri",
+        ]
+        dicts = []
+        for (
+            is_investment,
+            row,
+            plaid_transaction_id,
+            plaid_account_id,
+            *specific,
+        ) in zip(
+            self.is_investment().tolist(),
+            zip(*[columns[name] for name in common]),
+            columns["plaid_transaction_id"],
+            columns["plaid_account_id"],
+            columns["security_id"],
+            columns["quantity"],
+            columns["price_per_share"],
+            columns["merchant_name"],
+        ):
+            transaction = dict(zip(common, row))
+            if plaid_transaction_id:
+                transaction["plaid_transaction_id"] = plaid_transaction_id
+            if plaid_account_id:
+                transaction["plaid_account_id"] = plaid_account_id
+            security_id, quantity, price_per_share, merchant_name = specific
+            if is_investment:
+                transaction["security_id"] = security_id
+                transaction["quantity"] = quantity
+                transaction["price_per_share"] = price_per_share
+            else:
+                transaction["merchant_name"] = merchant_name
+            dicts.append(transaction)
+        return dicts
+
+    def to_transactions(self) -> List[Transaction]:
+        return [row.to_transaction() for row in self]
+
+
+class TransactionRow:
+    """
+    Transaction Row
+
+    A lazy view of a single row of a transaction batch. Attributes are
+    decoded from the batch columns when accessed and mirror the attributes
+    of the `Transaction` models.
+    """
+
+    __slots__ = ("batch", "index")
+
+    def __init__(self, batch: TransactionBatch, index: int) -> None:
+        self.batch = batch
+        self.index = index
+
+    @property
+    def transaction_id(self) -> str:
+        return self.batch.transaction_ids[self.index]
+
+    @property
+    def user_id(self) -> str:
+        return self.batch.user_ids[self.batch.user_codes[self.index]]
+
+    @property
+    def account_id(self) -> str:
+        return self.batch.account_ids[self.batch.account_codes[self.index]]
+
+    @property
+    def transaction_type(self) -> TransactionType:
+        return TRANSACTION_TYPES[self.batch.type_codes[self.index]]
+
+    @property
+    def transaction_subtype(self) -> TransactionSubType:
+        return TRANSACTION_SUBTYPES[self.batch.subtype_codes[self.index]]
+
+    @property
+    def transaction_category(self) -> TransactionCategory:
+        return TRANSACTION_CATEGORIES[self.batch.category_codes[self.index]]
+
+    @property
+    def transaction_date(self) -> dt.date:
+        return dt.date.fromordinal(int(self.batch.days[self.index]) + EPOCH_ORDINAL)
+
+    @property
+    def transaction_amount(self) -> float:
+        return float(self.batch.amounts[self.index])
+
+    @property
+    def merchant_logo_s3_uri(self) -> Optional[str]:
+        code = self.batch.merchant_logo_codes[self.index]
+        return self.batch.merchant_logo_s3_uris[code] if code != NO_CODE else None
+
+    @property
+    def merchant_name(self) -> Optional[str]:
+        code = self.batch.merchant_codes[self.index]
+        return self.batch.merchant_names[code] if code != NO_CODE else None
+
+    @property
+    def security_id(self) -> Optional[str]:
+        code = self.batch.security_codes[self.index]
+        return self.batch.security_ids[code] if code != NO_CODE else None
+
+    @property
+    def quantity(self) -> float:
+        return float(self.batch.quantities[self.index])
+
+    @property
+    def price_per_share(self) -> float:
+        return float(self.batch.prices_per_share[self.index])
+
+    @property
+    def plaid_transaction_id(self) -> Optional[str]:
+        return self.batch.plaid_transaction_ids[self.index]
+
+    @property
+    def plaid_account_id(self) -> Optional[str]:
+        code = self.batch.plaid_account_codes[self.index]
+        return self.batch.plaid_account_ids[code] if code != NO_CODE else None
+
+    def is_plaid_transaction(self) -> bool:
+        return self.plaid_transaction_id is not None
+
+    def to_transaction(self) -> Transaction:
+        if self.transaction_type == TransactionType.INVESTMENT:
+            return InvestmentTransaction(
+                transaction_id=self.transaction_id,
+                account_id=self.account_id,
+                user_id=self.user_id,
+                transaction_type=self.transaction_type,
+                transaction_subtype=self.transaction_subtype,
+                transaction_category=self.transaction_category,
+                transaction_date=self.transaction_date,
+                transaction_amount=self.transaction_amount,
+                security_id=self.security_id,
+                quantity=self.quantity,
+                price_per_share=self.price_per_share,
+                merchant_logo_s3_uri=self.merchant_logo_s3_uri,
+                plaid_transaction_id=self.plaid_transaction_id,
+                plaid_account_id=self.plaid_account_id,
+            )
+        return BankTransaction(
+            transaction_id=self.transaction_id,
+            account_id=self.account_id,
+            user_id=self.user_id,
+            transaction_type=self.transaction_type,
+            transaction_subtype=self.transaction_subtype,
+            transaction_category=self.transaction_category,
+            transaction_date=self.transaction_date,
+            transaction_amount=self.transaction_amount,
+            merchant_name=self.merchant_name,
+            merchant_logo_s3_uri=self.merchant_logo_s3_uri,
+            plaid_transaction_id=self.plaid_transaction_id,
+            plaid_account_id=self.plaid_account_id,
+        )
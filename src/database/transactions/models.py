@@ -1,9 +1,12 @@
 import random
 from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
 from datetime import date, datetime, timezone
 from enum import Enum
-from typing import Optional, Union
+from typing import Dict, Optional, Union
 
+from src.database.codecs import Field, FieldType, ModelCodec, get_enum_lookup
+from src.database.models import Model
 from src.environment import DOMAIN
 
 
@@ -90,9 +93,62 @@ class TransactionCategory(Enum):
         )
 
 
-class Transaction(ABC):
+@dataclass
+class TransactionTotals:
+    """
+    Transaction Totals
+
+    The number of transactions, the income and expense totals, and the
+    per-category totals of the transactions in a date range. Only banking
+    credits and interest count as income and only banking debits count as
+    expenses.
+    """
+
+    num_transactions: int = 0
+    total_income: float = 0.0
+    total_expense: float = 0.0
+    category_totals: Dict[str, float] = field(default_factory=dict)
+
+    @property
+    def cash_flow(self) -> float:
+        return self.total_income - self.total_expense
+
+    def add_transaction(self, transaction: "Transaction") -> None:
+        self.num_transactions += 1
+        if transaction.is_income():
+            self.total_income += transaction.transaction_amount
+        elif transaction.is_expense():
+            self.total_expense += transaction.transaction_amount
+        category = transaction.transaction_category.value
+        self.category_totals[category] = (
+            self.category_totals.get(category, 0.0) + transaction.transaction_amount
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "total_income": self.total_income,
+            "total_expense": self.total_expense,
+            "cash_flow": self.cash_flow,
+        }
+
+
+class Transaction(Model, ABC):
     """Transaction Model"""
 
+    __slots__ = (
+        "transaction_id",
+        "account_id",
+        "user_id",
+        "transaction_type",
+        "transaction_subtype",
+        "transaction_category",
+        "transaction_date",
+        "transaction_amount",
+        "merchant_logo_s3_uri",
+        "plaid_transaction_id",
+        "plaid_account_id",
+    )
+
     DEFAULT_MERCHANT_LOGO_S3_URI = f"s3://walter-backend-media-{DOMAIN.value}/public/logos/default-merchant-logo.png"
 
     def __init__(
@@ -148,29 +204,6 @@ class Transaction(ABC):
 
         return attributes
 
-    def _get_common_attributes_ddb_item(self) -> dict:
-        ddb_item = {
-            "transaction_id": {"S": self.transaction_id},
-            "account_id": {"S": self.account_id},
-            "user_id": {"S": self.user_id},
-            "transaction_type": {"S": self.transaction_type.value},
-            "transaction_subtype": {"S": self.transaction_subtype.value},
-            "transaction_category": {"S": self.transaction_category.value},
-            "transaction_date": {
-                "S": self._get_transaction_date_uuid()
-            },  # use uuid to ensure uniqueness
-            "transaction_amount": {"N": str(self.transaction_amount)},
-            "merchant_logo_s3_uri": {"S": self.merchant_logo_s3_uri},
-        }
-
-        # add optional fields to return item
-        if self.plaid_transaction_id:
-            ddb_item["plaid_transaction_id"] = {"S": self.plaid_transaction_id}
-        if self.plaid_account_id:
-            ddb_item["plaid_account_id"] = {"S": self.plaid_account_id}
-
-        return ddb_item
-
     def is_income(self) -> bool:
         if self.transaction_type == TransactionType.BANKING:
             return self.transaction_subtype in [
@@ -191,9 +224,13 @@ class Transaction(ABC):
     def to_dict(self) -> dict:
         pass
 
-    @abstractmethod
     def to_ddb_item(self) -> dict:
-        pass
+        return TRANSACTION_CODECS[self.transaction_type].encode(self)
+
+    @classmethod
+    def from_ddb_item(cls, ddb_item: dict):
+        transaction_type = TRANSACTION_TYPES.decode(ddb_item["transaction_type"]["S"])
+        return TRANSACTION_CODECS[transaction_type].decode(ddb_item)
 
     @staticmethod
     def _generate_id(prefix: str) -> str:
@@ -205,6 +242,8 @@ class Transaction(ABC):
 class InvestmentTransaction(Transaction):
     """Investment Transaction Model"""
 
+    __slots__ = ("security_id", "quantity", "price_per_share")
+
     def __init__(
         self,
         transaction_id: str,
@@ -239,6 +278,11 @@ class InvestmentTransaction(Transaction):
         self.quantity = quantity
         self.price_per_share = price_per_share
 
+    @staticmethod
+    def get_account_security_id(account_id: str, security_id: str) -> str:
+        """Get the composite key of the holding the transaction belongs to."""
+        return f"{account_id}#{security_id}"
+
     def to_dict(self) -> dict:
         return {
             **self._get_common_attributes_dict(),
@@ -247,20 +291,6 @@ class InvestmentTransaction(Transaction):
             "price_per_share": self.price_per_share,
         }
 
-    def to_ddb_item(self) -> dict:
-        return {
-            **self._get_common_attributes_ddb_item(),
-            "security_id": {
-                "S": self.security_id,
-            },
-            "quantity": {
-                "N": str(self.quantity),
-            },
-            "price_per_share": {
-                "N": str(self.price_per_share),
-            },
-        }
-
     @classmethod
     def create(
         cls,
@@ -296,35 +326,14 @@ class InvestmentTransaction(Transaction):
 
     @classmethod
     def from_ddb_item(cls, ddb_item: dict):
-        return InvestmentTransaction(
-            transaction_id=ddb_item["transaction_id"]["S"],
-            account_id=ddb_item["account_id"]["S"],
-            user_id=ddb_item["user_id"]["S"],
-            transaction_type=TransactionType.from_string(
-                ddb_item["transaction_type"]["S"]
-            ),
-            transaction_category=TransactionCategory.from_string(
-                ddb_item["transaction_category"]["S"]
-            ),
-            transaction_subtype=InvestmentTransactionSubType.from_string(
-                ddb_item["transaction_subtype"]["S"]
-            ),
-            transaction_date=datetime.fromisoformat(
-                ddb_item["transaction_date"]["S"].split("#")[0]
-            ).date(),  # remove uuid suffix
-            transaction_amount=float(ddb_item["transaction_amount"]["N"]),
-            security_id=ddb_item["security_id"]["S"],
-            quantity=float(ddb_item["quantity"]["N"]),
-            merchant_logo_s3_uri=ddb_item["merchant_logo_s3_uri"]["S"],
-            price_per_share=float(ddb_item["price_per_share"]["N"]),
-            plaid_transaction_id=ddb_item.get("plaid_transaction_id", {}).get("S"),
-            plaid_account_id=ddb_item.get("plaid_account_id", {}).get("S"),
-        )
+        return TRANSACTION_CODECS[TransactionType.INVESTMENT].decode(ddb_item)
 
 
 class BankTransaction(Transaction):
     """Bank Transaction Model"""
 
+    __slots__ = ("merchant_name",)
+
     def __init__(
         self,
         transaction_id: str,
@@ -361,12 +370,6 @@ class BankTransaction(Transaction):
             "merchant_name": self.merchant_name,
         }
 
-    def to_ddb_item(self) -> dict:
-        return {
-            **self._get_common_attributes_ddb_item(),
-            "merchant_name": {"S": self.merchant_name},
-        }
-
     @classmethod
     def create(
         cls,
@@ -399,25 +402,55 @@ class BankTransaction(Transaction):
 
     @classmethod
     def from_ddb_item(cls, ddb_item: dict):
-        return BankTransaction(
-            transaction_id=ddb_item["transaction_id"]["S"],
-            account_id=ddb_item["account_id"]["S"],
-            user_id=ddb_item["user_id"]["S"],
-            transaction_type=TransactionType.from_string(
-                ddb_item["transaction_type"]["S"]
-            ),
-            transaction_subtype=BankingTransactionSubType.from_string(
-                ddb_item["transaction_subtype"]["S"]
+        return TRANSACTION_CODECS[TransactionType.BANKING].decode(ddb_item)
+
+
+TRANSACTION_FIELDS = [
+    Field("transaction_id"),
+    Field("account_id"),
+    Field("user_id"),
+    Field("transaction_type", FieldType.ENUM, enum=TransactionType),
+    Field("transaction_category", FieldType.ENUM, enum=TransactionCategory),
+    # use uuid to ensure uniqueness
+    Field("transaction_date", FieldType.DATE, suffix="transaction_id"),
+    Field("transaction_amount", FieldType.FLOAT),
+    Field("merchant_logo_s3_uri"),
+    Field("plaid_transaction_id", optional=True),
+    Field("plaid_account_id", optional=True),
+]
+"""(List[Field]): The schema of the attributes common to every transaction item."""
+
+TRANSACTION_CODECS = {
+    TransactionType.INVESTMENT: ModelCodec(
+        InvestmentTransaction,
+        [
+            *TRANSACTION_FIELDS,
+            Field(
+                "transaction_subtype",
+                FieldType.ENUM,
+                enum=InvestmentTransactionSubType,
             ),
-            transaction_category=TransactionCategory.from_string(
-                ddb_item["transaction_category"]["S"]
+            Field("security_id"),
+            Field("quantity", FieldType.FLOAT),
+            Field("price_per_share", FieldType.FLOAT),
+        ],
+        computed={
+            "account_security_id": lambda transaction: InvestmentTransaction.get_account_security_id(
+                transaction.account_id, transaction.security_id
+            )
+        },
+    ),
+    TransactionType.BANKING: ModelCodec(
+        BankTransaction,
+        [
+            *TRANSACTION_FIELDS,
+            Field(
+                "transaction_subtype", FieldType.ENUM, enum=BankingTransactionSubType
             ),
-            transaction_date=datetime.fromisoformat(
-                ddb_item["transaction_date"]["S"].split("#")[0]
-            ).date(),  # remove uuid suffix
-            transaction_amount=float(ddb_item["transaction_amount"]["N"]),
-            merchant_name=ddb_item["merchant_name"]["S"],
-            merchant_logo_s3_uri=ddb_item["merchant_logo_s3_uri"]["S"],
-            plaid_transaction_id=ddb_item.get("plaid_transaction_id", {}).get("S"),
-            plaid_account_id=ddb_item.get("plaid_account_id", {}).get("S"),
-        )
+            Field("merchant_name"),
+        ],
+    ),
+}
+"""(Dict[TransactionType, ModelCodec]): The codec of the transactions of each transaction type."""
+
+TRANSACTION_TYPES = get_enum_lookup(TransactionType)
@@ -1,10 +1,10 @@
 import datetime as dt
 from dataclasses import dataclass
-from typing import List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
 from src.aws.dynamodb.client import WalterDDBClient
+from src.database.transactions.batch import REQUIRED_ATTRIBUTES, TransactionBatch
 from src.database.transactions.models import (
-    BankTransaction,
     InvestmentTransaction,
     Transaction,
     TransactionType,
@@ -28,6 +28,12 @@ class TransactionsTable:
     # Global Secondary Indexes (GSIs)
     USER_DATE_RANGE_INDEX_NAME_FORMAT = "Transactions-UserDateRangeIndex-{domain}"
     ACCOUNT_DATE_RANGE_INDEX_NAME_FORMAT = "Transactions-AccountDateRangeIndex-{domain}"
+    ACCOUNT_SECURITY_DATE_RANGE_INDEX_NAME_FORMAT = (
+        "Transactions-AccountSecurityDateRangeIndex-{domain}"
+    )
+    PLAID_TRANSACTION_ID_INDEX_NAME_FORMAT = (
+        "Transactions-PlaidTransactionIdIndex-{domain}"
+    )
 
     ddb: WalterDDBClient
     domain: Domain
@@ -105,6 +111,196 @@ class TransactionsTable:
         LOG.info(f"Found {len(transactions)} transactions for account '{account_id}'")
         return transactions
 
+    def get_user_transaction_batch(
+        self,
+        user_id: str,
+        start_date: dt.datetime,
+        end_date: dt.datetime,
+        attributes: Optional[Iterable[str]] = None,
+    ) -> TransactionBatch:
+        """
+        Get the transactions of a user between start_date and end_date (inclusive) as a batch.
+
+        Only the given attributes are read from DDB, if any, in addition to
+        the attributes required by the batch.
+        """
+        LOG.info(
+            f"Getting transaction batch for user '{user_id}' between '{start_date.date()}' and '{end_date.date()}'"
+        )
+        return self._get_transaction_batch(
+            self._get_user_date_range_index_name(self.domain),
+            "user_id",
+            user_id,
+            start_date,
+            end_date,
+            attributes,
+        )
+
+    def get_account_transaction_batch(
+        self,
+        account_id: str,
+        start_date: dt.datetime = dt.datetime.min,
+        end_date: dt.datetime = dt.datetime.max,
+        attributes: Optional[Iterable[str]] = None,
+    ) -> TransactionBatch:
+        """
+        Get the transactions of an account between start_date and end_date (inclusive) as a batch.
+
+        Only the given attributes are read from DDB, if any, in addition to
+        the attributes required by the batch.
+        """
+        LOG.info(
+            f"Getting transaction batch for account '{account_id}' between '{start_date.date()}' and '{end_date.date()}'"
+        )
+        return self._get_transaction_batch(
+            self._get_account_date_range_index(self.domain),
+            "account_id",
+            account_id,
+            start_date,
+            end_date,
+            attributes,
+        )
+
+    def get_user_transactions_page(
+        self,
+        user_id: str,
+        start_date: dt.datetime,
+        end_date: dt.datetime,
+        limit: int,
+        exclusive_start_key: Optional[dict] = None,
+        descending: bool = False,
+        attributes: Optional[Iterable[str]] = None,
+    ) -> Tuple[TransactionBatch, Optional[dict]]:
+        """
+        Get a page of the transactions of a user between start_date and end_date (inclusive).
+
+        Only the given attributes are read from DDB, if any, in addition to
+        the attributes required by the batch.
+
+        Returns:
+            The batch of transactions in the page, sorted by date, and the key to resume
+            from, or None if there are no more transactions.
+        """
+        LOG.info(
+            f"Getting page of {limit} transactions for user '{user_id}' between '{start_date.date()}' and '{end_date.date()}'"
+        )
+        return self._get_transactions_page(
+            self._get_user_date_range_index_name(self.domain),
+            "user_id",
+            user_id,
+            start_date,
+            end_date,
+            limit,
+            exclusive_start_key,
+            descending,
+            attributes,
+        )
+
+    def get_account_transactions_page(
+        self,
+        account_id: str,
+        start_date: dt.datetime,
+        end_date: dt.datetime,
+        limit: int,
+        exclusive_start_key: Optional[dict] = None,
+        descending: bool = False,
+        attributes: Optional[Iterable[str]] = None,
+    ) -> Tuple[TransactionBatch, Optional[dict]]:
+        """
+        Get a page of the transactions of an account between start_date and end_date (inclusive).
+
+        Only the given attributes are read from DDB, if any, in addition to
+        the attributes required by the batch.
+
+        Returns:
+            The batch of transactions in the page, sorted by date, and the key to resume
+            from, or None if there are no more transactions.
+        """
+        LOG.info(
+            f"Getting page of {limit} transactions for account '{account_id}' between '{start_date.date()}' and '{end_date.date()}'"
+        )
+        return self._get_transactions_page(
+            self._get_account_date_range_index(self.domain),
+            "account_id",
+            account_id,
+            start_date,
+            end_date,
+            limit,
+            exclusive_start_key,
+            descending,
+            attributes,
+        )
+
+    def get_holding_transactions(
+        self,
+        account_id: str,
+        security_id: str,
+        start_date: dt.datetime = dt.datetime.min,
+        end_date: dt.datetime = dt.datetime.max,
+    ) -> List[InvestmentTransaction]:
+        """Get the investment transactions for a holding between start_date and end_date (inclusive)."""
+        LOG.info(
+            f"Getting transactions for security '{security_id}' in account '{account_id}' between '{start_date.date()}' and '{end_date.date()}'"
+        )
+        lower = TransactionsTable._sort_key_prefix(start_date) + "#"
+        upper = TransactionsTable._sort_key_prefix(end_date) + "#~"
+        items = self.ddb.query_index(
+            table=self.table_name,
+            index_name=self._get_account_security_date_range_index(self.domain),
+            expression="account_security_id = :account_security_id AND transaction_date BETWEEN :start_date AND :end_date",
+            attributes={
+                ":account_security_id": {
+                    "S": InvestmentTransaction.get_account_security_id(
+                        account_id, security_id
+                    )
+                },
+                ":start_date": {"S": lower},
+                ":end_date": {"S": upper},
+            },
+        )
+        transactions = [TransactionsTable._from_ddb_item(item) for item in items]
+        LOG.info(
+            f"Found {len(transactions)} transactions for security '{security_id}' in account '{account_id}'"
+        )
+        return transactions
+
+    def get_account_security_transactions(
+        self,
+        account_id: str,
+        security_id: str,
+        start_date: dt.datetime = dt.datetime.min,
+        end_date: dt.datetime = dt.datetime.max,
+    ) -> List[InvestmentTransaction]:
+        """
+        Get the investment transactions for a holding between start_date and end_date (inclusive).
+
+        Unlike `get_holding_transactions`, the transactions are read from the
+        account date range index and filtered by security, so transactions
+        written before the account security index existed are included.
+        """
+        LOG.info(
+            f"Getting transactions for security '{security_id}' in account '{account_id}' between '{start_date.date()}' and '{end_date.date()}' by account"
+        )
+        lower = TransactionsTable._sort_key_prefix(start_date) + "#"
+        upper = TransactionsTable._sort_key_prefix(end_date) + "#~"
+        items = self.ddb.query_index(
+            table=self.table_name,
+            index_name=self._get_account_date_range_index(self.domain),
+            expression="account_id = :account_id AND transaction_date BETWEEN :start_date AND :end_date",
+            attributes={
+                ":account_id": {"S": account_id},
+                ":start_date": {"S": lower},
+                ":end_date": {"S": upper},
+                ":security_id": {"S": security_id},
+            },
+            filter_expression="security_id = :security_id",
+        )
+        transactions = [TransactionsTable._from_ddb_item(item) for item in items]
+        LOG.info(
+            f"Found {len(transactions)} transactions for security '{security_id}' in account '{account_id}'"
+        )
+        return transactions
+
     def get_transactions_by_account(self, account_id: str) -> List[Transaction]:
         """Get all transactions for a given account."""
         LOG.info(f"Getting all transactions for account '{account_id}'")
@@ -112,12 +308,117 @@ class TransactionsTable:
             account_id, dt.datetime.min, dt.datetime.max
         )
 
+    def get_account_transaction_keys_page(
+        self,
+        account_id: str,
+        exclusive_start_key: Optional[dict] = None,
+        limit: Optional[int] = None,
+    ) -> Tuple[List[Tuple[str, str]], Optional[dict]]:
+        """
+        Get a page of the primary keys of the transactions of an account.
+
+        Returns:
+            The user ID and transaction ID of each transaction in the page and
+            the key to resume from, or None if there are no more transactions.
+        """
+        LOG.info(f"Getting page of transaction keys for account '{account_id}'")
+        items, last_evaluated_key = self.ddb.query_index_page(
+            table=self.table_name,
+            index_name=self._get_account_date_range_index(self.domain),
+            expression="account_id = :account_id",
+            attributes={":account_id": {"S": account_id}},
+            exclusive_start_key=exclusive_start_key,
+            limit=limit,
+        )
+        keys = [(item["user_id"]["S"], item["transaction_id"]["S"]) for item in items]
+        return keys, last_evaluated_key
+
+    def get_transaction_keys_by_plaid_transaction_ids(
+        self, plaid_transaction_ids: List[str]
+    ) -> Dict[str, Tuple[str, str]]:
+        """
+        Get the primary keys of the transactions with the given Plaid transaction IDs.
+
+        The Plaid transaction ID index is sparse and keys-only, so each lookup
+        returns just the `(user_id, transaction_id)` primary key of the
+        matching transaction. Unknown Plaid transaction IDs are omitted.
+        """
+        LOG.info(
+            f"Getting transaction keys for {len(plaid_transaction_ids)} Plaid transactions"
+        )
+        keys = {}
+        for plaid_transaction_id in plaid_transaction_ids:
+            items = self.ddb.query_index(
+                table=self.table_name,
+                index_name=self._get_plaid_transaction_id_index(self.domain),
+                expression="plaid_transaction_id = :plaid_transaction_id",
+                attributes={":plaid_transaction_id": {"S": plaid_transaction_id}},
+            )
+            if items:
+                keys[plaid_transaction_id] = (
+                    items[0]["user_id"]["S"],
+                    items[0]["transaction_id"]["S"],
+                )
+        LOG.info(f"Found {len(keys)} transaction keys for Plaid transactions")
+        return keys
+
+    def get_transactions(self, keys: List[Tuple[str, str]]) -> List[Transaction]:
+        """Get the transactions with the given `(user_id, transaction_id)` keys in batches."""
+        LOG.info(f"Getting {len(keys)} transactions by key")
+        items = self.ddb.batch_get_items(
+            table=self.table_name,
+            keys=[
+                TransactionsTable._get_primary_key(user_id, transaction_id)
+                for user_id, transaction_id in keys
+            ],
+        )
+        return [TransactionsTable._from_ddb_item(item) for item in items]
+
     def get_all_transactions(self) -> List[Transaction]:
         """Get all transactions."""
         LOG.info("Getting all transactions")
         items = self.ddb.scan_table(table=self.table_name)
         return [TransactionsTable._from_ddb_item(item) for item in items]
 
+    def iter_transaction_pages(self) -> Iterator[List[Transaction]]:
+        """Stream all transactions one scanned page at a time."""
+        LOG.info("Streaming all transactions")
+        for items in self.ddb.scan_table_pages(table=self.table_name):
+            yield [TransactionsTable._from_ddb_item(item) for item in items]
+
+    def get_items_page(
+        self, exclusive_start_key: Optional[dict] = None, limit: Optional[int] = None
+    ) -> Tuple[List[dict], Optional[dict]]:
+        """Scan a single page of raw transaction items, used by table migrations."""
+        return self.ddb.scan_page(self.table_name, exclusive_start_key, limit)
+
+    def backfill_account_security_id(self, item: dict) -> bool:
+        """
+        Set the composite holding key of an investment transaction item if missing.
+
+        Returns True if the item was updated, False if the item already had
+        the key or is not an investment transaction.
+        """
+        if item["transaction_type"]["S"].lower() != TransactionType.INVESTMENT.value:
+            return False
+        if "account_security_id" in item:
+            return False
+        return self.ddb.update_item(
+            table=self.table_name,
+            key=TransactionsTable._get_primary_key(
+                item["user_id"]["S"], item["transaction_id"]["S"]
+            ),
+            update_expression="SET account_security_id = :account_security_id",
+            attribute_values={
+                ":account_security_id": {
+                    "S": InvestmentTransaction.get_account_security_id(
+                        item["account_id"]["S"], item["security_id"]["S"]
+                    )
+                }
+            },
+            condition_expression="attribute_exists(user_id) AND attribute_not_exists(account_security_id)",
+        )
+
     def put_transaction(self, transaction: Transaction) -> Transaction:
         """
         Add or update a transaction in the table.
@@ -132,13 +433,41 @@ class TransactionsTable:
         LOG.info("Transaction put successfully!")
         return transaction
 
-    def delete_transaction(self, user_id: str, transaction_id: str) -> None:
+    def replace_transaction(self, transaction: Transaction) -> Optional[Transaction]:
+        """Add or update a transaction in the table and return the transaction it replaced, if any."""
+        LOG.info(
+            f"Replacing transaction '{transaction.transaction_id}' for account '{transaction.account_id}'"
+        )
+        item = self.ddb.put_item(
+            self.table_name, transaction.to_ddb_item(), return_old=True
+        )
+        LOG.info("Transaction replaced successfully!")
+        return TransactionsTable._from_ddb_item(item) if item else None
+
+    def delete_transaction(
+        self, user_id: str, transaction_id: str
+    ) -> Optional[Transaction]:
+        """Delete a transaction from the table and return it, if it existed."""
         LOG.info(f"Deleting transaction '{transaction_id}' for user '{user_id}'")
-        self.ddb.delete_item(
+        item = self.ddb.delete_item(
             table=self.table_name,
             key=TransactionsTable._get_primary_key(user_id, transaction_id),
+            return_old=True,
         )
         LOG.info("Transaction deleted successfully!")
+        return TransactionsTable._from_ddb_item(item) if item else None
+
+    def delete_transactions(self, keys: List[Tuple[str, str]]) -> None:
+        """Batch delete transactions given their user ID and transaction ID."""
+        LOG.info(f"Batch deleting {len(keys)} transaction(s)")
+        self.ddb.batch_write_items(
+            table=self.table_name,
+            delete_keys=[
+                TransactionsTable._get_primary_key(user_id, transaction_id)
+                for user_id, transaction_id in keys
+            ],
+        )
+        LOG.info("Transactions deleted successfully!")
 
     @staticmethod
     def _sort_key_prefix(date: dt.datetime) -> str:
@@ -153,6 +482,74 @@ class TransactionsTable:
             },
         }
 
+    def _get_transactions_page(
+        self,
+        index_name: str,
+        key_name: str,
+        key_value: str,
+        start_date: dt.datetime,
+        end_date: dt.datetime,
+        limit: int,
+        exclusive_start_key: Optional[dict],
+        descending: bool,
+        attributes: Optional[Iterable[str]],
+    ) -> Tuple[TransactionBatch, Optional[dict]]:
+        items, last_evaluated_key = self.ddb.query_index_page(
+            table=self.table_name,
+            index_name=index_name,
+            expression=f"{key_name} = :{key_name} AND transaction_date BETWEEN :start_date AND :end_date",
+            attributes=TransactionsTable._get_date_range_attributes(
+                key_name, key_value, start_date, end_date
+            ),
+            exclusive_start_key=exclusive_start_key,
+            limit=limit,
+            scan_index_forward=not descending,
+            projection=TransactionsTable._get_projection(attributes),
+        )
+        batch = TransactionBatch.from_ddb_items(items)
+        LOG.info(f"Found {len(batch)} transactions in page")
+        return batch, last_evaluated_key
+
+    def _get_transaction_batch(
+        self,
+        index_name: str,
+        key_name: str,
+        key_value: str,
+        start_date: dt.datetime,
+        end_date: dt.datetime,
+        attributes: Optional[Iterable[str]],
+    ) -> TransactionBatch:
+        # pages are decoded as they are queried so the raw items of the
+        # complete query are never held in memory at once
+        pages = self.ddb.query_index_pages(
+            table=self.table_name,
+            index_name=index_name,
+            expression=f"{key_name} = :{key_name} AND transaction_date BETWEEN :start_date AND :end_date",
+            attributes=TransactionsTable._get_date_range_attributes(
+                key_name, key_value, start_date, end_date
+            ),
+            projection=TransactionsTable._get_projection(attributes),
+        )
+        batch = TransactionBatch.from_ddb_items(item for page in pages for item in page)
+        LOG.info(f"Found {len(batch)} transactions for {key_name} '{key_value}'")
+        return batch
+
+    @staticmethod
+    def _get_projection(attributes: Optional[Iterable[str]]) -> Optional[List[str]]:
+        if attributes is None:
+            return None
+        return REQUIRED_ATTRIBUTES + sorted(set(attributes) - set(REQUIRED_ATTRIBUTES))
+
+    @staticmethod
+    def _get_date_range_attributes(
+        key_name: str, key_value: str, start_date: dt.datetime, end_date: dt.datetime
+    ) -> dict:
+        return {
+            f":{key_name}": {"S": key_value},
+            ":start_date": {"S": TransactionsTable._sort_key_prefix(start_date) + "#"},
+            ":end_date": {"S": TransactionsTable._sort_key_prefix(end_date) + "#~"},
+        }
+
     @staticmethod
     def _get_user_date_range_index_name(domain: Domain) -> str:
         return TransactionsTable.USER_DATE_RANGE_INDEX_NAME_FORMAT.format(
@@ -165,11 +562,19 @@ class TransactionsTable:
             domain=domain.value
         )
 
+    @staticmethod
+    def _get_account_security_date_range_index(domain: Domain) -> str:
+        return TransactionsTable.ACCOUNT_SECURITY_DATE_RANGE_INDEX_NAME_FORMAT.format(
+            domain=domain.value
+        )
+
+    @staticmethod
+    def _get_plaid_transaction_id_index(domain: Domain) -> str:
+        return TransactionsTable.PLAID_TRANSACTION_ID_INDEX_NAME_FORMAT.format(
+            domain=domain.value
+        )
+
     @staticmethod
     def _from_ddb_item(item: dict) -> Transaction:
         """Deserialize a DDB item into the appropriate Transaction subclass."""
-        txn_type_val = item["transaction_type"]["S"].lower()
-        if txn_type_val == TransactionType.INVESTMENT.value:
-            return InvestmentTransaction.from_ddb_item(item)
-        else:
-            return BankTransaction.from_ddb_item(item)
+        return Transaction.from_ddb_item(item)
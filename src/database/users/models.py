@@ -4,6 +4,8 @@ from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Optional
 
+from src.database.codecs import Field, FieldType, ModelCodec
+
 
 @dataclass
 class User:
@@ -81,54 +83,40 @@ class User:
         }
 
     def to_ddb_item(self) -> dict:
-        # set default values for optional fields
-        profile_picture_s3_uri = "N/A"
-        if self.profile_picture_s3_uri:
-            profile_picture_s3_uri = self.profile_picture_s3_uri
-
-        profile_picture_url = "N/A"
-        if self.profile_picture_url:
-            profile_picture_url = self.profile_picture_url
-
-        profile_picture_url_expiration = "N/A"
-        if self.profile_picture_url_expiration and isinstance(
-            self.profile_picture_url_expiration, datetime
-        ):
-            profile_picture_url_expiration = (
-                self.profile_picture_url_expiration.isoformat()
-            )
-
-        stripe_customer_id = "N/A"
-        if self.stripe_customer_id:
-            stripe_customer_id = self.stripe_customer_id
+        # optional fields are stored as "N/A" if not set
+        return USER_CODEC.encode(self)
 
-        stripe_subscription_id = "N/A"
-        if self.stripe_subscription_id:
-            stripe_subscription_id = self.stripe_subscription_id
-
-        # return ddb item with all fields set (even optional ones with default values)
-        return {
-            "user_id": {
-                "S": self.user_id,
-            },
-            "email": {
-                "S": self.email,
-            },
-            "first_name": {"S": self.first_name},
-            "last_name": {"S": self.last_name},
-            "password_hash": {"S": self.password_hash},
-            "sign_up_date": {"S": self.sign_up_date.isoformat()},
-            "last_active_date": {"S": self.last_active_date.isoformat()},
-            "verified": {"BOOL": self.verified},
-            "profile_picture_s3_uri": {"S": profile_picture_s3_uri},
-            "profile_picture_url": {"S": profile_picture_url},
-            "profile_picture_url_expiration": {"S": profile_picture_url_expiration},
-            "stripe_subscription_id": {"S": stripe_subscription_id},
-            "stripe_customer_id": {"S": stripe_customer_id},
-        }
+    @classmethod
+    def from_ddb_item(cls, ddb_item: dict) -> "User":
+        return USER_CODEC.decode(ddb_item)
 
     @staticmethod
     def generate_user_id() -> str:
         timestamp_part = str(int(datetime.now(timezone.utc).timestamp()))[-6:]
         random_part = str(random.randint(1000, 9999))
         return f"user-{timestamp_part}{random_part}"
+
+
+USER_CODEC = ModelCodec(
+    User,
+    [
+        Field("user_id"),
+        Field("email"),
+        Field("first_name"),
+        Field("last_name"),
+        Field("password_hash"),
+        Field("sign_up_date", FieldType.DATETIME),
+        Field("last_active_date", FieldType.DATETIME),
+        Field("verified", FieldType.BOOLEAN),
+        Field("profile_picture_s3_uri", missing="N/A"),
+        Field("profile_picture_url", missing="N/A"),
+        Field(
+            "profile_picture_url_expiration",
+            FieldType.DATETIME,
+            missing="N/A",
+            timezone=timezone.utc,
+        ),
+        Field("stripe_subscription_id", missing="N/A"),
+        Field("stripe_customer_id", missing="N/A"),
+    ],
+)
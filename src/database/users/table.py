@@ -44,7 +44,7 @@ class UsersTable:
         item = self.ddb.get_item(self.table, key)
         if item is None:
             return None
-        return UsersTable._get_user_from_ddb_item(item)
+        return User.from_ddb_item(item)
 
     def get_user_by_email(self, email: str) -> Optional[User]:
         log.info(f"Getting user with email '{email}' from table '{self.table}'")
@@ -59,12 +59,39 @@ class UsersTable:
             return None
 
         # return first item if multiple items found
-        return None if len(items) == 0 else UsersTable._get_user_from_ddb_item(items[0])
+        return None if len(items) == 0 else User.from_ddb_item(items[0])
 
     def update_user(self, user: User) -> None:
         log.info(f"Updating user with email '{user.email}'")
         self.ddb.put_item(self.table, user.to_ddb_item())
 
+    def update_last_active_date(
+        self, user_id: str, last_active_date: dt.datetime, min_interval: dt.timedelta
+    ) -> bool:
+        """
+        Set the last active date of an existing user with a conditional partial update.
+
+        The update is skipped if the user does not exist or was already active
+        within the minimum interval, so concurrent requests across processes
+        write the attribute at most once per interval.
+
+        Returns:
+            True if the last active date was updated, False otherwise.
+        """
+        log.info(f"Updating last active date of user '{user_id}'")
+        return self.ddb.update_item(
+            table=self.table,
+            key=UsersTable._get_user_key(user_id),
+            update_expression="SET last_active_date = :last_active_date",
+            attribute_values={
+                ":last_active_date": {"S": last_active_date.isoformat()},
+                ":active_before": {
+                    "S": (last_active_date - min_interval).isoformat(),
+                },
+            },
+            condition_expression="attribute_exists(user_id) AND last_active_date <= :active_before",
+        )
+
     def delete_user(self, user_id: str) -> None:
         log.info(f"Deleting user '{user_id}'")
         self.ddb.delete_item(self.table, UsersTable._get_user_key(user_id))
@@ -73,7 +100,7 @@ class UsersTable:
         log.info(f"Getting users from table '{self.table}'")
         users = []
         for item in self.ddb.scan_table(self.table):
-            users.append(UsersTable._get_user_from_ddb_item(item))
+            users.append(User.from_ddb_item(item))
         return users
 
     @staticmethod
@@ -87,44 +114,3 @@ class UsersTable:
     @staticmethod
     def _get_user_key(user_id: str) -> dict:
         return {"user_id": {"S": user_id}}
-
-    @staticmethod
-    def _get_user_from_ddb_item(item: dict) -> User:
-        # set optional fields, if not provided then set as None
-        profile_picture_s3_uri = None
-        if item["profile_picture_s3_uri"]["S"] != "N/A":
-            profile_picture_s3_uri = item["profile_picture_s3_uri"]["S"]
-
-        profile_picture_url = None
-        if item["profile_picture_url"]["S"] != "N/A":
-            profile_picture_url = item["profile_picture_url"]["S"]
-
-        profile_picture_url_expiration = None
-        if item["profile_picture_url_expiration"]["S"] != "N/A":
-            profile_picture_url_expiration = dt.datetime.fromisoformat(
-                item["profile_picture_url_expiration"]["S"]
-            ).replace(tzinfo=dt.UTC)
-
-        stripe_customer_id = None
-        if item["stripe_customer_id"]["S"] != "N/A":
-            stripe_customer_id = item["stripe_customer_id"]["S"]
-
-        stripe_subscription_id = None
-        if item["stripe_subscription_id"]["S"] != "N/A":
-            stripe_subscription_id = item["stripe_subscription_id"]["S"]
-
-        return User(
-            user_id=item["user_id"]["S"],
-            email=item["email"]["S"],
-            first_name=item["first_name"]["S"],
-            last_name=item["last_name"]["S"],
-            password_hash=item["password_hash"]["S"],
-            sign_up_date=dt.datetime.fromisoformat(item["sign_up_date"]["S"]),
-            last_active_date=dt.datetime.fromisoformat(item["last_active_date"]["S"]),
-            verified=item["verified"]["BOOL"],
-            profile_picture_s3_uri=profile_picture_s3_uri,
-            profile_picture_url=profile_picture_url,
-            profile_picture_url_expiration=profile_picture_url_expiration,
-            stripe_customer_id=stripe_customer_id,
-            stripe_subscription_id=stripe_subscription_id,
-        )
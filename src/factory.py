@@ -3,6 +3,7 @@ from dataclasses import dataclass
 import boto3
 
 from plaid import Environment
+from src.accounts.queue import PurgeAccountTaskQueue
 from src.ai.mlp.expenses import ExpenseCategorizerMLP
 from src.auth.authenticator import WalterAuthenticator
 from src.aws.dynamodb.client import WalterDDBClient
@@ -10,14 +11,17 @@ from src.aws.s3.client import WalterS3Client
 from src.aws.secretsmanager.client import WalterSecretsManagerClient
 from src.aws.sqs.client import WalterSQSClient
 from src.aws.sts.client import WalterSTSClient
+from src.config import CONFIG
 from src.database.client import WalterDB
 from src.environment import Domain
 from src.investments.holdings.updater import HoldingUpdater
+from src.investments.securities.history import PriceHistoryStore
 from src.investments.securities.updater import SecurityUpdater
 from src.media.bucket import MediaBucket
 from src.metrics.client import DatadogMetricsClient
 from src.plaid.client import PlaidClient
 from src.plaid.transaction_converter import TransactionConverter
+from src.polygon.cache import PolygonCache
 from src.polygon.client import PolygonClient
 from src.transactions.queue import SyncUserTransactionsTaskQueue
 from src.utils.log import Logger
@@ -53,7 +57,9 @@ class ClientFactory:
     transaction_converter: TransactionConverter = None
     plaid: PlaidClient = None
     sync_transactions_task_queue: SyncUserTransactionsTaskQueue = None
+    purge_account_task_queue: PurgeAccountTaskQueue = None
     media_bucket: MediaBucket = None
+    price_history_store: PriceHistoryStore = None
 
     def __post_init__(self) -> None:
         LOG.debug("Creating WalterBackend client factory")
@@ -181,7 +187,16 @@ class ClientFactory:
 
     def get_polygon_client(self) -> PolygonClient:
         if self.polygon is None:
-            self.polygon = PolygonClient(self.get_secrets_client())
+            self.polygon = PolygonClient(
+                self.get_secrets_client(),
+                cache=PolygonCache(
+                    walter_db=(
+                        self.get_db_client()
+                        if CONFIG.polygon.ddb_cache_enabled
+                        else None
+                    )
+                ),
+            )
         return self.polygon
 
     def get_transaction_converter(self) -> TransactionConverter:
@@ -228,12 +243,26 @@ class ClientFactory:
             )
         return self.sync_transactions_task_queue
 
+    def get_purge_account_task_queue(self) -> PurgeAccountTaskQueue:
+        if self.purge_account_task_queue is None:
+            self.purge_account_task_queue = PurgeAccountTaskQueue(self.get_sqs_client())
+        return self.purge_account_task_queue
+
     def get_media_bucket(self) -> MediaBucket:
         if self.media_bucket is None:
             LOG.debug("Creating MediaBucket")
             self.media_bucket = MediaBucket(self.get_s3_client(), self.domain)
         return self.media_bucket
 
+    def get_price_history_store(self) -> PriceHistoryStore:
+        if self.price_history_store is None:
+            LOG.debug("Creating PriceHistoryStore")
+            self.price_history_store = PriceHistoryStore(
+                media_bucket=self.get_media_bucket(),
+                max_concurrent_requests=CONFIG.portfolio_history.max_concurrent_requests,
+            )
+        return self.price_history_store
+
     def _boto3_client_kwargs(self) -> dict:
         if (
             not self.aws_access_key_id
@@ -0,0 +1,193 @@
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+import numpy as np
+
+from src.database.holdings.models import Holding
+from src.database.transactions.models import (
+    InvestmentTransaction,
+    InvestmentTransactionSubType,
+    Transaction,
+)
+from src.investments.holdings.updater import HoldingUpdater
+from src.utils.log import Logger
+
+log = Logger(__name__).get_logger()
+
+
+@dataclass
+class RebuiltHoldings:
+    """
+    Rebuilt Holdings
+
+    The result of rebuilding the holdings of an account from its transactions.
+    Securities with invalid transaction histories are excluded from both the
+    open holdings and the closed securities so their holdings are left as is.
+    """
+
+    account_id: str
+    holdings: List[Holding] = field(default_factory=list)
+    closed_security_ids: List[str] = field(default_factory=list)
+    invalid_histories: Dict[str, str] = field(default_factory=dict)
+
+
+@dataclass
+class HoldingRebuilder:
+    """
+    Holding Rebuilder
+
+    Rebuilds the holdings of an account from its full transaction history
+    with vectorized NumPy operations rather than applying transactions one
+    at a time like `HoldingUpdater`. The transactions of all securities in
+    the account are sorted into contiguous (security, date, transaction ID)
+    groups and replayed with grouped cumulative sums.
+
+    Holdings use the average cost method, so sells scale the total cost
+    basis by the fraction of the position kept and only the transactions
+    after the position was last fully sold determine the current holding.
+    Securities that are oversold at any point or have transactions other
+    than buys and sells are reported as invalid histories.
+    """
+
+    QUANTITY_TOLERANCE = HoldingUpdater.QUANTITY_TOLERANCE
+
+    def __post_init__(self) -> None:
+        log.debug("Initializing Holding Rebuilder")
+
+    def rebuild(
+        self, account_id: str, transactions: List[Transaction]
+    ) -> RebuiltHoldings:
+        result = RebuiltHoldings(account_id=account_id)
+
+        investment_transactions = []
+        for transaction in transactions:
+            if not isinstance(transaction, InvestmentTransaction):
+                continue
+            if transaction.transaction_subtype not in (
+                InvestmentTransactionSubType.BUY,
+                InvestmentTransactionSubType.SELL,
+            ):
+                result.invalid_histories[transaction.security_id] = (
+                    f"Invalid transaction subtype: {transaction.transaction_subtype}"
+                )
+                continue
+            investment_transactions.append(transaction)
+
+        investment_transactions = [
+            transaction
+            for transaction in investment_transactions
+            if transaction.security_id not in result.invalid_histories
+        ]
+        if not investment_transactions:
+            return result
+
+        log.info(
+            f"Replaying {len(investment_transactions)} transactions for account '{account_id}'"
+        )
+
+        # sort transactions into contiguous groups per security ordered by
+        # transactions table sort key, matching the holding updater replay order
+        security_ids, groups = np.unique(
+            [transaction.security_id for transaction in investment_transactions],
+            return_inverse=True,
+        )
+        transaction_keys = np.array(
+            [
+                HoldingUpdater._get_transaction_key(transaction)
+                for transaction in investment_transactions
+            ]
+        )
+        order = np.lexsort((transaction_keys, groups))
+        groups = groups[order]
+        transaction_keys = transaction_keys[order]
+        quantities = np.array(
+            [transaction.quantity for transaction in investment_transactions],
+            dtype=float,
+        )[order]
+        prices = np.array(
+            [transaction.price_per_share for transaction in investment_transactions],
+            dtype=float,
+        )[order]
+        is_buy = np.array(
+            [
+                transaction.transaction_subtype == InvestmentTransactionSubType.BUY
+                for transaction in investment_transactions
+            ]
+        )[order]
+
+        num_transactions = len(groups)
+        indices = np.arange(num_transactions)
+        starts = np.flatnonzero(np.r_[True, groups[1:] != groups[:-1]])
+        ends = np.r_[starts[1:], num_transactions] - 1
+        lengths = ends - starts + 1
+
+        # running quantity of each security after each transaction
+        deltas = np.where(is_buy, quantities, -quantities)
+        running_quantities = HoldingRebuilder._grouped_cumsum(deltas, starts, lengths)
+        running_quantities[np.abs(running_quantities) <= self.QUANTITY_TOLERANCE] = 0
+        oversold = (
+            np.minimum.reduceat(running_quantities, starts) < -self.QUANTITY_TOLERANCE
+        )
+
+        # only transactions after the position was last fully sold make up the
+        # current cost basis, a position always reopens with a buy
+        closed = running_quantities == 0
+        open_starts = np.maximum(
+            np.maximum.reduceat(np.where(closed, indices + 1, 0), starts), starts
+        )
+        is_open = indices >= np.repeat(open_starts, lengths)
+
+        # sells keep the average cost basis so each sell scales the total cost
+        # basis by the fraction of the position kept, the total cost basis is
+        # then the sum of each buy scaled by the sells that followed it
+        previous_quantities = running_quantities - deltas
+        kept_fractions = np.ones(num_transactions)
+        open_sells = is_open & ~is_buy & ~np.repeat(oversold, lengths)
+        kept_fractions[open_sells] = (
+            running_quantities[open_sells] / previous_quantities[open_sells]
+        )
+        log_kept = HoldingRebuilder._grouped_cumsum(
+            np.log(kept_fractions), starts, lengths
+        )
+        buy_costs = np.where(is_open & is_buy, quantities * prices, 0.0)
+        scaled_costs = buy_costs * np.exp(np.repeat(log_kept[ends], lengths) - log_kept)
+        total_cost_bases = np.add.reduceat(scaled_costs, starts)
+        final_quantities = running_quantities[ends]
+
+        for group, security_id in enumerate(security_ids):
+            security_id = str(security_id)
+            if oversold[group]:
+                log.warning(
+                    f"Transaction history for account '{account_id}' and security '{security_id}' oversells the holding!"
+                )
+                result.invalid_histories[security_id] = (
+                    "Investment transaction sell quantity is greater than holding quantity"
+                )
+                continue
+
+            quantity = float(final_quantities[group])
+            if quantity <= self.QUANTITY_TOLERANCE:
+                result.closed_security_ids.append(security_id)
+                continue
+
+            total_cost_basis = float(total_cost_bases[group])
+            holding = Holding.create_new_holding(
+                account_id=account_id,
+                security_id=security_id,
+                quantity=quantity,
+                average_cost_basis=total_cost_basis / quantity,
+            )
+            holding.total_cost_basis = total_cost_basis
+            holding.last_transaction_key = str(transaction_keys[ends[group]])
+            result.holdings.append(holding)
+
+        return result
+
+    @staticmethod
+    def _grouped_cumsum(
+        values: np.ndarray, starts: np.ndarray, lengths: np.ndarray
+    ) -> np.ndarray:
+        """Cumulative sum of the values restarting at each contiguous group."""
+        cumsum = np.cumsum(values)
+        offsets = cumsum[starts] - values[starts]
+        return cumsum - np.repeat(offsets, lengths)
@@ -1,5 +1,6 @@
-from dataclasses import dataclass
-from typing import List
+import datetime as dt
+from dataclasses import dataclass, replace
+from typing import List, Optional
 
 from src.database.client import WalterDB
 from src.database.holdings.models import Holding
@@ -15,7 +16,22 @@ log = Logger(__name__).get_logger()
 
 @dataclass
 class HoldingUpdater:
-    """Holding Updater"""
+    """
+    Holding Updater
+
+    Holdings are maintained incrementally. Transactions appended after the
+    latest transaction applied to a holding update its running quantity and
+    cost basis in O(1). Out-of-order adds, edits, and deletes unwind the
+    holding back to the affected date and replay only the transactions from
+    that date onward, falling back to a full replay of the holding history
+    when the unwind is ambiguous (e.g. the holding was fully sold in between)
+    or the holding predates incremental maintenance. Every
+    `RECONCILIATION_INTERVAL` incremental updates the holding is reconciled
+    against a full replay of its history.
+    """
+
+    RECONCILIATION_INTERVAL = 25
+    QUANTITY_TOLERANCE = 1e-6
 
     walter_db: WalterDB
 
@@ -32,18 +48,24 @@ class HoldingUpdater:
             transaction.account_id, transaction.security_id
         )
 
-        # create list of updated transactions, add existing transactions if a holding exists
-        updated_transactions = []
-        if holding:
-            updated_transactions.extend(
-                self.walter_db.get_transactions_by_holding(
-                    holding.account_id, holding.security_id
-                )
-            )
-        updated_transactions.append(transaction)
-
-        self._update(
-            transaction.account_id, transaction.security_id, updated_transactions
+        # create new holding from the transaction if no holding exists
+        if holding is None:
+            self._update(transaction.account_id, transaction.security_id, [transaction])
+            return
+
+        # apply transactions appended after the latest applied transaction in O(1)
+        if holding.last_transaction_key is not None and (
+            HoldingUpdater._get_transaction_key(transaction)
+            > holding.last_transaction_key
+        ):
+            self._append(holding, transaction)
+            return
+
+        self._replay_from(
+            holding,
+            HoldingUpdater._get_transaction_key(transaction),
+            removed_transaction_id=None,
+            added_transaction=transaction,
         )
 
     def update_transaction(self, transaction: InvestmentTransaction) -> None:
@@ -51,48 +73,238 @@ class HoldingUpdater:
             f"Updating transaction '{transaction.transaction_id}' and updating holding..."
         )
 
-        # get existing holding, one should exist when updating a transaction
+        # get existing holding, which is missing if the transaction history
+        # sold the holding to zero or the holding was removed by a rebuild
         holding = self.walter_db.get_holding(
             transaction.account_id, transaction.security_id
         )
+        if holding is None:
+            self._replay_all(
+                transaction.account_id,
+                transaction.security_id,
+                removed_transaction_id=transaction.transaction_id,
+                added_transaction=transaction,
+            )
+            return
 
-        # get existing transactions for holding and replace transaction to update
-        transactions = self.walter_db.get_transactions_by_holding(
-            holding.account_id, holding.security_id
+        # replay from the earlier of the existing and updated transaction dates
+        affected_key = HoldingUpdater._get_transaction_key(transaction)
+        existing_transaction = self.walter_db.get_user_transaction(
+            transaction.user_id, transaction.transaction_id
         )
+        if existing_transaction is not None:
+            affected_key = min(
+                affected_key, HoldingUpdater._get_transaction_key(existing_transaction)
+            )
 
-        updated_transactions = []
-        for txn in transactions:
-            if txn.transaction_id != transaction.transaction_id:
-                updated_transactions.append(txn)
-                continue
-            # replace transaction to update
-            updated_transactions.append(transaction)
-
-        self._update(holding.account_id, holding.security_id, updated_transactions)
+        self._replay_from(
+            holding,
+            affected_key,
+            removed_transaction_id=transaction.transaction_id,
+            added_transaction=transaction,
+        )
 
     def delete_transaction(self, transaction: InvestmentTransaction) -> None:
         log.info(
             f"Deleting transaction '{transaction.transaction_id}' and updating holding..."
         )
 
-        # get existing holding, one should exist when deleting a transaction
+        # get existing holding, which is missing if the transaction history
+        # sold the holding to zero or the holding was removed by a rebuild
         holding = self.walter_db.get_holding(
             transaction.account_id, transaction.security_id
         )
+        if holding is None:
+            self._replay_all(
+                transaction.account_id,
+                transaction.security_id,
+                removed_transaction_id=transaction.transaction_id,
+                added_transaction=None,
+            )
+            return
+
+        self._replay_from(
+            holding,
+            HoldingUpdater._get_transaction_key(transaction),
+            removed_transaction_id=transaction.transaction_id,
+            added_transaction=None,
+        )
+
+    def _append(self, holding: Holding, transaction: InvestmentTransaction) -> None:
+        log.info(
+            f"Appending transaction '{transaction.transaction_id}' to holding for account '{holding.account_id}' and security '{holding.security_id}'"
+        )
+
+        self._verify_and_sort_transactions(
+            holding.account_id, holding.security_id, [transaction]
+        )
+        self._apply_transaction(holding, transaction)
+        holding.last_transaction_key = HoldingUpdater._get_transaction_key(transaction)
+        holding.updates_since_reconciliation += 1
+        holding.updated_at = dt.datetime.now(dt.timezone.utc)
+
+        if holding.updates_since_reconciliation >= self.RECONCILIATION_INTERVAL:
+            holding = self._reconcile(holding, transaction)
+
+        self._save(holding)
+
+    def _reconcile(
+        self, holding: Holding, transaction: InvestmentTransaction
+    ) -> Holding:
+        log.info(
+            f"Reconciling holding for account '{holding.account_id}' and security '{holding.security_id}'"
+        )
+
+        # the appended transaction is not persisted yet so include it in the replay
+        transactions = [
+            txn
+            for txn in self.walter_db.get_transactions_by_holding(
+                holding.account_id, holding.security_id
+            )
+            if txn.transaction_id != transaction.transaction_id
+        ]
+        transactions.append(transaction)
+        reconciled_holding = self._replay(
+            holding.account_id, holding.security_id, transactions
+        )
+
+        if (
+            abs(reconciled_holding.quantity - holding.quantity)
+            > self.QUANTITY_TOLERANCE
+            or abs(reconciled_holding.total_cost_basis - holding.total_cost_basis)
+            > self.QUANTITY_TOLERANCE
+        ):
+            log.warning(
+                f"Holding for account '{holding.account_id}' and security '{holding.security_id}' drifted from its transaction history! "
+                f"Incremental: ({holding.quantity}, {holding.total_cost_basis}) Reconciled: ({reconciled_holding.quantity}, {reconciled_holding.total_cost_basis})"
+            )
+
+        reconciled_holding.created_at = holding.created_at
+        return reconciled_holding
+
+    def _replay_from(
+        self,
+        holding: Holding,
+        affected_key: str,
+        removed_transaction_id: Optional[str],
+        added_transaction: Optional[InvestmentTransaction],
+    ) -> None:
+        account_id = holding.account_id
+        security_id = holding.security_id
+        log.info(
+            f"Replaying holding for account '{account_id}' and security '{security_id}' from '{affected_key}'"
+        )
+
+        # get the transactions on or after the affected date, the transaction being
+        # updated or deleted is still persisted and included in these transactions
+        affected_date = dt.date.fromisoformat(affected_key.split("#")[0])
+        later_transactions = [
+            transaction
+            for transaction in self._verify_and_sort_transactions(
+                account_id,
+                security_id,
+                self.walter_db.get_transactions_by_holding(
+                    account_id,
+                    security_id,
+                    dt.datetime.combine(affected_date, dt.time.min),
+                ),
+            )
+            if HoldingUpdater._get_transaction_key(transaction) >= affected_key
+        ]
+
+        updated_transactions = [
+            transaction
+            for transaction in later_transactions
+            if transaction.transaction_id != removed_transaction_id
+        ]
+        if added_transaction is not None:
+            updated_transactions.append(added_transaction)
+
+        # unwind the holding to its state before the affected transactions
+        # and replay the updated transactions from there, if no transactions
+        # remain to replay the latest applied transaction key is left as is which
+        # only routes later out-of-order changes to a (full) replay
+        unwound_holding = self._unwind(holding, later_transactions)
+        if unwound_holding is None:
+            log.info("Unable to unwind holding, replaying full holding history...")
+            self._replay_all(
+                account_id, security_id, removed_transaction_id, added_transaction
+            )
+            return
 
-        # get existing transactions for holding and remove transaction to delete
-        transactions = self.walter_db.get_transactions_by_holding(
-            holding.account_id, holding.security_id
+        updated_holding = self._replay(
+            account_id, security_id, updated_transactions, unwound_holding
         )
+        updated_holding.created_at = holding.created_at
+        self._save(updated_holding)
 
-        updated_transactions = []
-        for txn in transactions:
-            if txn.transaction_id == transaction.transaction_id:
-                continue
-            updated_transactions.append(txn)
+    def _replay_all(
+        self,
+        account_id: str,
+        security_id: str,
+        removed_transaction_id: Optional[str],
+        added_transaction: Optional[InvestmentTransaction],
+    ) -> None:
+        """Rebuild the holding from its full transaction history with the change applied."""
+        transactions = [
+            transaction
+            for transaction in self.walter_db.get_transactions_by_holding(
+                account_id, security_id
+            )
+            if transaction.transaction_id != removed_transaction_id
+        ]
+        if added_transaction is not None:
+            transactions.append(added_transaction)
+        self._update(account_id, security_id, transactions)
+
+    def _unwind(
+        self, holding: Holding, transactions: List[InvestmentTransaction]
+    ) -> Optional[Holding]:
+        """
+        Undo the given sorted transactions from the holding, latest first.
+
+        Returns None if the holding cannot be unwound exactly, i.e. the holding
+        predates incremental maintenance, its latest applied transaction does
+        not match the given transactions, or a buy being undone reopened a
+        fully sold position whose prior average cost basis is unknown.
+        """
+        if holding.last_transaction_key is None:
+            return None
+
+        if transactions and (
+            HoldingUpdater._get_transaction_key(transactions[-1])
+            != holding.last_transaction_key
+        ):
+            return None
+
+        unwound_holding = replace(holding)
+        average_cost_basis_known = True
+        for transaction in reversed(transactions):
+            match transaction.transaction_subtype:
+                case InvestmentTransactionSubType.BUY:
+                    unwound_holding.quantity -= transaction.quantity
+                    unwound_holding.total_cost_basis -= (
+                        transaction.quantity * transaction.price_per_share
+                    )
+                    if unwound_holding.quantity <= self.QUANTITY_TOLERANCE:
+                        unwound_holding.quantity = 0
+                        unwound_holding.total_cost_basis = 0
+                        average_cost_basis_known = False
+                    else:
+                        unwound_holding.average_cost_basis = (
+                            unwound_holding.total_cost_basis / unwound_holding.quantity
+                        )
+                case InvestmentTransactionSubType.SELL:
+                    if not average_cost_basis_known:
+                        return None
+                    unwound_holding.quantity += transaction.quantity
+                    unwound_holding.total_cost_basis = (
+                        unwound_holding.quantity * unwound_holding.average_cost_basis
+                    )
+                case _:
+                    return None
 
-        self._update(holding.account_id, holding.security_id, updated_transactions)
+        return unwound_holding
 
     def _update(
         self,
@@ -103,45 +315,58 @@ class HoldingUpdater:
         log.info(
             f"Attempting to update holding for account '{account_id}' for security '{security_id}' with {len(transactions)} transactions"
         )
+        self._save(self._replay(account_id, security_id, transactions))
 
+    def _replay(
+        self,
+        account_id: str,
+        security_id: str,
+        transactions: List[InvestmentTransaction],
+        holding: Optional[Holding] = None,
+    ) -> Holding:
         # sort transactions by transaction date
         sorted_transactions = self._verify_and_sort_transactions(
             account_id, security_id, transactions
         )
 
         # initialize new holding with zero quantity and average cost basis to start
-        updated_holding = Holding.create_new_holding(
-            account_id=account_id,
-            security_id=security_id,
-            quantity=0,
-            average_cost_basis=0,
-        )
+        # if replaying the full transaction history, a full replay also reconciles
+        # the holding with its transaction history
+        updated_holding = holding
+        if updated_holding is None:
+            updated_holding = Holding.create_new_holding(
+                account_id=account_id,
+                security_id=security_id,
+                quantity=0,
+                average_cost_basis=0,
+            )
+            updated_holding.updates_since_reconciliation = 0
+        else:
+            updated_holding.updates_since_reconciliation += 1
 
         # iterate through transaction history and update holding accordingly or throw exception
         # for invalid transaction history which will block the holding update
         for transaction in sorted_transactions:
-            match transaction.transaction_subtype:
-                case InvestmentTransactionSubType.BUY:
-                    self._handle_buy_transaction(updated_holding, transaction)
-                case InvestmentTransactionSubType.SELL:
-                    self._handle_sell_transaction(updated_holding, transaction)
-                case _:
-                    raise InvalidHoldingUpdate(
-                        f"Invalid transaction subtype: {transaction.transaction_subtype}"
-                    )
+            self._apply_transaction(updated_holding, transaction)
+            updated_holding.last_transaction_key = HoldingUpdater._get_transaction_key(
+                transaction
+            )
+
+        updated_holding.updated_at = dt.datetime.now(dt.timezone.utc)
 
         log.info("Holding update successful!")
 
+        return updated_holding
+
+    def _save(self, holding: Holding) -> None:
         # handle holding with zero quantity after updating transactions
         # holding with zero quantity is invalid and should be deleted from database
         # holding with non-zero quantity is valid and should be kept in database
-        if updated_holding.quantity > 0:
-            self.walter_db.put_holding(updated_holding)
+        if holding.quantity > self.QUANTITY_TOLERANCE:
+            self.walter_db.put_holding(holding)
         else:
             log.info("Holding update resulted in zero quantity. Deleting holding...")
-            self.walter_db.delete_holding(
-                updated_holding.account_id, updated_holding.security_id
-            )
+            self.walter_db.delete_holding(holding.account_id, holding.security_id)
 
     def _verify_and_sort_transactions(
         self,
@@ -164,20 +389,35 @@ class HoldingUpdater:
                     f"Transaction {transaction} is not associated with holding for account '{account_id}' and security '{security_id}'!"
                 )
 
-        return sorted(transactions, key=lambda t: t.transaction_date)
+        # sort by date and transaction id to match the order of the transactions
+        # table sort key so incremental and full replays apply the same order
+        return sorted(transactions, key=HoldingUpdater._get_transaction_key)
+
+    def _apply_transaction(
+        self, holding: Holding, transaction: InvestmentTransaction
+    ) -> None:
+        match transaction.transaction_subtype:
+            case InvestmentTransactionSubType.BUY:
+                self._handle_buy_transaction(holding, transaction)
+            case InvestmentTransactionSubType.SELL:
+                self._handle_sell_transaction(holding, transaction)
+            case _:
+                raise InvalidHoldingUpdate(
+                    f"Invalid transaction subtype: {transaction.transaction_subtype}"
+                )
 
     def _handle_sell_transaction(
         self, holding: Holding, transaction: InvestmentTransaction
     ) -> None:
         # ensure that the holding quantity is greater than the transaction sell quantity
-        if transaction.quantity > holding.quantity:
+        if transaction.quantity > holding.quantity + self.QUANTITY_TOLERANCE:
             raise InvalidHoldingUpdate(
                 f"Investment transaction sell quantity ({transaction.quantity}) is greater than holding quantity ({holding.quantity})!"
             )
 
         # if user has enough holding quantity to satisfy sell transaction, update holding quantity and total cost basis
         # holding average cost basis does not change for sell transactions
-        holding.quantity -= transaction.quantity
+        holding.quantity = max(holding.quantity - transaction.quantity, 0)
         holding.total_cost_basis = holding.quantity * holding.average_cost_basis
 
     def _handle_buy_transaction(
@@ -186,3 +426,8 @@ class HoldingUpdater:
         holding.quantity += transaction.quantity
         holding.total_cost_basis += transaction.quantity * transaction.price_per_share
         holding.average_cost_basis = holding.total_cost_basis / holding.quantity
+
+    @staticmethod
+    def _get_transaction_key(transaction: InvestmentTransaction) -> str:
+        """Get the transactions table sort key (date#transaction_id) of the transaction."""
+        return f"{transaction.transaction_date.isoformat()[:10]}#{transaction.transaction_id}"
@@ -0,0 +1,243 @@
+import math
+from dataclasses import dataclass
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+from src.database.transactions.models import (
+    InvestmentTransaction,
+    InvestmentTransactionSubType,
+    Transaction,
+)
+from src.investments.holdings.updater import HoldingUpdater
+from src.investments.securities.history import DailyPriceBars
+from src.utils.log import Logger
+
+log = Logger(__name__).get_logger()
+
+
+@dataclass
+class PortfolioHistory:
+    """
+    Portfolio History
+
+    Daily value, cumulative net contributions (buys minus sells), and
+    cumulative time-weighted return of a portfolio over a date range.
+    """
+
+    dates: np.ndarray
+    values: np.ndarray
+    net_contributions: np.ndarray
+    time_weighted_returns: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def resample(self, max_points: int) -> "PortfolioHistory":
+        """
+        Downsample the history to at most `max_points` evenly spaced days.
+
+        The series are cumulative so sampling keeps the returns and
+        contributions of skipped days. The last day is always kept.
+        """
+        if len(self) <= max_points:
+            return self
+        stride = math.ceil(len(self) / max_points)
+        indices = np.arange(len(self) - 1, -1, -stride)[::-1]
+        return PortfolioHistory(
+            dates=self.dates[indices],
+            values=self.values[indices],
+            net_contributions=self.net_contributions[indices],
+            time_weighted_returns=self.time_weighted_returns[indices],
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "dates": [str(day) for day in self.dates],
+            "values": self.values.round(2).tolist(),
+            "net_contributions": self.net_contributions.round(2).tolist(),
+            "time_weighted_returns": self.time_weighted_returns.round(6).tolist(),
+        }
+
+
+@dataclass
+class PortfolioHistoryEngine:
+    """
+    Portfolio History Engine
+
+    Rebuilds the holdings of a portfolio on every day of a date range from
+    its investment transactions and values them with the daily closes of
+    the price history store, all with vectorized NumPy operations over a
+    (security, day) grid. Transaction prices and the latest security prices
+    are used as additional price observations so days before the price
+    history of a security begins are still valued. Prices are carried
+    forward over days without an observation, e.g. weekends and holidays.
+
+    Daily returns are computed with the Modified Dietz method, treating buys
+    as external flows at the start of the day and sells as external flows at
+    the end of the day, and chained into a cumulative time-weighted return.
+    """
+
+    QUANTITY_TOLERANCE = HoldingUpdater.QUANTITY_TOLERANCE
+
+    def __post_init__(self) -> None:
+        log.debug("Initializing Portfolio History Engine")
+
+    def get_history(
+        self,
+        transactions: List[Transaction],
+        price_history: Dict[str, DailyPriceBars],
+        start_date: date,
+        end_date: date,
+        latest_prices: Optional[Dict[str, Tuple[date, float]]] = None,
+    ) -> PortfolioHistory:
+        """
+        Get the daily history of a portfolio.
+
+        Args:
+            transactions: The transactions of the portfolio, transactions other than buys and sells are ignored.
+            price_history: The daily price bars of the securities of the portfolio.
+            start_date: The first day of the history.
+            end_date: The last day of the history.
+            latest_prices: The latest price of each security and the day it was observed.
+
+        Returns:
+            The portfolio history from the start date to the end date.
+        """
+        transactions = [
+            transaction
+            for transaction in transactions
+            if isinstance(transaction, InvestmentTransaction)
+            and transaction.transaction_subtype
+            in (InvestmentTransactionSubType.BUY, InvestmentTransactionSubType.SELL)
+        ]
+        latest_prices = latest_prices or {}
+
+        # the grid starts the day before the start date so the first day has
+        # a previous value to compute its return from
+        first_day = np.datetime64(start_date - timedelta(days=1), "D")
+        days = np.arange(
+            first_day, np.datetime64(end_date, "D") + 1, dtype="datetime64[D]"
+        )
+        num_days = len(days)
+        log.info(
+            f"Computing portfolio history over {num_days - 1} days from {len(transactions)} transactions"
+        )
+
+        if not transactions:
+            zeros = np.zeros(num_days - 1)
+            return PortfolioHistory(days[1:], zeros, zeros.copy(), zeros.copy())
+
+        security_ids, security_index = np.unique(
+            [transaction.security_id for transaction in transactions],
+            return_inverse=True,
+        )
+        transaction_days = np.array(
+            [
+                transaction.transaction_date.isoformat()[:10]
+                for transaction in transactions
+            ],
+            dtype="datetime64[D]",
+        )
+        quantities = np.array([transaction.quantity for transaction in transactions])
+        prices = np.array([transaction.price_per_share for transaction in transactions])
+        signs = np.array(
+            [
+                (
+                    1.0
+                    if transaction.transaction_subtype
+                    == InvestmentTransactionSubType.BUY
+                    else -1.0
+                )
+                for transaction in transactions
+            ]
+        )
+
+        # transactions before the grid are folded into its first day and
+        # transactions after the end date are ignored
+        offsets = (transaction_days - first_day).astype(np.int64)
+        in_range = offsets < num_days
+        day_index = np.clip(offsets, 0, None)[in_range]
+
+        deltas = np.zeros((len(security_ids), num_days))
+        np.add.at(
+            deltas,
+            (security_index[in_range], day_index),
+            (signs * quantities)[in_range],
+        )
+        held = np.cumsum(deltas, axis=1)
+        held[np.abs(held) < self.QUANTITY_TOLERANCE] = 0.0
+
+        # flows before the first day are part of the starting value
+        is_flow = in_range & (offsets > 0)
+        amounts = (quantities * prices)[is_flow]
+        is_buy = signs[is_flow] > 0
+        inflows = np.bincount(
+            offsets[is_flow][is_buy], weights=amounts[is_buy], minlength=num_days
+        )
+        outflows = np.bincount(
+            offsets[is_flow][~is_buy], weights=amounts[~is_buy], minlength=num_days
+        )
+        flows = inflows - outflows
+
+        price_grid = np.vstack(
+            [
+                self._get_daily_prices(
+                    days,
+                    price_history.get(security_id),
+                    transaction_days[security_index == index],
+                    prices[security_index == index],
+                    latest_prices.get(security_id),
+                )
+                for index, security_id in enumerate(security_ids)
+            ]
+        )
+        values = np.nansum(np.where(held != 0, held * price_grid, 0.0), axis=0)
+
+        # modified dietz daily returns with buys at the start of the day and
+        # sells at the end of the day
+        previous_values = values[:-1]
+        invested = previous_values + inflows[1:]
+        gains = values[1:] - previous_values - flows[1:]
+        daily_returns = np.divide(
+            gains, invested, out=np.zeros_like(gains), where=invested > 0
+        )
+
+        return PortfolioHistory(
+            dates=days[1:],
+            values=values[1:],
+            net_contributions=np.cumsum(flows[1:]),
+            time_weighted_returns=np.cumprod(1 + daily_returns) - 1,
+        )
+
+    @staticmethod
+    def _get_daily_prices(
+        days: np.ndarray,
+        bars: Optional[DailyPriceBars],
+        transaction_days: np.ndarray,
+        transaction_prices: np.ndarray,
+        latest_price: Optional[Tuple[date, float]],
+    ) -> np.ndarray:
+        """Get the last observed price of a security on each day, NaN before its first observation."""
+        observed_days = [transaction_days]
+        observed_prices = [transaction_prices]
+        priorities = [np.zeros(len(transaction_days))]
+        if bars is not None and len(bars):
+            observed_days.append(bars.dates)
+            observed_prices.append(bars.close)
+            priorities.append(np.ones(len(bars)))
+        if latest_price is not None:
+            observed_days.append(np.array([latest_price[0]], dtype="datetime64[D]"))
+            observed_prices.append(np.array([latest_price[1]]))
+            priorities.append(np.full(1, 2.0))
+        observed_days = np.concatenate(observed_days).astype("datetime64[D]")
+        observed_prices = np.concatenate(observed_prices)
+
+        # on days with several observations the close is preferred over
+        # transaction prices and the latest price over both
+        order = np.lexsort((np.concatenate(priorities), observed_days))
+        observed_days, observed_prices = observed_days[order], observed_prices[order]
+
+        index = np.searchsorted(observed_days, days, side="right") - 1
+        return np.where(index >= 0, observed_prices[np.clip(index, 0, None)], np.nan)
@@ -0,0 +1,152 @@
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import date
+from io import BytesIO
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from src.media.bucket import MediaBucket
+from src.utils.log import Logger
+
+log = Logger(__name__).get_logger()
+
+
+@dataclass
+class DailyPriceBars:
+    """
+    Daily Price Bars
+
+    Columnar daily OHLC price bars of a security, sorted by date with at most
+    one bar per date. Dates are stored as `datetime64[D]` and prices as
+    `float64` so whole series can be searched and sliced without Python
+    loops.
+    """
+
+    COLUMNS = ["dates", "open", "high", "low", "close"]
+
+    dates: np.ndarray
+    open: np.ndarray
+    high: np.ndarray
+    low: np.ndarray
+    close: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.dates)
+
+    def append_price(self, day: date, price: float) -> "DailyPriceBars":
+        """
+        Add a price observed on the given day to the bars.
+
+        A price on the date of the last bar updates its high, low, and close,
+        and a price on a later date starts a new bar. Prices older than the
+        last bar are ignored as the bars are append-only.
+        """
+        day = np.datetime64(day, "D")
+        if len(self) and day < self.dates[-1]:
+            log.warning(f"Ignoring price on {day} older than the last bar")
+            return self
+        if len(self) and day == self.dates[-1]:
+            self.high[-1] = max(self.high[-1], price)
+            self.low[-1] = min(self.low[-1], price)
+            self.close[-1] = price
+            return self
+        return DailyPriceBars(
+            dates=np.append(self.dates, day),
+            open=np.append(self.open, price),
+            high=np.append(self.high, price),
+            low=np.append(self.low, price),
+            close=np.append(self.close, price),
+        )
+
+    def to_bytes(self) -> bytes:
+        stream = BytesIO()
+        np.savez_compressed(
+            stream, **{column: getattr(self, column) for column in self.COLUMNS}
+        )
+        return stream.getvalue()
+
+    @classmethod
+    def from_bytes(cls, contents: bytes) -> "DailyPriceBars":
+        with np.load(BytesIO(contents), allow_pickle=False) as arrays:
+            return DailyPriceBars(**{column: arrays[column] for column in cls.COLUMNS})
+
+    @classmethod
+    def empty(cls) -> "DailyPriceBars":
+        return DailyPriceBars(
+            dates=np.array([], dtype="datetime64[D]"),
+            open=np.array([], dtype=np.float64),
+            high=np.array([], dtype=np.float64),
+            low=np.array([], dtype=np.float64),
+            close=np.array([], dtype=np.float64),
+        )
+
+
+@dataclass
+class PriceHistoryStore:
+    """
+    Price History Store
+
+    Stores the daily price bars of each security as a compressed NumPy
+    archive in the private folder of the media bucket. Bars are appended by
+    the UpdateSecurityPrices workflow from the prices it refreshes, so the
+    history grows without any additional Polygon requests.
+    """
+
+    KEY_FORMAT = "prices/daily/{security_id}.npz"
+
+    media_bucket: MediaBucket
+    max_concurrent_requests: int = 8
+
+    def __post_init__(self) -> None:
+        log.debug("Initializing Price History Store")
+
+    def get_bars(self, security_id: str) -> DailyPriceBars:
+        contents = self.media_bucket.get_private_bytes(
+            PriceHistoryStore._get_key(security_id)
+        )
+        if contents is None:
+            log.debug(f"No price history found for security '{security_id}'")
+            return DailyPriceBars.empty()
+        return DailyPriceBars.from_bytes(contents)
+
+    def get_bars_for_securities(
+        self, security_ids: List[str]
+    ) -> Dict[str, DailyPriceBars]:
+        log.info(f"Getting price history for {len(security_ids)} securities")
+        if not security_ids:
+            return {}
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_concurrent_requests, len(security_ids))
+        ) as executor:
+            return dict(zip(security_ids, executor.map(self.get_bars, security_ids)))
+
+    def put_bars(self, security_id: str, bars: DailyPriceBars) -> None:
+        self.media_bucket.upload_private_contents(
+            PriceHistoryStore._get_key(security_id), bars.to_bytes()
+        )
+
+    def append_prices(self, prices: List[Tuple[str, date, float]]) -> None:
+        """
+        Append prices to the price history of their securities.
+
+        Args:
+            prices: The security ID, day, and price of each observed price, at most one per security.
+        """
+        log.info(f"Appending {len(prices)} prices to price history")
+        if not prices:
+            return
+
+        def append(security_id: str, day: date, price: float) -> None:
+            self.put_bars(
+                security_id, self.get_bars(security_id).append_price(day, price)
+            )
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_concurrent_requests, len(prices))
+        ) as executor:
+            list(executor.map(lambda args: append(*args), prices))
+
+    @staticmethod
+    def _get_key(security_id: str) -> str:
+        return PriceHistoryStore.KEY_FORMAT.format(security_id=security_id)
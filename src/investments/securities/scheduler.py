@@ -0,0 +1,142 @@
+import math
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Dict, List, Tuple
+
+from src.config import CONFIG, PriceRefreshConfig
+from src.database.client import WalterDB
+from src.database.securities.exchanges import (
+    MarketExchange,
+    get_market_exchange_by_key_name,
+)
+from src.database.securities.models import Security, Stock
+from src.utils.log import Logger
+from src.utils.ttl_cache import TTLCache
+
+log = Logger(__name__).get_logger()
+
+CRYPTO_MARKET = MarketExchange(name="Crypto", key_name="crypto")
+"""(MarketExchange): The crypto market, which trades 24/7."""
+
+
+HOLDER_COUNTS_KEY = "holder_counts"
+"""(str): The key of the security holder counts in the holder index."""
+
+HOLDER_INDEX: TTLCache[Dict[str, int]] = TTLCache()
+"""(TTLCache[Dict[str, int]]): Number of holdings of each security, scanned from the Holdings table at most once per `holder_counts_ttl_minutes` in each process."""
+
+
+@dataclass
+class PriceRefreshScheduler:
+    """
+    Price Refresh Scheduler
+
+    Decides which securities are due for a price refresh and when each
+    refreshed price expires. Refresh intervals shrink with the number of
+    holders of a security and with the size of its last price move, and
+    securities without holders are refreshed rarely. Stock prices are not
+    refreshed while their exchange is closed: the last refresh of a session
+    is scheduled shortly after the close to capture the closing price and
+    the next one at the following open. Crypto trades 24/7 and is refreshed
+    around the clock.
+
+    Due securities are returned in priority order, most held first, and
+    capped at `max_refreshes_per_run` so a single run stays within the
+    Polygon rate limit. Deferred securities remain due for the next run.
+    """
+
+    walter_db: WalterDB
+    config: PriceRefreshConfig = field(default_factory=lambda: CONFIG.price_refresh)
+    holder_index: TTLCache[Dict[str, int]] = field(default_factory=lambda: HOLDER_INDEX)
+
+    def __post_init__(self) -> None:
+        log.debug("Initializing Price Refresh Scheduler")
+
+    def get_due_securities(
+        self, securities: List[Security], now: datetime
+    ) -> Tuple[List[Security], List[Security]]:
+        """
+        Get the securities due for a price refresh.
+
+        Args:
+            securities: The securities to schedule.
+            now: The current time.
+
+        Returns:
+            The due securities to refresh in priority order and the due
+            securities deferred to a later run.
+        """
+        due_securities = [
+            security for security in securities if security.price_expires_at <= now
+        ]
+        due_securities.sort(
+            key=lambda security: (
+                -self.get_num_holders(security.security_id, now),
+                security.price_expires_at,
+            )
+        )
+        max_refreshes = self.config.max_refreshes_per_run
+        log.info(
+            f"{len(due_securities)} of {len(securities)} securities are due for a price refresh"
+        )
+        return due_securities[:max_refreshes], due_securities[max_refreshes:]
+
+    def get_price_expiry(
+        self, security: Security, previous_price: float, now: datetime
+    ) -> datetime:
+        """
+        Get the expiry of a security price refreshed at the given time.
+
+        Args:
+            security: The security with its refreshed price.
+            previous_price: The price of the security before the refresh.
+            now: The time of the refresh.
+
+        Returns:
+            The time at which the refreshed price expires.
+        """
+        price_change = (
+            abs(security.current_price - previous_price) / previous_price
+            if previous_price
+            else 0.0
+        )
+        expires_at = now + self.get_refresh_interval(
+            self.get_num_holders(security.security_id, now), price_change
+        )
+
+        calendar = self._get_market_exchange(security).calendar
+        if calendar is None:
+            return expires_at
+        if not calendar.is_open(now):
+            return calendar.get_next_open(now)
+        return min(
+            expires_at,
+            calendar.get_next_close(now)
+            + timedelta(minutes=self.config.market_close_delay_minutes),
+        )
+
+    def get_refresh_interval(self, num_holders: int, price_change: float) -> timedelta:
+        if num_holders == 0:
+            return timedelta(minutes=self.config.unheld_refresh_minutes)
+        minutes = self.config.base_refresh_minutes / (1 + math.log2(num_holders))
+        minutes /= 1 + price_change / self.config.volatility_threshold
+        return timedelta(minutes=max(self.config.min_refresh_minutes, minutes))
+
+    def get_num_holders(self, security_id: str, now: datetime) -> int:
+        with self.holder_index.lock:
+            holder_counts = self.holder_index.get(HOLDER_COUNTS_KEY, now)
+            if holder_counts is None:
+                log.info("Refreshing security holder index")
+                holder_counts = self.walter_db.get_security_holder_counts()
+                self.holder_index.put(
+                    HOLDER_COUNTS_KEY,
+                    holder_counts,
+                    now + timedelta(minutes=self.config.holder_counts_ttl_minutes),
+                )
+        return holder_counts.get(security_id, 0)
+
+    @staticmethod
+    def _get_market_exchange(security: Security) -> MarketExchange:
+        if isinstance(security, Stock):
+            return get_market_exchange_by_key_name(security.exchange)
+        return CRYPTO_MARKET
@@ -45,20 +45,38 @@ class MediaBucket:
     def does_private_file_exist(self, key: str) -> bool:
         return self._check_if_file_exists(key, MediaPrivacyType.PRIVATE)
 
-    def upload_public_contents(self, name: str, contents: str) -> str:
-        return self._stream_contents(name, contents, MediaPrivacyType.PUBLIC)
+    def get_private_contents(self, name: str) -> Optional[str]:
+        full_key: str = MediaBucket._get_key_name(name, MediaPrivacyType.PRIVATE)
+        return self.client.get_object(self.bucket, full_key)
 
-    def upload_private_contents(self, name: str, contents: str) -> None:
+    def get_private_bytes(self, name: str) -> Optional[bytes]:
+        full_key: str = MediaBucket._get_key_name(name, MediaPrivacyType.PRIVATE)
+        return self.client.get_object_bytes(self.bucket, full_key)
+
+    def upload_public_contents(
+        self, name: str, contents: str, content_type: Optional[str] = None
+    ) -> str:
+        return self._stream_contents(
+            name, contents, MediaPrivacyType.PUBLIC, content_type
+        )
+
+    def upload_private_contents(self, name: str, contents: str | bytes) -> None:
         return self._stream_contents(name, contents, MediaPrivacyType.PRIVATE)
 
     def _stream_contents(
-        self, key: str, contents: str, privacy_type: MediaPrivacyType
+        self,
+        key: str,
+        contents: str | bytes,
+        privacy_type: MediaPrivacyType,
+        content_type: Optional[str] = None,
     ) -> str:
         full_key: str = MediaBucket._get_key_name(key, privacy_type)
         LOG.debug(
             f"Uploading '{privacy_type.value}' file '{key}' to bucket '{self.bucket}'"
         )
-        s3_uri: str = self.client.put_object(self.bucket, full_key, contents)
+        s3_uri: str = self.client.put_object(
+            self.bucket, full_key, contents, content_type
+        )
         LOG.debug(
             f"Uploaded '{privacy_type.value}' file '{key}' to bucket '{self.bucket}'"
         )
@@ -69,7 +87,7 @@ class MediaBucket:
         LOG.debug(
             f"Checking if '{privacy_type.value}' file with key '{full_key}' exists in bucket '{self.bucket}'"
         )
-        if self.client.does_object_exist(self.bucket, key):
+        if self.client.does_object_exist(self.bucket, full_key):
             LOG.debug(
                 f"'{privacy_type.value}' file with key '{full_key}' exists in bucket '{self.bucket}'"
             )
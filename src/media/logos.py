@@ -0,0 +1,166 @@
+import json
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Set
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from src.media.bucket import MediaBucket
+from src.utils.log import Logger
+
+LOG = Logger(__name__).get_logger()
+
+KNOWN_LOGO_KEYS: Set[str] = set()
+"""(Set[str]): Logo keys known to exist in the media bucket, loaded from the manifest once per process. Logos are never deleted, so keys never expire."""
+
+
+@dataclass
+class MerchantLogoCache:
+    """
+    Merchant Logo Cache
+
+    This class ensures Plaid merchant logos are present in the public media
+    bucket so they can be served from the CDN. Known logos are tracked in a
+    process-level index backed by a manifest object in the media bucket,
+    so logos seen by any previous invocation are resolved without an S3
+    HEAD request. Logo URLs are deduplicated per batch and missing logos are
+    downloaded concurrently through a pooled HTTP session with timeouts.
+
+    The manifest is merged with its latest contents before each write, so
+    concurrent syncs only risk dropping an entry, which costs a HEAD request
+    on a later sync rather than a duplicate download.
+    """
+
+    LOGOS_FOLDER = "logos"
+    MANIFEST_KEY = "manifests/logos.json"
+    MAX_WORKERS = 8
+    CONNECT_TIMEOUT_SECONDS = 2
+    READ_TIMEOUT_SECONDS = 5
+
+    media_bucket: MediaBucket
+    known_logo_keys: Set[str] = field(default_factory=lambda: KNOWN_LOGO_KEYS)
+
+    session: requests.Session = None  # lazy init
+    manifest_loaded: bool = False
+
+    def __post_init__(self) -> None:
+        LOG.debug("Creating MerchantLogoCache")
+
+    def get_logos(self, logo_urls: Iterable[Optional[str]]) -> Dict[str, Optional[str]]:
+        """
+        Get the media bucket S3 URIs of the given merchant logos.
+
+        Logos missing from the media bucket are downloaded and uploaded before
+        returning. Logos that cannot be resolved map to None so callers can
+        fall back to a default logo rather than failing the sync.
+
+        Args:
+            logo_urls: The merchant logo URLs, duplicates and nulls are ignored.
+
+        Returns:
+            The mapping of logo URL to S3 URI, or None if unavailable.
+        """
+        unique_urls = {url for url in logo_urls if url}
+        if not unique_urls:
+            return {}
+
+        self._load_manifest()
+
+        logo_keys = {url: MerchantLogoCache._get_logo_key(url) for url in unique_urls}
+        unknown_urls = [
+            url for url, key in logo_keys.items() if key not in self.known_logo_keys
+        ]
+        LOG.info(
+            f"Resolving {len(unique_urls)} merchant logos, {len(unknown_urls)} not in known logo index"
+        )
+
+        new_keys: List[str] = []
+        if unknown_urls:
+            with ThreadPoolExecutor(
+                max_workers=min(self.MAX_WORKERS, len(unknown_urls))
+            ) as executor:
+                results = executor.map(
+                    lambda url: self._ingest_logo(url, logo_keys[url]), unknown_urls
+                )
+                for url, available in zip(unknown_urls, results):
+                    if available:
+                        self.known_logo_keys.add(logo_keys[url])
+                        new_keys.append(logo_keys[url])
+                    else:
+                        logo_keys[url] = None
+            if new_keys:
+                self._save_manifest()
+
+        return {
+            url: self.media_bucket.get_public_s3_uri(key) if key else None
+            for url, key in logo_keys.items()
+        }
+
+    def _ingest_logo(self, logo_url: str, logo_key: str) -> bool:
+        """Upload the logo if missing and return whether it is available in the media bucket."""
+        try:
+            logo_exists, _ = self.media_bucket.does_public_file_exist(logo_key)
+            if logo_exists:
+                return True
+
+            LOG.debug(f"Logo '{logo_key}' does not exist in media bucket, uploading...")
+            response = self._get_session().get(
+                logo_url,
+                timeout=(self.CONNECT_TIMEOUT_SECONDS, self.READ_TIMEOUT_SECONDS),
+            )
+            response.raise_for_status()
+            self.media_bucket.upload_public_contents(
+                name=logo_key,
+                contents=response.content,
+                content_type=response.headers.get("Content-Type"),
+            )
+            LOG.debug(f"Logo '{logo_key}' uploaded successfully!")
+            return True
+        except Exception as exception:
+            LOG.warning(f"Unable to ingest merchant logo '{logo_url}': {exception}")
+            return False
+
+    def _get_session(self) -> requests.Session:
+        if self.session is None:
+            adapter = HTTPAdapter(
+                pool_connections=self.MAX_WORKERS, pool_maxsize=self.MAX_WORKERS
+            )
+            self.session = requests.Session()
+            self.session.mount("https://", adapter)
+            self.session.mount("http://", adapter)
+        return self.session
+
+    def _load_manifest(self) -> None:
+        if self.manifest_loaded:
+            return
+        self.known_logo_keys.update(self._read_manifest())
+        self.manifest_loaded = True
+        LOG.debug(f"Loaded {len(self.known_logo_keys)} known merchant logos")
+
+    def _save_manifest(self) -> None:
+        # merge with latest manifest to preserve logos added by other invocations
+        self.known_logo_keys.update(self._read_manifest())
+        LOG.debug(f"Saving {len(self.known_logo_keys)} known merchant logos")
+        try:
+            self.media_bucket.upload_private_contents(
+                name=self.MANIFEST_KEY,
+                contents=json.dumps(sorted(self.known_logo_keys)),
+            )
+        except Exception as exception:
+            LOG.warning(f"Unable to save merchant logo manifest: {exception}")
+
+    def _read_manifest(self) -> List[str]:
+        try:
+            contents = self.media_bucket.get_private_contents(self.MANIFEST_KEY)
+        except Exception as exception:
+            LOG.warning(f"Unable to read merchant logo manifest: {exception}")
+            return []
+        if contents is None:
+            return []
+        return json.loads(contents)
+
+    @staticmethod
+    def _get_logo_key(logo_url: str) -> str:
+        logo_name = logo_url.split("/")[-1]
+        return f"{MerchantLogoCache.LOGOS_FOLDER}/{logo_name}"
@@ -165,6 +165,7 @@ class PlaidClient:
             response = self.client.transactions_sync(TransactionsSyncRequest(**kwargs))
 
             LOG.info("Getting newly added transactions...")
+            self.transaction_converter.prefetch_merchant_logos(response["added"])
             added_transactions = []
             for plaid_transaction in response["added"]:
                 transaction = self.transaction_converter.convert(
@@ -172,6 +173,12 @@ class PlaidClient:
                 )
                 added_transactions.append(transaction)
 
+            # resolve existing transactions for only the modified and removed
+            # transactions in this page rather than entire account histories
+            self.transaction_converter.resolve_existing_transactions(
+                response["modified"] + response["removed"]
+            )
+
             LOG.info("Getting modified transactions...")
             modified_transactions = []
             for plaid_transaction in response["modified"]:
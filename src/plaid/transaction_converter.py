@@ -2,8 +2,6 @@ from dataclasses import dataclass
 from enum import Enum
 from typing import Dict, List, Optional, Tuple
 
-import requests
-
 from src.ai.mlp.expenses import ExpenseCategorizerMLP
 from src.database.accounts.models import Account
 from src.database.client import WalterDB
@@ -14,6 +12,7 @@ from src.database.transactions.models import (
     TransactionType,
 )
 from src.media.bucket import MediaBucket
+from src.media.logos import MerchantLogoCache
 from src.utils.log import Logger
 
 LOG = Logger(__name__).get_logger()
@@ -44,12 +43,51 @@ class TransactionConverter:
     media_bucket: MediaBucket
 
     plaid_account_cache: Dict[str, Account] = None
+    plaid_transaction_keys: Dict[str, Tuple[str, str]] = None
     plaid_transaction_cache: Dict[str, Transaction] = None
+    merchant_logo_cache: MerchantLogoCache = None
+    merchant_logo_s3_uris: Dict[str, Optional[str]] = None
 
     def __post_init__(self) -> None:
         LOG.debug("Initializing Transaction Converter")
         self.plaid_account_cache = {}
+        self.plaid_transaction_keys = {}
+        self.plaid_transaction_cache = {}
+        self.merchant_logo_cache = MerchantLogoCache(self.media_bucket)
+        self.merchant_logo_s3_uris = {}
+
+    def resolve_existing_transactions(self, plaid_transactions: List[dict]) -> None:
+        """
+        Resolve the WalterDB transactions of the given modified or removed Plaid transactions.
+
+        Only the Plaid transaction IDs in the given page are looked up via the
+        Plaid transaction ID index and their transactions are fetched in a
+        single batch. Resolved transactions are cached for the current page
+        only, while the compact Plaid transaction ID to primary key map is
+        kept for the lifetime of the converter.
+        """
         self.plaid_transaction_cache = {}
+        self._resolve_existing_transactions(
+            [
+                plaid_transaction["transaction_id"]
+                for plaid_transaction in plaid_transactions
+            ]
+        )
+
+    def prefetch_merchant_logos(self, plaid_transactions: List[dict]) -> None:
+        """
+        Ensure the merchant logos of the given Plaid transactions are in the media bucket.
+
+        Logo URLs are deduplicated across the given transactions and missing
+        logos are ingested concurrently, so converting each transaction
+        afterward resolves its logo without any network calls.
+        """
+        logo_urls = [
+            plaid_transaction.get("logo_url")
+            for plaid_transaction in plaid_transactions
+            if plaid_transaction.get("logo_url") not in self.merchant_logo_s3_uris
+        ]
+        self.merchant_logo_s3_uris.update(self.merchant_logo_cache.get_logos(logo_urls))
 
     def convert(
         self, plaid_transaction: dict, conversion_type: TransactionConversionType
@@ -84,10 +122,16 @@ class TransactionConverter:
                     account, plaid_transaction
                 )
 
-                # update transaction fields
-                transaction.transaction_amount = plaid_transaction["amount"]
-                transaction.merchant_name = self._get_merchant_name(plaid_transaction)
-                transaction.transaction_date = plaid_transaction["date"]
+                # update transaction fields on a copy, the cached transaction
+                # is replaced rather than modified in place
+                transaction = transaction.replace(
+                    transaction_amount=plaid_transaction["amount"],
+                    merchant_name=self._get_merchant_name(plaid_transaction),
+                    transaction_date=plaid_transaction["date"],
+                )
+                self.plaid_transaction_cache[transaction.plaid_transaction_id] = (
+                    transaction
+                )
 
                 return transaction
             case TransactionConversionType.DELETED:
@@ -121,25 +165,31 @@ class TransactionConverter:
         # write plaid_account_id to account_id mapping to cache
         self.plaid_account_cache[plaid_account_id] = account
 
-        # get transactions for account only when first encountering the account from the transaction
-        self._cache_account_transactions(account)
-
         return account
 
-    def _cache_account_transactions(self, account: Account) -> List[Transaction]:
-        LOG.debug(
-            f"Getting transactions for account '{account.account_id}' to cache for Plaid transaction ID mappings"
-        )
-        transactions: List[Transaction] = self.db.get_account_transactions(
-            account.account_id
-        )
-        # add plaid transaction id to transaction mapping to cache
-        for transaction in transactions:
+    def _resolve_existing_transactions(self, plaid_transaction_ids: List[str]) -> None:
+        plaid_transaction_ids = list(dict.fromkeys(plaid_transaction_ids))
+        unknown_ids = [
+            plaid_transaction_id
+            for plaid_transaction_id in plaid_transaction_ids
+            if plaid_transaction_id not in self.plaid_transaction_keys
+        ]
+        if unknown_ids:
+            self.plaid_transaction_keys.update(
+                self.db.get_transaction_keys_by_plaid_transaction_ids(unknown_ids)
+            )
+
+        keys = [
+            self.plaid_transaction_keys[plaid_transaction_id]
+            for plaid_transaction_id in plaid_transaction_ids
+            if plaid_transaction_id in self.plaid_transaction_keys
+        ]
+        if not keys:
+            return
+
+        LOG.debug(f"Getting {len(keys)} existing transactions for Plaid transactions")
+        for transaction in self.db.get_transactions_by_keys(keys):
             self.plaid_transaction_cache[transaction.plaid_transaction_id] = transaction
-        LOG.debug(
-            f"Found {len(transactions)} transactions for account '{account.account_id}'"
-        )
-        return transactions
 
     def _create_new_transaction(
         self, account: Account, plaid_transaction: dict, merchant_logo_s3_uri: str
@@ -177,6 +227,11 @@ class TransactionConverter:
     ) -> Transaction:
         plaid_transaction_id: str = plaid_transaction["transaction_id"]
 
+        # transactions are usually resolved for the entire sync page, otherwise
+        # resolve the single transaction via the Plaid transaction ID index
+        if plaid_transaction_id not in self.plaid_transaction_cache:
+            self._resolve_existing_transactions([plaid_transaction_id])
+
         if plaid_transaction_id not in self.plaid_transaction_cache:
             raise ValueError(
                 "Transaction ID is required to update or delete a transaction"
@@ -210,44 +265,15 @@ class TransactionConverter:
     def _upload_merchant_logo_if_not_present(
         self, plaid_transaction: dict
     ) -> Optional[str]:
-        LOG.debug(
-            "Attempting to upload new Plaid merchant logo to media bucket if not already present..."
-        )
-
         # logos can be null, so just skip upload if not present and transaction will use default logo
         logo_url: Optional[str] = plaid_transaction.get("logo_url", None)
         if logo_url is None:
             LOG.debug("Merchant logo URL is null, skipping upload")
             return None
 
-        LOG.debug(
-            f"Merchant logo URL is not null, checking media bucket for logo: '{logo_url}'"
-        )
-
-        logo_name = logo_url.split("/")[-1]
-        logo_key = f"logos/{logo_name}"
-        get_logo_resp: Tuple[bool, Optional[str]] = (
-            self.media_bucket.does_public_file_exist(logo_key)
-        )
-        logo_exists, s3_uri = get_logo_resp
-
-        if logo_exists:
-            LOG.debug(
-                f"Logo '{logo_name}' already exists in media bucket, skipping upload"
-            )
-            return s3_uri
-
-        LOG.debug(f"Logo '{logo_name}' does not exist in media bucket, uploading...")
-
-        resp = requests.get(logo_url)
-        resp.raise_for_status()
-        body = resp.content
-
-        s3_uri = self.media_bucket.upload_public_contents(
-            name=logo_key,
-            contents=body,
-        )
-
-        LOG.debug(f"Logo '{logo_name}' uploaded successfully!")
+        # logos are usually prefetched for the entire sync page, otherwise
+        # ingest the single logo through the merchant logo cache
+        if logo_url not in self.merchant_logo_s3_uris:
+            self.prefetch_merchant_logos([plaid_transaction])
 
-        return s3_uri
+        return self.merchant_logo_s3_uris.get(logo_url)
@@ -0,0 +1,122 @@
+import json
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta, timezone
+from typing import Any, Optional, Tuple
+
+from src.database.client import WalterDB
+from src.utils.log import Logger
+from src.utils.ttl_cache import TTLCache
+
+log = Logger(__name__).get_logger()
+
+
+@dataclass
+class PolygonCacheStats:
+    """
+    Polygon Cache Stats
+
+    Counts of Polygon cache lookups served from memory, served from the
+    DDB cache table, and missed (i.e. requiring a Polygon request).
+    """
+
+    memory_hits: int = 0
+    ddb_hits: int = 0
+    misses: int = 0
+
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.ddb_hits
+
+    def hit_rate(self) -> Optional[float]:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else None
+
+    def __sub__(self, other: "PolygonCacheStats") -> "PolygonCacheStats":
+        return PolygonCacheStats(
+            memory_hits=self.memory_hits - other.memory_hits,
+            ddb_hits=self.ddb_hits - other.ddb_hits,
+            misses=self.misses - other.misses,
+        )
+
+    def to_dict(self) -> dict:
+        return {
+            "memory_hits": self.memory_hits,
+            "ddb_hits": self.ddb_hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate(),
+        }
+
+
+CACHE_ENTRIES: TTLCache[Any] = TTLCache()
+"""(TTLCache[Any]): Polygon responses cached in memory, shared by the Polygon clients and price fetch threads of the process."""
+
+CACHE_STATS = PolygonCacheStats()
+"""(PolygonCacheStats): Lookup counts of the in-memory Polygon responses, guarded by their lock."""
+
+
+@dataclass
+class PolygonCache:
+    """
+    Polygon Cache
+
+    TTL cache of Polygon responses, e.g. latest prices and ticker details.
+    Entries are kept in a process-level in-memory cache shared by all
+    Polygon clients and threads in the process. If a WalterDB is given,
+    entries are also written to the DDB Cache table so they are shared
+    across processes, and in-memory misses fall back to the table.
+
+    Values must be JSON serializable. Cache failures are logged and
+    treated as misses so the cache can never fail a Polygon request.
+    """
+
+    walter_db: Optional[WalterDB] = None
+    entries: TTLCache[Any] = field(default_factory=lambda: CACHE_ENTRIES)
+    stats: PolygonCacheStats = field(default_factory=lambda: CACHE_STATS)
+
+    def __post_init__(self) -> None:
+        log.debug(
+            f"Creating PolygonCache (DDB cache enabled: {self.walter_db is not None})"
+        )
+
+    def get(self, cache_key: str) -> Optional[Any]:
+        with self.entries.lock:
+            value = self.entries.get(cache_key)
+            if value is not None:
+                self.stats.memory_hits += 1
+                return value
+
+        entry = self._get_ddb_entry(cache_key)
+
+        with self.entries.lock:
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            self.stats.ddb_hits += 1
+            self.entries.put(cache_key, *entry)
+            return entry[0]
+
+    def put(self, cache_key: str, value: Any, ttl_seconds: int) -> None:
+        expires_at = datetime.now(timezone.utc) + timedelta(seconds=ttl_seconds)
+        self.entries.put(cache_key, value, expires_at)
+        if self.walter_db is not None:
+            try:
+                self.walter_db.put_cache_entry(cache_key, json.dumps(value), expires_at)
+            except Exception as exception:
+                log.warning(f"Unable to put cache entry '{cache_key}': {exception}")
+
+    def get_stats(self) -> PolygonCacheStats:
+        with self.entries.lock:
+            return replace(self.stats)
+
+    def _get_ddb_entry(self, cache_key: str) -> Optional[Tuple[Any, datetime]]:
+        if self.walter_db is None:
+            return None
+        try:
+            entry = self.walter_db.get_cache_entry(cache_key)
+        except Exception as exception:
+            log.warning(f"Unable to get cache entry '{cache_key}': {exception}")
+            return None
+        if entry is None:
+            return None
+        value, expires_at = entry
+        return json.loads(value), expires_at
@@ -1,23 +1,52 @@
-from dataclasses import dataclass
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
 from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
 
 from polygon import RESTClient
-from polygon.rest.models import TickerDetails
+from polygon.rest.models import SnapshotMarketType, TickerDetails, TickerSnapshot
 from src.aws.secretsmanager.client import WalterSecretsManagerClient
+from src.config import CONFIG
 from src.database.securities.models import SecurityType
 from src.environment import Domain
+from src.polygon.cache import PolygonCache, PolygonCacheStats
 from src.utils.log import Logger
+from src.utils.rate_limiter import TokenBucketRateLimiter
 
 log = Logger(__name__).get_logger()
 
+RATE_LIMITER = TokenBucketRateLimiter.per_minute(CONFIG.polygon.requests_per_minute)
+"""(TokenBucketRateLimiter): Process-level Polygon rate limiter shared by all Polygon clients and threads."""
+
+SecurityKey = Tuple[str, SecurityType]
+"""(SecurityKey): A security identified by its (ticker, security type)."""
+
 
 @dataclass
 class PolygonClient:
     """
     Polygon Client (https://polygon.io/)
+
+    Latest prices and ticker details are cached in a TTL cache shared by
+    all Polygon clients in the process (and optionally across processes
+    via DDB), and all requests are throttled by a shared rate limiter.
     """
 
+    PRICE_LOOKBACK = {
+        # cover weekends and market holidays for stocks
+        SecurityType.STOCK: timedelta(days=5),
+        SecurityType.CRYPTO: timedelta(days=1),
+    }
+
     walter_sm: WalterSecretsManagerClient
+    cache: PolygonCache = field(default_factory=PolygonCache)
+    rate_limiter: TokenBucketRateLimiter = field(default_factory=lambda: RATE_LIMITER)
+    max_concurrent_requests: int = CONFIG.polygon.max_concurrent_requests
+    use_snapshots: bool = CONFIG.polygon.use_snapshots
+    price_cache_ttl_seconds: int = CONFIG.polygon.price_cache_ttl_seconds
+    ticker_details_cache_ttl_seconds: int = (
+        CONFIG.polygon.ticker_details_cache_ttl_seconds
+    )
     client: RESTClient = None  # lazy init
 
     def __post_init__(self) -> None:
@@ -26,45 +55,233 @@ class PolygonClient:
     def get_ticker_info(
         self, security_ticker: str, security_type: SecurityType
     ) -> TickerDetails:
-        self._lazily_load_client()
-
         log.info(f"Getting ticker info for {security_ticker} ({security_type.value})")
         ticker = PolygonClient._get_ticker(security_ticker, security_type)
         log.debug(f"Ticker: {ticker}")
 
+        cache_key = f"ticker_details#{ticker}"
+        cached_details = self.cache.get(cache_key)
+        if cached_details is not None:
+            log.debug(f"Ticker info for {ticker} found in cache")
+            return TickerDetails(**cached_details)
+
+        self._lazily_load_client()
+        self.rate_limiter.acquire()
         details = self.client.get_ticker_details(
             ticker,
         )
 
+        self.cache.put(
+            cache_key,
+            PolygonClient._get_cacheable_details(details),
+            self.ticker_details_cache_ttl_seconds,
+        )
+
         return details
 
     def get_latest_price(
         self,
         security_ticker: str,
         security_type: SecurityType,
-        start_date: datetime = datetime.now(timezone.utc) - timedelta(days=7),
-        end_date: datetime = datetime.now(timezone.utc),
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
     ) -> float:
-        self._lazily_load_client()
+        """
+        Get the latest price of the security.
 
+        The latest price is the open of the most recent hourly bar between
+        the given dates. If no dates are given, the shortest window covering
+        the most recent bar is requested as of now and the price is cached.
+        """
         ticker = PolygonClient._get_ticker(security_ticker, security_type)
 
-        aggs = []
-        for a in self.client.list_aggs(
-            ticker,
-            1,
-            "hour",
-            start_date,
-            end_date,
-            adjusted="true",
-            sort="asc",
-        ):
-            aggs.append(a)
+        # explicit windows are historical queries and are not cached
+        if start_date is not None or end_date is not None:
+            return self._fetch_latest_price(ticker, security_type, start_date, end_date)
+
+        cached_price = self.cache.get(PolygonClient._get_price_cache_key(ticker))
+        if cached_price is not None:
+            log.debug(f"Latest price for {ticker} found in cache")
+            return cached_price
+
+        price = self._fetch_latest_price(ticker, security_type)
+        self.cache.put(
+            PolygonClient._get_price_cache_key(ticker),
+            price,
+            self.price_cache_ttl_seconds,
+        )
+        return price
+
+    def get_cache_stats(self) -> PolygonCacheStats:
+        return self.cache.get_stats()
+
+    def get_latest_prices(
+        self, securities: List[SecurityKey]
+    ) -> Dict[SecurityKey, Optional[float]]:
+        """
+        Get the latest prices of the given securities.
+
+        Cached prices are returned without a request. If snapshots are
+        enabled, uncached prices are fetched with one bulk snapshot request
+        per market. Remaining prices are fetched concurrently, one
+        request per security, throttled by the shared rate limiter. Prices
+        that cannot be fetched map to None so a single bad ticker does not
+        fail the whole batch.
+
+        Args:
+            securities: The (ticker, security type) of the securities.
+
+        Returns:
+            The mapping of (ticker, security type) to latest price, or None.
+        """
+        securities = list(dict.fromkeys(securities))
+        prices: Dict[SecurityKey, Optional[float]] = {}
+        for security in securities:
+            cached_price = self.cache.get(
+                PolygonClient._get_price_cache_key(PolygonClient._get_ticker(*security))
+            )
+            if cached_price is not None:
+                prices[security] = cached_price
+
+        uncached = [security for security in securities if security not in prices]
+        if self.use_snapshots and uncached:
+            self._lazily_load_client()
+            prices.update(self._get_snapshot_prices(uncached))
+
+        remaining = [
+            security for security in securities if prices.get(security) is None
+        ]
+        log.info(
+            f"Getting latest prices for {len(remaining)} of {len(securities)} securities individually"
+        )
+        if remaining:
+            self._lazily_load_client()
+            with ThreadPoolExecutor(
+                max_workers=min(self.max_concurrent_requests, len(remaining))
+            ) as executor:
+                for security, price in zip(
+                    remaining,
+                    executor.map(
+                        lambda security: self._get_price(*security), remaining
+                    ),
+                ):
+                    prices[security] = price
+
+        return prices
+
+    def _get_price(
+        self, security_ticker: str, security_type: SecurityType
+    ) -> Optional[float]:
+        ticker = PolygonClient._get_ticker(security_ticker, security_type)
+        try:
+            price = self._fetch_latest_price(ticker, security_type)
+        except Exception as exception:
+            log.warning(
+                f"Unable to get latest price for {security_ticker} ({security_type.value}): {exception}"
+            )
+            return None
+        self.cache.put(
+            PolygonClient._get_price_cache_key(ticker),
+            price,
+            self.price_cache_ttl_seconds,
+        )
+        return price
+
+    def _fetch_latest_price(
+        self,
+        ticker: str,
+        security_type: SecurityType,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
+    ) -> float:
+        if end_date is None:
+            end_date = datetime.now(timezone.utc)
+        if start_date is None:
+            start_date = end_date - PolygonClient.PRICE_LOOKBACK[security_type]
+
+        self._lazily_load_client()
+        self.rate_limiter.acquire()
+
+        # request only the most recent bar
+        latest_agg = next(
+            iter(
+                self.client.list_aggs(
+                    ticker,
+                    1,
+                    "hour",
+                    start_date,
+                    end_date,
+                    adjusted="true",
+                    sort="desc",
+                    limit=1,
+                )
+            ),
+            None,
+        )
+        if latest_agg is None:
+            raise ValueError(f"No price data found for {ticker}!")
 
         # TODO: Upgrade to Polygon premium and use latest trade API for price estimates (more accurate)
 
         # return the latest open price as surrogate for latest price
-        return aggs[-1].open
+        return latest_agg.open
+
+    def _get_snapshot_prices(
+        self, securities: List[SecurityKey]
+    ) -> Dict[SecurityKey, Optional[float]]:
+        prices = {}
+        for security_type, market_type in [
+            (SecurityType.STOCK, SnapshotMarketType.STOCKS),
+            (SecurityType.CRYPTO, SnapshotMarketType.CRYPTO),
+        ]:
+            tickers = {
+                PolygonClient._get_ticker(ticker, ticker_type): (ticker, ticker_type)
+                for ticker, ticker_type in securities
+                if ticker_type == security_type
+            }
+            if not tickers:
+                continue
+            log.info(f"Getting {market_type.value} snapshot for {len(tickers)} tickers")
+            try:
+                self.rate_limiter.acquire()
+                snapshots = self.client.get_snapshot_all(
+                    market_type, tickers=list(tickers)
+                )
+            except Exception as exception:
+                log.warning(
+                    f"Unable to get {market_type.value} snapshot, falling back to individual requests: {exception}"
+                )
+                continue
+            for snapshot in snapshots:
+                if snapshot.ticker in tickers:
+                    prices[tickers[snapshot.ticker]] = (
+                        PolygonClient._get_snapshot_price(snapshot)
+                    )
+        return prices
+
+    @staticmethod
+    def _get_price_cache_key(ticker: str) -> str:
+        return f"price#{ticker}"
+
+    @staticmethod
+    def _get_cacheable_details(details: TickerDetails) -> dict:
+        # only cache the scalar details, nested details are not needed by Walter
+        cacheable_details = {}
+        for details_field in fields(TickerDetails):
+            value = getattr(details, details_field.name, None)
+            if isinstance(value, (str, int, float, bool)):
+                cacheable_details[details_field.name] = value
+        return cacheable_details
+
+    @staticmethod
+    def _get_snapshot_price(snapshot: TickerSnapshot) -> Optional[float]:
+        # prefer the last trade and fall back to the latest available bar
+        if snapshot.last_trade is not None and snapshot.last_trade.price:
+            return snapshot.last_trade.price
+        for agg in [snapshot.min, snapshot.day, snapshot.prev_day]:
+            if agg is not None and agg.close:
+                return agg.close
+        return None
 
     def _lazily_load_client(self) -> None:
         if self.client is None:
@@ -0,0 +1,415 @@
+import calendar
+import datetime as dt
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.database.transactions.batch import (
+    NO_CODE,
+    TRANSACTION_CATEGORIES,
+    TransactionBatch,
+)
+from src.database.transactions.models import (
+    BankingTransactionSubType,
+    Transaction,
+    TransactionCategory,
+)
+from src.utils.log import Logger
+
+log = Logger(__name__).get_logger()
+
+CATEGORIES: List[TransactionCategory] = TRANSACTION_CATEGORIES
+"""(List[TransactionCategory]): The categories of the transaction category codes, the same codes as transaction batches."""
+
+CATEGORY_CODES: Dict[TransactionCategory, int] = {
+    category: code for code, category in enumerate(CATEGORIES)
+}
+"""(Dict[TransactionCategory, int]): The code of each transaction category."""
+
+EPOCH_ORDINAL = dt.date(1970, 1, 1).toordinal()
+
+
+@dataclass
+class TransactionColumns:
+    """
+    Transaction Columns
+
+    The transactions of a user as parallel NumPy arrays, one element per
+    transaction. Categories are encoded with the fixed codes of the
+    `TransactionCategory` enum, and merchants and accounts are dictionary
+    encoded to integer codes indexing `merchants` and `account_ids`, so
+    aggregations are plain `bincount`s over the codes.
+    """
+
+    amounts: np.ndarray  # float64
+    days: np.ndarray  # datetime64[D]
+    expenses: np.ndarray  # bool
+    category_codes: np.ndarray  # int64
+    merchant_codes: np.ndarray  # int64
+    account_codes: np.ndarray  # int64
+    merchants: List[str]
+    account_ids: List[str]
+
+    def __len__(self) -> int:
+        return len(self.amounts)
+
+    @classmethod
+    def from_transactions(
+        cls, transactions: Sequence[Transaction]
+    ) -> "TransactionColumns":
+        """
+        Load transactions into columns.
+
+        Each column is filled with a single `np.fromiter` pass over the
+        transactions and merchants and accounts are interned to codes in
+        the same pass, no per-transaction objects are kept.
+        """
+        count = len(transactions)
+        merchant_index: Dict[str, int] = {}
+        account_index: Dict[str, int] = {}
+        ordinals = np.fromiter(
+            (transaction.transaction_date.toordinal() for transaction in transactions),
+            dtype=np.int64,
+            count=count,
+        )
+        return TransactionColumns(
+            amounts=np.fromiter(
+                (transaction.transaction_amount for transaction in transactions),
+                dtype=np.float64,
+                count=count,
+            ),
+            days=(ordinals - EPOCH_ORDINAL).astype("datetime64[D]"),
+            # only banking debits are expenses, see Transaction.is_expense
+            expenses=np.fromiter(
+                (
+                    transaction.transaction_subtype is BankingTransactionSubType.DEBIT
+                    for transaction in transactions
+                ),
+                dtype=bool,
+                count=count,
+            ),
+            category_codes=np.fromiter(
+                (
+                    CATEGORY_CODES[transaction.transaction_category]
+                    for transaction in transactions
+                ),
+                dtype=np.int64,
+                count=count,
+            ),
+            # investment transactions do not have a merchant
+            merchant_codes=np.fromiter(
+                (
+                    merchant_index.setdefault(
+                        getattr(transaction, "merchant_name", ""), len(merchant_index)
+                    )
+                    for transaction in transactions
+                ),
+                dtype=np.int64,
+                count=count,
+            ),
+            account_codes=np.fromiter(
+                (
+                    account_index.setdefault(transaction.account_id, len(account_index))
+                    for transaction in transactions
+                ),
+                dtype=np.int64,
+                count=count,
+            ),
+            merchants=list(merchant_index),
+            account_ids=list(account_index),
+        )
+
+    @classmethod
+    def from_batch(cls, batch: TransactionBatch) -> "TransactionColumns":
+        """
+        Load a transaction batch into columns.
+
+        The batch is already columnar, so its arrays and string tables are
+        reused as is and only investment transactions, which do not have a
+        merchant, are given the code of an empty merchant name.
+        """
+        merchants = list(batch.merchant_names)
+        merchant_codes = batch.merchant_codes.astype(np.int64)
+        no_merchant = merchant_codes == NO_CODE
+        if no_merchant.any():
+            merchant_codes[no_merchant] = len(merchants)
+            merchants.append("")
+        return TransactionColumns(
+            amounts=batch.amounts,
+            days=batch.get_dates(),
+            expenses=batch.is_expense(),
+            category_codes=batch.category_codes.astype(np.int64),
+            merchant_codes=merchant_codes,
+            account_codes=batch.account_codes.astype(np.int64),
+            merchants=merchants,
+            account_ids=batch.account_ids,
+        )
+
+
+@dataclass
+class SpendingBreakdown:
+    """
+    Spending Breakdown
+
+    The spend and number of expenses per key, e.g. per category or merchant,
+    in the current period and, if compared, in the previous period.
+    """
+
+    keys: List[str]
+    spend: np.ndarray
+    num_transactions: np.ndarray
+    previous_spend: Optional[np.ndarray] = None
+    previous_num_transactions: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def select(self, indices: np.ndarray) -> "SpendingBreakdown":
+        return SpendingBreakdown(
+            keys=[self.keys[index] for index in indices],
+            spend=self.spend[indices],
+            num_transactions=self.num_transactions[indices],
+            previous_spend=(
+                self.previous_spend[indices]
+                if self.previous_spend is not None
+                else None
+            ),
+            previous_num_transactions=(
+                self.previous_num_transactions[indices]
+                if self.previous_num_transactions is not None
+                else None
+            ),
+        )
+
+    def nonzero(self) -> "SpendingBreakdown":
+        """Get the keys with expenses in either period, ordered by descending spend."""
+        active = self.num_transactions > 0
+        if self.previous_num_transactions is not None:
+            active |= self.previous_num_transactions > 0
+        indices = np.flatnonzero(active)
+        return self.select(indices[np.argsort(-self.spend[indices], kind="stable")])
+
+    def top(self, n: int) -> "SpendingBreakdown":
+        """Get the `n` keys with the highest spend in the current period."""
+        indices = np.flatnonzero(self.num_transactions > 0)
+        order = np.argsort(-self.spend[indices], kind="stable")[:n]
+        return self.select(indices[order])
+
+    def to_dict(self, key_name: str) -> List[dict]:
+        rows = {
+            key_name: self.keys,
+            "spend": self.spend.round(2).tolist(),
+            "num_transactions": self.num_transactions.tolist(),
+        }
+        if self.previous_spend is not None:
+            change = self.spend - self.previous_spend
+            percent_change = np.divide(
+                change,
+                self.previous_spend,
+                out=np.full(len(self), np.nan),
+                where=self.previous_spend != 0,
+            )
+            rows["previous_spend"] = self.previous_spend.round(2).tolist()
+            rows["previous_num_transactions"] = self.previous_num_transactions.tolist()
+            rows["change"] = change.round(2).tolist()
+            rows["percent_change"] = [
+                None if np.isnan(value) else value
+                for value in percent_change.round(4).tolist()
+            ]
+        return [dict(zip(rows, values)) for values in zip(*rows.values())]
+
+
+@dataclass
+class SpendingAnalytics:
+    """
+    Spending Analytics
+
+    The spend of a user in a period broken down by category, merchant,
+    account, weekday, and month, compared to the spend in the previous
+    period of the same length.
+    """
+
+    start_date: dt.date
+    end_date: dt.date
+    previous_start_date: dt.date
+    previous_end_date: dt.date
+    total_spend: float
+    previous_total_spend: float
+    num_transactions: int
+    previous_num_transactions: int
+    categories: SpendingBreakdown
+    merchants: SpendingBreakdown
+    accounts: SpendingBreakdown
+    weekdays: SpendingBreakdown
+    months: SpendingBreakdown
+
+    def to_dict(self) -> dict:
+        change = self.total_spend - self.previous_total_spend
+        return {
+            "start_date": self.start_date.isoformat(),
+            "end_date": self.end_date.isoformat(),
+            "previous_start_date": self.previous_start_date.isoformat(),
+            "previous_end_date": self.previous_end_date.isoformat(),
+            "total_spend": round(self.total_spend, 2),
+            "previous_total_spend": round(self.previous_total_spend, 2),
+            "change": round(change, 2),
+            "percent_change": (
+                round(change / self.previous_total_spend, 4)
+                if self.previous_total_spend
+                else None
+            ),
+            "num_transactions": self.num_transactions,
+            "previous_num_transactions": self.previous_num_transactions,
+            "categories": self.categories.to_dict("category"),
+            "merchants": self.merchants.to_dict("merchant_name"),
+            "accounts": self.accounts.to_dict("account_id"),
+            "weekdays": self.weekdays.to_dict("weekday"),
+            "months": self.months.to_dict("month"),
+        }
+
+
+@dataclass
+class SpendingAnalyticsEngine:
+    """
+    Spending Analytics Engine
+
+    Computes the spending analytics of a user from the columns of their
+    transactions with vectorized NumPy operations. Only expenses count as
+    spend. The current and previous periods are aggregated together by
+    offsetting the codes of previous period expenses by the number of keys,
+    so every breakdown of both periods is a single `bincount`.
+    """
+
+    WEEKDAYS = list(calendar.day_name)
+
+    def __post_init__(self) -> None:
+        log.debug("Initializing Spending Analytics Engine")
+
+    @staticmethod
+    def get_previous_period(
+        start_date: dt.date, end_date: dt.date
+    ) -> Tuple[dt.date, dt.date]:
+        """Get the period of the same length immediately before the given period."""
+        previous_end_date = start_date - dt.timedelta(days=1)
+        return previous_end_date - (end_date - start_date), previous_end_date
+
+    def get_analytics(
+        self,
+        columns: TransactionColumns,
+        start_date: dt.date,
+        end_date: dt.date,
+        num_merchants: int,
+        account_ids: Optional[Iterable[str]] = None,
+    ) -> SpendingAnalytics:
+        """
+        Get the spending analytics of a period.
+
+        Args:
+            columns: The transactions of the current and previous periods.
+            start_date: The first day of the current period.
+            end_date: The last day of the current period.
+            num_merchants: The number of top merchants to include.
+            account_ids: The accounts to include, defaults to all accounts.
+
+        Returns:
+            The spending analytics of the period.
+        """
+        previous_start_date, previous_end_date = self.get_previous_period(
+            start_date, end_date
+        )
+
+        days = columns.days
+        current = (days >= np.datetime64(start_date, "D")) & (
+            days <= np.datetime64(end_date, "D")
+        )
+        previous = (days >= np.datetime64(previous_start_date, "D")) & (
+            days <= np.datetime64(previous_end_date, "D")
+        )
+        mask = columns.expenses & (current | previous)
+        if account_ids is not None:
+            account_ids = set(account_ids)
+            account_codes = [
+                code
+                for code, account_id in enumerate(columns.account_ids)
+                if account_id in account_ids
+            ]
+            mask &= np.isin(columns.account_codes, account_codes)
+
+        # period 0 is the current period and period 1 the previous period
+        periods = (~current[mask]).astype(np.int64)
+        amounts = columns.amounts[mask]
+        log.info(
+            f"Aggregating {len(amounts)} expense(s) of {len(columns)} transaction(s)"
+        )
+
+        totals = np.bincount(periods, weights=amounts, minlength=2)
+        counts = np.bincount(periods, minlength=2)
+
+        categories = self._aggregate(
+            [category.value for category in CATEGORIES],
+            columns.category_codes[mask],
+            periods,
+            amounts,
+        )
+        merchants = self._aggregate(
+            columns.merchants, columns.merchant_codes[mask], periods, amounts
+        )
+        accounts = self._aggregate(
+            columns.account_ids, columns.account_codes[mask], periods, amounts
+        )
+        weekdays = self._aggregate(
+            SpendingAnalyticsEngine.WEEKDAYS,
+            (days[mask].astype(np.int64) + 3) % 7,  # 1970-01-01 was a Thursday
+            periods,
+            amounts,
+        )
+
+        # months are only broken down over the current period
+        first_month = np.datetime64(start_date, "M")
+        month_keys = np.arange(
+            first_month, np.datetime64(end_date, "M") + 1, dtype="datetime64[M]"
+        )
+        in_current = periods == 0
+        month_codes = (
+            days[mask][in_current].astype("datetime64[M]") - first_month
+        ).astype(np.int64)
+        months = SpendingBreakdown(
+            keys=[str(month) for month in month_keys],
+            spend=np.bincount(
+                month_codes, weights=amounts[in_current], minlength=len(month_keys)
+            ),
+            num_transactions=np.bincount(month_codes, minlength=len(month_keys)),
+        )
+
+        return SpendingAnalytics(
+            start_date=start_date,
+            end_date=end_date,
+            previous_start_date=previous_start_date,
+            previous_end_date=previous_end_date,
+            total_spend=float(totals[0]),
+            previous_total_spend=float(totals[1]),
+            num_transactions=int(counts[0]),
+            previous_num_transactions=int(counts[1]),
+            categories=categories.nonzero(),
+            merchants=merchants.top(num_merchants),
+            accounts=accounts.nonzero(),
+            weekdays=weekdays,
+            months=months,
+        )
+
+    @staticmethod
+    def _aggregate(
+        keys: List[str], codes: np.ndarray, periods: np.ndarray, amounts: np.ndarray
+    ) -> SpendingBreakdown:
+        num_keys = len(keys)
+        offset_codes = periods * num_keys + codes
+        spend = np.bincount(offset_codes, weights=amounts, minlength=2 * num_keys)
+        counts = np.bincount(offset_codes, minlength=2 * num_keys)
+        return SpendingBreakdown(
+            keys=keys,
+            spend=spend[:num_keys],
+            num_transactions=counts[:num_keys],
+            previous_spend=spend[num_keys:],
+            previous_num_transactions=counts[num_keys:],
+        )
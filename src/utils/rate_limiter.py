@@ -0,0 +1,66 @@
+import threading
+import time
+from dataclasses import dataclass, field
+
+from src.utils.log import Logger
+
+log = Logger(__name__).get_logger()
+
+
+@dataclass
+class TokenBucketRateLimiter:
+    """
+    Token Bucket Rate Limiter
+
+    Thread-safe token bucket that refills `rate_per_second` tokens per second
+    up to `capacity` tokens. Callers acquire a token before each request and
+    block until one is available, so concurrent workers sharing a limiter
+    never exceed the configured request rate beyond an initial burst of
+    `capacity` requests.
+    """
+
+    rate_per_second: float
+    capacity: float
+
+    tokens: float = None  # set during post-init
+    updated_at: float = None  # set during post-init
+    lock: threading.Lock = field(default_factory=threading.Lock)
+
+    def __post_init__(self) -> None:
+        log.debug(
+            f"Creating token bucket rate limiter with rate {self.rate_per_second}/s and capacity {self.capacity}"
+        )
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+
+    @classmethod
+    def per_minute(
+        cls, requests_per_minute: int, burst: int = 1
+    ) -> "TokenBucketRateLimiter":
+        """
+        Create a limiter of `requests_per_minute` requests in any minute.
+
+        The bucket starts full, so a capacity of `requests_per_minute` would
+        allow up to twice the limit in the first minute. With the default
+        burst of one request, no minute exceeds `requests_per_minute`.
+        """
+        return cls(rate_per_second=requests_per_minute / 60, capacity=burst)
+
+    def acquire(self) -> None:
+        """Block until a token is available and consume it."""
+        while True:
+            with self.lock:
+                self._refill()
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                wait_seconds = (1 - self.tokens) / self.rate_per_second
+            log.debug(f"Rate limited, waiting {wait_seconds:.2f} seconds for a token")
+            time.sleep(wait_seconds)
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self.tokens = min(
+            self.capacity, self.tokens + (now - self.updated_at) * self.rate_per_second
+        )
+        self.updated_at = now
@@ -0,0 +1,65 @@
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Generic, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+
+@dataclass
+class TTLCache(Generic[V]):
+    """
+    TTL Cache
+
+    Thread-safe in-memory cache of values that each expire at a given time.
+    Expired entries are dropped when read. If `max_entries` is given, the
+    least recently used entries are evicted beyond it.
+
+    The lock is reentrant so callers can hold it to make a read and a write,
+    or updates of state kept alongside the cache, atomic.
+    """
+
+    max_entries: Optional[int] = None
+    entries: "OrderedDict[str, Tuple[V, datetime]]" = field(default_factory=OrderedDict)
+    lock: threading.RLock = field(default_factory=threading.RLock)
+
+    def get(self, key: str, now: Optional[datetime] = None) -> Optional[V]:
+        """Get the value of the key, or None if it is missing or expired."""
+        if now is None:
+            now = datetime.now(timezone.utc)
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= now:
+                del self.entries[key]
+                return None
+            self.entries.move_to_end(key)
+            return value
+
+    def put(self, key: str, value: V, expires_at: datetime) -> None:
+        with self.lock:
+            self.entries[key] = (value, expires_at)
+            self.entries.move_to_end(key)
+            if self.max_entries is not None:
+                while len(self.entries) > self.max_entries:
+                    self.entries.popitem(last=False)
+
+    def pop(self, key: str) -> None:
+        with self.lock:
+            self.entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self.lock:
+            self.entries.clear()
+
+    def __contains__(self, key: str) -> bool:
+        with self.lock:
+            entry = self.entries.get(key)
+            return entry is not None and entry[1] > datetime.now(timezone.utc)
+
+    def __len__(self) -> int:
+        with self.lock:
+            return len(self.entries)
@@ -0,0 +1,111 @@
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from src.database.client import WalterDB
+from src.environment import Domain
+from src.metrics.client import DatadogMetricsClient
+from src.utils.log import Logger
+from src.workflows.common.models import Workflow, WorkflowResponse, WorkflowStatus
+
+log = Logger(__name__).get_logger()
+
+
+@dataclass
+class BackfillTransactionsIndex(Workflow):
+    """
+    Backfill Transactions Index
+
+    Backfills the composite `account_security_id` attribute on existing
+    investment transactions so they are included in the account security
+    date range index used to read the transaction history of a holding.
+
+    The workflow scans the Transactions table page by page and is resumable.
+    Each invocation processes at most `max_pages` pages and returns the key
+    to resume from as `last_evaluated_key`, which can be passed back in the
+    event as `exclusive_start_key` until the response reports completion,
+    e.g. with the `backfill-transactions-index` CLI command. Updates are
+    conditional so the backfill is idempotent.
+
+    Holding transaction history is read from the index only once
+    `migrations.holding_transactions_index_enabled` is set, which must not
+    happen before the backfill has completed.
+    """
+
+    WORKFLOW_NAME = "BackfillTransactionsIndex"
+    DEFAULT_MAX_PAGES = 50
+    PAGE_SIZE = 500
+    METRICS_NUM_SCANNED_TRANSACTIONS = "workflow.num_scanned_transactions"
+    METRICS_NUM_BACKFILLED_TRANSACTIONS = "workflow.num_backfilled_transactions"
+
+    walter_db: WalterDB
+
+    def __init__(
+        self,
+        domain: Domain,
+        walter_db: WalterDB,
+        metrics: DatadogMetricsClient,
+    ) -> None:
+        super().__init__(BackfillTransactionsIndex.WORKFLOW_NAME, domain, metrics)
+        self.walter_db = walter_db
+
+    def execute(self, event: dict, emit_metrics: bool = True) -> WorkflowResponse:
+        start_time = datetime.now(timezone.utc)
+
+        exclusive_start_key = event.get("exclusive_start_key")
+        max_pages = int(event.get("max_pages", self.DEFAULT_MAX_PAGES))
+        log.info(
+            f"Backfilling transactions index for up to {max_pages} pages starting from key: {exclusive_start_key}"
+        )
+
+        num_pages = 0
+        num_scanned = 0
+        num_backfilled = 0
+        last_evaluated_key = exclusive_start_key
+        while num_pages < max_pages:
+            items, last_evaluated_key = self.walter_db.get_transaction_items_page(
+                last_evaluated_key, self.PAGE_SIZE
+            )
+            num_pages += 1
+            num_scanned += len(items)
+            for item in items:
+                if self.walter_db.backfill_transaction_account_security_id(item):
+                    num_backfilled += 1
+            if last_evaluated_key is None:
+                break
+
+        complete = last_evaluated_key is None
+        log.info(
+            f"Scanned {num_scanned} transactions and backfilled {num_backfilled} transactions (complete: {complete})"
+        )
+
+        if emit_metrics:
+            log.info(f"Emitting '{self.name}' workflow additional metrics")
+            tags = self._get_metric_tags()
+            self.metrics.emit_metric(
+                self.METRICS_NUM_SCANNED_TRANSACTIONS, num_scanned, tags
+            )
+            self.metrics.emit_metric(
+                self.METRICS_NUM_BACKFILLED_TRANSACTIONS, num_backfilled, tags
+            )
+        else:
+            log.info(f"Not emitting additional metrics for '{self.name}' workflow!")
+
+        return WorkflowResponse(
+            name=BackfillTransactionsIndex.WORKFLOW_NAME,
+            status=WorkflowStatus.SUCCESS,
+            message=(
+                "Transactions index backfilled successfully"
+                if complete
+                else "Transactions index partially backfilled, resume from last evaluated key"
+            ),
+            data={
+                "duration_seconds": (
+                    datetime.now(timezone.utc) - start_time
+                ).total_seconds(),
+                "num_pages": num_pages,
+                "num_scanned_transactions": num_scanned,
+                "num_backfilled_transactions": num_backfilled,
+                "complete": complete,
+                "last_evaluated_key": last_evaluated_key,
+            },
+        )
@@ -5,7 +5,11 @@ from typing import Tuple
 from src.aws.sts.client import WalterSTSClient
 from src.factory import ClientFactory
 from src.utils.log import Logger
+from src.workflows.backfill_transactions_index import BackfillTransactionsIndex
 from src.workflows.common.models import Workflow
+from src.workflows.purge_account import PurgeAccount
+from src.workflows.rebuild_holdings import RebuildHoldings
+from src.workflows.reconcile_cash_flow_rollups import ReconcileCashFlowRollups
 from src.workflows.sync_user_transactions import SyncUserTransactions
 from src.workflows.update_security_prices import UpdateSecurityPrices
 
@@ -17,6 +21,10 @@ class Workflows(Enum):
 
     SYNC_USER_TRANSACTIONS = SyncUserTransactions.WORKFLOW_NAME
     UPDATE_SECURITY_PRICES = UpdateSecurityPrices.WORKFLOW_NAME
+    BACKFILL_TRANSACTIONS_INDEX = BackfillTransactionsIndex.WORKFLOW_NAME
+    REBUILD_HOLDINGS = RebuildHoldings.WORKFLOW_NAME
+    PURGE_ACCOUNT = PurgeAccount.WORKFLOW_NAME
+    RECONCILE_CASH_FLOW_ROLLUPS = ReconcileCashFlowRollups.WORKFLOW_NAME
 
     def get_name(self) -> str:
         return self.value
@@ -64,6 +72,7 @@ class WorkflowFactory:
                     walter_db=self.client_factory.get_db_client(),
                     polygon=self.client_factory.get_polygon_client(),
                     metrics=self.client_factory.get_metrics_client(),
+                    price_history=self.client_factory.get_price_history_store(),
                 )
             case Workflows.SYNC_USER_TRANSACTIONS:
                 return SyncUserTransactions(
@@ -72,6 +81,31 @@ class WorkflowFactory:
                     db=self.client_factory.get_db_client(),
                     metrics=self.client_factory.get_metrics_client(),
                 )
+            case Workflows.BACKFILL_TRANSACTIONS_INDEX:
+                return BackfillTransactionsIndex(
+                    domain=self.client_factory.get_domain(),
+                    walter_db=self.client_factory.get_db_client(),
+                    metrics=self.client_factory.get_metrics_client(),
+                )
+            case Workflows.REBUILD_HOLDINGS:
+                return RebuildHoldings(
+                    domain=self.client_factory.get_domain(),
+                    walter_db=self.client_factory.get_db_client(),
+                    metrics=self.client_factory.get_metrics_client(),
+                )
+            case Workflows.PURGE_ACCOUNT:
+                return PurgeAccount(
+                    domain=self.client_factory.get_domain(),
+                    walter_db=self.client_factory.get_db_client(),
+                    queue=self.client_factory.get_purge_account_task_queue(),
+                    metrics=self.client_factory.get_metrics_client(),
+                )
+            case Workflows.RECONCILE_CASH_FLOW_ROLLUPS:
+                return ReconcileCashFlowRollups(
+                    domain=self.client_factory.get_domain(),
+                    walter_db=self.client_factory.get_db_client(),
+                    metrics=self.client_factory.get_metrics_client(),
+                )
             case _:
                 raise ValueError(f"Workflow '{workflow}' not found")
 
@@ -0,0 +1,167 @@
+import json
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from src.accounts.queue import PurgeAccountTask, PurgeAccountTaskQueue
+from src.config import CONFIG, AccountDeletionConfig
+from src.database.client import WalterDB
+from src.environment import Domain
+from src.metrics.client import DatadogMetricsClient
+from src.utils.log import Logger
+from src.workflows.common.models import Workflow, WorkflowResponse, WorkflowStatus
+
+log = Logger(__name__).get_logger()
+
+
+@dataclass
+class PurgeAccount(Workflow):
+    """
+    Purge Account
+
+    Purges the transactions and holdings of an account marked as deleting by
+    the DeleteAccount API and then deletes its cash flow rollups and the
+    account itself. Transactions are read a page at a time from the account
+    date range index and removed with batch deletes, and the number of
+    purged items is recorded on the account after every page.
+
+    Each run purges at most `max_pages_per_run` pages so a single run stays
+    well within the Lambda timeout. Unfinished purges are resumed by a
+    follow-up task added to the PurgeAccount queue with the key of the last
+    purged page, so accounts with years of history are purged over several
+    runs without re-reading purged pages.
+    """
+
+    WORKFLOW_NAME = "PurgeAccount"
+    METRICS_NUM_DELETED_TRANSACTIONS = "workflow.num_deleted_transactions"
+    METRICS_NUM_DELETED_HOLDINGS = "workflow.num_deleted_holdings"
+
+    walter_db: WalterDB
+    queue: PurgeAccountTaskQueue
+    config: AccountDeletionConfig
+
+    def __init__(
+        self,
+        domain: Domain,
+        walter_db: WalterDB,
+        queue: PurgeAccountTaskQueue,
+        metrics: DatadogMetricsClient,
+        config: AccountDeletionConfig = CONFIG.account_deletion,
+    ) -> None:
+        super().__init__(PurgeAccount.WORKFLOW_NAME, domain, metrics)
+        self.walter_db = walter_db
+        self.queue = queue
+        self.config = config
+
+    def execute(self, event: dict, emit_metrics: bool = True) -> WorkflowResponse:
+        start_time = datetime.now(timezone.utc)
+
+        task = self._get_task(event)
+        log.info(
+            f"Purging account '{task.account_id}' for user '{task.user_id}' (run {task.num_runs + 1})"
+        )
+
+        num_pages = 0
+        num_deleted_transactions = 0
+        exclusive_start_key = task.exclusive_start_key
+        is_complete = False
+        while num_pages < self.config.max_pages_per_run:
+            keys, exclusive_start_key = (
+                self.walter_db.get_account_transaction_keys_page(
+                    task.account_id, exclusive_start_key, self.config.page_size
+                )
+            )
+            num_pages += 1
+            if keys:
+                self.walter_db.delete_transactions(keys)
+                self.walter_db.update_account_deletion_progress(
+                    task.user_id, task.account_id, len(keys), 0
+                )
+                num_deleted_transactions += len(keys)
+            if exclusive_start_key is None:
+                is_complete = True
+                break
+
+        num_deleted_holdings = 0
+        if is_complete:
+            security_ids = [
+                holding.security_id
+                for holding in self.walter_db.get_holdings(task.account_id)
+            ]
+            if security_ids:
+                self.walter_db.delete_holdings(task.account_id, security_ids)
+                self.walter_db.update_account_deletion_progress(
+                    task.user_id, task.account_id, 0, len(security_ids)
+                )
+            num_deleted_holdings = len(security_ids)
+            self.walter_db.delete_account_cash_flow_rollups(
+                task.user_id, task.account_id
+            )
+            if self.walter_db.delete_marked_account(task.user_id, task.account_id):
+                log.info(
+                    f"Account '{task.account_id}' purged and deleted successfully!"
+                )
+            else:
+                log.warning(
+                    f"Account '{task.account_id}' purged but not deleted as it is no longer marked as deleting!"
+                )
+        else:
+            self.queue.add_task(
+                PurgeAccountTask(
+                    user_id=task.user_id,
+                    account_id=task.account_id,
+                    exclusive_start_key=exclusive_start_key,
+                    num_deleted_transactions=task.num_deleted_transactions
+                    + num_deleted_transactions,
+                    num_runs=task.num_runs + 1,
+                )
+            )
+            log.info(
+                f"Purged {num_pages} page(s) of account '{task.account_id}', resuming in a follow-up task"
+            )
+        self.walter_db.bump_user_data_version(task.user_id)
+
+        if emit_metrics:
+            log.info(f"Emitting '{self.name}' workflow additional metrics")
+            tags = self._get_metric_tags()
+            self.metrics.emit_metric(
+                self.METRICS_NUM_DELETED_TRANSACTIONS, num_deleted_transactions, tags
+            )
+            self.metrics.emit_metric(
+                self.METRICS_NUM_DELETED_HOLDINGS, num_deleted_holdings, tags
+            )
+        else:
+            log.info(f"Not emitting additional metrics for '{self.name}' workflow!")
+
+        return WorkflowResponse(
+            name=PurgeAccount.WORKFLOW_NAME,
+            status=WorkflowStatus.SUCCESS,
+            message=(
+                "Account purged successfully"
+                if is_complete
+                else "Account purge in progress"
+            ),
+            data={
+                "duration_seconds": (
+                    datetime.now(timezone.utc) - start_time
+                ).total_seconds(),
+                "user_id": task.user_id,
+                "account_id": task.account_id,
+                "complete": is_complete,
+                "num_runs": task.num_runs + 1,
+                "num_pages": num_pages,
+                "num_deleted_transactions": num_deleted_transactions,
+                "total_deleted_transactions": task.num_deleted_transactions
+                + num_deleted_transactions,
+                "num_deleted_holdings": num_deleted_holdings,
+            },
+        )
+
+    def _get_task(self, event: dict) -> PurgeAccountTask:
+        log.info("Getting task from event")
+        log.debug(f"Event: {event}")
+        try:
+            return PurgeAccountTask.from_dict(json.loads(event["Records"][0]["body"]))
+        except KeyError as e:
+            raise ValueError(f"Missing required field: {e}")
+        except Exception as e:
+            raise ValueError(f"Invalid event: {e}")
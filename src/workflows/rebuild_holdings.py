@@ -0,0 +1,160 @@
+from dataclasses import dataclass
+from datetime import datetime, timezone
+
+from src.database.accounts.models import AccountType
+from src.database.client import WalterDB
+from src.environment import Domain
+from src.investments.holdings.rebuilder import HoldingRebuilder
+from src.metrics.client import DatadogMetricsClient
+from src.utils.log import Logger
+from src.workflows.common.models import Workflow, WorkflowResponse, WorkflowStatus
+
+log = Logger(__name__).get_logger()
+
+
+@dataclass
+class RebuildHoldings(Workflow):
+    """
+    Rebuild Holdings
+
+    Recomputes the holdings of investment accounts from their transaction
+    histories, e.g. after a bug fix or data migration. The transactions of
+    each account are replayed in bulk by the `HoldingRebuilder` and the
+    resulting holdings are written with batch writes. Holdings of fully sold
+    securities, or without any transactions, are deleted. Securities with
+    invalid transaction histories (e.g. oversells) keep their current
+    holding and are reported in the response.
+
+    The workflow is sharded with a DDB parallel scan of the Accounts table,
+    each invocation rebuilds the accounts in segment `shard` of `num_shards`
+    so many accounts can be rebuilt in parallel by invoking the workflow
+    once per shard. If `dry_run` is set, no holdings are written.
+    """
+
+    WORKFLOW_NAME = "RebuildHoldings"
+    METRICS_NUM_REBUILT_ACCOUNTS = "workflow.num_rebuilt_accounts"
+    METRICS_NUM_REBUILT_HOLDINGS = "workflow.num_rebuilt_holdings"
+    METRICS_NUM_DELETED_HOLDINGS = "workflow.num_deleted_holdings"
+    METRICS_NUM_INVALID_HISTORIES = "workflow.num_invalid_holding_histories"
+
+    walter_db: WalterDB
+    holding_rebuilder: HoldingRebuilder
+
+    def __init__(
+        self,
+        domain: Domain,
+        walter_db: WalterDB,
+        metrics: DatadogMetricsClient,
+        holding_rebuilder: HoldingRebuilder = None,
+    ) -> None:
+        super().__init__(RebuildHoldings.WORKFLOW_NAME, domain, metrics)
+        self.walter_db = walter_db
+        self.holding_rebuilder = holding_rebuilder or HoldingRebuilder()
+
+    def execute(self, event: dict, emit_metrics: bool = True) -> WorkflowResponse:
+        start_time = datetime.now(timezone.utc)
+
+        shard = int(event.get("shard", 0))
+        num_shards = int(event.get("num_shards", 1))
+        dry_run = bool(event.get("dry_run", False))
+        if num_shards < 1 or not 0 <= shard < num_shards:
+            raise ValueError(f"Invalid shard {shard} of {num_shards} shards!")
+        log.info(
+            f"Rebuilding holdings for shard {shard} of {num_shards} shards (dry run: {dry_run})"
+        )
+
+        num_accounts = 0
+        num_rebuilt = 0
+        num_deleted = 0
+        invalid_histories = []
+        for account in self.walter_db.stream_accounts(
+            segment=shard if num_shards > 1 else None,
+            total_segments=num_shards if num_shards > 1 else None,
+        ):
+            if account.account_type != AccountType.INVESTMENT:
+                continue
+            num_accounts += 1
+
+            rebuilt = self.holding_rebuilder.rebuild(
+                account.account_id,
+                self.walter_db.get_account_transactions(account.account_id),
+            )
+
+            # preserve the creation time of existing holdings and delete existing
+            # holdings no longer backed by a valid open position
+            existing_holdings = {
+                holding.security_id: holding
+                for holding in self.walter_db.get_holdings(account.account_id)
+            }
+            for holding in rebuilt.holdings:
+                if holding.security_id in existing_holdings:
+                    holding.created_at = existing_holdings[
+                        holding.security_id
+                    ].created_at
+            rebuilt_security_ids = {holding.security_id for holding in rebuilt.holdings}
+            stale_security_ids = [
+                security_id
+                for security_id in existing_holdings
+                if security_id not in rebuilt_security_ids
+                and security_id not in rebuilt.invalid_histories
+            ]
+
+            for security_id, reason in rebuilt.invalid_histories.items():
+                invalid_histories.append(
+                    {
+                        "account_id": account.account_id,
+                        "security_id": security_id,
+                        "reason": reason,
+                    }
+                )
+
+            num_rebuilt += len(rebuilt.holdings)
+            num_deleted += len(stale_security_ids)
+            if dry_run:
+                continue
+            if rebuilt.holdings:
+                self.walter_db.put_holdings(rebuilt.holdings)
+            if stale_security_ids:
+                self.walter_db.delete_holdings(account.account_id, stale_security_ids)
+            if rebuilt.holdings or stale_security_ids:
+                self.walter_db.bump_user_data_version(account.user_id)
+
+        log.info(
+            f"Rebuilt {num_rebuilt} holdings and deleted {num_deleted} holdings for {num_accounts} accounts with {len(invalid_histories)} invalid holding histories"
+        )
+
+        if emit_metrics:
+            log.info(f"Emitting '{self.name}' workflow additional metrics")
+            tags = self._get_metric_tags()
+            self.metrics.emit_metric(
+                self.METRICS_NUM_REBUILT_ACCOUNTS, num_accounts, tags
+            )
+            self.metrics.emit_metric(
+                self.METRICS_NUM_REBUILT_HOLDINGS, num_rebuilt, tags
+            )
+            self.metrics.emit_metric(
+                self.METRICS_NUM_DELETED_HOLDINGS, num_deleted, tags
+            )
+            self.metrics.emit_metric(
+                self.METRICS_NUM_INVALID_HISTORIES, len(invalid_histories), tags
+            )
+        else:
+            log.info(f"Not emitting additional metrics for '{self.name}' workflow!")
+
+        return WorkflowResponse(
+            name=RebuildHoldings.WORKFLOW_NAME,
+            status=WorkflowStatus.SUCCESS,
+            message="Holdings rebuilt successfully",
+            data={
+                "duration_seconds": (
+                    datetime.now(timezone.utc) - start_time
+                ).total_seconds(),
+                "shard": shard,
+                "num_shards": num_shards,
+                "dry_run": dry_run,
+                "num_accounts": num_accounts,
+                "num_rebuilt_holdings": num_rebuilt,
+                "num_deleted_holdings": num_deleted,
+                "invalid_histories": invalid_histories,
+            },
+        )
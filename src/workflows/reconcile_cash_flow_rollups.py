@@ -0,0 +1,136 @@
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Dict, List, Tuple
+
+from src.database.client import WalterDB
+from src.database.rollups.models import CashFlowRollup
+from src.environment import Domain
+from src.metrics.client import DatadogMetricsClient
+from src.utils.log import Logger
+from src.workflows.common.models import Workflow, WorkflowResponse, WorkflowStatus
+
+log = Logger(__name__).get_logger()
+
+
+@dataclass
+class ReconcileCashFlowRollups(Workflow):
+    """
+    Reconcile Cash Flow Rollups
+
+    Rebuilds the cash flow rollups of every user and account from the raw
+    transactions and repairs any rollups that drifted from them, e.g. after
+    a failed incremental update, and backfills the rollups of transactions
+    written before the rollups existed. Users are reconciled one at a time:
+    the transactions of a user are rolled up in memory and compared to the
+    rollups of the user and its accounts, drifted and missing rollups are
+    rewritten and rollups without any transactions are deleted. If
+    `user_id` is set, only that user is reconciled, and if `dry_run` is
+    set, the drift is reported without writing any rollups.
+
+    The rollups of a user are read before its transactions and only written
+    if they are unchanged since, so rollups updated by concurrent
+    transaction writes are left to the next run instead of overwritten.
+    """
+
+    WORKFLOW_NAME = "ReconcileCashFlowRollups"
+    METRICS_NUM_DRIFTED_ROLLUPS = "workflow.num_drifted_rollups"
+    METRICS_NUM_STALE_ROLLUPS = "workflow.num_stale_rollups"
+
+    walter_db: WalterDB
+
+    def __init__(
+        self,
+        domain: Domain,
+        walter_db: WalterDB,
+        metrics: DatadogMetricsClient,
+    ) -> None:
+        super().__init__(ReconcileCashFlowRollups.WORKFLOW_NAME, domain, metrics)
+        self.walter_db = walter_db
+
+    def execute(self, event: dict, emit_metrics: bool = True) -> WorkflowResponse:
+        start_time = datetime.now(timezone.utc)
+
+        user_id = event.get("user_id")
+        dry_run = bool(event.get("dry_run", False))
+        log.info(f"Reconciling cash flow rollups (dry run: {dry_run})")
+
+        if user_id:
+            user_ids = [user_id]
+        else:
+            user_ids = [user.user_id for user in self.walter_db.get_users()]
+
+        num_drifted = 0
+        num_stale = 0
+        for user_id in user_ids:
+            drifted, stale = self._reconcile_user(user_id, dry_run)
+            num_drifted += drifted
+            num_stale += stale
+        log.info(
+            f"Found {num_drifted} drifted and {num_stale} stale rollups of {len(user_ids)} user(s)"
+        )
+
+        if emit_metrics:
+            log.info(f"Emitting '{self.name}' workflow additional metrics")
+            tags = self._get_metric_tags()
+            self.metrics.emit_metric(
+                self.METRICS_NUM_DRIFTED_ROLLUPS, num_drifted, tags
+            )
+            self.metrics.emit_metric(self.METRICS_NUM_STALE_ROLLUPS, num_stale, tags)
+        else:
+            log.info(f"Not emitting additional metrics for '{self.name}' workflow!")
+
+        return WorkflowResponse(
+            name=ReconcileCashFlowRollups.WORKFLOW_NAME,
+            status=WorkflowStatus.SUCCESS,
+            message="Cash flow rollups reconciled successfully",
+            data={
+                "duration_seconds": (
+                    datetime.now(timezone.utc) - start_time
+                ).total_seconds(),
+                "dry_run": dry_run,
+                "num_users": len(user_ids),
+                "num_drifted_rollups": num_drifted,
+                "num_stale_rollups": num_stale,
+            },
+        )
+
+    def _reconcile_user(self, user_id: str, dry_run: bool) -> Tuple[int, int]:
+        log.info(f"Reconciling cash flow rollups of user '{user_id}'")
+        # the rollups are read before the transactions, so a transaction
+        # written in between fails the condition of the rollup writes
+        # instead of being overwritten by rollups built without it
+        account_ids = [
+            account.account_id for account in self.walter_db.get_accounts(user_id)
+        ]
+        account_ids.extend(self.walter_db.get_deleting_account_ids(user_id))
+        owner_ids = [CashFlowRollup.get_user_owner_id(user_id)] + [
+            CashFlowRollup.get_account_owner_id(account_id)
+            for account_id in account_ids
+        ]
+        items = {
+            owner_id: self.walter_db.get_cash_flow_rollup_items(owner_id)
+            for owner_id in owner_ids
+        }
+
+        expected: Dict[str, List[CashFlowRollup]] = {
+            owner_id: [] for owner_id in owner_ids
+        }
+        rollups = CashFlowRollup.from_transactions(
+            self.walter_db.get_user_transactions(user_id)
+        )
+        for (owner_id, _), rollup in rollups.items():
+            if owner_id not in expected:
+                # e.g. an account created after the rollups were read
+                log.info(f"Skipping rollups of '{owner_id}' until the next reconcile")
+                continue
+            expected[owner_id].append(rollup)
+
+        num_drifted = 0
+        num_stale = 0
+        for owner_id, owner_rollups in expected.items():
+            drifted, stale = self.walter_db.reconcile_cash_flow_rollups(
+                owner_id, items[owner_id], owner_rollups, dry_run
+            )
+            num_drifted += drifted
+            num_stale += stale
+        return num_drifted, num_stale
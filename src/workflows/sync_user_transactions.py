@@ -87,6 +87,9 @@ class SyncUserTransactions(Workflow):
         # update accounts with new plaid cursor and synced at
         self._update_accounts(accounts, response.cursor, response.synced_at)
 
+        # invalidate the responses of the user once per sync
+        self.db.bump_user_data_version(user.user_id)
+
         return WorkflowResponse(
             name=SyncUserTransactions.WORKFLOW_NAME,
             status=WorkflowStatus.SUCCESS,
@@ -187,7 +190,10 @@ class SyncUserTransactions(Workflow):
         for account in accounts:
             account.plaid_cursor = plaid_cursor
             account.plaid_last_sync_at = synced_at
-            updated_accounts.append(self.db.update_account(account))
+            # accounts deleted during the sync are skipped rather than restored
+            updated_account = self.db.update_account(account)
+            if updated_account is not None:
+                updated_accounts.append(updated_account)
         LOG.info(
             f"Updated {len(updated_accounts)} account(s) with new Plaid cursor synced at '{synced_at.isoformat()}'"
         )
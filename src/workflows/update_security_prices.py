@@ -1,9 +1,11 @@
 from dataclasses import dataclass
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timezone
 
 from src.database.client import WalterDB
-from src.database.securities.models import Crypto, SecurityType, Stock
+from src.database.securities.models import Crypto, Security, SecurityType, Stock
 from src.environment import Domain
+from src.investments.securities.history import PriceHistoryStore
+from src.investments.securities.scheduler import PriceRefreshScheduler
 from src.metrics.client import DatadogMetricsClient
 from src.polygon.client import PolygonClient
 from src.utils.log import Logger
@@ -16,14 +18,31 @@ log = Logger(__name__).get_logger()
 class UpdateSecurityPrices(Workflow):
     """
     Update Security Prices
+
+    Refreshes the prices of securities whose price has expired. Expiries and
+    refresh priorities are set by the `PriceRefreshScheduler` from the number
+    of holders of each security, its price volatility, and the trading hours
+    of its exchange. Prices are fetched concurrently by the Polygon client
+    under its shared rate limit and written back with batched writes.
+    Securities whose price cannot be fetched keep their current price and
+    are reported as failed.
+
+    If a `PriceHistoryStore` is given, the refreshed prices of held
+    securities are also appended to their daily price bars.
     """
 
     WORKFLOW_NAME = "UpdateSecurityPrices"
     METRICS_NUM_SECURITIES_METRIC = "workflow.num_securities"
     METRICS_NUM_UPDATED_SECURITIES_METRIC = "workflow.num_updated_securities"
+    METRICS_NUM_DEFERRED_SECURITIES_METRIC = "workflow.num_deferred_securities"
+    METRICS_NUM_FAILED_SECURITIES_METRIC = "workflow.num_failed_securities"
+    METRICS_POLYGON_CACHE_HITS_METRIC = "workflow.polygon_cache_hits"
+    METRICS_POLYGON_CACHE_MISSES_METRIC = "workflow.polygon_cache_misses"
 
     walter_db: WalterDB
     polygon: PolygonClient
+    scheduler: PriceRefreshScheduler
+    price_history: PriceHistoryStore
 
     def __init__(
         self,
@@ -31,10 +50,14 @@ class UpdateSecurityPrices(Workflow):
         walter_db: WalterDB,
         polygon: PolygonClient,
         metrics: DatadogMetricsClient,
+        scheduler: PriceRefreshScheduler = None,
+        price_history: PriceHistoryStore = None,
     ) -> None:
         super().__init__(UpdateSecurityPrices.WORKFLOW_NAME, domain, metrics)
         self.walter_db = walter_db
         self.polygon = polygon
+        self.scheduler = scheduler or PriceRefreshScheduler(walter_db)
+        self.price_history = price_history
 
     def execute(self, event: dict, emit_metrics: bool = True) -> WorkflowResponse:
         start_time = datetime.now(timezone.utc)
@@ -42,43 +65,77 @@ class UpdateSecurityPrices(Workflow):
         log.info("Getting all securities from database")
         securities = self.walter_db.get_securities()
 
-        log.info("Getting prices for all securities")
-        updated_securities = []
+        valid_securities = []
         for security in securities:
-            now = datetime.now(timezone.utc)
-            if security.price_expires_at > now:
-                log.info(
-                    f"Price '${security.current_price}' for security '{security.security_id}' has not expired yet. Skipping."
+            if not isinstance(security, (Stock, Crypto)):
+                log.error(
+                    f"Invalid security type '{security.security_type}' for security '{security.security_id}'! Skipping."
                 )
                 continue
+            valid_securities.append(security)
 
-            log.info(f"Getting price for security '{security.security_id}'")
+        expired_securities, deferred_securities = self.scheduler.get_due_securities(
+            valid_securities, datetime.now(timezone.utc)
+        )
+        if deferred_securities:
+            log.info(
+                f"Deferring price refresh of {len(deferred_securities)} lower priority securities to the next run"
+            )
 
-            price = None
-            if isinstance(security, Stock):
-                price = self.polygon.get_latest_price(
-                    security.ticker,
-                    SecurityType.STOCK,
-                )
-            elif isinstance(security, Crypto):
-                price = self.polygon.get_latest_price(
-                    security.ticker,
-                    SecurityType.CRYPTO,
-                )
-            else:
-                raise ValueError(f"Invalid security type '{security.security_type}'!")
+        log.info(f"Getting prices for {len(expired_securities)} expired securities")
+        cache_stats_before = self.polygon.get_cache_stats()
+        prices = self.polygon.get_latest_prices(
+            [
+                (security.ticker, UpdateSecurityPrices._get_security_type(security))
+                for security in expired_securities
+            ]
+        )
 
+        cache_stats = self.polygon.get_cache_stats() - cache_stats_before
+        log.info(f"Polygon cache stats: {cache_stats.to_dict()}")
+
+        # securities without a price keep their current price and are retried
+        # on the next run rather than failing the whole update
+        updated_securities = []
+        failed_securities = []
+        for security in expired_securities:
+            price = prices.get(
+                (security.ticker, UpdateSecurityPrices._get_security_type(security))
+            )
+            if price is None:
+                log.warning(
+                    f"Unable to get price for security '{security.security_id}'"
+                )
+                failed_securities.append(security.security_id)
+                continue
             log.info(f"Price for security '{security.security_id}': {price}")
+            previous_price = security.current_price
             security.current_price = price
             now = datetime.now(timezone.utc)
             security.price_updated_at = now
-            security.price_expires_at = now + timedelta(minutes=15)
+            security.price_expires_at = self.scheduler.get_price_expiry(
+                security, previous_price, now
+            )
             updated_securities.append(security)
 
-        log.info("Updating security prices in database")
-        for security in updated_securities:
-            log.info(f"Updating security '{security.security_id}'")
-            self.walter_db.update_security(security)
+        log.info(f"Updating {len(updated_securities)} security prices in database")
+        if updated_securities:
+            self.walter_db.put_securities(updated_securities)
+
+        if self.price_history is not None:
+            self.price_history.append_prices(
+                [
+                    (
+                        security.security_id,
+                        security.price_updated_at.date(),
+                        security.current_price,
+                    )
+                    for security in updated_securities
+                    if self.scheduler.get_num_holders(
+                        security.security_id, security.price_updated_at
+                    )
+                ]
+            )
 
         # emit update prices specific metrics
         if emit_metrics:
@@ -92,6 +149,22 @@ class UpdateSecurityPrices(Workflow):
                 len(updated_securities),
                 tags,
             )
+            self.metrics.emit_metric(
+                self.METRICS_NUM_DEFERRED_SECURITIES_METRIC,
+                len(deferred_securities),
+                tags,
+            )
+            self.metrics.emit_metric(
+                self.METRICS_NUM_FAILED_SECURITIES_METRIC,
+                len(failed_securities),
+                tags,
+            )
+            self.metrics.emit_metric(
+                self.METRICS_POLYGON_CACHE_HITS_METRIC, cache_stats.hits, tags
+            )
+            self.metrics.emit_metric(
+                self.METRICS_POLYGON_CACHE_MISSES_METRIC, cache_stats.misses, tags
+            )
         else:
             log.info(f"Not emitting additional metrics for '{self.name}' workflow!")
 
@@ -105,7 +178,16 @@ class UpdateSecurityPrices(Workflow):
                 ).total_seconds(),
                 "total_num_securities": len(securities),
                 "updated_num_securities": len(updated_securities),
+                "deferred_num_securities": len(deferred_securities),
+                "failed_securities": failed_securities,
+                "polygon_cache": cache_stats.to_dict(),
                 "updated_at": datetime.now(timezone.utc).isoformat(),
                 "securities": [security.to_dict() for security in updated_securities],
             },
         )
+
+    @staticmethod
+    def _get_security_type(security: Security) -> SecurityType:
+        if isinstance(security, Crypto):
+            return SecurityType.CRYPTO
+        return SecurityType.STOCK
@@ -0,0 +1,20 @@
+from src.accounts.queue import PurgeAccountTask, PurgeAccountTaskQueue
+
+
+def test_add_task_success(
+    purge_account_task_queue: PurgeAccountTaskQueue,
+) -> None:
+    task = PurgeAccountTask(user_id="user-004", account_id="acct-006")
+    task_id = purge_account_task_queue.add_task(task)
+    assert task_id is not None
+
+
+def test_task_round_trip() -> None:
+    task = PurgeAccountTask(
+        user_id="user-005",
+        account_id="acct-007",
+        exclusive_start_key={"account_id": {"S": "acct-007"}},
+        num_deleted_transactions=2,
+        num_runs=1,
+    )
+    assert PurgeAccountTask.from_dict(task.to_dict()) == task
@@ -0,0 +1,76 @@
+import json
+
+import pytest
+
+from src.ai.mlp.expenses import ExpenseCategorizerMLP
+from src.ai.mlp.featurizer import HashedExpenseFeaturizer
+from src.ai.mlp.training import (
+    StreamingExpenseCategorizerTrainer,
+    get_transactions_table_source,
+)
+from src.database.client import WalterDB
+from src.database.transactions.models import TransactionCategory
+
+LABELED_EXPENSES = [
+    ("Whole Foods", 85.25, "Groceries"),
+    ("Trader Joes", 42.10, "Groceries"),
+    ("Netflix", 15.99, "Subscriptions"),
+    ("Spotify", 9.99, "Subscriptions"),
+    ("Employer Payroll", -2500.00, "Income"),
+    ("Uber", 23.50, "Transportation"),
+    ("Unknown Vendor", 10.00, "Not A Category"),
+] * 20
+
+
+@pytest.fixture
+def trainer() -> StreamingExpenseCategorizerTrainer:
+    return StreamingExpenseCategorizerTrainer(
+        num_hidden_layers=8, num_hashed_features=64, batch_size=16, num_epochs=10
+    )
+
+
+def test_hashed_expense_featurizer_fixed_width() -> None:
+    featurizer = HashedExpenseFeaturizer(n_features=32)
+    features = featurizer.transform([[10.0, "Vendor A"], [-5.0, "A Brand New Vendor"]])
+    assert features.shape == (2, 32 + 2)
+
+
+def test_streaming_trainer_writes_versioned_artifacts(
+    trainer: StreamingExpenseCategorizerTrainer, tmp_path, monkeypatch
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    report = trainer.train(lambda: iter(LABELED_EXPENSES), version="v1")
+
+    assert report.version == "v1"
+    assert report.num_training_samples == 96
+    assert report.num_holdout_samples == 24
+    assert report.num_skipped_samples == 16
+    assert report.num_batches == 60
+    assert report.holdout_accuracy is not None
+    assert report.samples_per_second > 0
+
+    report_file = tmp_path / "expense_categorization_report-v1.json"
+    assert json.loads(report_file.read_text())["version"] == "v1"
+
+    # loading the pipeline must not import the training and database code
+    pipeline_file = tmp_path / "expense_categorization_pipeline-v1.pkl"
+    assert b"src.ai.mlp.training" not in pipeline_file.read_bytes()
+
+    categorizer = ExpenseCategorizerMLP(model_version="v1")
+    assert categorizer.categorize("Whole Foods", 80.00) in TransactionCategory
+
+
+def test_streaming_trainer_transactions_table_source(
+    trainer: StreamingExpenseCategorizerTrainer,
+    walter_db: WalterDB,
+    tmp_path,
+    monkeypatch,
+) -> None:
+    monkeypatch.chdir(tmp_path)
+    source = get_transactions_table_source(walter_db)
+    expenses = list(source())
+    assert len(expenses) > 0
+    assert all(isinstance(vendor, str) for vendor, _, _ in expenses)
+
+    report = trainer.train(source, version="v2")
+    assert report.num_training_samples + report.num_holdout_samples == len(expenses)
@@ -1,3 +1,5 @@
+import base64
+
 import pytest
 
 from src.api.accounts.create_account import CreateAccount
@@ -141,3 +143,68 @@ def test_create_account_failure_session_does_not_exist(
     assert response.http_status == HTTPStatus.UNAUTHORIZED
     assert response.status == Status.SUCCESS
     assert response.message == "Not authenticated! Session does not exist."
+
+
+def test_create_account_success_base64_encoded_body(
+    create_account_api: CreateAccount,
+    walter_authenticator: WalterAuthenticator,
+) -> None:
+    token, token_expiry = walter_authenticator.generate_access_token(
+        "user-001", "session-001"
+    )
+    event = get_api_event(
+        CREATE_ACCOUNT_API_PATH,
+        CREATE_ACCOUNT_API_METHOD,
+        token=token,
+        body={
+            "account_type": "credit",
+            "account_subtype": "credit card",
+            "institution_name": "Capital One",
+            "account_name": "Venture X",
+            "account_mask": "1234",
+            "balance": 123.45,
+        },
+    )
+    # API Gateway base64 encodes the bodies of its binary media types
+    event["body"] = base64.b64encode(event["body"].encode("utf-8")).decode("ascii")
+    event["isBase64Encoded"] = True
+
+    response = create_account_api.invoke(event)
+
+    assert response.http_status == HTTPStatus.CREATED
+    assert response.data["account"]["account_name"] == "Venture X"
+
+
+def test_create_account_success_bumps_user_data_version(
+    create_account_api: CreateAccount,
+    walter_db: WalterDB,
+    walter_authenticator: WalterAuthenticator,
+) -> None:
+    token, token_expiry = walter_authenticator.generate_access_token(
+        "user-001", "session-001"
+    )
+    body = {
+        "account_type": "credit",
+        "account_subtype": "credit card",
+        "institution_name": "Capital One",
+        "account_name": "Venture X",
+        "account_mask": "1234",
+        "balance": 123.45,
+    }
+    assert walter_db.get_user_data_version("user-001") is None
+
+    # failed writes do not bump the data version
+    invalid = get_api_event(
+        CREATE_ACCOUNT_API_PATH,
+        CREATE_ACCOUNT_API_METHOD,
+        token=token,
+        body={**body, "account_name": None},
+    )
+    assert create_account_api.invoke(invalid).http_status == HTTPStatus.BAD_REQUEST
+    assert walter_db.get_user_data_version("user-001") is None
+
+    event = get_api_event(
+        CREATE_ACCOUNT_API_PATH, CREATE_ACCOUNT_API_METHOD, token=token, body=body
+    )
+    assert create_account_api.invoke(event).http_status == HTTPStatus.CREATED
+    assert walter_db.get_user_data_version("user-001") is not None
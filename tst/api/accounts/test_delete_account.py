@@ -1,11 +1,18 @@
+import json
+
 import pytest
+from pytest_mock import MockerFixture
 
+from src.accounts.queue import PurgeAccountTaskQueue
 from src.api.accounts.delete_account import DeleteAccount
 from src.api.common.models import HTTPStatus, Status
 from src.api.factory import APIMethod, APIMethodFactory
 from src.api.routing.methods import HTTPMethod
 from src.auth.authenticator import WalterAuthenticator
 from src.database.client import WalterDB
+from src.environment import Domain
+from src.metrics.client import DatadogMetricsClient
+from src.workflows.purge_account import PurgeAccount
 from tst.api.utils import UNIT_TEST_REQUEST_ID, get_api_event, get_expected_response
 
 DELETE_ACCOUNT_API_PATH = "/accounts"
@@ -26,6 +33,9 @@ def test_delete_account_success(
     delete_account_api: DeleteAccount,
     walter_db: WalterDB,
     walter_authenticator: WalterAuthenticator,
+    purge_account_task_queue: PurgeAccountTaskQueue,
+    datadog_metrics: DatadogMetricsClient,
+    mocker: MockerFixture,
 ) -> None:
     # data seeded in the mock db
     user_id = "user-004"
@@ -54,12 +64,32 @@ def test_delete_account_success(
         api_name=delete_account_api.API_NAME,
         status_code=HTTPStatus.OK,
         status=Status.SUCCESS,
-        message="Successfully deleted account!",
+        message="Successfully started account deletion!",
     )
 
     # assert expected response
+    add_task = mocker.spy(purge_account_task_queue, "add_task")
     assert expected_response == delete_account_api.invoke(event)
 
+    # assert account is hidden while its transactions and holdings are purged
+    assert walter_db.get_account(user_id, account_id) is None
+    assert walter_db.get_account_transactions(account_id) != []
+    assert add_task.call_count == 1
+
+    # assert deleting an account twice fails
+    assert get_expected_response(
+        api_name=delete_account_api.API_NAME,
+        status_code=HTTPStatus.NOT_FOUND,
+        status=Status.SUCCESS,
+        message="Account does not exist!",
+    ) == delete_account_api.invoke(event)
+
+    # purge the account with the enqueued task
+    task = add_task.call_args.args[0]
+    PurgeAccount(
+        Domain.TESTING, walter_db, purge_account_task_queue, datadog_metrics
+    ).invoke({"Records": [{"body": json.dumps(task.to_dict())}]}, emit_metrics=False)
+
     # assert account, transactions, and holdings are deleted
     assert walter_db.get_account(user_id, account_id) is None
     assert walter_db.get_account_transactions(account_id) == []
@@ -1,3 +1,5 @@
+from datetime import datetime, timezone
+
 import pytest
 from freezegun import freeze_time
 
@@ -8,6 +10,7 @@ from src.api.routing.methods import HTTPMethod
 from src.auth.authenticator import WalterAuthenticator
 from src.database.client import WalterDB
 from tst.api.utils import UNIT_TEST_REQUEST_ID, get_api_event, get_expected_response
+from tst.constants import ACCOUNTS_TABLE_NAME, SECURITIES_TABLE_NAME
 
 GET_ACCOUNTS_API_PATH = "/accounts"
 """(str): Path to the get accounts API endpoint."""
@@ -102,6 +105,42 @@ def test_get_accounts_success(
     assert account_ids_to_account["acct-008"]["holdings"][0]["gain_loss"] == 24000.00
 
 
+@freeze_time("2025-07-01")
+def test_get_accounts_success_warm_reads_no_securities(
+    get_accounts_api: GetAccounts,
+    walter_db: WalterDB,
+    walter_authenticator: WalterAuthenticator,
+    mocker,
+) -> None:
+    # refresh the price of the held security so it is cacheable
+    security = walter_db.get_security("sec-nyse-coke")
+    security.price_expires_at = datetime(2025, 7, 1, 1, tzinfo=timezone.utc)
+    walter_db.put_security(security)
+    walter_db.securities_table.cache.clear()
+
+    access_token, access_token_expiry = walter_authenticator.generate_access_token(
+        "user-001", "session-001"
+    )
+    event = get_api_event(
+        GET_ACCOUNTS_API_PATH,
+        GET_ACCOUNTS_API_METHOD,
+        token=access_token,
+    )
+    spy = mocker.spy(walter_db.ddb, "get_item")
+
+    cold_response = get_accounts_api.invoke(event)
+    warm_response = get_accounts_api.invoke(event)
+
+    security_reads = [
+        call
+        for call in spy.call_args_list
+        if call.kwargs.get("table", call.args[0] if call.args else None)
+        == SECURITIES_TABLE_NAME
+    ]
+    assert len(security_reads) == 1
+    assert warm_response.data["accounts"] == cold_response.data["accounts"]
+
+
 @freeze_time("2025-07-01")
 def test_get_accounts_failure_not_authenticated(
     get_accounts_api: GetAccounts,
@@ -203,3 +242,134 @@ def test_get_accounts_success_investment_account_has_no_holdings(
     assert response.data["accounts"][0]["account_type"] == "investment"
     assert response.data["accounts"][0]["balance"] == 0.0
     assert len(response.data["accounts"][0]["holdings"]) == 0
+
+
+def test_get_accounts_success_balances_persisted_only_when_stale(
+    get_accounts_api: GetAccounts,
+    walter_db: WalterDB,
+    walter_authenticator: WalterAuthenticator,
+    mocker,
+) -> None:
+    user_id = "user-003"
+    account_id = "acct-004"
+    spy = mocker.spy(walter_db.ddb, "update_item")
+
+    with freeze_time("2025-07-01"):
+        token, token_expiry = walter_authenticator.generate_access_token(
+            user_id, "session-002"
+        )
+        event = get_api_event(
+            GET_ACCOUNTS_API_PATH, GET_ACCOUNTS_API_METHOD, token=token
+        )
+        get_accounts_api.invoke(event)
+        assert _count_account_writes(spy) == 1
+
+        # unchanged balances are not persisted again
+        response = get_accounts_api.invoke(event)
+        assert response.data["accounts"][0]["balance"] == 50.00
+        assert _count_account_writes(spy) == 1
+
+    # unchanged balances are persisted once they exceed the max balance age
+    with freeze_time("2025-07-01T01:00:00Z"):
+        token, token_expiry = walter_authenticator.generate_access_token(
+            user_id, "session-002"
+        )
+        event = get_api_event(
+            GET_ACCOUNTS_API_PATH, GET_ACCOUNTS_API_METHOD, token=token
+        )
+        get_accounts_api.invoke(event)
+        assert _count_account_writes(spy) == 2
+
+    account = walter_db.get_account(user_id, account_id)
+    assert account.balance == 50.00
+    assert account.balance_last_updated_at.isoformat() == "2025-07-01T01:00:00+00:00"
+
+
+def _count_account_writes(spy) -> int:
+    return len(
+        [
+            call
+            for call in spy.call_args_list
+            if call.kwargs.get("table") == ACCOUNTS_TABLE_NAME
+        ]
+    )
+
+
+@freeze_time("2025-07-01")
+def test_get_accounts_success_sparse_fields(
+    get_accounts_api: GetAccounts,
+    walter_db: WalterDB,
+    walter_authenticator: WalterAuthenticator,
+    mocker,
+) -> None:
+    access_token, access_token_expiry = walter_authenticator.generate_access_token(
+        "user-001", "session-001"
+    )
+    event = get_api_event(
+        GET_ACCOUNTS_API_PATH,
+        GET_ACCOUNTS_API_METHOD,
+        token=access_token,
+        query={"fields": "account_id,account_name"},
+    )
+    spy = mocker.spy(walter_db.ddb, "get_item")
+
+    response = get_accounts_api.invoke(event)
+
+    assert response.http_status == HTTPStatus.OK
+    assert "total_balance" not in response.data
+    assert sorted(response.data["accounts"], key=lambda a: a["account_id"]) == [
+        {"account_id": "acct-001", "account_name": "Walter Credit Account"},
+        {"account_id": "acct-008", "account_name": "Walter Investment Account"},
+    ]
+    # neither balances nor holdings are requested, securities are not read
+    assert all(
+        call.kwargs.get("table", call.args[0] if call.args else None)
+        != SECURITIES_TABLE_NAME
+        for call in spy.call_args_list
+    )
+
+
+@freeze_time("2025-07-01")
+def test_get_accounts_success_sparse_holding_fields(
+    get_accounts_api: GetAccounts,
+    walter_authenticator: WalterAuthenticator,
+) -> None:
+    access_token, access_token_expiry = walter_authenticator.generate_access_token(
+        "user-001", "session-001"
+    )
+    event = get_api_event(
+        GET_ACCOUNTS_API_PATH,
+        GET_ACCOUNTS_API_METHOD,
+        token=access_token,
+        query={"fields": "account_id,balance,holdings.security_id,holdings.gain_loss"},
+    )
+
+    response = get_accounts_api.invoke(event)
+
+    assert response.data["total_balance"] == 25000.00
+    accounts = {account["account_id"]: account for account in response.data["accounts"]}
+    assert accounts["acct-001"] == {"account_id": "acct-001", "balance": 0.0}
+    assert accounts["acct-008"]["balance"] == 25000.00
+    assert accounts["acct-008"]["holdings"] == [
+        {"security_id": "sec-nyse-coke", "gain_loss": 24000.00}
+    ]
+
+
+@freeze_time("2025-07-01")
+def test_get_accounts_failure_invalid_fields(
+    get_accounts_api: GetAccounts,
+    walter_authenticator: WalterAuthenticator,
+) -> None:
+    access_token, access_token_expiry = walter_authenticator.generate_access_token(
+        "user-001", "session-001"
+    )
+    event = get_api_event(
+        GET_ACCOUNTS_API_PATH,
+        GET_ACCOUNTS_API_METHOD,
+        token=access_token,
+        query={"fields": "account_id,plaid_access_token"},
+    )
+
+    response = get_accounts_api.invoke(event)
+
+    assert response.http_status == HTTPStatus.BAD_REQUEST
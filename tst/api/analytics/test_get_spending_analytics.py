@@ -0,0 +1,131 @@
+import pytest
+
+from src.api.analytics.get_spending_analytics import GetSpendingAnalytics
+from src.api.common.models import HTTPStatus, Status
+from src.api.factory import APIMethod, APIMethodFactory
+from src.api.routing.methods import HTTPMethod
+from src.auth.authenticator import WalterAuthenticator
+from tst.api.utils import UNIT_TEST_REQUEST_ID, get_api_event
+
+GET_SPENDING_ANALYTICS_API_PATH = "/analytics/spending"
+"""(str): Path to the get spending analytics API endpoint."""
+
+GET_SPENDING_ANALYTICS_API_METHOD = HTTPMethod.GET
+"""(HTTPMethod): HTTP method for the get spending analytics API endpoint."""
+
+
+@pytest.fixture
+def get_spending_analytics_api(
+    api_method_factory: APIMethodFactory,
+) -> GetSpendingAnalytics:
+    return api_method_factory.get_api(
+        APIMethod.GET_SPENDING_ANALYTICS, UNIT_TEST_REQUEST_ID
+    )
+
+
+def test_get_spending_analytics_success(
+    get_spending_analytics_api: GetSpendingAnalytics,
+    walter_authenticator: WalterAuthenticator,
+) -> None:
+    token, _ = walter_authenticator.generate_access_token("user-002", "session-004")
+    event = get_api_event(
+        GET_SPENDING_ANALYTICS_API_PATH,
+        GET_SPENDING_ANALYTICS_API_METHOD,
+        token=token,
+        query={"start_date": "2025-08-06", "end_date": "2025-08-06"},
+    )
+
+    response = get_spending_analytics_api.invoke(event)
+
+    assert response.http_status == HTTPStatus.OK
+    assert response.status == Status.SUCCESS
+
+    # rent is paid on 08-06 and starbucks on 08-05, the income is not spend
+    data = response.data
+    assert data["previous_start_date"] == "2025-08-05"
+    assert data["total_spend"] == 1500
+    assert data["previous_total_spend"] == 5
+    assert data["change"] == 1495
+    assert data["percent_change"] == 299
+    assert [category["category"] for category in data["categories"]] == [
+        "Housing",
+        "Restaurants",
+    ]
+    assert data["merchants"] == [
+        {
+            "merchant_name": "Rent",
+            "spend": 1500,
+            "num_transactions": 1,
+            "previous_spend": 0,
+            "previous_num_transactions": 0,
+            "change": 1500,
+            "percent_change": None,
+        }
+    ]
+    assert data["accounts"][0]["account_id"] == "acct-003"
+    assert data["accounts"][0]["account_name"] == "Walrus Credit Account"
+    assert data["weekdays"][2] == {
+        "weekday": "Wednesday",
+        "spend": 1500,
+        "num_transactions": 1,
+        "previous_spend": 0,
+        "previous_num_transactions": 0,
+        "change": 1500,
+        "percent_change": None,
+    }
+    assert data["months"] == [
+        {"month": "2025-08", "spend": 1500, "num_transactions": 1}
+    ]
+
+
+def test_get_spending_analytics_account(
+    get_spending_analytics_api: GetSpendingAnalytics,
+    walter_authenticator: WalterAuthenticator,
+) -> None:
+    token, _ = walter_authenticator.generate_access_token("user-002", "session-004")
+    event = get_api_event(
+        GET_SPENDING_ANALYTICS_API_PATH,
+        GET_SPENDING_ANALYTICS_API_METHOD,
+        token=token,
+        query={
+            "start_date": "2025-08-01",
+            "end_date": "2025-08-31",
+            "account_id": "acct-002",
+        },
+    )
+
+    response = get_spending_analytics_api.invoke(event)
+
+    # investment transactions are not spend
+    assert response.http_status == HTTPStatus.OK
+    assert response.data["total_spend"] == 0
+    assert response.data["categories"] == []
+    assert response.data["accounts"] == []
+
+
+def test_get_spending_analytics_failure_invalid_request(
+    get_spending_analytics_api: GetSpendingAnalytics,
+    walter_authenticator: WalterAuthenticator,
+) -> None:
+    token, _ = walter_authenticator.generate_access_token("user-002", "session-004")
+    for query, http_status in [
+        (
+            {"start_date": "2025-08-08", "end_date": "2025-08-01"},
+            HTTPStatus.BAD_REQUEST,
+        ),
+        (
+            {"start_date": "2000-01-01", "end_date": "2025-08-01"},
+            HTTPStatus.BAD_REQUEST,
+        ),
+        ({"start_date": "08/01/2025"}, HTTPStatus.BAD_REQUEST),
+        ({"num_merchants": "0"}, HTTPStatus.BAD_REQUEST),
+        ({"num_merchants": "ten"}, HTTPStatus.BAD_REQUEST),
+        ({"account_id": "acct-999"}, HTTPStatus.NOT_FOUND),
+    ]:
+        event = get_api_event(
+            GET_SPENDING_ANALYTICS_API_PATH,
+            GET_SPENDING_ANALYTICS_API_METHOD,
+            token=token,
+            query=query,
+        )
+        assert get_spending_analytics_api.invoke(event).http_status == http_status
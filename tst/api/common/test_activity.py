@@ -0,0 +1,94 @@
+import datetime as dt
+
+import pytest
+from freezegun import freeze_time
+
+from src.api.common.activity import LastActiveTracker
+from src.api.factory import APIMethod, APIMethodFactory
+from src.api.routing.methods import HTTPMethod
+from src.auth.authenticator import WalterAuthenticator
+from src.database.client import WalterDB
+from src.utils.ttl_cache import TTLCache
+from tst.api.utils import UNIT_TEST_REQUEST_ID, get_api_event
+
+LAST_ACTIVE_DATE = dt.datetime(2025, 6, 1, tzinfo=dt.UTC)
+"""(datetime): The last active date of the test user before each test."""
+
+
+@pytest.fixture
+def walter_db_user(walter_db: WalterDB) -> WalterDB:
+    user = walter_db.get_user_by_id("user-001")
+    user.last_active_date = LAST_ACTIVE_DATE
+    walter_db.update_user(user)
+    return walter_db
+
+
+def _create_tracker(walter_db: WalterDB) -> LastActiveTracker:
+    return LastActiveTracker(
+        walter_db=walter_db,
+        write_interval=dt.timedelta(minutes=15),
+        last_writes=TTLCache(),
+    )
+
+
+def test_record_activity_throttled_in_process(walter_db_user: WalterDB, mocker):
+    tracker = _create_tracker(walter_db_user)
+    spy = mocker.spy(walter_db_user.ddb, "update_item")
+
+    with freeze_time("2025-07-01T00:00:00Z"):
+        tracker.record_activity("user-001")
+    with freeze_time("2025-07-01T00:14:00Z"):
+        tracker.record_activity("user-001")
+    assert spy.call_count == 1
+    assert walter_db_user.get_user_by_id("user-001").last_active_date == dt.datetime(
+        2025, 7, 1, tzinfo=dt.UTC
+    )
+
+    with freeze_time("2025-07-01T00:15:00Z"):
+        tracker.record_activity("user-001")
+    assert spy.call_count == 2
+    assert walter_db_user.get_user_by_id("user-001").last_active_date == dt.datetime(
+        2025, 7, 1, 0, 15, tzinfo=dt.UTC
+    )
+
+
+def test_record_activity_throttled_across_processes(walter_db_user: WalterDB):
+    with freeze_time("2025-07-01T00:00:00Z"):
+        _create_tracker(walter_db_user).record_activity("user-001")
+
+    # a tracker in another process does not overwrite a recent write
+    with freeze_time("2025-07-01T00:10:00Z"):
+        _create_tracker(walter_db_user).record_activity("user-001")
+    assert walter_db_user.get_user_by_id("user-001").last_active_date == dt.datetime(
+        2025, 7, 1, tzinfo=dt.UTC
+    )
+
+
+def test_record_activity_user_does_not_exist(walter_db: WalterDB):
+    _create_tracker(walter_db).record_activity("user-ghost")
+    assert walter_db.get_user_by_id("user-ghost") is None
+
+
+@freeze_time("2025-07-01")
+def test_authenticated_apis_record_activity(
+    api_method_factory: APIMethodFactory,
+    walter_db_user: WalterDB,
+    walter_authenticator: WalterAuthenticator,
+    mocker,
+):
+    get_accounts_api = api_method_factory.get_api(
+        APIMethod.GET_ACCOUNTS, UNIT_TEST_REQUEST_ID
+    )
+    access_token, access_token_expiry = walter_authenticator.generate_access_token(
+        "user-001", "session-001"
+    )
+    event = get_api_event("/accounts", HTTPMethod.GET, token=access_token)
+    spy = mocker.spy(walter_db_user.ddb, "put_item")
+
+    get_accounts_api.invoke(event)
+    get_accounts_api.invoke(event)
+
+    assert walter_db_user.get_user_by_id("user-001").last_active_date == dt.datetime(
+        2025, 7, 1, tzinfo=dt.UTC
+    )
+    assert spy.call_count == 0
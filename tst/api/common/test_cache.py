@@ -0,0 +1,50 @@
+from freezegun import freeze_time
+
+from src.api.common.cache import CachedResponse, ResponseCache
+from src.database.client import WalterDB
+from src.utils.ttl_cache import TTLCache
+
+RESPONSE = CachedResponse("Retrieved accounts!", {"user_id": "user-001"})
+
+
+def _get_response_cache(walter_db: WalterDB = None, max_entries: int = 2):
+    return ResponseCache(walter_db, TTLCache(max_entries=max_entries))
+
+
+def test_cached_response_encode() -> None:
+    assert CachedResponse.decode(RESPONSE.encode()) == RESPONSE
+
+
+def test_response_cache_get_put() -> None:
+    cache = _get_response_cache()
+
+    with freeze_time("2025-07-01 12:00:00"):
+        assert cache.get("response#a") is None
+        cache.put("response#a", RESPONSE, ttl_seconds=60)
+        assert cache.get("response#a") == RESPONSE
+
+    with freeze_time("2025-07-01 12:01:00"):
+        assert cache.get("response#a") is None
+        assert "response#a" not in cache.entries
+
+
+def test_response_cache_evicts_least_recently_used() -> None:
+    cache = _get_response_cache(max_entries=2)
+
+    cache.put("response#a", RESPONSE, ttl_seconds=60)
+    cache.put("response#b", RESPONSE, ttl_seconds=60)
+    assert cache.get("response#a") == RESPONSE
+    cache.put("response#c", RESPONSE, ttl_seconds=60)
+
+    assert list(cache.entries.entries) == ["response#a", "response#c"]
+
+
+def test_response_cache_shared_through_ddb(walter_db: WalterDB) -> None:
+    writer = _get_response_cache(walter_db)
+    reader = _get_response_cache(walter_db)
+
+    with freeze_time("2025-07-01 12:00:00"):
+        writer.put("response#a", RESPONSE, ttl_seconds=60)
+        assert reader.get("response#a") == RESPONSE
+        assert "response#a" in reader.entries
+        assert reader.get("response#b") is None
@@ -0,0 +1,67 @@
+import datetime as dt
+
+import pytest
+
+from src.api.common.etags import (
+    get_body_etag,
+    get_data_version_etag,
+    get_opaque_tag,
+    matches_etag,
+)
+
+NOW = dt.datetime(2025, 7, 1, 12, 0, 1, tzinfo=dt.timezone.utc)
+
+
+def _get_etag(**kwargs) -> str:
+    args = {
+        "api_name": "GetTransactions",
+        "user_id": "user-001",
+        "version": "epoch.1",
+        "query": {"limit": "10", "layout": "columnar"},
+        "now": NOW,
+        "max_age_seconds": 300,
+    }
+    args.update(kwargs)
+    return get_data_version_etag(**args)
+
+
+def test_get_data_version_etag() -> None:
+    etag = _get_etag()
+
+    assert etag.startswith('W/"') and etag.endswith('"')
+    assert _get_etag(query={"layout": "columnar", "limit": "10"}) == etag
+    assert _get_etag(now=NOW + dt.timedelta(seconds=60)) == etag
+    assert _get_etag(now=NOW + dt.timedelta(seconds=300)) != etag
+    assert _get_etag(version="epoch.2") != etag
+    assert _get_etag(user_id="user-002") != etag
+    assert _get_etag(api_name="GetAccounts") != etag
+    assert _get_etag(query=None) != etag
+
+
+def test_get_body_etag() -> None:
+    assert get_body_etag(b'{"a":1}').startswith('W/"')
+    assert get_body_etag(b'{"a":1}') == get_body_etag(b'{"a":1}')
+    assert get_body_etag(b'{"a":1}') != get_body_etag(b'{"a":2}')
+
+
+@pytest.mark.parametrize(
+    "if_none_match, expected",
+    [
+        (None, False),
+        ("", False),
+        ('"abc"', True),
+        ('W/"abc"', True),
+        ('"xyz", "abc"', True),
+        ('"xyz"', False),
+        ("abc", False),
+        ("*", True),
+    ],
+)
+def test_matches_etag(if_none_match, expected) -> None:
+    assert matches_etag(if_none_match, '"abc"') == expected
+    assert matches_etag(if_none_match, 'W/"abc"') == expected
+
+
+def test_get_opaque_tag() -> None:
+    assert get_opaque_tag('W/"abc"') == "abc"
+    assert get_opaque_tag('"abc"') == "abc"
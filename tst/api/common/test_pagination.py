@@ -0,0 +1,26 @@
+import pytest
+
+from src.api.common.exceptions import BadRequest
+from src.api.common.pagination import decode_next_token, encode_next_token
+
+
+def test_next_token_round_trip() -> None:
+    key = {
+        "user_id": {"S": "user-002"},
+        "transaction_id": {"S": "bank-txn-001"},
+        "transaction_date": {"S": "2025-08-01#bank-txn-001"},
+    }
+    next_token = encode_next_token(key)
+    assert decode_next_token(next_token, "user_id", "user-002") == key
+
+
+def test_next_token_of_last_page() -> None:
+    assert encode_next_token(None) is None
+
+
+def test_next_token_of_other_partition() -> None:
+    next_token = encode_next_token({"user_id": {"S": "user-002"}})
+    with pytest.raises(BadRequest):
+        decode_next_token(next_token, "user_id", "user-001")
+    with pytest.raises(BadRequest):
+        decode_next_token(next_token, "account_id", "user-002")
@@ -0,0 +1,83 @@
+from datetime import date
+
+import pytest
+
+from src.api.common.models import HTTPStatus, Status
+from src.api.factory import APIMethod, APIMethodFactory
+from src.api.portfolio.get_portfolio_history import GetPortfolioHistory
+from src.api.routing.methods import HTTPMethod
+from src.auth.authenticator import WalterAuthenticator
+from src.factory import ClientFactory
+from tst.api.utils import UNIT_TEST_REQUEST_ID, get_api_event
+
+GET_PORTFOLIO_HISTORY_API_PATH = "/portfolio/history"
+"""(str): Path to the get portfolio history API endpoint."""
+
+GET_PORTFOLIO_HISTORY_API_METHOD = HTTPMethod.GET
+"""(HTTPMethod): HTTP method for the get portfolio history API endpoint."""
+
+
+@pytest.fixture
+def get_portfolio_history_api(
+    api_method_factory: APIMethodFactory,
+) -> GetPortfolioHistory:
+    return api_method_factory.get_api(
+        APIMethod.GET_PORTFOLIO_HISTORY, UNIT_TEST_REQUEST_ID
+    )
+
+
+def test_get_portfolio_history_success(
+    get_portfolio_history_api: GetPortfolioHistory,
+    client_factory: ClientFactory,
+    walter_authenticator: WalterAuthenticator,
+) -> None:
+    client_factory.get_price_history_store().append_prices(
+        [("sec-nasdaq-aapl", date(2025, 8, 5), 110.0)]
+    )
+    token, _ = walter_authenticator.generate_access_token("user-002", "session-004")
+    event = get_api_event(
+        GET_PORTFOLIO_HISTORY_API_PATH,
+        GET_PORTFOLIO_HISTORY_API_METHOD,
+        token=token,
+        query={"start_date": "2025-08-01", "end_date": "2025-08-08"},
+    )
+
+    response = get_portfolio_history_api.invoke(event)
+
+    assert response.http_status == HTTPStatus.OK
+    assert response.status == Status.SUCCESS
+    assert response.data["account_ids"] == ["acct-002"]
+
+    # buy aapl on 08-01, coke and btc on 08-04, aapl closes at 110 on 08-05
+    # and half the aapl position is sold at 125 on 08-08
+    history = response.data["history"]
+    assert history["dates"][0] == "2025-08-01"
+    assert history["dates"][-1] == "2025-08-08"
+    assert history["values"] == [1000, 1000, 1000, 2500, 2600, 2600, 2600, 2125]
+    assert history["net_contributions"][-1] == 1875
+    assert response.data["end_value"] == 2125
+    assert response.data["time_weighted_return"] == pytest.approx(
+        1.04 * (1 + 150 / 2600) - 1
+    )
+
+
+def test_get_portfolio_history_failure_invalid_range(
+    get_portfolio_history_api: GetPortfolioHistory,
+    walter_authenticator: WalterAuthenticator,
+) -> None:
+    token, _ = walter_authenticator.generate_access_token("user-002", "session-004")
+    for query in [
+        {"start_date": "2025-08-08", "end_date": "2025-08-01"},
+        {"start_date": "2000-01-01", "end_date": "2025-08-01"},
+        {"start_date": "08/01/2025"},
+        {"account_id": "acct-003"},
+    ]:
+        event = get_api_event(
+            GET_PORTFOLIO_HISTORY_API_PATH,
+            GET_PORTFOLIO_HISTORY_API_METHOD,
+            token=token,
+            query=query,
+        )
+        assert get_portfolio_history_api.invoke(event).http_status == (
+            HTTPStatus.BAD_REQUEST
+        )
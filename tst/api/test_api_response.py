@@ -1,8 +1,45 @@
+import base64
+import datetime as dt
+import gzip
+import json
+import zlib
+
+import numpy as np
+import pytest
+
 from src.api.common.models import HTTPStatus, Status
-from src.api.common.response import Response
+from src.api.common.response import (
+    ContentEncoding,
+    OrjsonJSONEncoder,
+    Response,
+    StdlibJSONEncoder,
+    get_content_encoding,
+)
 from src.environment import Domain
 
 
+def _create_response(data: dict, accept_encoding: str = None) -> Response:
+    return Response(
+        domain=Domain.DEVELOPMENT,
+        api_name="TestAPI",
+        request_id="test-request-id",
+        http_status=HTTPStatus.OK,
+        status=Status.SUCCESS,
+        message="Success!",
+        data=data,
+        accept_encoding=accept_encoding,
+    )
+
+
+LARGE_DATA = {
+    "transactions": [
+        {"transaction_id": f"txn-{i}", "merchant_name": "Walrus Café", "amount": i}
+        for i in range(500)
+    ]
+}
+"""(dict): Response data large enough to be compressed."""
+
+
 def test_api_response_with_cookies_dev():
     expected_cookie_settings = [
         "Path=/",
@@ -53,3 +90,105 @@ def test_api_response_with_cookies_prod():
     assert cookie.startswith("test-cookie=test-cookie-value;")
     for setting in expected_cookie_settings:
         assert setting in cookie
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, expected",
+    [
+        (None, ContentEncoding.IDENTITY),
+        ("", ContentEncoding.IDENTITY),
+        ("br", ContentEncoding.IDENTITY),
+        ("gzip, deflate, br", ContentEncoding.GZIP),
+        ("deflate, gzip", ContentEncoding.GZIP),
+        ("deflate", ContentEncoding.DEFLATE),
+        ("GZIP;q=0.5, deflate;q=0.8", ContentEncoding.DEFLATE),
+        ("gzip;q=0, deflate;q=0", ContentEncoding.IDENTITY),
+        ("*", ContentEncoding.GZIP),
+        ("*;q=0.5, gzip;q=0", ContentEncoding.DEFLATE),
+        ("gzip;q=invalid, deflate", ContentEncoding.DEFLATE),
+    ],
+)
+def test_get_content_encoding(accept_encoding, expected) -> None:
+    assert get_content_encoding(accept_encoding) == expected
+
+
+@pytest.mark.parametrize(
+    "accept_encoding, decompress",
+    [("gzip", gzip.decompress), ("deflate", zlib.decompress)],
+)
+def test_api_response_compressed(accept_encoding, decompress) -> None:
+    response_json = _create_response(LARGE_DATA, accept_encoding).to_json()
+
+    assert response_json["isBase64Encoded"] is True
+    assert response_json["headers"]["Content-Encoding"] == accept_encoding
+    assert response_json["headers"]["Vary"] == "Accept-Encoding"
+    body = json.loads(decompress(base64.b64decode(response_json["body"])))
+    assert body["Data"] == LARGE_DATA
+    # compression is deterministic
+    assert _create_response(LARGE_DATA, accept_encoding).to_json() == response_json
+
+
+def test_api_response_not_compressed_if_not_accepted() -> None:
+    response_json = _create_response(LARGE_DATA, "br").to_json()
+
+    assert "isBase64Encoded" not in response_json
+    assert "Content-Encoding" not in response_json["headers"]
+    assert response_json["headers"]["Vary"] == "Accept-Encoding"
+    assert json.loads(response_json["body"])["Data"] == LARGE_DATA
+
+
+def test_api_response_not_compressed_if_small() -> None:
+    data = {"user_id": "user-001"}
+
+    response_json = _create_response(data, "gzip").to_json()
+
+    assert "isBase64Encoded" not in response_json
+    assert "Content-Encoding" not in response_json["headers"]
+    assert "Vary" not in response_json["headers"]
+    assert json.loads(response_json["body"])["Data"] == data
+
+
+def test_api_response_with_etag_varies_by_accept_encoding() -> None:
+    response = _create_response({"user_id": "user-001"}, "gzip")
+    response.etag = 'W/"abc"'
+
+    response_json = response.to_json()
+
+    assert "Content-Encoding" not in response_json["headers"]
+    assert response_json["headers"]["ETag"] == 'W/"abc"'
+    assert response_json["headers"]["Vary"] == "Accept-Encoding"
+
+
+def test_api_response_not_modified_varies_by_accept_encoding() -> None:
+    response = _create_response({}, "gzip")
+    response.http_status = HTTPStatus.NOT_MODIFIED
+    response.etag = 'W/"abc"'
+
+    response_json = response.to_json()
+
+    assert response_json["statusCode"] == HTTPStatus.NOT_MODIFIED.value
+    assert response_json["headers"]["ETag"] == 'W/"abc"'
+    assert response_json["headers"]["Vary"] == "Accept-Encoding"
+
+
+def test_stdlib_json_encoder() -> None:
+    encoded = StdlibJSONEncoder().dumps({"merchant_name": "Walrus Café", "n": [1, 2]})
+
+    assert encoded == '{"merchant_name":"Walrus Café","n":[1,2]}'.encode("utf-8")
+
+
+def test_stdlib_json_encoder_matches_orjson() -> None:
+    obj = {
+        "date": dt.date(2025, 8, 1),
+        "datetime": dt.datetime(2025, 8, 1, 12, 30, 15, 250, tzinfo=dt.timezone.utc),
+        "status": Status.SUCCESS,
+        "cash_flow": float("nan"),
+        "totals": [1.5, float("inf"), -float("inf")],
+        "amounts": np.array([1.25, np.nan]),
+        "count": np.int64(3),
+    }
+
+    encoded = StdlibJSONEncoder().dumps(obj)
+
+    assert json.loads(encoded)["cash_flow"] is None
+    assert encoded == OrjsonJSONEncoder().dumps(obj)
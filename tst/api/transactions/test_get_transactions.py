@@ -1,11 +1,19 @@
+import base64
+import datetime as dt
+import gzip
+import json
+from typing import Optional
+
 import pytest
 
 from src.api.common.methods import WalterAPIMethod
 from src.api.common.models import HTTPStatus, Status
+from src.api.common.response import Response
 from src.api.factory import APIMethod, APIMethodFactory
 from src.api.routing.methods import HTTPMethod
 from src.api.transactions.get_transactions.method import GetTransactions
 from src.auth.authenticator import WalterAuthenticator
+from src.database.client import WalterDB
 from tst.api.utils import UNIT_TEST_REQUEST_ID, get_api_event
 
 
@@ -152,3 +160,444 @@ def test_get_account_transactions_failure_account_does_not_exist(
     assert response.http_status == HTTPStatus.NOT_FOUND
     assert response.status == Status.SUCCESS
     assert "Account does not exist" in response.message
+
+
+def test_get_transactions_paginated_most_recent_first(
+    get_transactions_api: GetTransactions, walter_authenticator: WalterAuthenticator
+) -> None:
+    user_id = "user-002"
+    session_id = "session-004"
+    token, token_expiry = walter_authenticator.generate_access_token(
+        user_id, session_id
+    )
+
+    # get the complete history in a single response for comparison
+    event = get_api_event(
+        GET_TRANSACTIONS_API_PATH, GET_TRANSACTIONS_API_METHOD, token=token
+    )
+    full_response = get_transactions_api.invoke(event).data
+    assert full_response["next_token"] is None
+
+    # page through the history most recent first
+    pages, next_token = [], None
+    while True:
+        query = {"limit": "3", "order": "desc"}
+        if next_token:
+            query["next_token"] = next_token
+        event = get_api_event(
+            GET_TRANSACTIONS_API_PATH,
+            GET_TRANSACTIONS_API_METHOD,
+            token=token,
+            query=query,
+        )
+        response = get_transactions_api.invoke(event)
+        assert response.http_status == HTTPStatus.OK
+        pages.append(response.data)
+        next_token = response.data["next_token"]
+        if next_token is None:
+            break
+
+    assert all(page["num_transactions"] <= 3 for page in pages)
+    transactions = [txn for page in pages for txn in page["transactions"]]
+    assert len(transactions) == full_response["num_transactions"]
+    assert {txn["transaction_id"] for txn in transactions} == {
+        txn["transaction_id"] for txn in full_response["transactions"]
+    }
+    dates = [txn["transaction_date"][:10] for txn in transactions]
+    assert dates == sorted(dates, reverse=True)
+
+    # totals of the whole window are returned with the first page only
+    for field in ["total_income", "total_expense", "cash_flow"]:
+        assert pages[0][field] == pytest.approx(full_response[field])
+        assert all(field not in page for page in pages[1:])
+
+
+def test_get_transactions_paginated_skips_deleting_accounts(
+    get_transactions_api: GetTransactions,
+    walter_authenticator: WalterAuthenticator,
+    walter_db: WalterDB,
+) -> None:
+    user_id = "user-002"
+    session_id = "session-004"
+    token, token_expiry = walter_authenticator.generate_access_token(
+        user_id, session_id
+    )
+    assert walter_db.mark_account_deleting(user_id, "acct-003", dt.datetime.now(dt.UTC))
+
+    pages, next_token = [], None
+    while True:
+        query = {"limit": "2"}
+        if next_token:
+            query["next_token"] = next_token
+        event = get_api_event(
+            GET_TRANSACTIONS_API_PATH,
+            GET_TRANSACTIONS_API_METHOD,
+            token=token,
+            query=query,
+        )
+        response = get_transactions_api.invoke(event)
+        assert response.http_status == HTTPStatus.OK
+        pages.append(response.data)
+        next_token = response.data["next_token"]
+        if next_token is None:
+            break
+
+    # pages only count the transactions they return
+    for page in pages:
+        assert page["num_transactions"] == len(page["transactions"])
+        assert all(txn["account_id"] != "acct-003" for txn in page["transactions"])
+    assert sum(page["num_transactions"] for page in pages) == 4
+
+
+def test_get_account_transactions_paginated_totals_span_window(
+    get_transactions_api: GetTransactions, walter_authenticator: WalterAuthenticator
+) -> None:
+    user_id = "user-002"
+    session_id = "session-004"
+    token, token_expiry = walter_authenticator.generate_access_token(
+        user_id, session_id
+    )
+    event = get_api_event(
+        GET_TRANSACTIONS_API_PATH,
+        GET_TRANSACTIONS_API_METHOD,
+        token=token,
+        query={
+            "start_date": "2025-08-01",
+            "end_date": "2025-08-31",
+            "account_id": "acct-003",
+            "limit": "1",
+            "order": "desc",
+        },
+    )
+    response = get_transactions_api.invoke(event)
+
+    assert response.http_status == HTTPStatus.OK
+    assert response.data["num_transactions"] == 1
+    assert response.data["next_token"] is not None
+    assert response.data["total_income"] == pytest.approx(2500.00)
+    assert response.data["total_expense"] == pytest.approx(1505.00)
+    assert response.data["cash_flow"] == pytest.approx(995.00)
+
+
+def test_get_transactions_failure_next_token_of_other_user(
+    get_transactions_api: GetTransactions, walter_authenticator: WalterAuthenticator
+) -> None:
+    # get a next token issued for user-002
+    token, token_expiry = walter_authenticator.generate_access_token(
+        "user-002", "session-004"
+    )
+    event = get_api_event(
+        GET_TRANSACTIONS_API_PATH,
+        GET_TRANSACTIONS_API_METHOD,
+        token=token,
+        query={"limit": "1"},
+    )
+    next_token = get_transactions_api.invoke(event).data["next_token"]
+    assert next_token is not None
+
+    # tokens cannot be used to resume queries of other users
+    token, token_expiry = walter_authenticator.generate_access_token(
+        "user-001", "session-001"
+    )
+    for query in [
+        {"limit": "1", "next_token": next_token},
+        {"limit": "1", "next_token": "not-a-token"},
+    ]:
+        event = get_api_event(
+            GET_TRANSACTIONS_API_PATH,
+            GET_TRANSACTIONS_API_METHOD,
+            token=token,
+            query=query,
+        )
+        response = get_transactions_api.invoke(event)
+        assert response.http_status == HTTPStatus.BAD_REQUEST
+        assert response.message == "Invalid next token!"
+
+
+@pytest.mark.parametrize(
+    "query",
+    [{"limit": "0"}, {"limit": "501"}, {"limit": "ten"}, {"order": "newest"}],
+)
+def test_get_transactions_failure_invalid_pagination(
+    get_transactions_api: GetTransactions,
+    walter_authenticator: WalterAuthenticator,
+    query: dict,
+) -> None:
+    token, token_expiry = walter_authenticator.generate_access_token(
+        "user-002", "session-004"
+    )
+    event = get_api_event(
+        GET_TRANSACTIONS_API_PATH,
+        GET_TRANSACTIONS_API_METHOD,
+        token=token,
+        query=query,
+    )
+    response = get_transactions_api.invoke(event)
+    assert response.http_status == HTTPStatus.BAD_REQUEST
+
+
+def _denormalize(data: dict) -> list:
+    """Expand the transactions of a normalized or columnar response into rows."""
+    transactions = data["transactions"]
+    if isinstance(transactions, dict):
+        transactions = [
+            dict(zip(transactions, values)) for values in zip(*transactions.values())
+        ]
+    rows = []
+    for transaction in transactions:
+        account = data["accounts"][transaction["account_id"]]
+        merchant_logo = data["merchant_logos"][transaction["merchant_logo"]]
+        row = {
+            "account_institution_name": account["institution_name"],
+            "account_name": account["account_name"],
+            "account_type": account["account_type"],
+            "account_mask": account["account_mask"],
+            "merchant_logo_url": data["merchant_logo_base_url"] + merchant_logo,
+        }
+        for name, value in transaction.items():
+            if name != "merchant_logo" and value is not None:
+                row[name] = value
+        rows.append(row)
+    return rows
+
+
+@pytest.mark.parametrize("layout", ["normalized", "columnar"])
+@pytest.mark.parametrize("query", [{}, {"limit": "3", "order": "desc"}])
+def test_get_transactions_normalized_layouts(
+    get_transactions_api: GetTransactions,
+    walter_authenticator: WalterAuthenticator,
+    layout: str,
+    query: dict,
+) -> None:
+    token, token_expiry = walter_authenticator.generate_access_token(
+        "user-002", "session-004"
+    )
+    rows = get_transactions_api.invoke(
+        get_api_event(
+            GET_TRANSACTIONS_API_PATH,
+            GET_TRANSACTIONS_API_METHOD,
+            token=token,
+            query=query,
+        )
+    ).data
+    response = get_transactions_api.invoke(
+        get_api_event(
+            GET_TRANSACTIONS_API_PATH,
+            GET_TRANSACTIONS_API_METHOD,
+            token=token,
+            query={**query, "layout": layout},
+        )
+    )
+
+    assert response.http_status == HTTPStatus.OK
+    data = response.data
+    assert data["num_transactions"] == rows["num_transactions"] > 0
+    assert data["next_token"] == rows["next_token"]
+    # each account and merchant logo is sent once
+    assert len(data["merchant_logos"]) == len(set(data["merchant_logos"]))
+    assert "account_name" not in str(data["transactions"])
+    assert _denormalize(data) == rows["transactions"]
+
+
+def test_get_transactions_failure_invalid_layout(
+    get_transactions_api: GetTransactions, walter_authenticator: WalterAuthenticator
+) -> None:
+    token, token_expiry = walter_authenticator.generate_access_token(
+        "user-002", "session-004"
+    )
+    event = get_api_event(
+        GET_TRANSACTIONS_API_PATH,
+        GET_TRANSACTIONS_API_METHOD,
+        token=token,
+        query={"layout": "tabular"},
+    )
+    response = get_transactions_api.invoke(event)
+    assert response.http_status == HTTPStatus.BAD_REQUEST
+
+
+@pytest.mark.parametrize(
+    "fields",
+    [
+        ["transaction_id", "transaction_amount"],
+        ["account_id", "account_name", "merchant_logo_url", "is_plaid_transaction"],
+        ["transaction_date", "merchant_name", "quantity"],
+    ],
+)
+def test_get_transactions_sparse_fields(
+    get_transactions_api: GetTransactions,
+    walter_authenticator: WalterAuthenticator,
+    fields: list,
+) -> None:
+    token, token_expiry = walter_authenticator.generate_access_token(
+        "user-002", "session-004"
+    )
+    rows = get_transactions_api.invoke(
+        get_api_event(
+            GET_TRANSACTIONS_API_PATH, GET_TRANSACTIONS_API_METHOD, token=token
+        )
+    ).data
+    response = get_transactions_api.invoke(
+        get_api_event(
+            GET_TRANSACTIONS_API_PATH,
+            GET_TRANSACTIONS_API_METHOD,
+            token=token,
+            query={"fields": ",".join(fields)},
+        )
+    )
+
+    assert response.http_status == HTTPStatus.OK
+    assert response.data["num_transactions"] == rows["num_transactions"] > 0
+    assert response.data["transactions"] == [
+        {name: value for name, value in row.items() if name in fields}
+        for row in rows["transactions"]
+    ]
+
+    columnar = get_transactions_api.invoke(
+        get_api_event(
+            GET_TRANSACTIONS_API_PATH,
+            GET_TRANSACTIONS_API_METHOD,
+            token=token,
+            query={"fields": ",".join(fields), "layout": "columnar"},
+        )
+    ).data
+    assert set(columnar["transactions"]) <= set(fields) | {"merchant_logo"}
+    assert len(next(iter(columnar["transactions"].values()))) == len(
+        rows["transactions"]
+    )
+
+
+def test_get_transactions_failure_invalid_fields(
+    get_transactions_api: GetTransactions, walter_authenticator: WalterAuthenticator
+) -> None:
+    token, token_expiry = walter_authenticator.generate_access_token(
+        "user-002", "session-004"
+    )
+    event = get_api_event(
+        GET_TRANSACTIONS_API_PATH,
+        GET_TRANSACTIONS_API_METHOD,
+        token=token,
+        query={"fields": "transaction_id,plaid_access_token"},
+    )
+    response = get_transactions_api.invoke(event)
+    assert response.http_status == HTTPStatus.BAD_REQUEST
+
+
+def test_get_transactions_compressed(
+    get_transactions_api: GetTransactions, walter_authenticator: WalterAuthenticator
+) -> None:
+    token, token_expiry = walter_authenticator.generate_access_token(
+        "user-002", "session-004"
+    )
+    event = get_api_event(
+        GET_TRANSACTIONS_API_PATH, GET_TRANSACTIONS_API_METHOD, token=token
+    )
+    event["headers"]["Accept-Encoding"] = "gzip, deflate, br"
+
+    response = get_transactions_api.invoke(event)
+    response_json = response.to_json()
+
+    assert response_json["isBase64Encoded"] is True
+    assert response_json["headers"]["Content-Encoding"] == "gzip"
+    body = json.loads(gzip.decompress(base64.b64decode(response_json["body"])))
+    assert body["Data"] == response.data
+
+
+def test_get_transactions_not_modified(
+    get_transactions_api: GetTransactions,
+    walter_db: WalterDB,
+    walter_authenticator: WalterAuthenticator,
+    mocker,
+) -> None:
+    token, token_expiry = walter_authenticator.generate_access_token(
+        "user-002", "session-004"
+    )
+    walter_db.bump_user_data_version("user-002")
+
+    def invoke(if_none_match: Optional[str] = None) -> Response:
+        event = get_api_event(
+            GET_TRANSACTIONS_API_PATH,
+            GET_TRANSACTIONS_API_METHOD,
+            token=token,
+            query={"limit": "3"},
+        )
+        if if_none_match is not None:
+            event["headers"]["If-None-Match"] = if_none_match
+        return get_transactions_api.invoke(event)
+
+    response = invoke()
+    assert response.http_status == HTTPStatus.OK
+    assert response.etag is not None
+    assert response.to_json()["headers"]["ETag"] == response.etag
+
+    # unchanged data is not queried again
+    spy = mocker.spy(get_transactions_api, "execute")
+    not_modified = invoke(response.etag)
+    assert not_modified.http_status == HTTPStatus.NOT_MODIFIED
+    assert not_modified.etag == response.etag
+    assert spy.call_count == 0
+    response_json = not_modified.to_json()
+    assert response_json["statusCode"] == 304
+    assert "body" not in response_json
+
+    # writes of the user change the ETag
+    walter_db.bump_user_data_version("user-002")
+    modified = invoke(response.etag)
+    assert modified.http_status == HTTPStatus.OK
+    assert modified.etag != response.etag
+    assert modified.data == response.data
+    assert spy.call_count == 1
+
+
+def test_get_transactions_not_modified_body_hash_without_data_version(
+    get_transactions_api: GetTransactions,
+    walter_authenticator: WalterAuthenticator,
+) -> None:
+    token, token_expiry = walter_authenticator.generate_access_token(
+        "user-002", "session-004"
+    )
+    event = get_api_event(
+        GET_TRANSACTIONS_API_PATH, GET_TRANSACTIONS_API_METHOD, token=token
+    )
+
+    response = get_transactions_api.invoke(event)
+    event["headers"]["If-None-Match"] = response.etag
+    not_modified = get_transactions_api.invoke(event)
+
+    assert response.http_status == HTTPStatus.OK
+    assert not_modified.http_status == HTTPStatus.NOT_MODIFIED
+    assert not_modified.etag == response.etag
+
+
+def test_get_transactions_cached_response(
+    get_transactions_api: GetTransactions,
+    walter_db: WalterDB,
+    walter_authenticator: WalterAuthenticator,
+    mocker,
+) -> None:
+    token, token_expiry = walter_authenticator.generate_access_token(
+        "user-002", "session-004"
+    )
+    walter_db.bump_user_data_version("user-002")
+    event = get_api_event(
+        GET_TRANSACTIONS_API_PATH,
+        GET_TRANSACTIONS_API_METHOD,
+        token=token,
+        query={"limit": "3"},
+    )
+
+    response = get_transactions_api.invoke(event)
+
+    # unchanged data is served from the cache without an If-None-Match
+    spy = mocker.spy(get_transactions_api, "execute")
+    cached = get_transactions_api.invoke(event)
+    assert cached.http_status == HTTPStatus.OK
+    assert cached.etag == response.etag
+    assert cached.data == response.data
+    assert spy.call_count == 0
+
+    # writes of the user invalidate the cached response
+    walter_db.bump_user_data_version("user-002")
+    modified = get_transactions_api.invoke(event)
+    assert modified.http_status == HTTPStatus.OK
+    assert modified.data == response.data
+    assert spy.call_count == 1
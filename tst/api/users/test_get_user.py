@@ -4,6 +4,7 @@ from src.api.common.methods import HTTPStatus, Status, WalterAPIMethod
 from src.api.factory import APIMethod, APIMethodFactory
 from src.api.routing.methods import HTTPMethod
 from src.api.users.get_user import GetUser
+from src.auth.authenticator import WalterAuthenticator
 from tst.api.utils import UNIT_TEST_REQUEST_ID, get_api_event, get_expected_response
 
 GET_USER_API_PATH = "/users"
@@ -57,3 +58,24 @@ def test_get_user_failure_user_does_not_exist(get_user_api: GetUser) -> None:
         message="Not authenticated! Token is expired or invalid.",
     )
     assert expected_response == get_user_api.invoke(event)
+
+
+def test_get_user_not_modified(
+    get_user_api: GetUser, walter_authenticator: WalterAuthenticator
+) -> None:
+    token, token_expiry = walter_authenticator.generate_access_token(
+        "user-001", "session-001"
+    )
+    event = get_api_event(GET_USER_API_PATH, GET_USER_API_METHOD, token=token)
+
+    response = get_user_api.invoke(event)
+    event["headers"]["If-None-Match"] = f'"other", {response.etag}'
+    not_modified = get_user_api.invoke(event)
+    event["headers"]["If-None-Match"] = '"other"'
+    modified = get_user_api.invoke(event)
+
+    assert response.http_status == HTTPStatus.OK and response.etag is not None
+    assert not_modified.http_status == HTTPStatus.NOT_MODIFIED
+    assert not_modified.etag == response.etag
+    assert modified.http_status == HTTPStatus.OK
+    assert modified.data == response.data
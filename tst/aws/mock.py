@@ -8,6 +8,7 @@ from mypy_boto3_sqs import SQSClient
 from src.environment import Domain
 from src.media.bucket import MediaBucket
 from tst.constants import (
+    PURGE_ACCOUNT_TASK_QUEUE_NAME,
     SECRETS_TEST_FILE,
     SYNC_TRANSACTIONS_TASK_QUEUE_NAME,
 )
@@ -74,3 +75,4 @@ class MockSQS:
 
     def initialize(self) -> None:
         self.sqs.create_queue(QueueName=SYNC_TRANSACTIONS_TASK_QUEUE_NAME)
+        self.sqs.create_queue(QueueName=PURGE_ACCOUNT_TASK_QUEUE_NAME)
@@ -0,0 +1,44 @@
+from unittest.mock import Mock
+
+import pytest
+
+from src.aws.dynamodb.client import WalterDDBClient
+from src.aws.dynamodb.exceptions import UnprocessedItemsError
+
+TABLE = "Transactions-unittest"
+KEY = {"user_id": {"S": "user-001"}, "transaction_id": {"S": "txn-001"}}
+
+
+def _create_client(mocker) -> WalterDDBClient:
+    mocker.patch("src.aws.dynamodb.client.time.sleep")
+    return WalterDDBClient(Mock())
+
+
+def test_batch_get_items_retries_unprocessed_keys(mocker) -> None:
+    client = _create_client(mocker)
+    client.client.batch_get_item.side_effect = [
+        {"Responses": {}, "UnprocessedKeys": {TABLE: {"Keys": [KEY]}}},
+        {"Responses": {TABLE: [KEY]}},
+    ]
+
+    assert client.batch_get_items(TABLE, [KEY]) == [KEY]
+    assert client.client.batch_get_item.call_count == 2
+
+
+def test_batch_write_items_backs_off_and_gives_up(mocker) -> None:
+    client = _create_client(mocker)
+    sleep = mocker.patch("src.aws.dynamodb.client.time.sleep")
+    unprocessed = {TABLE: [{"DeleteRequest": {"Key": KEY}}]}
+    client.client.batch_write_item.return_value = {"UnprocessedItems": unprocessed}
+
+    with pytest.raises(UnprocessedItemsError):
+        client.batch_write_items(TABLE, delete_keys=[KEY])
+
+    assert (
+        client.client.batch_write_item.call_count == WalterDDBClient.MAX_BATCH_ATTEMPTS
+    )
+    assert sleep.call_count == WalterDDBClient.MAX_BATCH_ATTEMPTS - 1
+    assert all(
+        0 <= call.args[0] <= WalterDDBClient.BATCH_RETRY_MAX_DELAY_SECONDS
+        for call in sleep.call_args_list
+    )
@@ -7,7 +7,10 @@ from mypy_boto3_secretsmanager import SecretsManagerClient
 from mypy_boto3_ses.client import SESClient
 from mypy_boto3_sqs import SQSClient
 
+from src.accounts.queue import PurgeAccountTaskQueue
 from src.ai.mlp.expenses import ExpenseCategorizerMLP
+from src.api.common.activity import LAST_ACTIVE_WRITES
+from src.api.common.cache import RESPONSE_CACHE_ENTRIES
 from src.api.factory import APIMethodFactory
 from src.auth.authenticator import WalterAuthenticator
 from src.aws.dynamodb.client import WalterDDBClient
@@ -17,6 +20,7 @@ from src.aws.ses.client import WalterSESClient
 from src.aws.sqs.client import WalterSQSClient
 from src.canaries.routing.router import CanaryRouter
 from src.database.client import WalterDB
+from src.database.securities.cache import SECURITY_CACHE
 from src.environment import Domain
 from src.factory import ClientFactory
 from src.investments.holdings.updater import HoldingUpdater
@@ -32,6 +36,19 @@ from tst.plaid.mock import MockPlaidClient
 from tst.polygon.mock import MockPolygonClient
 from tst.transactions.mock import MockTransactionsCategorizer
 
+########################
+# PROCESS-LEVEL CACHES #
+########################
+
+
+@pytest.fixture(autouse=True)
+def clear_process_level_caches() -> None:
+    # process-level caches outlive the mocked tables of each test
+    SECURITY_CACHE.clear()
+    LAST_ACTIVE_WRITES.clear()
+    RESPONSE_CACHE_ENTRIES.clear()
+
+
 ######################
 # BOTO3 CLIENT MOCKS #
 ######################
@@ -171,6 +188,13 @@ def sync_transactions_task_queue(
     return SyncUserTransactionsTaskQueue(walter_sqs)
 
 
+@pytest.fixture
+def purge_account_task_queue(
+    walter_sqs: WalterSQSClient,
+) -> PurgeAccountTaskQueue:
+    return PurgeAccountTaskQueue(walter_sqs)
+
+
 @pytest.fixture
 def media_bucket(
     walter_s3: WalterS3Client,
@@ -218,6 +242,7 @@ def client_factory(
     transactions_categorizer: MockTransactionsCategorizer,
     plaid_client: MockPlaidClient,
     sync_transactions_task_queue: SyncUserTransactionsTaskQueue,
+    purge_account_task_queue: PurgeAccountTaskQueue,
     media_bucket: MediaBucket,
 ) -> ClientFactory:
     # create a client factory
@@ -240,6 +265,7 @@ def client_factory(
     client_factory.expense_categorizer = transactions_categorizer
     client_factory.plaid = plaid_client
     client_factory.sync_transactions_task_queue = sync_transactions_task_queue
+    client_factory.purge_account_task_queue = purge_account_task_queue
     client_factory.media_bucket = media_bucket
 
     # return the client factory configured with mock clients
@@ -54,6 +54,12 @@ TRANSACTIONS_TABLE_NAME = f"Transactions-{Domain.TESTING.value}"
 TRANSACTIONS_TEST_FILE = "tst/database/data/transactions.jsonl"
 """(str): The name of the test transactions input file."""
 
+CACHE_TABLE_NAME = f"Cache-{Domain.TESTING.value}"
+"""(str): The name of the Cache table that stores cached third-party responses."""
+
+CASH_FLOW_ROLLUPS_TABLE_NAME = f"CashFlowRollups-{Domain.TESTING.value}"
+"""(str): The name of the CashFlowRollups table that stores the cash flow rollups of users and accounts."""
+
 ###################
 # TEST SQS QUEUES #
 ###################
@@ -63,6 +69,11 @@ SYNC_TRANSACTIONS_TASK_QUEUE_NAME = (
 )
 """(str): The name of the SyncTransactions task queue."""
 
+PURGE_ACCOUNT_TASK_QUEUE_NAME = (
+    f"WalterBackend-PurgeAccount-Queue-{Domain.TESTING.value}"
+)
+"""(str): The name of the PurgeAccount task queue."""
+
 
 ####################
 # TEST STOCKS DATA #
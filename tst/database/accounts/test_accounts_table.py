@@ -0,0 +1,102 @@
+import datetime as dt
+
+import pytest
+
+from src.aws.dynamodb.client import WalterDDBClient
+from src.database.accounts.table import AccountsTable
+from src.environment import Domain
+from tst.constants import ACCOUNTS_TABLE_NAME
+
+
+@pytest.fixture
+def accounts_table(ddb_client) -> AccountsTable:
+    ddb = WalterDDBClient(ddb_client)
+    return AccountsTable(ddb=ddb, domain=Domain.TESTING)
+
+
+def test_table_name_format(accounts_table: AccountsTable):
+    assert accounts_table.table_name == ACCOUNTS_TABLE_NAME
+
+
+def test_update_account_balance(accounts_table: AccountsTable):
+    updated_at = dt.datetime(2025, 7, 1, 1, tzinfo=dt.timezone.utc)
+    assert accounts_table.update_account_balance(
+        "user-003", "acct-004", 50.0, updated_at
+    )
+
+    account = accounts_table.get_account("user-003", "acct-004")
+    assert account.balance == pytest.approx(50.0)
+    assert account.balance_last_updated_at == updated_at
+    assert account.updated_at == updated_at
+    # other attributes are left untouched
+    assert account.account_name == "Bob Investment Account"
+
+
+def test_update_account_balance_skips_older_balances(accounts_table: AccountsTable):
+    updated_at = dt.datetime(2025, 7, 1, 1, tzinfo=dt.timezone.utc)
+    accounts_table.update_account_balance("user-003", "acct-004", 50.0, updated_at)
+
+    assert not accounts_table.update_account_balance(
+        "user-003", "acct-004", 40.0, updated_at - dt.timedelta(minutes=1)
+    )
+    account = accounts_table.get_account("user-003", "acct-004")
+    assert account.balance == pytest.approx(50.0)
+
+
+def test_update_account_balance_account_does_not_exist(
+    accounts_table: AccountsTable,
+):
+    updated_at = dt.datetime(2025, 7, 1, 1, tzinfo=dt.timezone.utc)
+    assert not accounts_table.update_account_balance(
+        "user-003", "acct-ghost", 50.0, updated_at
+    )
+    assert accounts_table.get_account("user-003", "acct-ghost") is None
+
+
+def test_mark_account_deleting(accounts_table: AccountsTable):
+    deleting_at = dt.datetime(2025, 7, 1, 1, tzinfo=dt.timezone.utc)
+    assert accounts_table.mark_account_deleting("user-003", "acct-004", deleting_at)
+
+    # accounts being deleted are hidden and can only be marked once
+    assert accounts_table.get_account("user-003", "acct-004") is None
+    assert "acct-004" not in [
+        account.account_id for account in accounts_table.get_accounts("user-003")
+    ]
+    assert not accounts_table.mark_account_deleting("user-003", "acct-004", deleting_at)
+    assert accounts_table.update_account_deletion_progress("user-003", "acct-004", 2, 1)
+
+    # unmarked accounts are visible again
+    accounts_table.unmark_account_deleting("user-003", "acct-004")
+    assert accounts_table.get_account("user-003", "acct-004") is not None
+    assert not accounts_table.update_account_deletion_progress(
+        "user-003", "acct-004", 2, 1
+    )
+
+
+def test_mark_account_deleting_missing_account(accounts_table: AccountsTable):
+    deleting_at = dt.datetime(2025, 7, 1, 1, tzinfo=dt.timezone.utc)
+    assert not accounts_table.mark_account_deleting(
+        "user-003", "acct-does-not-exist", deleting_at
+    )
+
+
+def test_update_account_keeps_deleting_mark(accounts_table: AccountsTable):
+    deleting_at = dt.datetime(2025, 7, 1, 1, tzinfo=dt.timezone.utc)
+    account = accounts_table.get_account("user-003", "acct-004")
+    assert accounts_table.mark_account_deleting("user-003", "acct-004", deleting_at)
+
+    # accounts read before they were marked cannot clear the mark
+    account.account_name = "Stale Account Name"
+    assert accounts_table.update_account(account) is None
+    assert accounts_table.get_account("user-003", "acct-004") is None
+    assert accounts_table.update_account_deletion_progress("user-003", "acct-004", 1, 0)
+
+    # deleted accounts are not recreated
+    assert accounts_table.delete_marked_account("user-003", "acct-004")
+    assert accounts_table.update_account(account) is None
+    assert not accounts_table.mark_account_deleting("user-003", "acct-004", deleting_at)
+
+
+def test_delete_marked_account_requires_mark(accounts_table: AccountsTable):
+    assert not accounts_table.delete_marked_account("user-003", "acct-004")
+    assert accounts_table.get_account("user-003", "acct-004") is not None
@@ -95,3 +95,12 @@ def test_create_update_delete_holding(holdings_table: HoldingsTable):
     # Delete and verify removal
     holdings_table.delete_holding("acct-0001", "sec-test-xyz")
     assert holdings_table.get_holding("acct-0001", "sec-test-xyz") is None
+
+
+def test_get_security_holder_counts(holdings_table: HoldingsTable):
+    assert holdings_table.get_security_holder_counts() == {
+        "sec-nasdaq-aapl": 2,
+        "sec-nasdaq-meta": 1,
+        "sec-nyse-coke": 3,
+        "sec-crypto-btc": 3,
+    }
@@ -1,11 +1,13 @@
 import datetime
 import json
 from dataclasses import dataclass
+from typing import List
 
 from mypy_boto3_dynamodb.client import DynamoDBClient
 
 from src.database.accounts.models import Account
 from src.database.holdings.models import Holding
+from src.database.rollups.models import CashFlowRollup
 from src.database.securities.models import Crypto, SecurityType, Stock
 from src.database.sessions.models import Session
 from src.database.transactions.models import (
@@ -13,6 +15,7 @@ from src.database.transactions.models import (
     BankTransaction,
     InvestmentTransaction,
     InvestmentTransactionSubType,
+    Transaction,
     TransactionCategory,
     TransactionType,
 )
@@ -21,6 +24,8 @@ from src.environment import Domain
 from tst.constants import (
     ACCOUNTS_TABLE_NAME,
     ACCOUNTS_TEST_FILE,
+    CACHE_TABLE_NAME,
+    CASH_FLOW_ROLLUPS_TABLE_NAME,
     HOLDINGS_TABLE_NAME,
     HOLDINGS_TEST_FILE,
     SECURITIES_TABLE_NAME,
@@ -50,7 +55,11 @@ class MockDDB:
         self._create_accounts_table(ACCOUNTS_TABLE_NAME, ACCOUNTS_TEST_FILE)
         self._create_securities_table(SECURITIES_TABLE_NAME, SECURITIES_TEST_FILE)
         self._create_holdings_table(HOLDINGS_TABLE_NAME, HOLDINGS_TEST_FILE)
-        self._create_transactions_table(TRANSACTIONS_TABLE_NAME, TRANSACTIONS_TEST_FILE)
+        transactions = self._create_transactions_table(
+            TRANSACTIONS_TABLE_NAME, TRANSACTIONS_TEST_FILE
+        )
+        self._create_cache_table(CACHE_TABLE_NAME)
+        self._create_cash_flow_rollups_table(CASH_FLOW_ROLLUPS_TABLE_NAME, transactions)
 
     def _create_users_table(self, table_name: str, input_file_name: str) -> None:
         self.mock_ddb.create_table(
@@ -318,7 +327,9 @@ class MockDDB:
                     ).to_ddb_item(),
                 )
 
-    def _create_transactions_table(self, table_name: str, input_file_name: str) -> None:
+    def _create_transactions_table(
+        self, table_name: str, input_file_name: str
+    ) -> List[Transaction]:
         self.mock_ddb.create_table(
             TableName=table_name,
             KeySchema=[
@@ -330,6 +341,8 @@ class MockDDB:
                 {"AttributeName": "account_id", "AttributeType": "S"},
                 {"AttributeName": "transaction_id", "AttributeType": "S"},
                 {"AttributeName": "transaction_date", "AttributeType": "S"},
+                {"AttributeName": "account_security_id", "AttributeType": "S"},
+                {"AttributeName": "plaid_transaction_id", "AttributeType": "S"},
             ],
             BillingMode=MockDDB.ON_DEMAND_BILLING_MODE,
             GlobalSecondaryIndexes=[
@@ -349,9 +362,25 @@ class MockDDB:
                     ],
                     "Projection": {"ProjectionType": "ALL"},
                 },
+                {
+                    "IndexName": f"Transactions-AccountSecurityDateRangeIndex-{Domain.TESTING.value}",
+                    "KeySchema": [
+                        {"AttributeName": "account_security_id", "KeyType": "HASH"},
+                        {"AttributeName": "transaction_date", "KeyType": "RANGE"},
+                    ],
+                    "Projection": {"ProjectionType": "ALL"},
+                },
+                {
+                    "IndexName": f"Transactions-PlaidTransactionIdIndex-{Domain.TESTING.value}",
+                    "KeySchema": [
+                        {"AttributeName": "plaid_transaction_id", "KeyType": "HASH"},
+                    ],
+                    "Projection": {"ProjectionType": "KEYS_ONLY"},
+                },
             ],
         )
         # seed transactions from the provided JSONL file
+        transactions = []
         with open(input_file_name) as transactions_f:
             for txn in transactions_f:
                 if not txn.strip():
@@ -384,7 +413,7 @@ class MockDDB:
                         transaction_id=transaction_id,
                         plaid_account_id=transaction_json["plaid_account_id"],
                         plaid_transaction_id=transaction_json["plaid_transaction_id"],
-                    ).to_ddb_item()
+                    )
                 else:
                     transaction_item = BankTransaction(
                         user_id=transaction_json["user_id"],
@@ -408,5 +437,40 @@ class MockDDB:
                         transaction_id=transaction_id,
                         plaid_account_id=transaction_json["plaid_account_id"],
                         plaid_transaction_id=transaction_json["plaid_transaction_id"],
-                    ).to_ddb_item()
-                self.mock_ddb.put_item(TableName=table_name, Item=transaction_item)
+                    )
+                self.mock_ddb.put_item(
+                    TableName=table_name, Item=transaction_item.to_ddb_item()
+                )
+                transactions.append(transaction_item)
+        return transactions
+
+    def _create_cache_table(self, table_name: str) -> None:
+        self.mock_ddb.create_table(
+            TableName=table_name,
+            KeySchema=[
+                {"AttributeName": "cache_key", "KeyType": "HASH"},
+            ],
+            AttributeDefinitions=[
+                {"AttributeName": "cache_key", "AttributeType": "S"},
+            ],
+            BillingMode=MockDDB.ON_DEMAND_BILLING_MODE,
+        )
+
+    def _create_cash_flow_rollups_table(
+        self, table_name: str, transactions: List[Transaction]
+    ) -> None:
+        self.mock_ddb.create_table(
+            TableName=table_name,
+            KeySchema=[
+                {"AttributeName": "owner_id", "KeyType": "HASH"},
+                {"AttributeName": "bucket", "KeyType": "RANGE"},
+            ],
+            AttributeDefinitions=[
+                {"AttributeName": "owner_id", "AttributeType": "S"},
+                {"AttributeName": "bucket", "AttributeType": "S"},
+            ],
+            BillingMode=MockDDB.ON_DEMAND_BILLING_MODE,
+        )
+        # seed the rollups of the seeded transactions
+        for rollup in CashFlowRollup.from_transactions(transactions).values():
+            self.mock_ddb.put_item(TableName=table_name, Item=rollup.to_ddb_item())
@@ -0,0 +1,170 @@
+import datetime as dt
+
+import pytest
+
+from src.aws.dynamodb.client import WalterDDBClient
+from src.database.client import WalterDB
+from src.database.rollups.models import CashFlowRollup
+from src.database.rollups.table import CashFlowRollupsTable
+from src.database.transactions.models import (
+    BankingTransactionSubType,
+    BankTransaction,
+    TransactionCategory,
+    TransactionType,
+)
+from src.environment import Domain
+from tst.constants import CASH_FLOW_ROLLUPS_TABLE_NAME
+
+USER_OWNER_ID = CashFlowRollup.get_user_owner_id("user-002")
+ACCOUNT_OWNER_ID = CashFlowRollup.get_account_owner_id("acct-003")
+
+
+@pytest.fixture
+def rollups_table(ddb_client) -> CashFlowRollupsTable:
+    ddb = WalterDDBClient(ddb_client)
+    return CashFlowRollupsTable(ddb=ddb, domain=Domain.TESTING)
+
+
+def _get_bank_transaction(
+    transaction_date: dt.date, amount: float, transaction_id: str = "bank-txn-100"
+) -> BankTransaction:
+    return BankTransaction(
+        user_id="user-002",
+        account_id="acct-003",
+        transaction_type=TransactionType.BANKING,
+        transaction_subtype=BankingTransactionSubType.DEBIT,
+        transaction_category=TransactionCategory.GROCERIES,
+        transaction_date=transaction_date,
+        transaction_amount=amount,
+        merchant_name="Grocery Store",
+        transaction_id=transaction_id,
+    )
+
+
+def test_table_name_format(rollups_table: CashFlowRollupsTable):
+    assert rollups_table.table_name == CASH_FLOW_ROLLUPS_TABLE_NAME
+
+
+def test_get_totals(rollups_table: CashFlowRollupsTable):
+    # seeded acct-003 transactions are all in August 2025
+    totals = rollups_table.get_totals(
+        ACCOUNT_OWNER_ID, dt.datetime.min.date(), dt.datetime.max.date()
+    )
+    assert totals.num_transactions == 3
+    assert totals.total_income == pytest.approx(2500.00)
+    assert totals.total_expense == pytest.approx(1505.00)
+    assert totals.cash_flow == pytest.approx(995.00)
+    assert totals.category_totals["Housing"] == pytest.approx(1500.00)
+
+    # partial months are read from the daily buckets
+    totals = rollups_table.get_totals(
+        ACCOUNT_OWNER_ID, dt.date(2025, 8, 6), dt.date(2025, 8, 6)
+    )
+    assert totals.num_transactions == 2
+    assert totals.total_expense == pytest.approx(1500.00)
+    totals = rollups_table.get_totals(
+        ACCOUNT_OWNER_ID, dt.date(2025, 7, 15), dt.date(2025, 8, 5)
+    )
+    assert totals.num_transactions == 1
+    assert totals.total_expense == pytest.approx(5.00)
+
+    # user rollups include the investment transactions of the user
+    totals = rollups_table.get_totals(
+        USER_OWNER_ID, dt.date(2025, 8, 1), dt.date(2025, 8, 31)
+    )
+    assert totals.num_transactions == 7
+    assert totals.total_income == pytest.approx(2500.00)
+
+
+def test_get_totals_reads_whole_months_from_monthly_buckets(
+    rollups_table: CashFlowRollupsTable,
+):
+    for day in range(1, 29):
+        rollups_table.update_rollups(
+            [], [_get_bank_transaction(dt.date(2025, 9, day), 1.0, f"txn-{day}")]
+        )
+
+    totals = rollups_table.get_totals(
+        ACCOUNT_OWNER_ID, dt.date(2025, 8, 6), dt.date(2025, 9, 30)
+    )
+    assert totals.num_transactions == 30
+    assert totals.total_expense == pytest.approx(1528.00)
+
+
+def test_walter_db_transaction_writes_update_rollups(
+    walter_db: WalterDB, rollups_table: CashFlowRollupsTable
+):
+    day = dt.date(2025, 8, 20)
+
+    def get_totals():
+        return rollups_table.get_totals(ACCOUNT_OWNER_ID, day, day)
+
+    # add
+    walter_db.add_transaction(_get_bank_transaction(day, 40.0))
+    assert get_totals().total_expense == pytest.approx(40.0)
+
+    # edits replace the previous transaction
+    walter_db.update_transaction(_get_bank_transaction(day, 25.0))
+    totals = get_totals()
+    assert totals.num_transactions == 1
+    assert totals.total_expense == pytest.approx(25.0)
+
+    # delete
+    walter_db.delete_transaction("user-002", "bank-txn-100")
+    totals = get_totals()
+    assert totals.num_transactions == 0
+    assert totals.total_expense == pytest.approx(0.0)
+
+    # deleting a missing transaction leaves the rollups untouched
+    walter_db.delete_transaction("user-002", "bank-txn-100")
+    assert get_totals().num_transactions == 0
+
+
+def test_delete_account_rollups(rollups_table: CashFlowRollupsTable):
+    rollups_table.delete_account_rollups("user-002", "acct-003")
+
+    assert rollups_table.get_rollups(ACCOUNT_OWNER_ID) == []
+    totals = rollups_table.get_totals(
+        USER_OWNER_ID, dt.date(2025, 8, 1), dt.date(2025, 8, 31)
+    )
+    assert totals.num_transactions == 4
+    assert totals.total_income == pytest.approx(0.0)
+    assert totals.total_expense == pytest.approx(0.0)
+
+    # deleting again does not subtract the account rollups twice
+    rollups_table.delete_account_rollups("user-002", "acct-003")
+    totals = rollups_table.get_totals(
+        USER_OWNER_ID, dt.date(2025, 8, 1), dt.date(2025, 8, 31)
+    )
+    assert totals.num_transactions == 4
+
+
+def test_reconcile_rollups_skips_rollups_changed_concurrently(
+    rollups_table: CashFlowRollupsTable,
+):
+    day = dt.date(2025, 9, 1)
+    expected = [
+        rollup
+        for rollup in CashFlowRollup.from_transactions(
+            [_get_bank_transaction(day, 10.0)]
+        ).values()
+        if rollup.owner_id == ACCOUNT_OWNER_ID
+    ]
+    items = rollups_table.get_rollup_items(ACCOUNT_OWNER_ID)
+
+    # a transaction written after the rollups are read
+    rollups_table.update_rollups([], [_get_bank_transaction(day, 5.0, "bank-txn-101")])
+
+    drifted, stale = rollups_table.reconcile_rollups(ACCOUNT_OWNER_ID, items, expected)
+
+    # the unchanged August rollups are deleted but the September rollups
+    # written concurrently are not overwritten
+    assert drifted == 2
+    assert stale == 3
+    totals = rollups_table.get_totals(ACCOUNT_OWNER_ID, day, day)
+    assert totals.num_transactions == 1
+    assert totals.total_expense == pytest.approx(5.0)
+    totals = rollups_table.get_totals(
+        ACCOUNT_OWNER_ID, dt.date(2025, 8, 1), dt.date(2025, 8, 31)
+    )
+    assert totals.num_transactions == 0
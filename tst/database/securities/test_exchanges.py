@@ -0,0 +1,64 @@
+from datetime import date, datetime, timezone
+
+from src.database.securities.exchanges import (
+    MARKET_EXCHANGES,
+    US_TRADING_CALENDAR,
+    get_market_exchange_by_key_name,
+    get_us_market_holidays,
+)
+
+
+def test_get_us_market_holidays() -> None:
+    assert get_us_market_holidays(2025) == {
+        date(2025, 1, 1),
+        date(2025, 1, 20),
+        date(2025, 2, 17),
+        date(2025, 4, 18),
+        date(2025, 5, 26),
+        date(2025, 6, 19),
+        date(2025, 7, 4),
+        date(2025, 9, 1),
+        date(2025, 11, 27),
+        date(2025, 12, 25),
+    }
+    # new year's day on a saturday is not observed, independence day on a
+    # saturday is observed the friday before
+    assert date(2021, 12, 31) not in get_us_market_holidays(2022)
+    assert date(2026, 7, 3) in get_us_market_holidays(2026)
+
+
+def test_us_trading_calendar() -> None:
+    # 2025-08-08 is a friday, 9:30 EDT is 13:30 UTC
+    assert not US_TRADING_CALENDAR.is_open(
+        datetime(2025, 8, 8, 13, 29, tzinfo=timezone.utc)
+    )
+    assert US_TRADING_CALENDAR.is_open(
+        datetime(2025, 8, 8, 13, 30, tzinfo=timezone.utc)
+    )
+    assert not US_TRADING_CALENDAR.is_open(
+        datetime(2025, 8, 8, 20, 0, tzinfo=timezone.utc)
+    )
+    assert not US_TRADING_CALENDAR.is_open(
+        datetime(2025, 8, 9, 15, 0, tzinfo=timezone.utc)
+    )
+
+    # the next open after friday's close skips the weekend
+    friday_close = datetime(2025, 8, 8, 20, 0, tzinfo=timezone.utc)
+    assert US_TRADING_CALENDAR.get_next_open(friday_close) == datetime(
+        2025, 8, 11, 13, 30, tzinfo=timezone.utc
+    )
+    assert US_TRADING_CALENDAR.get_next_close(friday_close) == datetime(
+        2025, 8, 11, 20, 0, tzinfo=timezone.utc
+    )
+
+    # and holidays, e.g. labor day on 2025-09-01
+    assert US_TRADING_CALENDAR.get_next_open(
+        datetime(2025, 8, 29, 21, 0, tzinfo=timezone.utc)
+    ) == datetime(2025, 9, 2, 13, 30, tzinfo=timezone.utc)
+
+
+def test_get_market_exchange_by_key_name() -> None:
+    assert get_market_exchange_by_key_name("NASDAQ") == MARKET_EXCHANGES["XNAS"]
+    assert get_market_exchange_by_key_name("lse") == MARKET_EXCHANGES["XLON"]
+    assert get_market_exchange_by_key_name("invalid") == MARKET_EXCHANGES["UNK"]
+    assert MARKET_EXCHANGES["COIN"].is_open(datetime(2025, 8, 9, tzinfo=timezone.utc))
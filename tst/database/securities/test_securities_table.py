@@ -1,6 +1,7 @@
 import datetime as dt
 
 import pytest
+from freezegun import freeze_time
 
 from src.aws.dynamodb.client import WalterDDBClient
 from src.database.securities.models import Crypto, SecurityType, Stock
@@ -91,3 +92,67 @@ def test_create_update_delete_security(securities_table: SecuritiesTable):
     # Delete
     securities_table.delete_security(created.security_id)
     assert securities_table.get_security(created.security_id) is None
+
+
+@freeze_time("2025-01-01T00:30:00Z")
+def test_get_security_cached_until_price_expiry(
+    securities_table: SecuritiesTable, mocker
+):
+    spy = mocker.spy(securities_table.ddb, "get_item")
+
+    stock = securities_table.get_security("sec-nasdaq-aapl")
+    cached_stock = securities_table.get_security("sec-nasdaq-aapl")
+    assert spy.call_count == 1
+    assert cached_stock.security_id == stock.security_id
+    assert cached_stock.current_price == stock.current_price
+
+    # cached securities are copies
+    cached_stock.current_price = 0.0
+    assert securities_table.get_security("sec-nasdaq-aapl").current_price == 100.0
+
+    # expired prices are read from the table again
+    with freeze_time("2025-01-01T01:00:00Z"):
+        securities_table.get_security("sec-nasdaq-aapl")
+    assert spy.call_count == 2
+
+
+@freeze_time("2025-01-01T00:30:00Z")
+def test_get_security_by_ticker_cached(securities_table: SecuritiesTable, mocker):
+    query_spy = mocker.spy(securities_table.ddb, "query_index")
+    get_spy = mocker.spy(securities_table.ddb, "get_item")
+
+    stock = securities_table.get_security_by_ticker("AAPL")
+    assert securities_table.get_security_by_ticker("AAPL").ticker == stock.ticker
+    assert securities_table.get_security(stock.security_id).ticker == stock.ticker
+    assert query_spy.call_count == 1
+    assert get_spy.call_count == 0
+
+    stats = securities_table.cache.get_stats()
+    assert stats.to_dict() == {"hits": 2, "misses": 1, "hit_rate": 2 / 3}
+
+
+@freeze_time("2025-03-01T00:30:00Z")
+def test_update_security_replaces_cached_security(
+    securities_table: SecuritiesTable, mocker
+):
+    now = dt.datetime(2025, 3, 1, tzinfo=dt.timezone.utc)
+    stock = securities_table.create_security(
+        Stock(
+            name="Test Company",
+            ticker="TST",
+            exchange="NYSE",
+            price=10.0,
+            price_updated_at=now,
+            price_expires_at=now + dt.timedelta(hours=1),
+        )
+    )
+    spy = mocker.spy(securities_table.ddb, "get_item")
+
+    stock.current_price = 12.34
+    securities_table.update_security(stock)
+    assert securities_table.get_security(stock.security_id).current_price == 12.34
+    assert spy.call_count == 0
+
+    securities_table.delete_security(stock.security_id)
+    assert securities_table.get_security(stock.security_id) is None
+    assert securities_table.get_security_by_ticker("TST") is None
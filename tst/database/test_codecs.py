@@ -0,0 +1,286 @@
+import dataclasses
+import datetime as dt
+import random
+import string
+from typing import Callable, Optional
+
+import pytest
+
+from src.database.accounts.models import Account, AccountType
+from src.database.codecs import Field, FieldType
+from src.database.holdings.models import Holding
+from src.database.models import get_slots
+from src.database.securities.models import Crypto, Security, Stock
+from src.database.sessions.models import Session
+from src.database.transactions.models import (
+    BankingTransactionSubType,
+    BankTransaction,
+    InvestmentTransaction,
+    InvestmentTransactionSubType,
+    Transaction,
+    TransactionCategory,
+    TransactionType,
+)
+from src.database.users.models import User
+
+NUM_EXAMPLES = 200
+
+
+def _string(rng: random.Random) -> str:
+    alphabet = string.ascii_letters + string.digits + "#-_ é"
+    return "".join(rng.choice(alphabet) for _ in range(rng.randint(1, 12)))
+
+
+def _optional(rng: random.Random, value: Callable) -> Optional:
+    return value(rng) if rng.random() < 0.5 else None
+
+
+def _float(rng: random.Random) -> float:
+    return rng.choice([0.0, round(rng.uniform(-1e4, 1e4), 2), rng.uniform(0, 1e9)])
+
+
+def _datetime(rng: random.Random) -> dt.datetime:
+    value = dt.datetime(2020, 1, 1) + dt.timedelta(
+        seconds=rng.randrange(10**8), microseconds=rng.randrange(10**6)
+    )
+    return value.replace(tzinfo=dt.timezone.utc) if rng.random() < 0.5 else value
+
+
+def _create_account(rng: random.Random) -> Account:
+    return Account.create(
+        user_id=_string(rng),
+        account_type=rng.choice(list(AccountType)).value,
+        account_subtype=_string(rng),
+        institution_name=_string(rng),
+        account_name=_string(rng),
+        account_mask=_string(rng),
+        balance=_float(rng),
+        plaid_institution_id=_optional(rng, _string),
+        plaid_account_id=_optional(rng, _string),
+        plaid_access_token=_optional(rng, _string),
+        plaid_item_id=_optional(rng, _string),
+        plaid_cursor=_optional(rng, _string),
+        plaid_last_sync_at=_optional(rng, _datetime),
+    )
+
+
+def _create_transaction(rng: random.Random) -> Transaction:
+    common = {
+        "transaction_id": _string(rng),
+        "account_id": _string(rng),
+        "user_id": _string(rng),
+        "transaction_category": rng.choice(list(TransactionCategory)),
+        "transaction_date": _datetime(rng).date(),
+        "transaction_amount": _float(rng),
+        "merchant_logo_s3_uri": _optional(rng, _string),
+        "plaid_transaction_id": _optional(rng, _string),
+        "plaid_account_id": _optional(rng, _string),
+    }
+    if rng.random() < 0.5:
+        return InvestmentTransaction(
+            transaction_type=TransactionType.INVESTMENT,
+            transaction_subtype=rng.choice(list(InvestmentTransactionSubType)),
+            security_id=_string(rng),
+            quantity=_float(rng),
+            price_per_share=_float(rng),
+            **common,
+        )
+    return BankTransaction(
+        transaction_type=TransactionType.BANKING,
+        transaction_subtype=rng.choice(list(BankingTransactionSubType)),
+        merchant_name=_string(rng),
+        **common,
+    )
+
+
+def _create_security(rng: random.Random) -> Security:
+    if rng.random() < 0.5:
+        return Stock(
+            _string(rng),
+            _string(rng),
+            _string(rng),
+            _float(rng),
+            _datetime(rng),
+            _datetime(rng),
+        )
+    return Crypto(
+        _string(rng), _string(rng), _float(rng), _datetime(rng), _datetime(rng)
+    )
+
+
+def _create_holding(rng: random.Random) -> Holding:
+    return Holding(
+        account_id=_string(rng),
+        security_id=_string(rng),
+        quantity=_float(rng),
+        total_cost_basis=_float(rng),
+        average_cost_basis=_float(rng),
+        created_at=_datetime(rng),
+        updated_at=_datetime(rng),
+        last_transaction_key=_optional(rng, _string),
+        updates_since_reconciliation=rng.randrange(100),
+    )
+
+
+def _create_session(rng: random.Random) -> Session:
+    return Session(
+        user_id=_string(rng),
+        token_id=_string(rng),
+        ip_address=_string(rng),
+        device=_string(rng),
+        session_start=_datetime(rng),
+        session_expiration=_datetime(rng),
+        revoked=rng.random() < 0.5,
+        session_end=_optional(rng, _datetime),
+        ttl=_optional(rng, lambda rng: rng.randrange(1, 2**31)),
+    )
+
+
+def _create_user(rng: random.Random) -> User:
+    return User(
+        user_id=_string(rng),
+        email=_string(rng),
+        first_name=_string(rng),
+        last_name=_string(rng),
+        password_hash=_string(rng),
+        sign_up_date=_datetime(rng),
+        last_active_date=_datetime(rng),
+        verified=rng.random() < 0.5,
+        profile_picture_s3_uri=_optional(rng, _string),
+        profile_picture_url=_optional(rng, _string),
+        profile_picture_url_expiration=_optional(
+            rng, lambda rng: _datetime(rng).replace(tzinfo=dt.timezone.utc)
+        ),
+        stripe_subscription_id=_optional(rng, _string),
+        stripe_customer_id=_optional(rng, _string),
+    )
+
+
+def _get_attributes(model) -> dict:
+    # users define a __dict__ method so their fields are read as a dataclass
+    if dataclasses.is_dataclass(model):
+        return dataclasses.asdict(model)
+    return {name: getattr(model, name) for name in get_slots(type(model))}
+
+
+@pytest.mark.parametrize(
+    "create_model, from_ddb_item",
+    [
+        (_create_account, Account.from_ddb_item),
+        (_create_transaction, Transaction.from_ddb_item),
+        (_create_security, Security.from_ddb_item),
+        (_create_holding, Holding.from_ddb_item),
+        (_create_session, Session.from_ddb_item),
+        (_create_user, User.from_ddb_item),
+    ],
+)
+def test_round_trip(create_model: Callable, from_ddb_item: Callable) -> None:
+    rng = random.Random(0)
+    for _ in range(NUM_EXAMPLES):
+        model = create_model(rng)
+        item = model.to_ddb_item()
+
+        decoded = from_ddb_item(item)
+
+        assert type(decoded) is type(model)
+        assert _get_attributes(decoded) == _get_attributes(model)
+        assert decoded.to_ddb_item() == item
+
+
+def test_encode_omits_empty_optional_attributes() -> None:
+    rng = random.Random(0)
+    account = _create_account(rng)
+    account.plaid_cursor = None
+    account.plaid_last_sync_at = None
+
+    item = account.to_ddb_item()
+
+    assert "plaid_cursor" not in item
+    assert "plaid_last_sync_at" not in item
+    assert item["account_type"] == {"S": account.account_type.value}
+
+
+def test_encode_computed_attributes() -> None:
+    transaction = InvestmentTransaction(
+        transaction_id="investment-txn-001",
+        account_id="acct-001",
+        user_id="user-001",
+        transaction_type=TransactionType.INVESTMENT,
+        transaction_subtype=InvestmentTransactionSubType.BUY,
+        transaction_category=TransactionCategory.INVESTMENT,
+        transaction_date=dt.date(2025, 8, 1),
+        transaction_amount=1000.0,
+        security_id="sec-nasdaq-aapl",
+        quantity=10.0,
+        price_per_share=100.0,
+    )
+
+    item = transaction.to_ddb_item()
+
+    assert item["transaction_date"] == {"S": "2025-08-01#investment-txn-001"}
+    assert item["account_security_id"] == {"S": "acct-001#sec-nasdaq-aapl"}
+
+
+def test_decode_legacy_items() -> None:
+    holding = Holding.from_ddb_item(
+        {
+            "account_id": {"S": "acct-001"},
+            "security_id": {"S": "sec-nasdaq-aapl"},
+            "quantity": {"N": "10"},
+            "total_cost_basis": {"N": "1000"},
+            "average_cost_basis": {"N": "100"},
+            "created_at": {"S": "2025-08-01T00:00:00"},
+            "updated_at": {"S": "2025-08-01T00:00:00"},
+        }
+    )
+    assert holding.updates_since_reconciliation == 0
+    assert holding.last_transaction_key is None
+
+    # enum values that are not stored in their canonical form
+    transaction = Transaction.from_ddb_item(
+        {
+            "transaction_id": {"S": "bank-txn-001"},
+            "account_id": {"S": "acct-001"},
+            "user_id": {"S": "user-001"},
+            "transaction_type": {"S": "BANKING"},
+            "transaction_subtype": {"S": "Debit"},
+            "transaction_category": {"S": "restaurants"},
+            "transaction_date": {"S": "2025-08-01T00:00:00#bank-txn-001"},
+            "transaction_amount": {"N": "12.5"},
+            "merchant_name": {"S": "Chipotle"},
+            "merchant_logo_s3_uri": {"S": "s3://logos/chipotle.png"},
+        }
+    )
+    assert isinstance(transaction, BankTransaction)
+    assert transaction.transaction_subtype == BankingTransactionSubType.DEBIT
+    assert transaction.transaction_category == TransactionCategory.RESTAURANTS
+    assert transaction.transaction_date == dt.date(2025, 8, 1)
+    assert transaction.plaid_transaction_id is None
+
+    with pytest.raises(ValueError):
+        Transaction.from_ddb_item(
+            {**transaction.to_ddb_item(), "transaction_subtype": {"S": "refund"}}
+        )
+
+
+def test_user_missing_attributes() -> None:
+    user = User(
+        user_id="user-001",
+        email="walter@gmail.com",
+        first_name="Walter",
+        last_name="Walrus",
+        password_hash="walter",
+    )
+
+    item = user.to_ddb_item()
+
+    assert item["profile_picture_url_expiration"] == {"S": "N/A"}
+    assert item["stripe_customer_id"] == {"S": "N/A"}
+    assert User.from_ddb_item(item).stripe_customer_id is None
+
+
+def test_invalid_field() -> None:
+    with pytest.raises(ValueError):
+        Field("account-id")
+    with pytest.raises(ValueError):
+        Field("account_type", FieldType.ENUM)
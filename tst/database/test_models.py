@@ -0,0 +1,131 @@
+import copy
+import datetime as dt
+import pickle
+
+import pytest
+
+from src.database.accounts.models import Account, AccountType
+from src.database.holdings.models import Holding
+from src.database.models import FrozenModelError, get_slots
+from src.database.securities.models import Stock
+from src.database.sessions.models import Session
+from src.database.transactions.models import (
+    BankingTransactionSubType,
+    BankTransaction,
+    TransactionCategory,
+    TransactionType,
+)
+
+NOW = dt.datetime(2025, 8, 1, tzinfo=dt.timezone.utc)
+
+
+def _create_transaction() -> BankTransaction:
+    return BankTransaction(
+        transaction_id="bank-txn-001",
+        account_id="acct-001",
+        user_id="user-001",
+        transaction_type=TransactionType.BANKING,
+        transaction_subtype=BankingTransactionSubType.DEBIT,
+        transaction_category=TransactionCategory.RESTAURANTS,
+        transaction_date=NOW.date(),
+        transaction_amount=12.5,
+        merchant_name="Chipotle",
+    )
+
+
+def _create_models() -> list:
+    return [
+        _create_transaction(),
+        Account.create(
+            user_id="user-001",
+            account_type=AccountType.DEPOSITORY.value,
+            account_subtype="checking",
+            institution_name="Walrus Bank",
+            account_name="Checking",
+            account_mask="1234",
+            balance=100.0,
+        ),
+        Stock("Apple Inc.", "AAPL", "NASDAQ", 100.0, NOW, NOW),
+        Holding.create_new_holding("acct-001", "sec-nasdaq-aapl", 10.0, 100.0),
+        Session.create("user-001", "token-001", "127.0.0.1", "iPhone"),
+    ]
+
+
+def _get_attributes(model) -> dict:
+    return {name: getattr(model, name) for name in get_slots(type(model))}
+
+
+@pytest.mark.parametrize(
+    "model", _create_models(), ids=lambda model: type(model).__name__
+)
+def test_models_are_slotted(model) -> None:
+    assert not hasattr(model, "__dict__")
+    with pytest.raises(AttributeError):
+        model.unknown_attribute = "unknown"
+
+
+def test_get_slots() -> None:
+    assert get_slots(BankTransaction)[0] == "transaction_id"
+    assert get_slots(BankTransaction)[-1] == "merchant_name"
+    assert "ticker" in get_slots(Stock)
+    assert "ttl" in get_slots(Session)
+
+
+def test_replace() -> None:
+    transaction = _create_transaction()
+
+    updated = transaction.replace(transaction_amount=20.0, merchant_name="Chick-fil-A")
+
+    assert type(updated) is BankTransaction
+    assert updated.transaction_amount == 20.0
+    assert updated.merchant_name == "Chick-fil-A"
+    assert updated.transaction_id == transaction.transaction_id
+    assert transaction.transaction_amount == 12.5
+    assert transaction.merchant_name == "Chipotle"
+    with pytest.raises(TypeError):
+        transaction.replace(security_id="sec-nasdaq-aapl")
+
+
+@pytest.mark.parametrize(
+    "model", _create_models(), ids=lambda model: type(model).__name__
+)
+def test_freeze_and_thaw(model) -> None:
+    frozen = model.freeze()
+
+    assert isinstance(frozen, type(model))
+    assert frozen.is_frozen() and not model.is_frozen()
+    assert frozen.freeze() is frozen
+    assert _get_attributes(frozen) == _get_attributes(model)
+    assert frozen.to_ddb_item() == model.to_ddb_item()
+    name = get_slots(type(model))[0]
+    with pytest.raises(FrozenModelError):
+        setattr(frozen, name, "modified")
+    with pytest.raises(FrozenModelError):
+        delattr(frozen, name)
+
+    thawed = frozen.thaw()
+
+    assert type(thawed) is type(model)
+    setattr(thawed, name, "modified")
+    assert getattr(frozen, name) == getattr(model, name)
+
+
+def test_replace_frozen() -> None:
+    frozen = _create_transaction().freeze()
+
+    updated = frozen.replace(transaction_amount=20.0)
+
+    assert updated.is_frozen()
+    assert updated.transaction_amount == 20.0
+    assert frozen.transaction_amount == 12.5
+
+
+def test_copy_and_pickle() -> None:
+    transaction = _create_transaction()
+    frozen = transaction.freeze()
+
+    assert _get_attributes(copy.copy(transaction)) == _get_attributes(transaction)
+    assert _get_attributes(copy.deepcopy(frozen)) == _get_attributes(transaction)
+    unpickled = pickle.loads(pickle.dumps(frozen))
+    assert unpickled.is_frozen()
+    assert _get_attributes(unpickled) == _get_attributes(transaction)
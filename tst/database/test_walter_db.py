@@ -1,3 +1,8 @@
+import datetime as dt
+
+import pytest
+
+from src.database.client import WalterDB
 from src.database.users.models import User
 
 #########
@@ -28,3 +33,38 @@ WALRUS = User(
 ##############
 
 # TODO: Add unit tests
+
+
+def test_user_data_version(walter_db: WalterDB) -> None:
+    assert walter_db.get_user_data_version("user-001") is None
+
+    walter_db.bump_user_data_version("user-001")
+    first = walter_db.get_user_data_version("user-001")
+    walter_db.bump_user_data_version("user-001")
+    second = walter_db.get_user_data_version("user-001")
+
+    assert first is not None and second is not None and first != second
+    # the epoch of the version is kept across bumps
+    assert first.split(".")[0] == second.split(".")[0]
+    assert walter_db.get_user_data_version("user-002") is None
+
+
+@pytest.mark.parametrize("cash_flow_rollups_enabled", [False, True])
+def test_user_transaction_totals_exclude_deleting_accounts(
+    walter_db: WalterDB, cash_flow_rollups_enabled: bool
+) -> None:
+    walter_db.cash_flow_rollups_enabled = cash_flow_rollups_enabled
+    august = (dt.datetime(2025, 8, 1), dt.datetime(2025, 8, 31))
+
+    totals = walter_db.get_user_transaction_totals("user-002", *august)
+    assert totals.num_transactions == 7
+    assert totals.total_income == pytest.approx(2500.00)
+
+    # the transactions of acct-003 are excluded as soon as it is marked
+    assert walter_db.mark_account_deleting(
+        "user-002", "acct-003", dt.datetime.now(dt.UTC)
+    )
+    totals = walter_db.get_user_transaction_totals("user-002", *august)
+    assert totals.num_transactions == 4
+    assert totals.total_income == pytest.approx(0.0)
+    assert totals.total_expense == pytest.approx(0.0)
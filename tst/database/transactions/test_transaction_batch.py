@@ -0,0 +1,164 @@
+import datetime as dt
+
+import numpy as np
+import pytest
+
+from src.aws.dynamodb.client import WalterDDBClient
+from src.database.transactions.batch import TransactionBatch
+from src.database.transactions.models import (
+    BankingTransactionSubType,
+    BankTransaction,
+    InvestmentTransaction,
+    InvestmentTransactionSubType,
+    TransactionCategory,
+    TransactionTotals,
+    TransactionType,
+)
+from src.database.transactions.table import TransactionsTable
+from src.environment import Domain
+
+
+@pytest.fixture
+def transactions_table(ddb_client) -> TransactionsTable:
+    ddb = WalterDDBClient(ddb_client)
+    return TransactionsTable(ddb=ddb, domain=Domain.TESTING)
+
+
+def _create_transactions() -> list:
+    return [
+        BankTransaction.create(
+            account_id="acct-001",
+            user_id="user-001",
+            transaction_type=TransactionType.BANKING,
+            transaction_subtype=BankingTransactionSubType.DEBIT,
+            transaction_category=TransactionCategory.RESTAURANTS,
+            transaction_date=dt.date(2025, 8, 1),
+            transaction_amount=12.5,
+            merchant_name="Chipotle",
+            plaid_transaction_id="plaid-txn-001",
+            plaid_account_id="plaid-acct-001",
+        ),
+        InvestmentTransaction.create(
+            account_id="acct-002",
+            user_id="user-001",
+            transaction_type=TransactionType.INVESTMENT,
+            transaction_subtype=InvestmentTransactionSubType.BUY,
+            transaction_category=TransactionCategory.INVESTMENT,
+            transaction_date=dt.date(2025, 8, 2),
+            ticker="AAPL",
+            exchange="NASDAQ",
+            quantity=10.0,
+            price_per_share=100.0,
+        ),
+        BankTransaction.create(
+            account_id="acct-001",
+            user_id="user-001",
+            transaction_type=TransactionType.BANKING,
+            transaction_subtype=BankingTransactionSubType.CREDIT,
+            transaction_category=TransactionCategory.INCOME,
+            transaction_date=dt.date(2025, 8, 3),
+            transaction_amount=2500.0,
+            merchant_name="Employer",
+        ),
+        BankTransaction.create(
+            account_id="acct-001",
+            user_id="user-001",
+            transaction_type=TransactionType.BANKING,
+            transaction_subtype=BankingTransactionSubType.DEBIT,
+            transaction_category=TransactionCategory.RESTAURANTS,
+            transaction_date=dt.date(2025, 8, 3),
+            transaction_amount=7.5,
+            merchant_name="Chipotle",
+        ),
+    ]
+
+
+def test_from_ddb_items_round_trip() -> None:
+    transactions = _create_transactions()
+    batch = TransactionBatch.from_ddb_items(
+        transaction.to_ddb_item() for transaction in transactions
+    )
+
+    assert len(batch) == 4
+    assert batch.to_dicts() == [transaction.to_dict() for transaction in transactions]
+    assert [transaction.to_dict() for transaction in batch.to_transactions()] == [
+        transaction.to_dict() for transaction in transactions
+    ]
+
+
+def test_from_ddb_items_interns_strings() -> None:
+    batch = TransactionBatch.from_ddb_items(
+        transaction.to_ddb_item() for transaction in _create_transactions()
+    )
+
+    assert batch.account_ids == ["acct-001", "acct-002"]
+    assert batch.merchant_names == ["Chipotle", "Employer"]
+    assert batch.merchant_codes.tolist() == [0, -1, 1, 0]
+    assert batch.security_codes.tolist() == [-1, 0, -1, -1]
+    assert np.isnan(batch.quantities[0])
+    assert batch.get_dates()[1] == np.datetime64("2025-08-02")
+
+
+def test_transaction_row() -> None:
+    batch = TransactionBatch.from_ddb_items(
+        transaction.to_ddb_item() for transaction in _create_transactions()
+    )
+
+    row = batch[0]
+    assert row.account_id == "acct-001"
+    assert row.transaction_subtype == BankingTransactionSubType.DEBIT
+    assert row.transaction_date == dt.date(2025, 8, 1)
+    assert row.merchant_name == "Chipotle"
+    assert row.security_id is None
+    assert row.is_plaid_transaction()
+    assert batch[-1].transaction_amount == 7.5
+    assert batch[1].security_id == "sec-nasdaq-aapl"
+    assert not batch[1].is_plaid_transaction()
+    with pytest.raises(IndexError):
+        batch[4]
+
+
+def test_take_reverse_and_filter_accounts() -> None:
+    transactions = _create_transactions()
+    batch = TransactionBatch.from_ddb_items(
+        transaction.to_ddb_item() for transaction in transactions
+    )
+
+    assert [row.transaction_id for row in batch.reverse()] == [
+        transaction.transaction_id for transaction in reversed(transactions)
+    ]
+    filtered = batch.filter_accounts(["acct-002", "acct-999"])
+    assert len(filtered) == 1
+    assert filtered.to_dicts() == [transactions[1].to_dict()]
+    assert len(batch.filter_accounts([])) == 0
+
+
+def test_get_totals() -> None:
+    transactions = _create_transactions()
+    batch = TransactionBatch.from_ddb_items(
+        transaction.to_ddb_item() for transaction in transactions
+    )
+
+    expected = TransactionTotals()
+    for transaction in transactions:
+        expected.add_transaction(transaction)
+    assert batch.get_totals().to_dict() == expected.to_dict()
+
+
+def test_empty_batch() -> None:
+    batch = TransactionBatch.empty()
+
+    assert len(batch) == 0
+    assert batch.to_dicts() == []
+    assert batch.reverse().to_dicts() == []
+    assert batch.get_totals().to_dict() == TransactionTotals().to_dict()
+
+
+def test_get_account_transaction_batch(transactions_table: TransactionsTable) -> None:
+    start = dt.datetime(2025, 8, 5)
+    end = dt.datetime(2025, 8, 6)
+
+    batch = transactions_table.get_account_transaction_batch("acct-003", start, end)
+
+    expected = transactions_table.get_account_transactions("acct-003", start, end)
+    assert batch.to_dicts() == [transaction.to_dict() for transaction in expected]
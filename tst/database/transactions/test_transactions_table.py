@@ -123,3 +123,27 @@ def test_delete_transaction(transactions_table: TransactionsTable):
     # Delete and verify removal
     transactions_table.delete_transaction(user_id, txn_id)
     assert transactions_table.get_user_transaction(user_id, txn_id) is None
+
+
+def test_get_account_transactions_page_descending(
+    transactions_table: TransactionsTable,
+):
+    transactions, last_evaluated_key = transactions_table.get_account_transactions_page(
+        "acct-003", dt.datetime.min, dt.datetime.max, 2, descending=True
+    )
+    assert len(transactions) == 2
+    assert last_evaluated_key is not None
+    assert transactions[0].transaction_date >= transactions[1].transaction_date
+
+    # resume from the last evaluated key
+    remaining, last_evaluated_key = transactions_table.get_account_transactions_page(
+        "acct-003",
+        dt.datetime.min,
+        dt.datetime.max,
+        2,
+        exclusive_start_key=last_evaluated_key,
+        descending=True,
+    )
+    assert len(remaining) == 1
+    assert last_evaluated_key is None
+    assert remaining[0].transaction_date <= transactions[1].transaction_date
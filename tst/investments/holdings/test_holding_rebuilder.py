@@ -0,0 +1,145 @@
+import datetime as dt
+import random
+
+import pytest
+
+from src.database.transactions.models import (
+    InvestmentTransaction,
+    InvestmentTransactionSubType,
+    TransactionCategory,
+    TransactionType,
+)
+from src.investments.holdings.exceptions import InvalidHoldingUpdate
+from src.investments.holdings.rebuilder import HoldingRebuilder
+from src.investments.holdings.updater import HoldingUpdater
+
+BUY = InvestmentTransactionSubType.BUY
+SELL = InvestmentTransactionSubType.SELL
+
+
+@pytest.fixture
+def holding_rebuilder() -> HoldingRebuilder:
+    return HoldingRebuilder()
+
+
+def _create_transaction(
+    transaction_id: str,
+    security_id: str,
+    date: dt.date,
+    subtype: InvestmentTransactionSubType,
+    quantity: float,
+    price_per_share: float,
+) -> InvestmentTransaction:
+    return InvestmentTransaction(
+        transaction_id=transaction_id,
+        account_id="acct-007",
+        user_id="user-005",
+        transaction_type=TransactionType.INVESTMENT,
+        transaction_subtype=subtype,
+        transaction_category=TransactionCategory.INVESTMENT,
+        transaction_date=date,
+        transaction_amount=quantity * price_per_share,
+        security_id=security_id,
+        quantity=quantity,
+        price_per_share=price_per_share,
+    )
+
+
+def _create_random_history(security_id: str, seed: int) -> list:
+    # random buys and sells that never oversell and sometimes close the position
+    rng = random.Random(seed)
+    transactions, quantity = [], 0.0
+    for index in range(50):
+        date = dt.date(2025, 1, 1) + dt.timedelta(days=index // 2)
+        if quantity > 0 and rng.random() < 0.4:
+            sell_quantity = quantity if rng.random() < 0.2 else quantity * rng.random()
+            quantity -= sell_quantity
+            subtype, txn_quantity = SELL, sell_quantity
+        else:
+            txn_quantity = round(rng.uniform(0.5, 20), 3)
+            quantity += txn_quantity
+            subtype = BUY
+        transactions.append(
+            _create_transaction(
+                f"txn-{security_id}-{index:03d}",
+                security_id,
+                date,
+                subtype,
+                txn_quantity,
+                round(rng.uniform(10, 500), 2),
+            )
+        )
+    rng.shuffle(transactions)
+    return transactions
+
+
+def test_rebuild_matches_sequential_replay(
+    holding_rebuilder: HoldingRebuilder, holding_updater: HoldingUpdater
+) -> None:
+    histories = {
+        f"sec-{seed}": _create_random_history(f"sec-{seed}", seed) for seed in range(5)
+    }
+    transactions = [txn for history in histories.values() for txn in history]
+
+    rebuilt = holding_rebuilder.rebuild("acct-007", transactions)
+
+    assert rebuilt.invalid_histories == {}
+    holdings = {holding.security_id: holding for holding in rebuilt.holdings}
+    assert set(holdings) | set(rebuilt.closed_security_ids) == set(histories)
+    for security_id, history in histories.items():
+        expected = holding_updater._replay("acct-007", security_id, history)
+        if security_id in rebuilt.closed_security_ids:
+            assert expected.quantity == pytest.approx(0, abs=1e-6)
+            continue
+        holding = holdings[security_id]
+        assert holding.quantity == pytest.approx(expected.quantity)
+        assert holding.total_cost_basis == pytest.approx(expected.total_cost_basis)
+        assert holding.average_cost_basis == pytest.approx(expected.average_cost_basis)
+        assert holding.last_transaction_key == expected.last_transaction_key
+
+
+def test_rebuild_flags_invalid_histories(
+    holding_rebuilder: HoldingRebuilder, holding_updater: HoldingUpdater
+) -> None:
+    oversold = [
+        _create_transaction("txn-1", "sec-a", dt.date(2025, 8, 1), BUY, 10, 100),
+        _create_transaction("txn-2", "sec-a", dt.date(2025, 8, 2), SELL, 15, 100),
+        _create_transaction("txn-3", "sec-a", dt.date(2025, 8, 3), BUY, 10, 100),
+    ]
+    dividend = [
+        _create_transaction(
+            "txn-4",
+            "sec-b",
+            dt.date(2025, 8, 1),
+            InvestmentTransactionSubType.DIVIDEND,
+            1,
+            5,
+        )
+    ]
+    closed = [
+        _create_transaction("txn-5", "sec-c", dt.date(2025, 8, 1), BUY, 10, 100),
+        _create_transaction("txn-6", "sec-c", dt.date(2025, 8, 2), SELL, 10, 120),
+    ]
+    valid = [
+        _create_transaction("txn-7", "sec-d", dt.date(2025, 8, 1), BUY, 10, 100),
+        _create_transaction("txn-8", "sec-d", dt.date(2025, 8, 2), SELL, 5, 120),
+        _create_transaction("txn-9", "sec-d", dt.date(2025, 8, 3), BUY, 5, 200),
+    ]
+
+    rebuilt = holding_rebuilder.rebuild(
+        "acct-007", oversold + dividend + closed + valid
+    )
+
+    # the sequential replay rejects the oversold history as well
+    with pytest.raises(InvalidHoldingUpdate):
+        holding_updater._replay("acct-007", "sec-a", oversold)
+
+    assert set(rebuilt.invalid_histories) == {"sec-a", "sec-b"}
+    assert rebuilt.closed_security_ids == ["sec-c"]
+    assert len(rebuilt.holdings) == 1
+    holding = rebuilt.holdings[0]
+    assert holding.security_id == "sec-d"
+    assert holding.quantity == pytest.approx(10)
+    assert holding.total_cost_basis == pytest.approx(1500)
+    assert holding.average_cost_basis == pytest.approx(150)
+    assert holding.last_transaction_key == "2025-08-03#txn-9"
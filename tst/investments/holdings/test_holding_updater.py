@@ -1,8 +1,13 @@
+import datetime as dt
+
 import pytest
 
 from src.database.client import WalterDB
 from src.database.transactions.models import (
     InvestmentTransaction,
+    InvestmentTransactionSubType,
+    TransactionCategory,
+    TransactionType,
 )
 from src.investments.holdings.exceptions import InvalidHoldingUpdate
 from src.investments.holdings.updater import HoldingUpdater
@@ -35,3 +40,153 @@ def test_update_holding_invalid_transactions(
     # assert an exception is raised for an invalid holding update
     with pytest.raises(InvalidHoldingUpdate):
         holding_updater.delete_transaction(transaction)
+
+
+def _create_transaction(
+    transaction_id: str,
+    date: dt.date,
+    subtype: InvestmentTransactionSubType,
+    quantity: float,
+    price_per_share: float,
+) -> InvestmentTransaction:
+    return InvestmentTransaction(
+        transaction_id=transaction_id,
+        account_id="acct-007",
+        user_id="user-005",
+        transaction_type=TransactionType.INVESTMENT,
+        transaction_subtype=subtype,
+        transaction_category=TransactionCategory.INVESTMENT,
+        transaction_date=date,
+        transaction_amount=quantity * price_per_share,
+        security_id="sec-nasdaq-nflx",
+        quantity=quantity,
+        price_per_share=price_per_share,
+    )
+
+
+def _add_transaction(
+    holding_updater: HoldingUpdater,
+    walter_db: WalterDB,
+    transaction: InvestmentTransaction,
+) -> None:
+    # mirror the add transaction API which updates the holding before persisting
+    holding_updater.add_transaction(transaction)
+    walter_db.add_transaction(transaction)
+
+
+def test_add_transaction_in_order_is_incremental(
+    holding_updater: HoldingUpdater, walter_db: WalterDB, mocker
+) -> None:
+    buy = InvestmentTransactionSubType.BUY
+    sell = InvestmentTransactionSubType.SELL
+    _add_transaction(
+        holding_updater,
+        walter_db,
+        _create_transaction("txn-a", dt.date(2025, 8, 1), buy, 10, 100),
+    )
+
+    spy = mocker.spy(walter_db, "get_transactions_by_holding")
+    _add_transaction(
+        holding_updater,
+        walter_db,
+        _create_transaction("txn-b", dt.date(2025, 8, 2), buy, 10, 200),
+    )
+    _add_transaction(
+        holding_updater,
+        walter_db,
+        _create_transaction("txn-c", dt.date(2025, 8, 3), sell, 5, 300),
+    )
+
+    # appended transactions do not read the holding transaction history
+    assert spy.call_count == 0
+
+    holding = walter_db.get_holding("acct-007", "sec-nasdaq-nflx")
+    assert holding.quantity == 15
+    assert holding.average_cost_basis == 150
+    assert holding.total_cost_basis == 2250
+    assert holding.last_transaction_key == "2025-08-03#txn-c"
+
+
+def test_out_of_order_changes_replay_from_affected_date(
+    holding_updater: HoldingUpdater, walter_db: WalterDB
+) -> None:
+    buy = InvestmentTransactionSubType.BUY
+    sell = InvestmentTransactionSubType.SELL
+    first_buy = _create_transaction("txn-a", dt.date(2025, 8, 1), buy, 10, 100)
+    for transaction in [
+        first_buy,
+        _create_transaction("txn-b", dt.date(2025, 8, 3), buy, 10, 200),
+        _create_transaction("txn-c", dt.date(2025, 8, 5), sell, 5, 300),
+    ]:
+        _add_transaction(holding_updater, walter_db, transaction)
+
+    # backdated buy between existing transactions
+    _add_transaction(
+        holding_updater,
+        walter_db,
+        _create_transaction("txn-d", dt.date(2025, 8, 2), buy, 20, 50),
+    )
+    holding = walter_db.get_holding("acct-007", "sec-nasdaq-nflx")
+    assert holding.quantity == pytest.approx(35)
+    assert holding.average_cost_basis == pytest.approx(4000 / 40)
+    assert holding.last_transaction_key == "2025-08-05#txn-c"
+
+    # deleting the first buy replays the remaining history
+    holding_updater.delete_transaction(first_buy)
+    walter_db.delete_transaction(first_buy.user_id, first_buy.transaction_id)
+    holding = walter_db.get_holding("acct-007", "sec-nasdaq-nflx")
+    assert holding.quantity == pytest.approx(25)
+    assert holding.average_cost_basis == pytest.approx(3000 / 30)
+
+
+def test_incremental_updates_are_periodically_reconciled(
+    holding_updater: HoldingUpdater, walter_db: WalterDB, mocker
+) -> None:
+    spy = mocker.spy(walter_db, "get_transactions_by_holding")
+    for day in range(1, HoldingUpdater.RECONCILIATION_INTERVAL + 2):
+        _add_transaction(
+            holding_updater,
+            walter_db,
+            _create_transaction(
+                f"txn-{day:02d}",
+                dt.date(2025, 8, 1) + dt.timedelta(days=day),
+                InvestmentTransactionSubType.BUY,
+                1,
+                day,
+            ),
+        )
+
+    assert spy.call_count == 1
+    holding = walter_db.get_holding("acct-007", "sec-nasdaq-nflx")
+    assert holding.quantity == HoldingUpdater.RECONCILIATION_INTERVAL + 1
+    assert holding.updates_since_reconciliation == 0
+
+
+def test_changes_to_sold_holding_rebuild_holding(
+    holding_updater: HoldingUpdater, walter_db: WalterDB
+) -> None:
+    buy = InvestmentTransactionSubType.BUY
+    sell = InvestmentTransactionSubType.SELL
+    sale = _create_transaction("txn-b", dt.date(2025, 8, 2), sell, 10, 200)
+    for transaction in [
+        _create_transaction("txn-a", dt.date(2025, 8, 1), buy, 10, 100),
+        sale,
+    ]:
+        _add_transaction(holding_updater, walter_db, transaction)
+
+    # selling the full position deletes the holding
+    assert walter_db.get_holding("acct-007", "sec-nasdaq-nflx") is None
+
+    # editing the sale rebuilds the holding from its history
+    partial_sale = _create_transaction("txn-b", dt.date(2025, 8, 2), sell, 4, 200)
+    holding_updater.update_transaction(partial_sale)
+    walter_db.update_transaction(partial_sale)
+    holding = walter_db.get_holding("acct-007", "sec-nasdaq-nflx")
+    assert holding.quantity == pytest.approx(6)
+    assert holding.average_cost_basis == pytest.approx(100)
+
+    # deleting a transaction of a removed holding rebuilds it too
+    walter_db.delete_holding("acct-007", "sec-nasdaq-nflx")
+    holding_updater.delete_transaction(partial_sale)
+    holding = walter_db.get_holding("acct-007", "sec-nasdaq-nflx")
+    assert holding.quantity == pytest.approx(10)
@@ -0,0 +1,117 @@
+import datetime as dt
+
+import numpy as np
+import pytest
+
+from src.database.transactions.models import (
+    InvestmentTransaction,
+    InvestmentTransactionSubType,
+    TransactionCategory,
+    TransactionType,
+)
+from src.investments.portfolio.history import PortfolioHistoryEngine
+from src.investments.securities.history import DailyPriceBars
+
+
+@pytest.fixture
+def portfolio_history_engine() -> PortfolioHistoryEngine:
+    return PortfolioHistoryEngine()
+
+
+def _create_transaction(
+    transaction_id: str,
+    date: dt.date,
+    subtype: InvestmentTransactionSubType,
+    quantity: float,
+    price_per_share: float,
+) -> InvestmentTransaction:
+    return InvestmentTransaction(
+        transaction_id=transaction_id,
+        account_id="acct-002",
+        user_id="user-002",
+        transaction_type=TransactionType.INVESTMENT,
+        transaction_subtype=subtype,
+        transaction_category=TransactionCategory.INVESTMENT,
+        transaction_date=date,
+        transaction_amount=quantity * price_per_share,
+        security_id="sec-a",
+        quantity=quantity,
+        price_per_share=price_per_share,
+    )
+
+
+def _create_bars(closes: dict) -> DailyPriceBars:
+    bars = DailyPriceBars.empty()
+    for day, close in closes.items():
+        bars = bars.append_price(day, close)
+    return bars
+
+
+def test_time_weighted_return_excludes_flows(
+    portfolio_history_engine: PortfolioHistoryEngine,
+) -> None:
+    transactions = [
+        _create_transaction(
+            "txn-1", dt.date(2025, 1, 1), InvestmentTransactionSubType.BUY, 10, 100
+        ),
+        # doubling the position does not change the return
+        _create_transaction(
+            "txn-2", dt.date(2025, 1, 3), InvestmentTransactionSubType.BUY, 10, 110
+        ),
+    ]
+    bars = _create_bars(
+        {
+            dt.date(2025, 1, 2): 110.0,
+            dt.date(2025, 1, 3): 110.0,
+            dt.date(2025, 1, 4): 121.0,
+        }
+    )
+
+    history = portfolio_history_engine.get_history(
+        transactions, {"sec-a": bars}, dt.date(2025, 1, 1), dt.date(2025, 1, 5)
+    )
+
+    assert history.values.tolist() == pytest.approx([1000, 1100, 2200, 2420, 2420])
+    assert history.net_contributions.tolist() == pytest.approx(
+        [1000, 1000, 2100, 2100, 2100]
+    )
+    assert history.time_weighted_returns.tolist() == pytest.approx(
+        [0.0, 0.1, 0.1, 0.21, 0.21]
+    )
+
+
+def test_history_starts_with_prior_holdings(
+    portfolio_history_engine: PortfolioHistoryEngine,
+) -> None:
+    transactions = [
+        _create_transaction(
+            "txn-1", dt.date(2024, 1, 1), InvestmentTransactionSubType.BUY, 10, 100
+        ),
+        _create_transaction(
+            "txn-2", dt.date(2025, 1, 2), InvestmentTransactionSubType.SELL, 10, 150
+        ),
+    ]
+
+    history = portfolio_history_engine.get_history(
+        transactions,
+        {},
+        dt.date(2025, 1, 1),
+        dt.date(2025, 1, 3),
+        latest_prices={"sec-a": (dt.date(2025, 1, 1), 120.0)},
+    )
+
+    assert history.values.tolist() == pytest.approx([1200, 0, 0])
+    assert history.net_contributions.tolist() == pytest.approx([0, -1500, -1500])
+    # the first day returns from the last transaction price to the latest price
+    assert history.time_weighted_returns.tolist() == pytest.approx([0.2, 0.5, 0.5])
+
+
+def test_resample(portfolio_history_engine: PortfolioHistoryEngine) -> None:
+    history = portfolio_history_engine.get_history(
+        [], {}, dt.date(2020, 1, 1), dt.date(2024, 12, 31)
+    )
+    resampled = history.resample(366)
+
+    assert len(history) == 1827
+    assert len(resampled) <= 366
+    assert resampled.dates[-1] == np.datetime64("2024-12-31")
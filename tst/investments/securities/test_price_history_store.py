@@ -0,0 +1,47 @@
+from datetime import date
+
+import numpy as np
+import pytest
+
+from src.investments.securities.history import DailyPriceBars, PriceHistoryStore
+from src.media.bucket import MediaBucket
+
+
+@pytest.fixture
+def price_history_store(media_bucket: MediaBucket) -> PriceHistoryStore:
+    return PriceHistoryStore(media_bucket=media_bucket)
+
+
+def test_append_prices(price_history_store: PriceHistoryStore) -> None:
+    assert len(price_history_store.get_bars("sec-nasdaq-aapl")) == 0
+
+    price_history_store.append_prices(
+        [
+            ("sec-nasdaq-aapl", date(2025, 8, 1), 100.0),
+            ("sec-crypto-btc", date(2025, 8, 1), 50.0),
+        ]
+    )
+    price_history_store.append_prices([("sec-nasdaq-aapl", date(2025, 8, 1), 110.0)])
+    price_history_store.append_prices([("sec-nasdaq-aapl", date(2025, 8, 1), 90.0)])
+    price_history_store.append_prices([("sec-nasdaq-aapl", date(2025, 8, 4), 95.0)])
+
+    # prices on the same day update the bar, later days start a new bar
+    bars = price_history_store.get_bars_for_securities(
+        ["sec-nasdaq-aapl", "sec-crypto-btc"]
+    )
+    aapl = bars["sec-nasdaq-aapl"]
+    assert aapl.dates.tolist() == [date(2025, 8, 1), date(2025, 8, 4)]
+    assert aapl.open.tolist() == [100.0, 95.0]
+    assert aapl.high.tolist() == [110.0, 95.0]
+    assert aapl.low.tolist() == [90.0, 95.0]
+    assert aapl.close.tolist() == [90.0, 95.0]
+    assert bars["sec-crypto-btc"].close.tolist() == [50.0]
+
+
+def test_daily_price_bars_ignore_older_prices() -> None:
+    bars = DailyPriceBars.empty().append_price(date(2025, 8, 4), 100.0)
+    bars = bars.append_price(date(2025, 8, 1), 50.0)
+    assert bars.dates.tolist() == [date(2025, 8, 4)]
+    assert np.array_equal(
+        DailyPriceBars.from_bytes(bars.to_bytes()).close, np.array([100.0])
+    )
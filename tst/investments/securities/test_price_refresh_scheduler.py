@@ -0,0 +1,105 @@
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from src.config import PriceRefreshConfig
+from src.database.client import WalterDB
+from src.database.securities.models import Stock
+from src.investments.securities.scheduler import PriceRefreshScheduler
+from src.utils.ttl_cache import TTLCache
+
+# 2025-08-08 is a friday, the US markets are open from 13:30 to 20:00 UTC
+MARKET_OPEN = datetime(2025, 8, 8, 15, 0, tzinfo=timezone.utc)
+MARKET_CLOSED = datetime(2025, 8, 9, 15, 0, tzinfo=timezone.utc)
+NEXT_OPEN = datetime(2025, 8, 11, 13, 30, tzinfo=timezone.utc)
+
+
+@pytest.fixture
+def price_refresh_scheduler(walter_db: WalterDB) -> PriceRefreshScheduler:
+    return PriceRefreshScheduler(
+        walter_db,
+        config=PriceRefreshConfig(max_refreshes_per_run=3),
+        holder_index=TTLCache(),
+    )
+
+
+def test_get_due_securities_by_priority(
+    price_refresh_scheduler: PriceRefreshScheduler, walter_db: WalterDB
+) -> None:
+    securities = walter_db.get_securities()
+    meta = walter_db.get_security("sec-nasdaq-meta")
+    meta.price_expires_at = MARKET_OPEN + timedelta(minutes=5)
+
+    due, deferred = price_refresh_scheduler.get_due_securities(
+        [
+            security
+            for security in securities
+            if security.security_id != meta.security_id
+        ]
+        + [meta],
+        MARKET_OPEN,
+    )
+
+    # most held securities first, unheld securities last
+    assert [security.security_id for security in due] == [
+        "sec-crypto-btc",
+        "sec-nyse-coke",
+        "sec-nasdaq-aapl",
+    ]
+    assert [security.security_id for security in deferred] == ["sec-crypto-eth"]
+
+
+def test_get_refresh_interval(price_refresh_scheduler: PriceRefreshScheduler) -> None:
+    get_interval = price_refresh_scheduler.get_refresh_interval
+    assert get_interval(0, 0.0) == timedelta(minutes=240)
+    assert get_interval(1, 0.0) == timedelta(minutes=15)
+    assert get_interval(2, 0.0) == timedelta(minutes=7.5)
+    assert get_interval(1, 0.01) == timedelta(minutes=7.5)
+    assert get_interval(1000, 0.5) == timedelta(minutes=5)
+
+
+def test_get_price_expiry_respects_market_hours(
+    price_refresh_scheduler: PriceRefreshScheduler, walter_db: WalterDB
+) -> None:
+    aapl = walter_db.get_security("sec-nasdaq-aapl")
+    eth = walter_db.get_security("sec-crypto-eth")
+
+    # held stocks refresh during market hours
+    assert price_refresh_scheduler.get_price_expiry(
+        aapl, aapl.current_price, MARKET_OPEN
+    ) == MARKET_OPEN + timedelta(minutes=7.5)
+
+    # but not past the closing price refresh, even when unheld
+    tsla = Stock.create("Tesla Inc.", "TSLA", "nasdaq", 100.0)
+    before_close = datetime(2025, 8, 8, 19, 55, tzinfo=timezone.utc)
+    assert price_refresh_scheduler.get_price_expiry(
+        tsla, tsla.current_price, before_close
+    ) == datetime(2025, 8, 8, 20, 15, tzinfo=timezone.utc)
+
+    # and not again until the next open once the market is closed
+    assert (
+        price_refresh_scheduler.get_price_expiry(
+            aapl, aapl.current_price, MARKET_CLOSED
+        )
+        == NEXT_OPEN
+    )
+
+    # crypto refreshes 24/7
+    assert price_refresh_scheduler.get_price_expiry(
+        eth, eth.current_price, MARKET_CLOSED
+    ) == MARKET_CLOSED + timedelta(minutes=240)
+
+
+def test_holder_index_is_reused_until_stale(
+    price_refresh_scheduler: PriceRefreshScheduler, walter_db: WalterDB
+) -> None:
+    assert price_refresh_scheduler.get_num_holders("sec-nasdaq-meta", MARKET_OPEN) == 1
+
+    walter_db.delete_holding("acct-007", "sec-nasdaq-meta")
+    assert price_refresh_scheduler.get_num_holders("sec-nasdaq-meta", MARKET_OPEN) == 1
+    assert (
+        price_refresh_scheduler.get_num_holders(
+            "sec-nasdaq-meta", MARKET_OPEN + timedelta(minutes=60)
+        )
+        == 0
+    )
@@ -0,0 +1,84 @@
+import json
+from dataclasses import dataclass, field
+from typing import List
+
+import pytest
+import requests
+
+from src.media.bucket import MediaBucket
+from src.media.logos import MerchantLogoCache
+
+UBER_LOGO_URL = "https://plaid-merchant-logos.plaid.com/uber_1060.png"
+NETFLIX_LOGO_URL = "https://plaid-merchant-logos.plaid.com/netflix_123.png"
+
+
+@dataclass
+class MockLogoResponse:
+    status_code: int
+    content: bytes = b"logo"
+    headers: dict = field(default_factory=lambda: {"Content-Type": "image/png"})
+
+    def raise_for_status(self) -> None:
+        if self.status_code != 200:
+            raise requests.HTTPError(f"Status code {self.status_code}")
+
+
+@dataclass
+class MockLogoSession:
+    status_code: int = 200
+    requested_urls: List[str] = field(default_factory=list)
+
+    def get(self, url: str, timeout: tuple) -> MockLogoResponse:
+        assert timeout is not None
+        self.requested_urls.append(url)
+        return MockLogoResponse(self.status_code)
+
+
+@pytest.fixture
+def logo_cache(media_bucket: MediaBucket) -> MerchantLogoCache:
+    return MerchantLogoCache(
+        media_bucket=media_bucket, known_logo_keys=set(), session=MockLogoSession()
+    )
+
+
+def test_get_logos_deduplicates_and_uploads_missing_logos(
+    logo_cache: MerchantLogoCache, media_bucket: MediaBucket
+) -> None:
+    logos = logo_cache.get_logos([UBER_LOGO_URL, UBER_LOGO_URL, NETFLIX_LOGO_URL, None])
+
+    assert logos == {
+        UBER_LOGO_URL: media_bucket.get_public_s3_uri("logos/uber_1060.png"),
+        NETFLIX_LOGO_URL: media_bucket.get_public_s3_uri("logos/netflix_123.png"),
+    }
+    assert sorted(logo_cache.session.requested_urls) == sorted(
+        [UBER_LOGO_URL, NETFLIX_LOGO_URL]
+    )
+    assert media_bucket.does_public_file_exist("logos/uber_1060.png")[0]
+    manifest = json.loads(
+        media_bucket.get_private_contents(MerchantLogoCache.MANIFEST_KEY)
+    )
+    assert manifest == ["logos/netflix_123.png", "logos/uber_1060.png"]
+
+
+def test_get_logos_known_logos_skip_media_bucket(
+    logo_cache: MerchantLogoCache, media_bucket: MediaBucket
+) -> None:
+    media_bucket.upload_private_contents(
+        MerchantLogoCache.MANIFEST_KEY, json.dumps(["logos/uber_1060.png"])
+    )
+
+    logos = logo_cache.get_logos([UBER_LOGO_URL])
+
+    assert logos[UBER_LOGO_URL] == media_bucket.get_public_s3_uri("logos/uber_1060.png")
+    assert logo_cache.session.requested_urls == []
+
+
+def test_get_logos_download_failure_returns_none(
+    logo_cache: MerchantLogoCache,
+) -> None:
+    logo_cache.session = MockLogoSession(status_code=404)
+
+    logos = logo_cache.get_logos([UBER_LOGO_URL])
+
+    assert logos == {UBER_LOGO_URL: None}
+    assert "logos/uber_1060.png" not in logo_cache.known_logo_keys
@@ -98,3 +98,32 @@ def test_transaction_converter_deleted_transaction(
     assert transaction.merchant_name == merchant_name
     assert transaction.transaction_amount == amount
     assert transaction.transaction_date == date
+
+
+def test_transaction_converter_resolve_existing_transactions(
+    transaction_converter: TransactionConverter,
+) -> None:
+    date = dt.datetime(2025, 8, 30)
+    plaid_transactions = [
+        create_plaid_transaction("plaid-acct-001", "plaid-txn-001", "Uber", 1, date),
+        create_plaid_transaction("plaid-acct-001", "plaid-txn-404", "Uber", 1, date),
+    ]
+    transaction_converter.resolve_existing_transactions(plaid_transactions)
+
+    # only the plaid transactions in the page are resolved
+    assert transaction_converter.plaid_transaction_keys == {
+        "plaid-txn-001": ("user-001", "bank-txn-999")
+    }
+    assert set(transaction_converter.plaid_transaction_cache) == {"plaid-txn-001"}
+
+
+def test_transaction_converter_deleted_transaction_does_not_exist(
+    transaction_converter: TransactionConverter,
+) -> None:
+    plaid_transaction = create_plaid_transaction(
+        "plaid-acct-001", "plaid-txn-404", "Uber", 6.33, dt.datetime(2025, 8, 30)
+    )
+    with pytest.raises(ValueError):
+        transaction_converter.convert(
+            plaid_transaction, TransactionConversionType.DELETED
+        )
@@ -1,10 +1,11 @@
 from dataclasses import dataclass
-from datetime import datetime, timedelta, timezone
-from typing import Dict
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
 
 from polygon import BadResponse
 from polygon.rest.models import TickerDetails
 from src.database.securities.models import SecurityType
+from src.polygon.cache import PolygonCacheStats
 
 MOCK_DATA = {
     "AAPL": {
@@ -73,9 +74,25 @@ class MockPolygonClient:
         self,
         security_ticker: str,
         security_type: SecurityType,
-        start_date: datetime = datetime.now(timezone.utc) - timedelta(days=1),
-        end_date: datetime = datetime.now(timezone.utc),
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None,
     ) -> float:
         if security_ticker.upper() not in self.data:
             raise BadResponse("Security not found")
         return self.data[security_ticker.upper()]["price"]
+
+    def get_latest_prices(
+        self, securities: List[Tuple[str, SecurityType]]
+    ) -> Dict[Tuple[str, SecurityType], Optional[float]]:
+        prices = {}
+        for security_ticker, security_type in securities:
+            try:
+                prices[(security_ticker, security_type)] = self.get_latest_price(
+                    security_ticker, security_type
+                )
+            except BadResponse:
+                prices[(security_ticker, security_type)] = None
+        return prices
+
+    def get_cache_stats(self) -> PolygonCacheStats:
+        return PolygonCacheStats()
@@ -0,0 +1,48 @@
+from datetime import datetime, timedelta, timezone
+
+from src.database.client import WalterDB
+from src.polygon.cache import PolygonCache, PolygonCacheStats
+from src.utils.ttl_cache import TTLCache
+
+
+def _create_cache(walter_db: WalterDB = None) -> PolygonCache:
+    return PolygonCache(
+        walter_db=walter_db, entries=TTLCache(), stats=PolygonCacheStats()
+    )
+
+
+def test_polygon_cache_memory() -> None:
+    cache = _create_cache()
+    assert cache.get("price#AAPL") is None
+
+    cache.put("price#AAPL", 105.5, ttl_seconds=60)
+    assert cache.get("price#AAPL") == 105.5
+
+    cache.put("price#META", 250.0, ttl_seconds=0)
+    assert cache.get("price#META") is None
+
+    stats = cache.get_stats()
+    assert stats.to_dict() == {
+        "memory_hits": 1,
+        "ddb_hits": 0,
+        "misses": 2,
+        "hit_rate": 1 / 3,
+    }
+
+
+def test_polygon_cache_shared_across_processes_via_ddb(walter_db: WalterDB) -> None:
+    cache = _create_cache(walter_db)
+    cache.put("ticker_details#AAPL", {"ticker": "AAPL"}, ttl_seconds=60)
+
+    # a cache in another process only shares the DDB cache table
+    other_cache = _create_cache(walter_db)
+    assert other_cache.get("ticker_details#AAPL") == {"ticker": "AAPL"}
+    assert other_cache.get("ticker_details#AAPL") == {"ticker": "AAPL"}
+    assert other_cache.get_stats().ddb_hits == 1
+    assert other_cache.get_stats().memory_hits == 1
+
+    # expired entries pending TTL deletion are ignored
+    walter_db.put_cache_entry(
+        "price#AAPL", "100.0", datetime.now(timezone.utc) - timedelta(seconds=1)
+    )
+    assert other_cache.get("price#AAPL") is None
@@ -6,7 +6,10 @@ import pytest
 from polygon.exceptions import BadResponse
 from src.aws.secretsmanager.client import WalterSecretsManagerClient
 from src.database.securities.models import SecurityType
+from src.polygon.cache import PolygonCache, PolygonCacheStats
 from src.polygon.client import PolygonClient
+from src.utils.rate_limiter import TokenBucketRateLimiter
+from src.utils.ttl_cache import TTLCache
 
 
 @pytest.fixture
@@ -24,7 +27,11 @@ def mock_rest_client(monkeypatch):
 def polygon_client(
     walter_sm: WalterSecretsManagerClient,
 ) -> PolygonClient:
-    return PolygonClient(walter_sm)
+    return PolygonClient(
+        walter_sm,
+        cache=PolygonCache(entries=TTLCache(), stats=PolygonCacheStats()),
+        rate_limiter=TokenBucketRateLimiter(rate_per_second=1000, capacity=1000),
+    )
 
 
 def test_get_stock_ticker_info_success(mock_rest_client, polygon_client) -> None:
@@ -64,12 +71,10 @@ def test_get_crypto_ticker_info_success(mock_rest_client, polygon_client) -> Non
 def test_get_latest_price_stock_success(mock_rest_client, polygon_client) -> None:
     mock_client_instance, mock_rest_client_class = mock_rest_client
 
-    # setup mock list_aggs response with two aggregate entries
-    agg1 = Mock()
-    agg1.open = 100.0
-    agg2 = Mock()
-    agg2.open = 105.5
-    mock_client_instance.list_aggs.return_value = [agg1, agg2]
+    # setup mock list_aggs response with the latest aggregate entry
+    agg = Mock()
+    agg.open = 105.5
+    mock_client_instance.list_aggs.return_value = [agg]
 
     start_date = datetime(2025, 8, 14, 0, 0, 0, tzinfo=timezone.utc)
     end_date = datetime(2025, 8, 15, 0, 0, 0, tzinfo=timezone.utc)
@@ -80,7 +85,14 @@ def test_get_latest_price_stock_success(mock_rest_client, polygon_client) -> Non
 
     mock_rest_client_class.assert_called_once_with(api_key="test-polygon-api-key")
     mock_client_instance.list_aggs.assert_called_once_with(
-        "AAPL", 1, "hour", start_date, end_date, adjusted="true", sort="asc"
+        "AAPL",
+        1,
+        "hour",
+        start_date,
+        end_date,
+        adjusted="true",
+        sort="desc",
+        limit=1,
     )
     assert result == 105.5
 
@@ -88,14 +100,10 @@ def test_get_latest_price_stock_success(mock_rest_client, polygon_client) -> Non
 def test_get_latest_price_crypto_success(mock_rest_client, polygon_client) -> None:
     mock_client_instance, mock_rest_client_class = mock_rest_client
 
-    # setup mock list_aggs response with three aggregate entries
-    agg1 = Mock()
-    agg1.open = 25000.0
-    agg2 = Mock()
-    agg2.open = 25250.0
-    agg3 = Mock()
-    agg3.open = 25100.0
-    mock_client_instance.list_aggs.return_value = [agg1, agg2, agg3]
+    # setup mock list_aggs response with the latest aggregate entry
+    agg = Mock()
+    agg.open = 25100.0
+    mock_client_instance.list_aggs.return_value = [agg]
 
     start_date = datetime(2025, 8, 14, 12, 0, 0, tzinfo=timezone.utc)
     end_date = datetime(2025, 8, 15, 12, 0, 0, tzinfo=timezone.utc)
@@ -106,7 +114,14 @@ def test_get_latest_price_crypto_success(mock_rest_client, polygon_client) -> No
 
     mock_rest_client_class.assert_called_once_with(api_key="test-polygon-api-key")
     mock_client_instance.list_aggs.assert_called_once_with(
-        "X:BTCUSD", 1, "hour", start_date, end_date, adjusted="true", sort="asc"
+        "X:BTCUSD",
+        1,
+        "hour",
+        start_date,
+        end_date,
+        adjusted="true",
+        sort="desc",
+        limit=1,
     )
     assert result == 25100.0
 
@@ -131,3 +146,118 @@ def test_get_ticker() -> None:
     assert PolygonClient._get_ticker("MSFT", SecurityType.STOCK) == "MSFT"
     assert PolygonClient._get_ticker("BTC", SecurityType.CRYPTO) == "X:BTCUSD"
     assert PolygonClient._get_ticker("ETH", SecurityType.CRYPTO) == "X:ETHUSD"
+
+
+def test_get_latest_prices_isolates_failures(mock_rest_client, polygon_client) -> None:
+    mock_client_instance, _ = mock_rest_client
+
+    def list_aggs(ticker, *args, **kwargs):
+        if ticker == "BAD":
+            raise BadResponse("Ticker not found")
+        agg = Mock()
+        agg.open = {"AAPL": 100.0, "X:BTCUSD": 25000.0}[ticker]
+        return [agg]
+
+    mock_client_instance.list_aggs.side_effect = list_aggs
+
+    prices = polygon_client.get_latest_prices(
+        [
+            ("AAPL", SecurityType.STOCK),
+            ("BAD", SecurityType.STOCK),
+            ("BTC", SecurityType.CRYPTO),
+            ("AAPL", SecurityType.STOCK),
+        ]
+    )
+
+    assert prices == {
+        ("AAPL", SecurityType.STOCK): 100.0,
+        ("BAD", SecurityType.STOCK): None,
+        ("BTC", SecurityType.CRYPTO): 25000.0,
+    }
+    assert mock_client_instance.list_aggs.call_count == 3
+
+
+def test_get_latest_prices_from_snapshots(mock_rest_client, polygon_client) -> None:
+    mock_client_instance, _ = mock_rest_client
+    polygon_client.use_snapshots = True
+
+    aapl = Mock(ticker="AAPL", last_trade=Mock(price=101.5))
+    btc = Mock(ticker="X:BTCUSD", last_trade=None, min=Mock(close=25500.0))
+
+    def get_snapshot_all(market_type, tickers):
+        return {"stocks": [aapl], "crypto": [btc]}[market_type.value]
+
+    mock_client_instance.get_snapshot_all.side_effect = get_snapshot_all
+    agg = Mock()
+    agg.open = 50.0
+    mock_client_instance.list_aggs.return_value = [agg]
+
+    prices = polygon_client.get_latest_prices(
+        [
+            ("AAPL", SecurityType.STOCK),
+            ("COKE", SecurityType.STOCK),
+            ("BTC", SecurityType.CRYPTO),
+        ]
+    )
+
+    # one snapshot request per market, missing snapshots fall back to aggregates
+    assert prices == {
+        ("AAPL", SecurityType.STOCK): 101.5,
+        ("BTC", SecurityType.CRYPTO): 25500.0,
+        ("COKE", SecurityType.STOCK): 50.0,
+    }
+    assert mock_client_instance.get_snapshot_all.call_count == 2
+    mock_client_instance.list_aggs.assert_called_once()
+
+
+def test_get_latest_price_cached(mock_rest_client, polygon_client) -> None:
+    mock_client_instance, _ = mock_rest_client
+    agg = Mock()
+    agg.open = 105.5
+    mock_client_instance.list_aggs.return_value = [agg]
+
+    before = datetime.now(timezone.utc)
+    assert polygon_client.get_latest_price("AAPL", SecurityType.STOCK) == 105.5
+    assert polygon_client.get_latest_price("AAPL", SecurityType.STOCK) == 105.5
+    assert polygon_client.get_latest_prices([("AAPL", SecurityType.STOCK)]) == {
+        ("AAPL", SecurityType.STOCK): 105.5
+    }
+
+    # the default window is computed at call time
+    mock_client_instance.list_aggs.assert_called_once()
+    _, _, _, start_date, end_date = mock_client_instance.list_aggs.call_args.args
+    assert end_date >= before
+    assert end_date - start_date == PolygonClient.PRICE_LOOKBACK[SecurityType.STOCK]
+
+    stats = polygon_client.get_cache_stats()
+    assert (stats.memory_hits, stats.misses) == (2, 1)
+
+
+def test_get_latest_price_cache_expired(mock_rest_client, polygon_client) -> None:
+    mock_client_instance, _ = mock_rest_client
+    agg = Mock()
+    agg.open = 105.5
+    mock_client_instance.list_aggs.return_value = [agg]
+    polygon_client.price_cache_ttl_seconds = 0
+
+    polygon_client.get_latest_price("AAPL", SecurityType.STOCK)
+    polygon_client.get_latest_price("AAPL", SecurityType.STOCK)
+
+    assert mock_client_instance.list_aggs.call_count == 2
+
+
+def test_get_ticker_info_cached(mock_rest_client, polygon_client) -> None:
+    mock_client_instance, mock_rest_client_class = mock_rest_client
+    mock_ticker_details = Mock()
+    mock_ticker_details.ticker = "AAPL"
+    mock_ticker_details.name = "Apple Inc."
+    mock_ticker_details.primary_exchange = "XNAS"
+    mock_client_instance.get_ticker_details.return_value = mock_ticker_details
+
+    polygon_client.get_ticker_info("AAPL", SecurityType.STOCK)
+    result = polygon_client.get_ticker_info("AAPL", SecurityType.STOCK)
+
+    mock_client_instance.get_ticker_details.assert_called_once_with("AAPL")
+    assert result.ticker == "AAPL"
+    assert result.name == "Apple Inc."
+    assert result.primary_exchange == "XNAS"
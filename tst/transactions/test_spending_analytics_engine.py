@@ -0,0 +1,186 @@
+import datetime as dt
+
+import numpy as np
+import pytest
+
+from src.database.transactions.batch import TransactionBatch
+from src.database.transactions.models import (
+    BankingTransactionSubType,
+    BankTransaction,
+    TransactionCategory,
+    TransactionType,
+)
+from src.transactions.analytics import SpendingAnalyticsEngine, TransactionColumns
+
+
+@pytest.fixture
+def spending_analytics_engine() -> SpendingAnalyticsEngine:
+    return SpendingAnalyticsEngine()
+
+
+def _create_transaction(
+    date: dt.date,
+    amount: float,
+    merchant_name: str,
+    category: TransactionCategory = TransactionCategory.SHOPPING,
+    subtype: BankingTransactionSubType = BankingTransactionSubType.DEBIT,
+    account_id: str = "acct-001",
+) -> BankTransaction:
+    return BankTransaction.create(
+        account_id=account_id,
+        user_id="user-001",
+        transaction_type=TransactionType.BANKING,
+        transaction_subtype=subtype,
+        transaction_category=category,
+        transaction_date=date,
+        transaction_amount=amount,
+        merchant_name=merchant_name,
+    )
+
+
+def test_transaction_columns_dictionary_encode() -> None:
+    columns = TransactionColumns.from_transactions(
+        [
+            _create_transaction(dt.date(2025, 8, 1), 10.0, "Target"),
+            _create_transaction(dt.date(2025, 8, 2), 20.0, "Amazon", account_id="b"),
+            _create_transaction(dt.date(2025, 8, 3), 30.0, "Target"),
+        ]
+    )
+
+    assert len(columns) == 3
+    assert columns.merchants == ["Target", "Amazon"]
+    assert columns.merchant_codes.tolist() == [0, 1, 0]
+    assert columns.account_ids == ["acct-001", "b"]
+    assert columns.account_codes.tolist() == [0, 1, 0]
+    assert columns.days[1] == np.datetime64("2025-08-02")
+    assert columns.amounts.tolist() == [10.0, 20.0, 30.0]
+
+
+def test_transaction_columns_from_batch() -> None:
+    transactions = [
+        _create_transaction(dt.date(2025, 8, 1), 10.0, "Target"),
+        _create_transaction(
+            dt.date(2025, 8, 2),
+            20.0,
+            "Employer",
+            TransactionCategory.INCOME,
+            BankingTransactionSubType.CREDIT,
+            account_id="b",
+        ),
+    ]
+
+    columns = TransactionColumns.from_batch(
+        TransactionBatch.from_ddb_items(
+            transaction.to_ddb_item() for transaction in transactions
+        )
+    )
+
+    expected = TransactionColumns.from_transactions(transactions)
+    assert columns.merchants == expected.merchants
+    assert columns.account_ids == expected.account_ids
+    assert columns.merchant_codes.tolist() == expected.merchant_codes.tolist()
+    assert columns.category_codes.tolist() == expected.category_codes.tolist()
+    assert columns.expenses.tolist() == [True, False]
+    assert (columns.days == expected.days).all()
+
+
+def test_get_analytics(spending_analytics_engine: SpendingAnalyticsEngine) -> None:
+    columns = TransactionColumns.from_transactions(
+        [
+            # previous period
+            _create_transaction(dt.date(2025, 7, 25), 40.0, "Target"),
+            # current period
+            _create_transaction(
+                dt.date(2025, 7, 30), 15.0, "Chipotle", TransactionCategory.RESTAURANTS
+            ),
+            _create_transaction(dt.date(2025, 8, 1), 50.0, "Target"),
+            _create_transaction(dt.date(2025, 8, 2), 80.0, "Amazon", account_id="b"),
+            _create_transaction(
+                dt.date(2025, 8, 4), 12.0, "Chipotle", TransactionCategory.RESTAURANTS
+            ),
+            _create_transaction(
+                dt.date(2025, 8, 5),
+                999.0,
+                "Employer",
+                TransactionCategory.INCOME,
+                BankingTransactionSubType.CREDIT,
+            ),
+            # out of both periods
+            _create_transaction(dt.date(2025, 9, 1), 1000.0, "Target"),
+        ]
+    )
+
+    analytics = spending_analytics_engine.get_analytics(
+        columns, dt.date(2025, 7, 28), dt.date(2025, 8, 10), num_merchants=2
+    )
+
+    assert analytics.previous_start_date == dt.date(2025, 7, 14)
+    assert analytics.previous_end_date == dt.date(2025, 7, 27)
+    assert analytics.total_spend == 157.0
+    assert analytics.previous_total_spend == 40.0
+    assert analytics.num_transactions == 4
+    assert analytics.previous_num_transactions == 1
+
+    data = analytics.to_dict()
+    assert data["percent_change"] == pytest.approx(117 / 40, abs=1e-4)
+    assert [(row["category"], row["spend"]) for row in data["categories"]] == [
+        ("Shopping", 130.0),
+        ("Restaurants", 27.0),
+    ]
+    assert [
+        (row["merchant_name"], row["spend"], row["previous_spend"])
+        for row in data["merchants"]
+    ] == [("Amazon", 80.0, 0.0), ("Target", 50.0, 40.0)]
+    assert [(row["account_id"], row["spend"]) for row in data["accounts"]] == [
+        ("b", 80.0),
+        ("acct-001", 77.0),
+    ]
+    assert [row["spend"] for row in data["weekdays"]] == [
+        12.0,
+        0,
+        15.0,
+        0,
+        50.0,
+        80.0,
+        0,
+    ]
+    assert data["months"] == [
+        {"month": "2025-07", "spend": 15.0, "num_transactions": 1},
+        {"month": "2025-08", "spend": 142.0, "num_transactions": 3},
+    ]
+
+
+def test_get_analytics_filters_accounts(
+    spending_analytics_engine: SpendingAnalyticsEngine,
+) -> None:
+    columns = TransactionColumns.from_transactions(
+        [
+            _create_transaction(dt.date(2025, 8, 1), 50.0, "Target"),
+            _create_transaction(dt.date(2025, 8, 2), 80.0, "Amazon", account_id="b"),
+        ]
+    )
+
+    analytics = spending_analytics_engine.get_analytics(
+        columns, dt.date(2025, 8, 1), dt.date(2025, 8, 31), 10, account_ids=["b"]
+    )
+
+    assert analytics.total_spend == 80.0
+    assert analytics.merchants.keys == ["Amazon"]
+
+
+def test_get_analytics_empty(
+    spending_analytics_engine: SpendingAnalyticsEngine,
+) -> None:
+    analytics = spending_analytics_engine.get_analytics(
+        TransactionColumns.from_transactions([]),
+        dt.date(2025, 8, 1),
+        dt.date(2025, 8, 31),
+        10,
+    )
+
+    data = analytics.to_dict()
+    assert data["total_spend"] == 0
+    assert data["percent_change"] is None
+    assert data["categories"] == []
+    assert data["merchants"] == []
+    assert len(data["weekdays"]) == 7
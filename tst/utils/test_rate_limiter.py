@@ -0,0 +1,47 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+
+from src.utils import rate_limiter as rate_limiter_module
+from src.utils.rate_limiter import TokenBucketRateLimiter
+
+
+def test_token_bucket_rate_limiter_allows_burst() -> None:
+    rate_limiter = TokenBucketRateLimiter(rate_per_second=1, capacity=5)
+    start = time.monotonic()
+    for _ in range(5):
+        rate_limiter.acquire()
+    assert time.monotonic() - start < 0.5
+
+
+def test_token_bucket_rate_limiter_throttles_concurrent_requests() -> None:
+    rate_limiter = TokenBucketRateLimiter(rate_per_second=50, capacity=1)
+    start = time.monotonic()
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(executor.map(lambda _: rate_limiter.acquire(), range(11)))
+    # the first token is available immediately, the remaining 10 refill at 50/s
+    assert time.monotonic() - start >= 0.19
+
+
+def test_token_bucket_rate_limiter_per_minute_never_exceeds_limit(monkeypatch) -> None:
+    now = [0.0]
+
+    def sleep(seconds: float) -> None:
+        now[0] += seconds
+
+    monkeypatch.setattr(
+        rate_limiter_module,
+        "time",
+        SimpleNamespace(monotonic=lambda: now[0], sleep=sleep),
+    )
+    requests_per_minute = 5
+    rate_limiter = TokenBucketRateLimiter.per_minute(requests_per_minute)
+
+    acquired_at = []
+    for _ in range(4 * requests_per_minute):
+        rate_limiter.acquire()
+        acquired_at.append(now[0])
+
+    for start in acquired_at:
+        in_window = [t for t in acquired_at if start <= t < start + 60 - 1e-6]
+        assert len(in_window) <= requests_per_minute
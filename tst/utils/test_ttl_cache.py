@@ -0,0 +1,40 @@
+from datetime import datetime, timedelta, timezone
+
+from src.utils.ttl_cache import TTLCache
+
+NOW = datetime(2025, 7, 1, tzinfo=timezone.utc)
+
+
+def test_ttl_cache_expires_entries() -> None:
+    cache = TTLCache()
+    cache.put("a", 1, NOW + timedelta(seconds=60))
+
+    assert cache.get("a", NOW) == 1
+    assert cache.get("a", NOW + timedelta(seconds=60)) is None
+    assert len(cache) == 0
+
+
+def test_ttl_cache_evicts_least_recently_used() -> None:
+    cache = TTLCache(max_entries=2)
+    expires_at = NOW + timedelta(seconds=60)
+
+    cache.put("a", 1, expires_at)
+    cache.put("b", 2, expires_at)
+    assert cache.get("a", NOW) == 1
+    cache.put("c", 3, expires_at)
+
+    assert list(cache.entries) == ["a", "c"]
+
+
+def test_ttl_cache_pop_and_clear() -> None:
+    cache = TTLCache()
+    expires_at = datetime.now(timezone.utc) + timedelta(seconds=60)
+    cache.put("a", 1, expires_at)
+    cache.put("b", 2, expires_at)
+
+    cache.pop("a")
+    assert "a" not in cache
+    assert "b" in cache
+
+    cache.clear()
+    assert len(cache) == 0
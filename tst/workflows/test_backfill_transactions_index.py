@@ -0,0 +1,97 @@
+import pytest
+from mypy_boto3_dynamodb import DynamoDBClient
+
+from src.database.client import WalterDB
+from src.environment import Domain
+from src.metrics.client import DatadogMetricsClient
+from src.workflows.backfill_transactions_index import BackfillTransactionsIndex
+from tst.constants import TRANSACTIONS_TABLE_NAME
+
+
+@pytest.fixture
+def backfill_transactions_index_workflow(
+    walter_db: WalterDB,
+    datadog_metrics: DatadogMetricsClient,
+) -> BackfillTransactionsIndex:
+    return BackfillTransactionsIndex(Domain.TESTING, walter_db, datadog_metrics)
+
+
+def _remove_account_security_ids(ddb_client: DynamoDBClient) -> int:
+    # simulate investment transactions written before the index attribute existed
+    items = ddb_client.scan(TableName=TRANSACTIONS_TABLE_NAME)["Items"]
+    num_removed = 0
+    for item in items:
+        if "account_security_id" in item:
+            ddb_client.update_item(
+                TableName=TRANSACTIONS_TABLE_NAME,
+                Key={
+                    "user_id": item["user_id"],
+                    "transaction_id": item["transaction_id"],
+                },
+                UpdateExpression="REMOVE account_security_id",
+            )
+            num_removed += 1
+    return num_removed
+
+
+def test_backfill_transactions_index_workflow_success(
+    backfill_transactions_index_workflow: BackfillTransactionsIndex,
+    walter_db: WalterDB,
+    ddb_client: DynamoDBClient,
+) -> None:
+    expected_transaction_ids = {
+        "investment-txn-009",
+        "investment-txn-010",
+        "investment-txn-011",
+    }
+    num_removed = _remove_account_security_ids(ddb_client)
+    assert num_removed > 0
+    assert (
+        walter_db.transactions_table.get_holding_transactions(
+            "acct-007", "sec-nyse-coke"
+        )
+        == []
+    )
+
+    # holding history is read by account until the index is enabled
+    transactions = walter_db.get_transactions_by_holding("acct-007", "sec-nyse-coke")
+    assert {
+        transaction.transaction_id for transaction in transactions
+    } == expected_transaction_ids
+
+    response = backfill_transactions_index_workflow.invoke({}, emit_metrics=True)
+
+    assert response.data["complete"] is True
+    assert response.data["num_backfilled_transactions"] == num_removed
+    walter_db.holding_transactions_index_enabled = True
+    transactions = walter_db.get_transactions_by_holding("acct-007", "sec-nyse-coke")
+    assert {
+        transaction.transaction_id for transaction in transactions
+    } == expected_transaction_ids
+
+    # backfill is idempotent
+    response = backfill_transactions_index_workflow.invoke({}, emit_metrics=False)
+    assert response.data["num_backfilled_transactions"] == 0
+
+
+def test_backfill_transactions_index_workflow_resumable(
+    backfill_transactions_index_workflow: BackfillTransactionsIndex,
+    ddb_client: DynamoDBClient,
+) -> None:
+    num_removed = _remove_account_security_ids(ddb_client)
+    backfill_transactions_index_workflow.PAGE_SIZE = 5
+
+    event = {"max_pages": 1}
+    num_backfilled, num_invocations = 0, 0
+    while True:
+        response = backfill_transactions_index_workflow.invoke(
+            event, emit_metrics=False
+        )
+        num_invocations += 1
+        num_backfilled += response.data["num_backfilled_transactions"]
+        if response.data["complete"]:
+            break
+        event["exclusive_start_key"] = response.data["last_evaluated_key"]
+
+    assert num_invocations > 1
+    assert num_backfilled == num_removed
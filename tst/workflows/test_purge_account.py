@@ -0,0 +1,108 @@
+import datetime as dt
+import json
+
+import pytest
+from pytest_mock import MockerFixture
+
+from src.accounts.queue import PurgeAccountTask, PurgeAccountTaskQueue
+from src.config import AccountDeletionConfig
+from src.database.client import WalterDB
+from src.environment import Domain
+from src.metrics.client import DatadogMetricsClient
+from src.workflows.common.models import WorkflowStatus
+from src.workflows.purge_account import PurgeAccount
+
+
+@pytest.fixture
+def purge_account_workflow(
+    walter_db: WalterDB,
+    purge_account_task_queue: PurgeAccountTaskQueue,
+    datadog_metrics: DatadogMetricsClient,
+) -> PurgeAccount:
+    return PurgeAccount(
+        Domain.TESTING, walter_db, purge_account_task_queue, datadog_metrics
+    )
+
+
+def get_purge_account_event(task: PurgeAccountTask) -> dict:
+    return {"Records": [{"body": json.dumps(task.to_dict())}]}
+
+
+def test_purge_account_workflow_success(
+    purge_account_workflow: PurgeAccount, walter_db: WalterDB
+) -> None:
+    # data seeded in the mock db
+    user_id = "user-004"
+    account_id = "acct-006"
+    walter_db.cash_flow_rollups_enabled = True
+
+    assert walter_db.mark_account_deleting(user_id, account_id, dt.datetime.now(dt.UTC))
+
+    response = purge_account_workflow.invoke(
+        get_purge_account_event(PurgeAccountTask(user_id, account_id)),
+        emit_metrics=True,
+    )
+
+    assert response.data["complete"] is True
+    assert response.data["num_deleted_transactions"] == 1
+    assert response.data["num_deleted_holdings"] == 1
+
+    # assert account, transactions, and holdings are deleted
+    assert walter_db.get_account(user_id, account_id) is None
+    assert walter_db.get_account_transactions(account_id) == []
+    assert walter_db.get_holdings(account_id) == []
+    assert walter_db.get_user_data_version(user_id) is not None
+
+    # assert cash flow rollups of the account are deleted
+    totals = walter_db.get_account_transaction_totals(
+        account_id, dt.datetime.min, dt.datetime.max
+    )
+    assert totals.num_transactions == 0
+
+
+def test_purge_account_workflow_resumes_in_follow_up_tasks(
+    walter_db: WalterDB,
+    purge_account_task_queue: PurgeAccountTaskQueue,
+    datadog_metrics: DatadogMetricsClient,
+    mocker: MockerFixture,
+) -> None:
+    # data seeded in the mock db
+    user_id = "user-005"
+    account_id = "acct-007"
+
+    assert walter_db.mark_account_deleting(user_id, account_id, dt.datetime.now(dt.UTC))
+
+    workflow = PurgeAccount(
+        Domain.TESTING,
+        walter_db,
+        purge_account_task_queue,
+        datadog_metrics,
+        AccountDeletionConfig(page_size=2, max_pages_per_run=1),
+    )
+    add_task = mocker.spy(purge_account_task_queue, "add_task")
+
+    # each run purges a single page and enqueues a follow-up task
+    task = PurgeAccountTask(user_id, account_id)
+    response = workflow.invoke(get_purge_account_event(task), emit_metrics=False)
+    num_runs = 1
+    while not response.data["complete"]:
+        assert add_task.call_count == num_runs
+        task = add_task.call_args.args[0]
+        assert task.num_runs == num_runs
+        assert task.exclusive_start_key is not None
+        response = workflow.invoke(get_purge_account_event(task), emit_metrics=False)
+        num_runs += 1
+
+    assert num_runs == 3
+    assert response.data["total_deleted_transactions"] == 5
+    assert response.data["num_deleted_holdings"] == 3
+    assert walter_db.get_account(user_id, account_id) is None
+    assert walter_db.get_account_transactions(account_id) == []
+    assert walter_db.get_holdings(account_id) == []
+
+
+def test_purge_account_workflow_failure_invalid_event(
+    purge_account_workflow: PurgeAccount,
+) -> None:
+    response = purge_account_workflow.invoke({"Records": []}, emit_metrics=False)
+    assert response.status == WorkflowStatus.FAILURE
@@ -0,0 +1,64 @@
+import pytest
+
+from src.database.client import WalterDB
+from src.environment import Domain
+from src.metrics.client import DatadogMetricsClient
+from src.workflows.rebuild_holdings import RebuildHoldings
+
+
+@pytest.fixture
+def rebuild_holdings_workflow(
+    walter_db: WalterDB,
+    datadog_metrics: DatadogMetricsClient,
+) -> RebuildHoldings:
+    return RebuildHoldings(Domain.TESTING, walter_db, datadog_metrics)
+
+
+def test_rebuild_holdings_workflow_success(
+    rebuild_holdings_workflow: RebuildHoldings, walter_db: WalterDB
+) -> None:
+    response = rebuild_holdings_workflow.invoke({}, emit_metrics=True)
+
+    # the oversold meta history in acct-007 is reported and left as is
+    assert response.data["invalid_histories"] == [
+        {
+            "account_id": "acct-007",
+            "security_id": "sec-nasdaq-meta",
+            "reason": "Investment transaction sell quantity is greater than holding quantity",
+        }
+    ]
+    assert walter_db.get_holding("acct-007", "sec-nasdaq-meta").quantity == 2.0
+
+    # holdings are recomputed from their transactions
+    holding = walter_db.get_holding("acct-002", "sec-nasdaq-aapl")
+    assert holding.quantity == 5
+    assert holding.total_cost_basis == 500
+    assert holding.average_cost_basis == 100
+    assert holding.last_transaction_key == "2025-08-08#investment-txn-002"
+    assert holding.created_at.year == 2024
+
+    # fully sold holdings are deleted
+    assert walter_db.get_holding("acct-007", "sec-nyse-coke") is None
+    assert response.data["num_deleted_holdings"] == 1
+
+
+def test_rebuild_holdings_workflow_sharded(
+    rebuild_holdings_workflow: RebuildHoldings, walter_db: WalterDB
+) -> None:
+    num_shards = 3
+    num_accounts, num_rebuilt = 0, 0
+    for shard in range(num_shards):
+        response = rebuild_holdings_workflow.invoke(
+            {"shard": shard, "num_shards": num_shards, "dry_run": True},
+            emit_metrics=False,
+        )
+        num_accounts += response.data["num_accounts"]
+        num_rebuilt += response.data["num_rebuilt_holdings"]
+
+    # shards cover every investment account exactly once
+    response = rebuild_holdings_workflow.invoke({"dry_run": True}, emit_metrics=False)
+    assert num_accounts == response.data["num_accounts"] == 6
+    assert num_rebuilt == response.data["num_rebuilt_holdings"]
+
+    # dry runs do not write holdings
+    assert walter_db.get_holding("acct-002", "sec-nasdaq-aapl").quantity == 100
@@ -0,0 +1,160 @@
+import datetime as dt
+
+import pytest
+
+from src.database.client import WalterDB
+from src.database.rollups.models import CashFlowRollup
+from src.database.transactions.models import (
+    BankingTransactionSubType,
+    BankTransaction,
+    TransactionCategory,
+    TransactionType,
+)
+from src.environment import Domain
+from src.metrics.client import DatadogMetricsClient
+from src.workflows.reconcile_cash_flow_rollups import ReconcileCashFlowRollups
+
+
+@pytest.fixture
+def reconcile_cash_flow_rollups_workflow(
+    walter_db: WalterDB,
+    datadog_metrics: DatadogMetricsClient,
+) -> ReconcileCashFlowRollups:
+    return ReconcileCashFlowRollups(Domain.TESTING, walter_db, datadog_metrics)
+
+
+def test_reconcile_cash_flow_rollups_workflow_success(
+    reconcile_cash_flow_rollups_workflow: ReconcileCashFlowRollups,
+    walter_db: WalterDB,
+) -> None:
+    account_owner_id = CashFlowRollup.get_account_owner_id("acct-003")
+    august = (dt.datetime(2025, 8, 1), dt.datetime(2025, 8, 31))
+    walter_db.cash_flow_rollups_enabled = True
+
+    # seeded rollups match the seeded transactions
+    response = reconcile_cash_flow_rollups_workflow.invoke({}, emit_metrics=True)
+    assert response.data["num_drifted_rollups"] == 0
+    assert response.data["num_stale_rollups"] == 0
+
+    # drift a rollup and add a rollup without any transactions
+    walter_db.put_cash_flow_rollups(
+        [
+            CashFlowRollup(account_owner_id, "M#2025-08", income=1.0),
+            CashFlowRollup(account_owner_id, "M#2024-01", num_transactions=1),
+        ]
+    )
+    assert walter_db.get_account_transaction_totals(
+        "acct-003", *august
+    ).total_income == pytest.approx(1.0)
+
+    # dry runs only report the drift
+    response = reconcile_cash_flow_rollups_workflow.invoke(
+        {"dry_run": True}, emit_metrics=False
+    )
+    assert response.data["num_drifted_rollups"] == 1
+    assert response.data["num_stale_rollups"] == 1
+    assert walter_db.get_account_transaction_totals(
+        "acct-003", *august
+    ).total_income == pytest.approx(1.0)
+
+    # drifted rollups are rebuilt and stale rollups deleted
+    response = reconcile_cash_flow_rollups_workflow.invoke({}, emit_metrics=False)
+    assert response.data["num_drifted_rollups"] == 1
+    assert response.data["num_stale_rollups"] == 1
+    totals = walter_db.get_account_transaction_totals("acct-003", *august)
+    assert totals.total_income == pytest.approx(2500.00)
+    assert totals.total_expense == pytest.approx(1505.00)
+    assert (
+        walter_db.get_account_transaction_totals(
+            "acct-003", dt.datetime(2024, 1, 1), dt.datetime(2024, 1, 31)
+        ).num_transactions
+        == 0
+    )
+
+
+def test_transaction_totals_are_computed_from_transactions_until_rollups_are_enabled(
+    walter_db: WalterDB,
+) -> None:
+    august = (dt.datetime(2025, 8, 1), dt.datetime(2025, 8, 31))
+    walter_db.put_cash_flow_rollups(
+        [
+            CashFlowRollup(
+                CashFlowRollup.get_account_owner_id("acct-003"),
+                "M#2025-08",
+                income=1.0,
+            )
+        ]
+    )
+
+    totals = walter_db.get_account_transaction_totals("acct-003", *august)
+    assert totals.num_transactions == 3
+    assert totals.total_income == pytest.approx(2500.00)
+    assert totals.total_expense == pytest.approx(1505.00)
+    assert walter_db.get_user_transaction_totals(
+        "user-002", *august
+    ).total_income == pytest.approx(2500.00)
+
+    walter_db.cash_flow_rollups_enabled = True
+    assert walter_db.get_account_transaction_totals(
+        "acct-003", *august
+    ).total_income == pytest.approx(1.0)
+
+
+def test_reconcile_cash_flow_rollups_workflow_keeps_concurrent_writes(
+    reconcile_cash_flow_rollups_workflow: ReconcileCashFlowRollups,
+    walter_db: WalterDB,
+    monkeypatch,
+) -> None:
+    walter_db.cash_flow_rollups_enabled = True
+    august = (dt.datetime(2025, 8, 1), dt.datetime(2025, 8, 31))
+    walter_db.put_cash_flow_rollups(
+        [
+            CashFlowRollup(
+                CashFlowRollup.get_account_owner_id("acct-003"),
+                "M#2025-08",
+                income=1.0,
+            )
+        ]
+    )
+
+    # a transaction written after the rollups are read but not seen by the
+    # read of the transactions
+    get_user_transactions = walter_db.get_user_transactions
+
+    def get_user_transactions_then_write(user_id):
+        transactions = get_user_transactions(user_id)
+        walter_db.add_transaction(
+            BankTransaction(
+                user_id="user-002",
+                account_id="acct-003",
+                transaction_type=TransactionType.BANKING,
+                transaction_subtype=BankingTransactionSubType.DEBIT,
+                transaction_category=TransactionCategory.GROCERIES,
+                transaction_date=dt.date(2025, 8, 20),
+                transaction_amount=40.0,
+                merchant_name="Grocery Store",
+                transaction_id="bank-txn-100",
+            )
+        )
+        return transactions
+
+    monkeypatch.setattr(
+        walter_db, "get_user_transactions", get_user_transactions_then_write
+    )
+    reconcile_cash_flow_rollups_workflow.invoke(
+        {"user_id": "user-002"}, emit_metrics=False
+    )
+    monkeypatch.undo()
+
+    # the drifted rollup is left to the next run instead of overwritten
+    totals = walter_db.get_account_transaction_totals("acct-003", *august)
+    assert totals.num_transactions == 1
+    assert totals.total_expense == pytest.approx(40.0)
+
+    reconcile_cash_flow_rollups_workflow.invoke(
+        {"user_id": "user-002"}, emit_metrics=False
+    )
+    totals = walter_db.get_account_transaction_totals("acct-003", *august)
+    assert totals.num_transactions == 4
+    assert totals.total_income == pytest.approx(2500.00)
+    assert totals.total_expense == pytest.approx(1545.00)
@@ -118,6 +118,8 @@ def test_sync_transactions_success(
     assert data["user_id"] == user_id
     assert data["plaid_item_id"] == plaid_item_id
     assert len(data["accounts"]) == 1
+    # the responses of the user are invalidated
+    assert walter_db.get_user_data_version(user_id) is not None
 
 
 def _create_task_event(user_id: str, plaid_item_id: str) -> dict:
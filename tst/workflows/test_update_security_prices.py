@@ -1,11 +1,18 @@
+from datetime import timedelta
+
 import pytest
 
+from src.config import PriceRefreshConfig
 from src.database.client import WalterDB
 from src.database.securities.models import Crypto, Stock
 from src.environment import Domain
+from src.investments.securities.history import PriceHistoryStore
+from src.investments.securities.scheduler import PriceRefreshScheduler
+from src.media.bucket import MediaBucket
 from src.metrics.client import DatadogMetricsClient
+from src.utils.ttl_cache import TTLCache
 from src.workflows.update_security_prices import UpdateSecurityPrices
-from tst.polygon.mock import MockPolygonClient
+from tst.polygon.mock import MOCK_DATA, MockPolygonClient
 
 
 @pytest.fixture
@@ -55,3 +62,77 @@ def test_update_security_prices_workflow_success(
     assert updated_securities_dict["sec-nasdaq-meta"].current_price == 10000.00
     assert updated_securities_dict["sec-crypto-btc"].current_price == 10000.00
     assert updated_securities_dict["sec-crypto-eth"].current_price == 10000.00
+
+
+def test_update_security_prices_workflow_isolates_failures(
+    walter_db: WalterDB,
+    datadog_metrics: DatadogMetricsClient,
+) -> None:
+    # polygon has no price for coke
+    polygon_client = MockPolygonClient(
+        data={ticker: data for ticker, data in MOCK_DATA.items() if ticker != "COKE"}
+    )
+    workflow = UpdateSecurityPrices(
+        Domain.TESTING, walter_db, polygon_client, datadog_metrics
+    )
+
+    response = workflow.invoke(event={})
+
+    assert response.data["failed_securities"] == ["sec-nyse-coke"]
+    assert response.data["updated_num_securities"] == 4
+    assert walter_db.get_security("sec-nyse-coke").current_price == 250.00
+    assert walter_db.get_security("sec-nasdaq-meta").current_price == 10000.00
+
+
+def test_update_security_prices_workflow_schedules_by_demand(
+    walter_db: WalterDB,
+    polygon_client: MockPolygonClient,
+    datadog_metrics: DatadogMetricsClient,
+) -> None:
+    scheduler = PriceRefreshScheduler(
+        walter_db,
+        config=PriceRefreshConfig(max_refreshes_per_run=4),
+        holder_index=TTLCache(),
+    )
+    workflow = UpdateSecurityPrices(
+        Domain.TESTING, walter_db, polygon_client, datadog_metrics, scheduler
+    )
+
+    response = workflow.invoke(event={})
+
+    # the unheld eth price is deferred to the next run
+    assert response.data["updated_num_securities"] == 4
+    assert response.data["deferred_num_securities"] == 1
+    assert walter_db.get_security("sec-crypto-eth").current_price == 125.0
+
+    # held and volatile btc expires sooner than the next run refreshes unheld eth
+    response = workflow.invoke(event={})
+    assert response.data["updated_num_securities"] == 1
+    btc = walter_db.get_security("sec-crypto-btc")
+    eth = walter_db.get_security("sec-crypto-eth")
+    assert btc.price_expires_at - btc.price_updated_at < timedelta(minutes=15)
+    assert eth.price_expires_at - eth.price_updated_at == timedelta(minutes=240)
+
+
+def test_update_security_prices_workflow_appends_price_history(
+    walter_db: WalterDB,
+    polygon_client: MockPolygonClient,
+    datadog_metrics: DatadogMetricsClient,
+    media_bucket: MediaBucket,
+) -> None:
+    price_history = PriceHistoryStore(media_bucket=media_bucket)
+    workflow = UpdateSecurityPrices(
+        Domain.TESTING,
+        walter_db,
+        polygon_client,
+        datadog_metrics,
+        scheduler=PriceRefreshScheduler(walter_db, holder_index=TTLCache()),
+        price_history=price_history,
+    )
+
+    workflow.invoke(event={})
+
+    # only held securities keep a price history
+    assert price_history.get_bars("sec-nasdaq-meta").close.tolist() == [10000.0]
+    assert price_history.get_bars("sec-crypto-btc").close.tolist() == [10000.0]
+    assert len(price_history.get_bars("sec-crypto-eth")) == 0
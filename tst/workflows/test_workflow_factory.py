@@ -1,4 +1,8 @@
+from src.workflows.backfill_transactions_index import BackfillTransactionsIndex
 from src.workflows.factory import WorkflowFactory, Workflows
+from src.workflows.purge_account import PurgeAccount
+from src.workflows.rebuild_holdings import RebuildHoldings
+from src.workflows.reconcile_cash_flow_rollups import ReconcileCashFlowRollups
 from src.workflows.sync_user_transactions import SyncUserTransactions
 from src.workflows.update_security_prices import UpdateSecurityPrices
 from tst.api.utils import UNIT_TEST_REQUEST_ID
@@ -13,3 +17,19 @@ def test_workflow_factory(workflow_factory: WorkflowFactory) -> None:
         Workflows.SYNC_USER_TRANSACTIONS, UNIT_TEST_REQUEST_ID
     )
     assert isinstance(workflow, SyncUserTransactions)
+    workflow = workflow_factory.get_workflow(
+        Workflows.BACKFILL_TRANSACTIONS_INDEX, UNIT_TEST_REQUEST_ID
+    )
+    assert isinstance(workflow, BackfillTransactionsIndex)
+    workflow = workflow_factory.get_workflow(
+        Workflows.REBUILD_HOLDINGS, UNIT_TEST_REQUEST_ID
+    )
+    assert isinstance(workflow, RebuildHoldings)
+    workflow = workflow_factory.get_workflow(
+        Workflows.PURGE_ACCOUNT, UNIT_TEST_REQUEST_ID
+    )
+    assert isinstance(workflow, PurgeAccount)
+    workflow = workflow_factory.get_workflow(
+        Workflows.RECONCILE_CASH_FLOW_ROLLUPS, UNIT_TEST_REQUEST_ID
+    )
+    assert isinstance(workflow, ReconcileCashFlowRollups)